@@ -18,6 +18,7 @@ from eleven_video.models.domain import Audio, VoiceInfo
 from eleven_video.models.quota import QuotaInfo
 from eleven_video.exceptions.custom_errors import ElevenLabsAPIError, ValidationError
 from eleven_video.monitoring.usage import UsageMonitor
+from eleven_video.utils.mp3 import mp3_duration
 
 
 class ElevenLabsAdapter:
@@ -339,12 +340,12 @@ class ElevenLabsAdapter:
         # Story 5.1/5.2: Report character usage to monitor (AC5 / Story 5.2 AC4)
         self._report_character_usage(text, voice_id)
         
-        # AC6: Return Audio with file size for downstream processing
-        # NOTE: duration_seconds requires mp3 parsing (e.g., mutagen library).
-        # This can be added in a future story if needed for video timing calculations.
+        # AC6: Return Audio with file size for downstream processing.
+        # Duration is read from the MP3 frame headers so the compiler does not
+        # need to decode the file with ffmpeg to learn its length.
         return Audio(
             data=audio_bytes,
-            duration_seconds=None,
+            duration_seconds=mp3_duration(audio_bytes),
             file_size_bytes=len(audio_bytes)
         )
     
@@ -88,8 +88,16 @@ class _SettingsBase(BaseSettings):
     default_image_model: Optional[str] = None
     default_gemini_model: Optional[str] = None
     default_duration_minutes: Optional[int] = None
-    
-    @field_validator("default_voice", "default_image_model", "default_gemini_model", mode="before")
+    # Encoder speed/quality profile (draft, standard, archival)
+    default_render_profile: Optional[str] = None
+    # Directory for compile intermediates (e.g. tmpfs or local NVMe); system temp if unset
+    scratch_dir: Optional[str] = None
+    # Keep encoded segments here so re-renders only encode changed images; no cache if unset
+    segment_cache_dir: Optional[str] = None
+    # Cores shared by all renders on this machine; every core if unset
+    cpu_budget: Optional[int] = None
+    
+    @field_validator("default_voice", "default_image_model", "default_gemini_model", "scratch_dir", "segment_cache_dir", mode="before")
     @classmethod
     def empty_string_to_none(cls, v: Any) -> Optional[str]:
         """Treat empty strings as None (not configured)."""
@@ -111,6 +119,18 @@ class _SettingsBase(BaseSettings):
         except (ValueError, TypeError):
             return None  # Invalid type, treat as not configured
 
+    @field_validator("default_render_profile", mode="before")
+    @classmethod
+    def validate_render_profile(cls, v: Any) -> Optional[str]:
+        """Validate the render profile name if set."""
+        if not isinstance(v, str) or not v.strip():
+            return None
+        from eleven_video.processing.profiles import RENDER_PROFILES
+        name = v.lower().strip()
+        if name not in RENDER_PROFILES:
+            return None  # Invalid value, treat as not configured
+        return name
+
     @model_validator(mode="after")
     def validate_non_empty_keys(self) -> "_SettingsBase":
         """Ensure API keys are not empty strings."""
@@ -163,6 +163,9 @@ def setup():
         "default_duration_minutes": default_duration_minutes,
         "output_format": output_format,
     }
+    # Keep settings that the wizard does not prompt for
+    if existing_config.get("default_render_profile"):
+        new_config["default_render_profile"] = existing_config["default_render_profile"]
     
     # Save configuration (AC4)
     save_config(new_config)
@@ -337,9 +340,19 @@ def generate(
     image_model: Optional[str] = typer.Option(None, "--image-model", "-m", help="Image model ID to use"),
     gemini_model: Optional[str] = typer.Option(None, "--gemini-model", help="Gemini text model ID to use (no short option due to -g conflict)"),
     duration: Optional[int] = typer.Option(None, "--duration", "-d", help="Target video duration in minutes"),
-    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file path"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file path ('-' streams fragmented MP4 to stdout)"),
     resolution: Optional[str] = typer.Option(None, "--resolution", "-r", help="Output resolution (1080p, 720p, portrait, square)"),
     interactive: bool = typer.Option(False, "--interactive", "-i", help="Force all interactive prompts even with defaults configured"),
+    no_zoom: bool = typer.Option(False, "--no-zoom", help="Disable Ken Burns zoom (static slideshow, much faster to compile)"),
+    render_profile: Optional[str] = typer.Option(None, "--render-profile", help="Encoder speed/quality profile (draft, standard, archival)"),
+    preview: bool = typer.Option(False, "--preview", help="Also render a 360p/12fps proxy before the full render"),
+    audio_mode: str = typer.Option("aac", "--audio-mode", help="Narration audio: aac (encode in render), copy (mux MP3 unchanged), transcode (encode AAC in parallel)"),
+    output_format: str = typer.Option("mp4", "--output-format", help="Container: mp4, fmp4 (fragmented, playable while rendering), hls (playlist + segments)"),
+    scratch_dir: Optional[Path] = typer.Option(None, "--scratch-dir", help="Directory for compile intermediates, e.g. a tmpfs or local NVMe mount (default: scratch_dir setting, else system temp)"),
+    shared_dir: Optional[Path] = typer.Option(None, "--shared-dir", help="Shared directory where `render-worker` processes on other machines encode the segments"),
+    transition: float = typer.Option(0.0, "--transition", help="Crossfade between images, in seconds (default 0: hard cuts)"),
+    work_dir: Optional[Path] = typer.Option(None, "--work-dir", help="Keep generated assets and finished segments here so a crashed run can be resumed by rerunning the same command"),
+    segment_cache: Optional[Path] = typer.Option(None, "--segment-cache", help="Directory of encoded segments reused across renders (default: segment_cache_dir setting, else no cache)"),
 ):
     """
     Generate an AI video from a prompt.
@@ -351,20 +364,232 @@ def generate(
     4. Compiles everything into a final video (FFmpeg).
     
     Use --interactive / -i to force interactive prompts even when defaults are configured.
+    Use --no-zoom for a static slideshow that skips per-frame rendering.
+    Use --render-profile draft for quick review renders.
+    Use --preview to get a low-resolution proxy for review before the full render finishes.
+    Use --audio-mode copy to mux the narration MP3 without re-encoding it.
+    Use --output-format fmp4 or hls to start playing or uploading before the render finishes,
+    or --output - to stream the video to stdout (e.g. `eleven-video generate -p "..." -o - | ffplay -`).
+    Use --scratch-dir to keep compile intermediates on fast local storage instead of /tmp.
+    Use --shared-dir to spread the segment encodes over `eleven-video render-worker` processes.
+    Use --transition 0.5 to crossfade between images instead of cutting.
+    Use --work-dir to make a long render resumable: rerun the same command after a crash.
+    Use --segment-cache to re-encode only the images that changed since an earlier render.
+    """
+    from eleven_video.processing.output_formats import is_stdout
+
+    previous_stderr = console.stderr
+    if output is not None and is_stdout(output):
+        # Messages go to stderr so stdout carries only the video stream
+        console.stderr = True
+    try:
+        _run_generation(
+            prompt, voice, image_model, gemini_model, duration, output, resolution,
+            interactive, no_zoom, render_profile, render_mode="both" if preview else "full",
+            audio_mode=audio_mode, output_format=output_format, scratch_dir=scratch_dir,
+            shared_dir=shared_dir, transition_seconds=transition, work_dir=work_dir,
+            segment_cache_dir=segment_cache
+        )
+    finally:
+        console.stderr = previous_stderr
+
+
+@app.command()
+def preview(
+    prompt: Optional[str] = typer.Option(None, "--prompt", "-p", help="Text prompt to generate video from"),
+    voice: Optional[str] = typer.Option(None, "--voice", "-v", help="Voice ID to use"),
+    image_model: Optional[str] = typer.Option(None, "--image-model", "-m", help="Image model ID to use"),
+    gemini_model: Optional[str] = typer.Option(None, "--gemini-model", help="Gemini text model ID to use (no short option due to -g conflict)"),
+    duration: Optional[int] = typer.Option(None, "--duration", "-d", help="Target video duration in minutes"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file path"),
+    resolution: Optional[str] = typer.Option(None, "--resolution", "-r", help="Resolution of the full render (1080p, 720p, portrait, square)"),
+    interactive: bool = typer.Option(False, "--interactive", "-i", help="Force all interactive prompts even with defaults configured"),
+    no_zoom: bool = typer.Option(False, "--no-zoom", help="Disable Ken Burns zoom (static slideshow)"),
+    scratch_dir: Optional[Path] = typer.Option(None, "--scratch-dir", help="Directory for compile intermediates (default: scratch_dir setting, else system temp)"),
+):
+    """
+    Generate a low-resolution proxy preview of an AI video.
+
+    Runs the same pipeline as `generate` but renders only a 360p, 12 fps
+    proxy with the cheapest encoder settings, so a video can be reviewed
+    (and rejected) without paying for a full-resolution encode.
     """
+    _run_generation(
+        prompt, voice, image_model, gemini_model, duration, output, resolution,
+        interactive, no_zoom, None, render_mode="preview", scratch_dir=scratch_dir
+    )
+
+
+@app.command("render-worker")
+def render_worker(
+    shared_dir: Path = typer.Option(..., "--shared-dir", help="Shared directory that `generate --shared-dir` publishes segment tasks to"),
+    idle_timeout: Optional[float] = typer.Option(None, "--idle-timeout", help="Exit after this many seconds without work (default: run until interrupted)"),
+    max_tasks: Optional[int] = typer.Option(None, "--max-tasks", help="Exit after rendering this many segments"),
+):
+    """
+    Render video segments for jobs published to a shared directory.
+
+    Run one or more workers on every machine that mounts the directory;
+    each claims segment tasks through lock files, encodes them with ffmpeg
+    and leaves the joining to the node that started the job.
+    """
+    from eleven_video.processing.distributed import RenderWorker
+
+    if not shared_dir.is_dir():
+        console.print(f"[red]Invalid shared directory: {shared_dir} is not an existing directory[/red]")
+        raise typer.Exit(1)
+
+    def report(task_path: Path, error: Optional[Exception]) -> None:
+        job = task_path.parent.parent.name
+        if error is None:
+            console.print(f"Rendered {task_path.stem} of {job}")
+        else:
+            console.print(f"[red]Failed {task_path.stem} of {job}:[/red] {error}")
+
+    console.print(f"[dim]Render worker waiting for segments in {shared_dir}[/dim]")
+    try:
+        count = RenderWorker(shared_dir, on_task=report).run(idle_timeout=idle_timeout, max_tasks=max_tasks)
+    except KeyboardInterrupt:
+        raise typer.Exit(130) from None
+    console.print(f"Render worker finished after {count} segments")
+
+
+@app.command()
+def calibrate(
+    render_profile: str = typer.Option("standard", "--render-profile", help="Encoder speed/quality profile to calibrate (draft, standard, archival)"),
+    show: bool = typer.Option(False, "--show", help="Print the cached calibration without measuring again"),
+):
+    """
+    Measure this machine's render speed so `generate` picks the fastest backend.
+
+    Probes the local ffmpeg build, times resampling, encoding and every
+    render path on synthetic input, and caches the results. Afterwards
+    renders with zoom use the backend and worker layout predicted to be
+    fastest for their resolution and image count instead of moviepy.
+    """
+    from eleven_video.exceptions.custom_errors import ValidationError, VideoProcessingError
+    from eleven_video.processing.calibration import Calibration, calibrate as run_calibration, default_calibration_path
+    from eleven_video.processing.profiles import get_render_profile
+
+    try:
+        profile_name = get_render_profile(render_profile).name
+    except ValidationError as e:
+        console.print(f"[red]Invalid render profile:[/red] {e}")
+        raise typer.Exit(1) from e
+
+    if show:
+        calibration = Calibration.load(profile_name)
+        if calibration is None:
+            console.print(f"[yellow]No current calibration for the {profile_name} profile.[/yellow]")
+            console.print("Run [bold]eleven-video calibrate[/bold] to measure this machine.")
+            raise typer.Exit(1)
+    else:
+        console.print(f"[dim]Calibrating the {profile_name} profile (takes a minute or two)...[/dim]")
+        try:
+            calibration = run_calibration(profile_name, on_result=lambda line: console.print(f"[dim]{line}[/dim]"))
+        except VideoProcessingError as e:
+            console.print(f"[red]Calibration failed:[/red] {e}")
+            raise typer.Exit(1) from e
+        calibration.save()
+
+    console.print(f"ffmpeg {calibration.ffmpeg_version}, {calibration.cores} cores")
+    console.print(f"H.264 encoders: {', '.join(calibration.h264_encoders) or 'none'}")
+    console.print(
+        f"Resample {calibration.resample_megapixels_per_second:.0f} MP/s, "
+        f"encode {calibration.encode_megapixels_per_second:.0f} MP/s"
+    )
+    table = Table(title="Render plans")
+    table.add_column("Resolution")
+    table.add_column("Images", justify="right")
+    table.add_column("Backend")
+    table.add_column("Workers x threads", justify="right")
+    for label, resolution in (("1080p", (1920, 1080)), ("720p", (1280, 720))):
+        for images in (10, 60):
+            # Five seconds per image
+            plan = calibration.plan(resolution, images, images * 5 * get_render_profile(profile_name).fps)
+            table.add_row(label, str(images), plan.backend, f"{plan.workers} x {plan.threads}")
+    console.print(table)
+    console.print(f"[dim]Calibration cache: {default_calibration_path(profile_name)}[/dim]")
+
+
+def _run_generation(
+    prompt: Optional[str],
+    voice: Optional[str],
+    image_model: Optional[str],
+    gemini_model: Optional[str],
+    duration: Optional[int],
+    output: Optional[Path],
+    resolution: Optional[str],
+    interactive: bool,
+    no_zoom: bool,
+    render_profile: Optional[str],
+    render_mode: str = "full",
+    audio_mode: str = "aac",
+    output_format: str = "mp4",
+    scratch_dir: Optional[Path] = None,
+    shared_dir: Optional[Path] = None,
+    transition_seconds: float = 0.0,
+    work_dir: Optional[Path] = None,
+    segment_cache_dir: Optional[Path] = None,
+) -> None:
+    """Shared implementation of the `generate` and `preview` commands."""
     from eleven_video.orchestrator import VideoPipeline
+    from eleven_video.processing.audio_mux import AUDIO_MODES
+    from eleven_video.processing.output_formats import OUTPUT_FORMATS, is_stdout
+    from eleven_video.processing.profiles import RENDER_PROFILES
 
     # VALIDATION (Story 3.6 - Task 6.2)
     if duration is not None and duration not in [3, 5, 10]:
         console.print(f"[red]Invalid duration: {duration}. Must be 3, 5, or 10 minutes.[/red]")
         raise typer.Exit(1)
 
+    if render_profile is not None and render_profile.lower().strip() not in RENDER_PROFILES:
+        console.print(f"[red]Invalid render profile: {render_profile}. Options: {', '.join(RENDER_PROFILES)}[/red]")
+        raise typer.Exit(1)
+
+    if audio_mode not in AUDIO_MODES:
+        console.print(f"[red]Invalid audio mode: {audio_mode}. Options: {', '.join(AUDIO_MODES)}[/red]")
+        raise typer.Exit(1)
+
+    if output_format not in OUTPUT_FORMATS:
+        console.print(f"[red]Invalid output format: {output_format}. Options: {', '.join(OUTPUT_FORMATS)}[/red]")
+        raise typer.Exit(1)
+
+    if scratch_dir is not None and scratch_dir.exists() and not scratch_dir.is_dir():
+        console.print(f"[red]Invalid scratch directory: {scratch_dir} is not a directory[/red]")
+        raise typer.Exit(1)
+
+    if shared_dir is not None and not shared_dir.is_dir():
+        console.print(f"[red]Invalid shared directory: {shared_dir} is not an existing directory[/red]")
+        raise typer.Exit(1)
+
+    if transition_seconds < 0:
+        console.print(f"[red]Invalid transition: {transition_seconds}. Must be 0 or more seconds.[/red]")
+        raise typer.Exit(1)
+
+    if work_dir is not None and work_dir.exists() and not work_dir.is_dir():
+        console.print(f"[red]Invalid work directory: {work_dir} is not a directory[/red]")
+        raise typer.Exit(1)
+
+    if segment_cache_dir is not None and segment_cache_dir.exists() and not segment_cache_dir.is_dir():
+        console.print(f"[red]Invalid segment cache: {segment_cache_dir} is not a directory[/red]")
+        raise typer.Exit(1)
+
+    to_stdout = output is not None and is_stdout(output)
+    if to_stdout:
+        # A pipe cannot be seeked back into, so stdout always gets fragmented MP4
+        if output_format == "hls":
+            console.print("[red]HLS output cannot be streamed to stdout. Use --output-format fmp4.[/red]")
+            raise typer.Exit(1)
+        output_format = "fmp4"
+
     # Story 3.7: Load config defaults for priority hierarchy
     config = load_config()
     default_voice = config.get("default_voice")
     default_image_model = config.get("default_image_model")
     default_gemini_model = config.get("default_gemini_model")
     default_duration_minutes = config.get("default_duration_minutes")
+    default_render_profile = config.get("default_render_profile")
     
     # Treat empty strings as None (not configured)
     if default_voice and not default_voice.strip():
@@ -406,6 +631,12 @@ def generate(
             duration = default_duration_minutes
             console.print(f"[dim]Using default duration: {duration} minutes[/dim]")
 
+    # Render profile priority (no interactive prompt - falls back to "standard")
+    if render_profile is None and isinstance(default_render_profile, str):
+        if default_render_profile.lower().strip() in RENDER_PROFILES:
+            render_profile = default_render_profile.lower().strip()
+            console.print(f"[dim]Using default render profile: {render_profile}[/dim]")
+
     # Interactive prompt if not provided
     if not prompt:
         console.print(Panel.fit(
@@ -436,7 +667,19 @@ def generate(
         settings = Settings(_profile_override=profile_override)
     except ConfigurationError as e:
         console.print(f"[red]Configuration Error:[/red] {e}")
-        raise typer.Exit(1)
+        raise typer.Exit(1) from e
+
+    # Scratch directory priority: CLI flag > scratch_dir setting (env/.env/config) > system temp
+    configured_scratch = getattr(settings, "scratch_dir", None)
+    if scratch_dir is None and isinstance(configured_scratch, str):
+        scratch_dir = Path(configured_scratch)
+        console.print(f"[dim]Using scratch directory: {scratch_dir}[/dim]")
+
+    # Segment cache priority: CLI flag > segment_cache_dir setting > no cache
+    configured_cache = getattr(settings, "segment_cache_dir", None)
+    if segment_cache_dir is None and isinstance(configured_cache, str):
+        segment_cache_dir = Path(configured_cache)
+        console.print(f"[dim]Using segment cache: {segment_cache_dir}[/dim]")
 
     # Interactive voice selection if still None and in TTY (Story 3.3)
     if voice is None:
@@ -516,7 +759,7 @@ def generate(
             console.print(f"[dim]Using resolution: {selected_resolution.value['label']}[/dim]")
         except KeyError:
             console.print(f"[red]Invalid resolution: {resolution}. Options: 1080p, 720p, portrait, square[/red]")
-            raise typer.Exit(1)
+            raise typer.Exit(1) from None
             
     # 2. Interactive Selection (if no flag)
     if selected_resolution is None:
@@ -533,7 +776,16 @@ def generate(
     # Initialize pipeline
     pipeline = VideoPipeline(
         settings=settings, 
-        output_dir=output.parent if output else None
+        output_dir=output.parent if output and not to_stdout else None,
+        render_profile=render_profile,
+        audio_mode=audio_mode,
+        output_format=output_format,
+        output_path=output if to_stdout else None,
+        scratch_dir=scratch_dir,
+        shared_dir=shared_dir,
+        transition_seconds=transition_seconds,
+        work_dir=work_dir,
+        segment_cache_dir=segment_cache_dir
     )
 
     try:
@@ -546,7 +798,9 @@ def generate(
             image_model_id=image_model,
             gemini_model_id=gemini_model,
             duration_minutes=duration,
-            resolution=selected_resolution
+            resolution=selected_resolution,
+            enable_zoom=not no_zoom,
+            render_mode=render_mode
         )
         
         # Success handled by pipeline.show_summary()
@@ -555,7 +809,7 @@ def generate(
         console.print(f"\n[red]❌ Generation Failed:[/red] {e}")
         # Debug info
         # console.print_exception()
-        raise typer.Exit(1)
+        raise typer.Exit(1) from e
 
 
 if __name__ == "__main__":
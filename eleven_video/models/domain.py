@@ -80,12 +80,23 @@ class Video:
         file_size_bytes: File size in bytes.
         codec: Video codec used (default h264).
         resolution: Video resolution as (width, height) tuple.
+        preview_path: Low-resolution proxy rendered alongside this video, if any.
+        encode_fps: Frames encoded per second of wall time during the render
+            (None if not measured).
+        poster_path: Poster image (JPEG at the video's resolution), if rendered.
+        sprite_path: Seek-bar thumbnail sprite sheet (JPEG), if rendered.
+        sprite_index_path: WebVTT file mapping time ranges to sprite tiles, if rendered.
     """
     file_path: Path
     duration_seconds: float
     file_size_bytes: int
     codec: str = "h264"
     resolution: tuple = (1920, 1080)
+    preview_path: Optional[Path] = None
+    encode_fps: Optional[float] = None
+    poster_path: Optional[Path] = None
+    sprite_path: Optional[Path] = None
+    sprite_index_path: Optional[Path] = None
 
 
 @dataclass
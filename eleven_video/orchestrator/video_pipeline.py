@@ -1,14 +1,23 @@
+import json
 import logging
+import os
+import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 import datetime
 
 from eleven_video.config import Settings
 from eleven_video.api.gemini import GeminiAdapter
 from eleven_video.api.elevenlabs import ElevenLabsAdapter
 from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from eleven_video.processing.calibration import Calibration
+from eleven_video.processing.cpu_governor import CpuGovernor
+from eleven_video.processing.profiles import get_render_profile
+from eleven_video.processing.segment_cache import SegmentCache
+from eleven_video.processing.output_formats import is_stdout, output_suffix
+from eleven_video.exceptions.custom_errors import ValidationError
 from eleven_video.ui.progress import VideoPipelineProgress
-from eleven_video.models.domain import Video, PipelineStage, Resolution
+from eleven_video.models.domain import Audio, Image, Video, PipelineStage, Resolution
 from eleven_video.monitoring.usage import UsageMonitor
 from eleven_video.ui.usage_panel import UsageDisplay
 
@@ -18,17 +27,45 @@ logger = logging.getLogger(__name__)
 class VideoPipeline:
     """Orchestrates end-to-end video generation."""
     
+    # "full": final render only, "preview": 360p/12fps proxy only,
+    # "both": proxy first (for early review), then the final render
+    RENDER_MODES = ("full", "preview", "both")
+    
     def __init__(
         self, 
         settings: Settings,
         output_dir: Optional[Path] = None,
         progress: Optional[VideoPipelineProgress] = None,
-        show_usage: bool = True
+        show_usage: bool = True,
+        render_profile: Optional[str] = None,
+        audio_mode: str = "aac",
+        output_format: str = "mp4",
+        output_path: Optional[Path] = None,
+        scratch_dir: Optional[Path] = None,
+        shared_dir: Optional[Path] = None,
+        transition_seconds: float = 0.0,
+        work_dir: Optional[Path] = None,
+        segment_cache_dir: Optional[Path] = None
     ):
         self.settings = settings
         self.output_dir = output_dir or Path(self.settings.project_root) / "output"
         self.progress = progress or VideoPipelineProgress()
         self.show_usage = show_usage
+        self.render_profile = render_profile
+        self.audio_mode = audio_mode
+        # "fmp4"/"hls" can be read while rendering; output_path "-" streams to stdout
+        self.output_format = output_format
+        self.output_path = output_path
+        # Compile intermediates go here instead of the system temp directory
+        self.scratch_dir = scratch_dir
+        # Segments are rendered by render workers sharing this directory
+        self.shared_dir = shared_dir
+        # Crossfade between scene images (0 = hard cuts)
+        self.transition_seconds = transition_seconds
+        # Resumable run: generated assets and compile progress survive a crash here
+        self.work_dir = Path(work_dir) if work_dir else None
+        # Encoded segments reused across renders (parallel backend only)
+        self.segment_cache_dir = segment_cache_dir
         # Lazy init placeholders
         self._gemini: Optional[GeminiAdapter] = None
         self._elevenlabs: Optional[ElevenLabsAdapter] = None
@@ -42,7 +79,18 @@ class VideoPipeline:
         if not self._elevenlabs:
             self._elevenlabs = ElevenLabsAdapter(settings=self.settings)
         if not self._compiler:
-            self._compiler = FFmpegVideoCompiler()
+            # Node-wide core budget shared with other renders on this machine
+            cpu_budget = getattr(self.settings, "cpu_budget", None)
+            self._compiler = FFmpegVideoCompiler(
+                profile=self.render_profile, audio_mode=self.audio_mode, output_format=self.output_format,
+                scratch_dir=self.scratch_dir,
+                shared_dir=self.shared_dir,
+                transition_seconds=self.transition_seconds,
+                segment_cache=SegmentCache(self.segment_cache_dir) if self.segment_cache_dir is not None else None,
+                cpu_governor=CpuGovernor(budget=cpu_budget) if isinstance(cpu_budget, int) else None,
+                # Measurements from `eleven-video calibrate`, if this machine has them
+                calibration=Calibration.load(get_render_profile(self.render_profile).name)
+            )
 
     def _init_usage_monitoring(self) -> None:
         """Initialize usage monitoring for the session (Story 5.1)."""
@@ -141,7 +189,7 @@ class VideoPipeline:
             
             logger.debug(f"Total Events: {summary.get('events_count', 0)}")
 
-    def generate(self, prompt: str, voice_id: Optional[str] = None, image_model_id: Optional[str] = None, gemini_model_id: Optional[str] = None, duration_minutes: Optional[int] = None, resolution: Optional[Resolution] = None) -> Video:
+    def generate(self, prompt: str, voice_id: Optional[str] = None, image_model_id: Optional[str] = None, gemini_model_id: Optional[str] = None, duration_minutes: Optional[int] = None, resolution: Optional[Resolution] = None, enable_zoom: bool = True, render_mode: str = "full") -> Video:
         """Run full pipeline.
         
         Args:
@@ -151,7 +199,14 @@ class VideoPipeline:
             gemini_model_id: Optional Gemini text model ID for script (Story 3.5).
             duration_minutes: Optional video duration in minutes (Story 3.6).
             resolution: Optional output resolution (Story 3.8).
+            enable_zoom: Whether to apply Ken Burns zoom; when False the static-slideshow
+                fast path is used.
+            render_mode: "full" (default), "preview" (low-resolution proxy only) or
+                "both" (proxy first, then the full render).
         """
+        if render_mode not in self.RENDER_MODES:
+            raise ValidationError(f"Unknown render mode '{render_mode}'. Options: {', '.join(self.RENDER_MODES)}")
+        
         self._init_adapters()
         # Initialize usage monitoring (Story 5.1)
         self._init_usage_monitoring()
@@ -164,37 +219,88 @@ class VideoPipeline:
         self._start_usage_display()
         
         try:
-            # 1. Script (Pass gemini_model_id - Story 3.5, duration - Story 3.6)
-            self.progress.start_stage(PipelineStage.PROCESSING_SCRIPT)
-            script = self._gemini.generate_script(prompt, progress_callback=callback, model_id=gemini_model_id, duration_minutes=duration_minutes)
-            self.progress.complete_stage(PipelineStage.PROCESSING_SCRIPT)
-            self._print_usage_update()  # Story 5.1 - show running usage
-
-            # 2. Audio (Pass voice_id)
-            self.progress.start_stage(PipelineStage.PROCESSING_AUDIO)
-            audio = self._elevenlabs.generate_speech(
-                text=script.content, 
-                voice_id=voice_id,
-                progress_callback=callback
-            )
-            self.progress.complete_stage(PipelineStage.PROCESSING_AUDIO)
-            self._print_usage_update()  # Story 5.1 - show running usage
+            request = {
+                "prompt": prompt, "voice_id": voice_id, "image_model_id": image_model_id,
+                "gemini_model_id": gemini_model_id, "duration_minutes": duration_minutes,
+            }
+            saved = self._load_assets(request) if self.work_dir is not None else None
+            if saved is not None:
+                # Rerun after a crash: skip the paid API calls and compile the same inputs
+                audio, images = saved
+                if callback:
+                    callback(f"Reusing narration and {len(images)} images saved in {self.work_dir}")
+            else:
+                # 1. Script (Pass gemini_model_id - Story 3.5, duration - Story 3.6)
+                self.progress.start_stage(PipelineStage.PROCESSING_SCRIPT)
+                script = self._gemini.generate_script(prompt, progress_callback=callback, model_id=gemini_model_id, duration_minutes=duration_minutes)
+                self.progress.complete_stage(PipelineStage.PROCESSING_SCRIPT)
+                self._print_usage_update()  # Story 5.1 - show running usage
 
-            # 3. Images (Pass image_model_id - Story 3.4, calculate count - Story 3.6)
-            self.progress.start_stage(PipelineStage.PROCESSING_IMAGES)
+                # 2. Audio (Pass voice_id)
+                self.progress.start_stage(PipelineStage.PROCESSING_AUDIO)
+                audio = self._elevenlabs.generate_speech(
+                    text=script.content, 
+                    voice_id=voice_id,
+                    progress_callback=callback
+                )
+                self.progress.complete_stage(PipelineStage.PROCESSING_AUDIO)
+                self._print_usage_update()  # Story 5.1 - show running usage
+
+                # 3. Images (Pass image_model_id - Story 3.4, calculate count - Story 3.6)
+                self.progress.start_stage(PipelineStage.PROCESSING_IMAGES)
             
-            # Calculate target image count (15 images/min default)
-            target_image_count = duration_minutes * 15 if duration_minutes else None
+                # Calculate target image count (15 images/min default)
+                target_image_count = duration_minutes * 15 if duration_minutes else None
             
-            images = self._gemini.generate_images(script, progress_callback=callback, model_id=image_model_id, target_image_count=target_image_count)
-            self.progress.complete_stage(PipelineStage.PROCESSING_IMAGES)
-            self._print_usage_update()  # Story 5.1 - show running usage
+                images = self._gemini.generate_images(script, progress_callback=callback, model_id=image_model_id, target_image_count=target_image_count)
+                self.progress.complete_stage(PipelineStage.PROCESSING_IMAGES)
+                self._print_usage_update()  # Story 5.1 - show running usage
+
+                if self.work_dir is not None:
+                    self._save_assets(request, audio, images)
 
             # 4. Compile
             self.progress.start_stage(PipelineStage.COMPILING_VIDEO)
-            output_path = self._generate_output_path()
-            video = self._compiler.compile_video(images, audio, output_path, progress_callback=callback, resolution=resolution)
+            output_path = self.output_path or self._generate_output_path()
+            preview = None
+            if render_mode in ("preview", "both"):
+                # Cheap proxy so the video can be reviewed before paying for the full encode
+                base_path = self._generate_output_path() if is_stdout(output_path) else output_path
+                preview_path = base_path.with_name(f"{base_path.stem}_preview.mp4")
+                preview = self._compiler.compile_preview(images, audio, preview_path, progress_callback=callback, resolution=resolution, enable_zoom=enable_zoom)
+                if callback:
+                    callback(f"Preview ready: {preview_path}")
+            
+            if render_mode == "preview":
+                video = preview
+                output_path = preview.file_path
+            else:
+                # Zoom off: still images go through the ffmpeg static-slideshow fast path.
+                # Progressive formats need a backend whose encoder writes the output directly.
+                if not enable_zoom:
+                    backend = "ffmpeg"
+                elif self.shared_dir is not None:
+                    backend = "distributed"
+                elif self.output_format != "mp4":
+                    backend = "pipe"
+                elif self.segment_cache_dir is not None:
+                    # Only per-image segments can be reused from the cache
+                    backend = "parallel"
+                elif self._compiler.calibration is not None:
+                    # Fastest backend per this machine's `eleven-video calibrate` results
+                    backend = "auto"
+                else:
+                    backend = "moviepy"
+                options = {}
+                if self.work_dir is not None:
+                    # The compile keeps its finished segments here to resume from
+                    options["work_dir"] = self.work_dir / "compile"
+                video = self._compiler.compile_video(images, audio, output_path, progress_callback=callback, resolution=resolution, enable_zoom=enable_zoom, backend=backend, **options)
+                if preview is not None:
+                    video.preview_path = preview.file_path
             self.progress.complete_stage(PipelineStage.COMPILING_VIDEO)
+            if self.work_dir is not None:
+                shutil.rmtree(self.work_dir, ignore_errors=True)
 
             # Stop usage display and log summary (Story 5.1 - AC6)
             self._stop_usage_display()
@@ -208,8 +314,50 @@ class VideoPipeline:
             self.progress.fail_stage(self.progress.current_stage, str(e))
             raise
 
+    def _load_assets(self, request: Dict[str, Any]) -> Optional[Tuple[Audio, List[Image]]]:
+        """Narration and images saved in the work directory by an earlier run of the same request."""
+        assets = self.work_dir / "assets"
+        try:
+            manifest = json.loads((assets / "manifest.json").read_text(encoding="utf-8"))
+            if manifest.get("request") != request:
+                return None
+            audio = Audio(
+                data=(assets / manifest["audio"]["file"]).read_bytes(),
+                duration_seconds=manifest["audio"].get("duration_seconds")
+            )
+            images = [
+                Image(data=(assets / entry["file"]).read_bytes(), mime_type=entry["mime_type"])
+                for entry in manifest["images"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return audio, images
+
+    def _save_assets(self, request: Dict[str, Any], audio: Audio, images: List[Image]) -> None:
+        """Keep the generated narration and images so a rerun after a crash can reuse them.
+        
+        The manifest is written last (atomically), so a crash while saving
+        leaves no half-saved assets that look complete.
+        """
+        assets = self.work_dir / "assets"
+        assets.mkdir(parents=True, exist_ok=True)
+        (assets / "audio.mp3").write_bytes(audio.data)
+        entries = []
+        for i, image in enumerate(images):
+            name = f"image_{i:03d}.{'png' if 'png' in image.mime_type else 'jpg'}"
+            (assets / name).write_bytes(image.data)
+            entries.append({"file": name, "mime_type": image.mime_type})
+        manifest = {
+            "request": request,
+            "audio": {"file": "audio.mp3", "duration_seconds": audio.duration_seconds},
+            "images": entries,
+        }
+        tmp_path = assets / "manifest.json.tmp"
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp_path, assets / "manifest.json")
+
     def _generate_output_path(self) -> Path:
         """Generate a unique output path based on timestamp."""
         import datetime
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        return self.output_dir / f"video_{timestamp}.mp4"
+        return self.output_dir / f"video_{timestamp}{output_suffix(self.output_format)}"
@@ -2,7 +2,73 @@
 
 Exports:
     FFmpegVideoCompiler: Video compilation from images and audio.
+    FilterGraphRenderer: Single-process ffmpeg filter-graph renderer.
+    ParallelSegmentRenderer: Per-segment parallel encoder with stream-copy join.
+    SegmentCache: Content-addressed LRU cache of encoded segments.
+    FrameSink: ffmpeg subprocess encoding raw frames from stdin.
+    PipeRenderer: Threaded frame producer streaming into a FrameSink.
+    FrameRing: Shared-memory frame slots between producer processes and the encoder.
+    MemoryFile: In-memory file other processes open by path (compile inputs never hit disk).
+    StaticSlideshowRenderer: Concat-demuxer fast path for videos without zoom.
+    SourceImageStore: Decode-once, memory-mapped pre-scaled source images.
+    StreamingCompositor: Bounded-memory lazy timeline for the moviepy backend.
+    AudioTranscode: Background one-time audio transcode for remuxing.
+    EncodeProgress: Throttled frames/fps/ETA reporting for one render.
+    CompileJournal: Work directory and state file of a resumable compile.
+    ScratchSpace: Scratch root for intermediates with space reservation.
+    CpuGovernor: Node-wide CPU budget leased to concurrent renders.
+    Calibration: Measured render speed of this machine, used to plan backend="auto".
+    DistributedSegmentRenderer: Segment encodes spread over render workers via a shared directory.
+    RenderWorker: Claims and renders segment tasks from a shared directory.
+    ThumbnailRenderer: Poster frame and seek-bar sprite from the source images.
+    OUTPUT_FORMATS: Output containers (mp4, progressive fmp4 and hls).
+    RenderProfile: Named encoder speed/quality settings (draft, standard, archival).
 """
 from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from eleven_video.processing.ffmpeg_backend import FilterGraphRenderer
+from eleven_video.processing.segments import ParallelSegmentRenderer
+from eleven_video.processing.segment_cache import SegmentCache
+from eleven_video.processing.frame_sink import FrameSink, PipeRenderer
+from eleven_video.processing.frame_ring import FrameRing
+from eleven_video.processing.memory_files import MemoryFile
+from eleven_video.processing.slideshow import StaticSlideshowRenderer
+from eleven_video.processing.image_store import SourceImageStore
+from eleven_video.processing.compositor import StreamingCompositor
+from eleven_video.processing.audio_mux import AUDIO_MODES, AudioTranscode
+from eleven_video.processing.encode_progress import EncodeProgress
+from eleven_video.processing.compile_journal import CompileJournal
+from eleven_video.processing.scratch import ScratchSpace
+from eleven_video.processing.cpu_governor import CpuGovernor
+from eleven_video.processing.calibration import Calibration
+from eleven_video.processing.distributed import DistributedSegmentRenderer, RenderWorker
+from eleven_video.processing.thumbnails import ThumbnailRenderer
+from eleven_video.processing.output_formats import OUTPUT_FORMATS
+from eleven_video.processing.profiles import RENDER_PROFILES, RenderProfile, get_render_profile
 
-__all__ = ["FFmpegVideoCompiler"]
+__all__ = [
+    "FFmpegVideoCompiler",
+    "FilterGraphRenderer",
+    "ParallelSegmentRenderer",
+    "SegmentCache",
+    "FrameSink",
+    "PipeRenderer",
+    "FrameRing",
+    "MemoryFile",
+    "StaticSlideshowRenderer",
+    "SourceImageStore",
+    "StreamingCompositor",
+    "AudioTranscode",
+    "AUDIO_MODES",
+    "EncodeProgress",
+    "CompileJournal",
+    "ScratchSpace",
+    "CpuGovernor",
+    "Calibration",
+    "DistributedSegmentRenderer",
+    "RenderWorker",
+    "ThumbnailRenderer",
+    "OUTPUT_FORMATS",
+    "RenderProfile",
+    "RENDER_PROFILES",
+    "get_render_profile",
+]
@@ -0,0 +1,109 @@
+"""Narration audio handling outside the video render.
+
+By default every backend decodes the ElevenLabs MP3 and encodes AAC as part
+of the render. Two alternatives keep audio work off the critical path:
+
+- ``"copy"``: the MP3 stream is muxed into the MP4 unchanged (no decode, no
+  second lossy generation).
+- ``"transcode"``: the MP3 is transcoded to AAC once, in its own ffmpeg
+  process running while the video renders; the result is then remuxed
+  with the video by stream copy.
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(audio_mode=...)
+- eleven_video/processing/ffmpeg_backend.py: run_ffmpeg, get_ffmpeg_binary
+"""
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.processing.ffmpeg_backend import get_ffmpeg_binary, run_ffmpeg
+from eleven_video.processing.output_formats import muxer_args
+
+# "aac": encode AAC inside the render (previous behaviour)
+AUDIO_MODES = ("aac", "copy", "transcode")
+
+
+def mux_audio(
+    video_path: Path,
+    audio_path: Optional[Path],
+    output_path: Path,
+    output_format: str = "mp4",
+) -> None:
+    """Combine the video stream of one file with the audio of another, both by stream copy.
+
+    With no ``audio_path`` the video file (and its own audio) is remuxed
+    unchanged into ``output_format``.
+
+    Raises:
+        VideoProcessingError: If ffmpeg fails.
+    """
+    if audio_path is None:
+        inputs = ["-i", str(video_path)]
+    else:
+        inputs = ["-i", str(video_path), "-i", str(audio_path), "-map", "0:v", "-map", "1:a"]
+    run_ffmpeg([
+        *inputs,
+        "-c", "copy",
+        *muxer_args(output_format, output_path, keyframes=False),
+    ])
+
+
+class AudioTranscode:
+    """One-time audio transcode running in a background ffmpeg process.
+
+    The process starts on construction so it overlaps with the video render;
+    ``wait()`` blocks until the encoded file is ready.
+
+    Example:
+        with AudioTranscode("narration.mp3", Path("narration.m4a")) as transcode:
+            render_video_only(...)
+            mux_audio(video, transcode.wait(), output)
+    """
+
+    def __init__(self, audio_path: str, output_path: Path, audio_codec: str = "aac"):
+        self.output_path = Path(output_path)
+        cmd = [
+            get_ffmpeg_binary(), "-y", "-hide_banner", "-loglevel", "error",
+            "-i", str(audio_path),
+            "-vn",
+            "-c:a", audio_codec,
+            str(self.output_path),
+        ]
+        try:
+            self._process: Optional[subprocess.Popen] = subprocess.Popen(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
+        except FileNotFoundError as e:
+            raise VideoProcessingError(
+                "FFmpeg required but not found. Install FFmpeg and add to PATH."
+            ) from e
+
+    def wait(self) -> Path:
+        """Wait for the transcode to finish.
+
+        Returns:
+            Path of the encoded audio file.
+
+        Raises:
+            VideoProcessingError: If ffmpeg failed.
+        """
+        _, stderr = self._process.communicate()
+        if self._process.returncode != 0:
+            text = stderr.decode("utf-8", errors="replace").strip()
+            detail = text.splitlines()[-1] if text else f"exit code {self._process.returncode}"
+            raise VideoProcessingError(f"Audio transcode failed: {detail}")
+        return self.output_path
+
+    def close(self) -> None:
+        """Stop the process if it is still running (render failed or was abandoned)."""
+        if self._process.poll() is None:
+            self._process.kill()
+            self._process.communicate()
+
+    def __enter__(self) -> "AudioTranscode":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,392 @@
+"""Self-calibrating render planner (`eleven-video calibrate`).
+
+Which render path is fastest depends on the machine: the number of cores,
+the ffmpeg build and the speed of Pillow's resampling relative to x264 all
+shift the balance between moviepy's frame loop, the single ffmpeg filter
+graph, per-segment parallel encodes and the raw-frame pipe. Calibration
+measures it once instead of guessing:
+
+1. Probe the local ffmpeg build for its version and video encoders.
+2. Measure resample throughput (ZoomRenderer frames) and encode throughput
+   (raw frames through x264 at the render profile's settings), then time
+   every render path, and every worker layout of the parallel path, on
+   synthetic input. Each path is timed on a few long segments and on many
+   short ones with the same number of frames, which separates the cost per
+   frame pixel from the fixed cost per image.
+3. Cache the results on disk, one file per render profile. A cache is
+   ignored once the ffmpeg build or the core count changes.
+
+``Calibration.plan`` turns the timings into a render plan for a given
+resolution, image count and video length: the backend with the lowest
+estimated time, and for the parallel path how many segments to encode at
+once (each with ``cores // workers`` encoder threads). FFmpegVideoCompiler
+uses it for ``backend="auto"``.
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(calibration=...), backend="auto"
+- eleven_video/orchestrator/video_pipeline.py: loads the cached calibration
+- eleven_video/main.py: calibrate command
+"""
+import io
+import json
+import os
+import re
+import subprocess
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import platformdirs
+from PIL import Image as PILImage
+
+from eleven_video.config.persistence import APP_NAME
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.models.domain import Audio, Image, Resolution
+from eleven_video.processing.cpu_governor import CpuGovernor
+from eleven_video.processing.ffmpeg_backend import FilterGraphRenderer, get_ffmpeg_binary
+from eleven_video.processing.frame_sink import FrameSink
+from eleven_video.processing.profiles import RenderProfile, get_render_profile
+from eleven_video.processing.zoom import ZoomRenderer
+
+# Bump when the measurements or the cost model change
+CALIBRATION_VERSION = "1"
+
+# Render paths that can be timed on one machine ("distributed" needs render workers)
+CALIBRATED_BACKENDS = ("moviepy", "ffmpeg", "parallel", "pipe")
+
+CALIBRATION_RESOLUTION = Resolution.HD_720P
+
+# Both timed runs cover the same seconds of video: few long segments, many short ones
+CALIBRATION_RUNS = ((2, 3.0), (6, 1.0))
+
+# Frames rendered and encoded by the resample and encode measurements
+THROUGHPUT_FRAMES = 48
+
+# H.264 encoders looked for in the probe (software and hardware)
+H264_ENCODERS = ("libx264", "h264_nvenc", "h264_qsv", "h264_vaapi", "h264_videotoolbox", "h264_amf")
+
+
+def default_calibration_path(profile: str = "standard") -> Path:
+    """OS-standard cache file of one render profile's calibration."""
+    return Path(platformdirs.user_cache_dir(APP_NAME)) / f"calibration-{profile}.json"
+
+
+def probe_ffmpeg() -> Tuple[str, List[str]]:
+    """Version string and video encoder names of the local ffmpeg build.
+
+    Raises:
+        VideoProcessingError: If ffmpeg cannot be found or run.
+    """
+    binary = get_ffmpeg_binary()
+    try:
+        version = subprocess.run(
+            [binary, "-hide_banner", "-version"], capture_output=True, text=True, check=True
+        ).stdout
+        listing = subprocess.run(
+            [binary, "-hide_banner", "-encoders"], capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise VideoProcessingError(f"Cannot probe ffmpeg: {e}") from e
+    match = re.search(r"ffmpeg version (\S+)", version)
+    # After the legend, encoder lines look like " V....D libx264   libx264 H.264 / AVC ..."
+    encoders = re.findall(r"^\s*V\S{5}\s+(\S+)", listing.split("------", 1)[-1], re.MULTILINE)
+    return (match.group(1) if match else "unknown"), encoders
+
+
+@dataclass(frozen=True)
+class BackendTiming:
+    """Cost model of one render path (and worker layout) fitted from two timed runs.
+
+    Attributes:
+        backend: Render backend name.
+        workers: Segments encoded at once (parallel backend), otherwise 1.
+        seconds_per_megapixel: Seconds per frame megapixel (output frames x pixels).
+        seconds_per_image: Fixed seconds per image (decode, setup, segment join).
+    """
+
+    backend: str
+    workers: int
+    seconds_per_megapixel: float
+    seconds_per_image: float
+
+    def estimate(self, resolution: Tuple[int, int], image_count: int, frame_count: int) -> float:
+        """Estimated render seconds."""
+        w, h = resolution
+        return frame_count * w * h / 1e6 * self.seconds_per_megapixel + image_count * self.seconds_per_image
+
+
+@dataclass(frozen=True)
+class RenderPlan:
+    """Backend and worker layout chosen for one render.
+
+    Attributes:
+        backend: Render backend name.
+        workers: Segments encoded at once (parallel backend), otherwise 1.
+        threads: Encoder threads per worker.
+        estimated_seconds: Render time predicted from the calibration.
+    """
+
+    backend: str
+    workers: int
+    threads: int
+    estimated_seconds: float
+
+
+@dataclass
+class Calibration:
+    """Measured capabilities of this machine for one render profile.
+
+    Example:
+        calibration = Calibration.load("standard") or calibrate("standard")
+        plan = calibration.plan((1920, 1080), image_count=30, frame_count=4320)
+    """
+
+    profile: str
+    ffmpeg_version: str
+    encoders: List[str]
+    cores: int
+    resample_megapixels_per_second: float
+    encode_megapixels_per_second: float
+    timings: List[BackendTiming]
+    created: float = field(default_factory=time.time)
+    version: str = CALIBRATION_VERSION
+
+    @property
+    def h264_encoders(self) -> List[str]:
+        return [name for name in H264_ENCODERS if name in self.encoders]
+
+    def plan(
+        self, resolution: Tuple[int, int], image_count: int, frame_count: int, cores: Optional[int] = None
+    ) -> RenderPlan:
+        """Fastest measured backend and layout for a render.
+
+        Args:
+            resolution: Output (width, height).
+            image_count: Number of images (segments).
+            frame_count: Total output frames.
+            cores: Cores the render may use (default: the calibrated count);
+                parallel layouts with more workers than cores are skipped.
+        """
+        cores = cores or self.cores
+        candidates = [t for t in self.timings if t.workers <= max(cores, 1)] or self.timings
+        best = min(candidates, key=lambda t: t.estimate(resolution, image_count, frame_count))
+        return RenderPlan(
+            backend=best.backend,
+            workers=best.workers,
+            threads=max(cores // best.workers, 1),
+            estimated_seconds=best.estimate(resolution, image_count, frame_count),
+        )
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Calibration":
+        data = dict(data)
+        data["timings"] = [BackendTiming(**t) for t in data["timings"]]
+        return cls(**data)
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        """Write the calibration to its cache file."""
+        path = Path(path) if path else default_calibration_path(self.profile)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, profile: str = "standard", path: Optional[Path] = None) -> Optional["Calibration"]:
+        """Cached calibration of a profile, or None if there is none or it is stale.
+
+        A cache is stale when it was written by another calibration version,
+        with another ffmpeg build or on a machine with a different core count.
+        """
+        path = Path(path) if path else default_calibration_path(profile)
+        try:
+            calibration = cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        if calibration.version != CALIBRATION_VERSION or calibration.cores != (os.cpu_count() or 1):
+            return None
+        try:
+            ffmpeg_version, _ = probe_ffmpeg()
+        except VideoProcessingError:
+            return None
+        return calibration if ffmpeg_version == calibration.ffmpeg_version else None
+
+
+def synthetic_image(index: int, size: Tuple[int, int] = (1024, 1024)) -> Image:
+    """Textured PNG image (noise over a gradient) that costs what a real image costs to scale and encode."""
+    w, h = size
+    rng = np.random.default_rng(index)
+    gradient = np.linspace(0, 255, w, dtype=np.float32)[None, :, None]
+    pixels = np.clip(gradient + rng.normal(0, 12, (h, w, 3)), 0, 255).astype(np.uint8)
+    png = io.BytesIO()
+    PILImage.fromarray(pixels).save(png, "PNG", compress_level=1)
+    return Image(data=png.getvalue(), mime_type="image/png")
+
+
+def silent_audio(duration_seconds: float) -> Audio:
+    """MP3 of silence, encoded with the local ffmpeg.
+
+    Raises:
+        VideoProcessingError: If ffmpeg cannot encode it.
+    """
+    try:
+        result = subprocess.run(
+            [get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error",
+             "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono", "-t", str(duration_seconds),
+             "-c:a", "libmp3lame", "-b:a", "64k", "-f", "mp3", "pipe:1"],
+            capture_output=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise VideoProcessingError(f"Cannot create calibration audio: {e}") from e
+    return Audio(data=result.stdout, duration_seconds=duration_seconds)
+
+
+def _zoom_renderer(profile: RenderProfile, resolution: Tuple[int, int]) -> ZoomRenderer:
+    source = PILImage.open(io.BytesIO(synthetic_image(0).data)).convert("RGB")
+    return ZoomRenderer(
+        source, resolution, THROUGHPUT_FRAMES / profile.fps, fps=profile.fps, frame_resample=profile.pil_resample
+    )
+
+
+def measure_resample(profile: RenderProfile, resolution: Tuple[int, int]) -> float:
+    """Megapixels per second of Ken Burns frames resampled in Python (one thread)."""
+    renderer = _zoom_renderer(profile, resolution)
+    start = time.perf_counter()
+    renderer.render_frames(range(renderer.frame_count))
+    return _megapixels(resolution, renderer.frame_count) / (time.perf_counter() - start)
+
+
+def measure_encode(profile: RenderProfile, resolution: Tuple[int, int], work_dir: Path) -> float:
+    """Megapixels per second of Ken Burns frames encoded by x264 with the profile's settings."""
+    renderer = _zoom_renderer(profile, resolution)
+    frames = renderer.render_frames(range(renderer.frame_count))
+    encoder = FilterGraphRenderer(fps=profile.fps, encoder_options=profile.x264_args())
+    start = time.perf_counter()
+    with FrameSink(work_dir / "encode.mp4", resolution, fps=profile.fps,
+                   encoder_args=encoder.encoder_args()) as sink:
+        for frame in frames:
+            sink.write(sink.pack(frame))
+    return _megapixels(resolution, len(frames)) / (time.perf_counter() - start)
+
+
+def worker_layouts(cores: int) -> List[int]:
+    """Parallel worker counts worth timing: one, half the cores and all of them."""
+    return sorted({1, max(cores // 2, 1), cores})
+
+
+def calibrate(
+    profile: str = "standard",
+    backends: Sequence[str] = CALIBRATED_BACKENDS,
+    resolution: Resolution = CALIBRATION_RESOLUTION,
+    runs: Sequence[Tuple[int, float]] = CALIBRATION_RUNS,
+    on_result: Optional[Callable[[str], None]] = None,
+) -> Calibration:
+    """Probe ffmpeg and measure every render path on this machine.
+
+    Args:
+        profile: Render profile the measurements use.
+        backends: Render paths to time.
+        resolution: Resolution of the timed renders.
+        runs: Two (image count, seconds per image) pairs covering the same length.
+        on_result: Called with a line of text after each measurement.
+
+    Returns:
+        The calibration (not yet saved).
+
+    Raises:
+        VideoProcessingError: If ffmpeg is missing or no render path works.
+    """
+    from eleven_video.processing.video_handler import FFmpegVideoCompiler
+
+    report = on_result or (lambda message: None)
+    render_profile = get_render_profile(profile)
+    ffmpeg_version, encoders = probe_ffmpeg()
+    report(f"ffmpeg {ffmpeg_version}")
+    cores = os.cpu_count() or 1
+    target = (resolution.value["width"], resolution.value["height"])
+
+    with tempfile.TemporaryDirectory(prefix="eleven_video_calibrate_") as temp:
+        temp_dir = Path(temp)
+        resample = measure_resample(render_profile, target)
+        report(f"resample: {resample:.1f} megapixels/s")
+        encode = measure_encode(render_profile, target, temp_dir)
+        report(f"encode: {encode:.1f} megapixels/s")
+
+        inputs = [
+            ([synthetic_image(i) for i in range(count)], silent_audio(count * seconds))
+            for count, seconds in runs
+        ]
+        governor = CpuGovernor(root=temp_dir)
+        timings = []
+        for backend in backends:
+            for workers in worker_layouts(cores) if backend == "parallel" else [1]:
+                compiler = FFmpegVideoCompiler(
+                    profile=render_profile, thumbnails=False, cpu_governor=governor,
+                    segment_workers=workers if backend == "parallel" else None
+                )
+                seconds = [
+                    _time_render(compiler, images, audio, temp_dir / f"{backend}.mp4", resolution, backend)
+                    for images, audio in inputs
+                ]
+                if None in seconds:
+                    report(f"{backend}: failed, skipped")
+                    continue
+                timing = _fit(backend, workers, seconds, runs, target, render_profile.fps)
+                timings.append(timing)
+                layout = f" x{workers}" if backend == "parallel" else ""
+                report(f"{backend}{layout}: {_megapixels(target, 1) / timing.seconds_per_megapixel:.1f} frames/s")
+
+    if not timings:
+        raise VideoProcessingError("Calibration failed: no render path produced a video")
+    return Calibration(
+        profile=render_profile.name,
+        ffmpeg_version=ffmpeg_version,
+        encoders=encoders,
+        cores=cores,
+        resample_megapixels_per_second=resample,
+        encode_megapixels_per_second=encode,
+        timings=timings,
+    )
+
+
+def _time_render(compiler, images, audio, output_path, resolution, backend) -> Optional[float]:
+    """Wall seconds of one compile, or None if the backend failed (and fell back to moviepy)."""
+    messages: List[str] = []
+    start = time.perf_counter()
+    try:
+        compiler.compile_video(
+            images, audio, output_path, progress_callback=messages.append, resolution=resolution, backend=backend
+        )
+    except VideoProcessingError:
+        return None
+    elapsed = time.perf_counter() - start
+    if any(message.startswith(f"Warning: {backend} backend failed") for message in messages):
+        return None
+    return elapsed
+
+
+def _fit(
+    backend: str,
+    workers: int,
+    seconds: Sequence[float],
+    runs: Sequence[Tuple[int, float]],
+    resolution: Tuple[int, int],
+    fps: int,
+) -> BackendTiming:
+    """Split two timings of the same length into a per-image and a per-pixel cost."""
+    (few, few_seconds), (many, _) = runs
+    per_image = max((seconds[1] - seconds[0]) / (many - few), 0.0) if many != few else 0.0
+    frames = int(round(few * few_seconds * fps))
+    per_megapixel = max(seconds[0] - few * per_image, 1e-6) / _megapixels(resolution, frames)
+    return BackendTiming(backend, workers, per_megapixel, per_image)
+
+
+def _megapixels(resolution: Tuple[int, int], frames: int) -> float:
+    w, h = resolution
+    return w * h * frames / 1e6
+
@@ -0,0 +1,145 @@
+"""Crash-safe state of a resumable compile.
+
+A compile given a named work directory keeps its intermediates there instead
+of in a throwaway temp directory, plus a small ``state.json`` recording the
+job it belongs to and every intermediate file that was completely written.
+If the process dies part-way (OOM, preempted node, killed worker), running
+the same job with the same work directory skips the completed segments and
+continues with the rest. The directory is removed once the compile succeeds.
+
+The state file is replaced atomically after each completed file, so it is
+never half-written; a file that was still being encoded when the process
+died is not listed and is encoded again. Each file can be recorded with a
+signature of what it holds (e.g. a segment's frame count and filter chain);
+a resumed run only reuses it if it still expects the same content.
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler.compile_video(work_dir=...)
+- eleven_video/processing/segments.py: ParallelSegmentRenderer (journal=...)
+"""
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Union
+
+from eleven_video.exceptions.custom_errors import ValidationError
+
+STATE_FILE = "state.json"
+
+# Bump when the layout of the work directory changes
+JOURNAL_VERSION = 2
+
+
+def job_key(blobs: Iterable[bytes], settings: Sequence[object]) -> str:
+    """Identify a compile by its input bytes and every setting that shapes the output."""
+    digest = hashlib.sha256(f"v{JOURNAL_VERSION}".encode())
+    for blob in blobs:
+        digest.update(hashlib.sha256(blob).digest())
+    digest.update(repr(tuple(settings)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CompileJournal:
+    """Work directory plus the list of intermediates already completed in it.
+
+    Example:
+        journal = CompileJournal(Path("renders/job-42"))
+        journal.begin(job_key([...], settings))
+        if not journal.is_complete(segment_path):
+            encode(segment_path)
+            journal.mark_complete(segment_path)
+        ...
+        journal.finish()
+    """
+
+    def __init__(self, work_dir: Path):
+        self.work_dir = Path(work_dir)
+        self.state_path = self.work_dir / STATE_FILE
+        self.job = None
+        self._completed = set()
+        self._signatures = {}
+
+    def begin(self, key: str) -> int:
+        """Open the work directory for job ``key``.
+
+        Progress recorded for the same job is kept; a directory left by a
+        different job (or an older layout) is cleared first.
+
+        Returns:
+            Number of completed intermediates carried over from an earlier run.
+
+        Raises:
+            ValidationError: If the directory has other content and no compile state,
+                so it is not clobbered by mistake.
+        """
+        state = self._load()
+        if state is None:
+            if self.work_dir.exists() and any(self.work_dir.iterdir()):
+                raise ValidationError(
+                    f"Work directory {self.work_dir} is not empty and holds no compile state"
+                )
+        elif state.get("version") != JOURNAL_VERSION or state.get("job") != key:
+            self._clear()
+            state = None
+
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.job = key
+        self._completed = set(state.get("completed", [])) if state else set()
+        self._signatures = dict(state.get("signatures", {})) if state else {}
+        self._save()
+        return len(self._completed)
+
+    def is_complete(self, path: Union[str, Path], signature: Optional[str] = None) -> bool:
+        """Whether ``path`` was completely written by this job (and still exists).
+
+        With ``signature``, it must also have been recorded with the same
+        signature; a file written for different content is encoded again.
+        """
+        relative = self._relative(path)
+        if relative not in self._completed or not Path(path).exists():
+            return False
+        return signature is None or self._signatures.get(relative) == signature
+
+    def mark_complete(self, path: Union[str, Path], signature: Optional[str] = None) -> None:
+        """Record that ``path`` is completely written (holding ``signature``, if given)."""
+        relative = self._relative(path)
+        self._completed.add(relative)
+        if signature is None:
+            self._signatures.pop(relative, None)
+        else:
+            self._signatures[relative] = signature
+        self._save()
+
+    def finish(self) -> None:
+        """Remove the work directory after a successful compile."""
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _relative(self, path: Union[str, Path]) -> str:
+        return Path(path).resolve().relative_to(self.work_dir.resolve()).as_posix()
+
+    def _load(self):
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return state if isinstance(state, dict) else None
+
+    def _save(self) -> None:
+        state = {
+            "version": JOURNAL_VERSION,
+            "job": self.job,
+            "completed": sorted(self._completed),
+            "signatures": dict(sorted(self._signatures.items())),
+        }
+        tmp_path = self.state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.state_path)
+
+    def _clear(self) -> None:
+        for child in self.work_dir.iterdir():
+            if child.is_dir():
+                shutil.rmtree(child)
+            else:
+                child.unlink()
@@ -0,0 +1,124 @@
+"""Bounded-memory streaming compositor for the moviepy backend.
+
+``concatenate_videoclips`` needs every clip up front and keeps all of them
+(and whatever pixels they hold) alive until ``write_videofile`` finishes, so
+memory grows with the number of images. StreamingCompositor instead walks
+the timeline lazily: it materializes the segment containing the requested
+time, prepares the next one in a background thread, and closes everything
+behind it.
+
+Memory ceiling: at most ``1 + lookahead`` segment clips exist at any time
+(two by default), plus the frame being encoded. For the moviepy backend a
+segment is a view into the SourceImageStore, so the ceiling is two images at
+the oversampled base size (about 15 MB at 1080p) regardless of video length.
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler._render_with_moviepy
+- eleven_video/processing/image_store.py: SourceImageStore (segment pixels)
+"""
+import bisect
+import itertools
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from moviepy import VideoClip
+
+
+def _close_segment(future: Future) -> None:
+    if future.exception() is None:
+        close = getattr(future.result(), "close", None)
+        if close:
+            close()
+
+
+class StreamingCompositor:
+    """Timeline of equal-size segments built on demand.
+
+    Args:
+        segment_factory: Builds the clip for segment ``i`` (anything with
+            ``get_frame(t)``; ``close()`` is called when it is dropped).
+        durations: Duration of each segment in seconds.
+        size: Output (width, height) shared by every segment.
+        lookahead: Segments to prepare ahead of the current one.
+        on_segment: Called with the segment index when playback enters it.
+
+    Example:
+        compositor = StreamingCompositor(make_clip, [4.0] * 150, (1920, 1080))
+        compositor.to_clip().write_videofile("out.mp4", fps=24)
+    """
+
+    def __init__(
+        self,
+        segment_factory: Callable[[int], Any],
+        durations: Sequence[float],
+        size: Tuple[int, int],
+        lookahead: int = 1,
+        on_segment: Optional[Callable[[int], None]] = None,
+    ):
+        if not durations:
+            raise ValueError("StreamingCompositor needs at least one segment")
+        self.segment_factory = segment_factory
+        self.durations = list(durations)
+        self.size = tuple(size)
+        self.lookahead = lookahead
+        self.on_segment = on_segment
+        self.starts: List[float] = [0.0] + list(itertools.accumulate(self.durations))[:-1]
+        self.duration = sum(self.durations)
+        self._segments: Dict[int, Future] = {}
+        self._current: Optional[int] = None
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="compositor")
+
+    @property
+    def live_segments(self) -> List[int]:
+        """Indices of the segments currently materialized or being prepared."""
+        return sorted(self._segments)
+
+    def segment_index(self, t: float) -> int:
+        """Index of the segment that contains time ``t``."""
+        index = bisect.bisect_right(self.starts, t) - 1
+        return min(max(index, 0), len(self.durations) - 1)
+
+    def get_frame(self, t: float) -> np.ndarray:
+        """Frame at timeline time ``t`` (seconds)."""
+        index = self.segment_index(t)
+        if index != self._current:
+            self._enter(index)
+        return self._segments[index].result().get_frame(t - self.starts[index])
+
+    def _enter(self, index: int) -> None:
+        """Make ``index`` current: drop segments outside the window and prefetch ahead."""
+        window = set(range(index, min(index + self.lookahead, len(self.durations) - 1) + 1))
+        for stale in [i for i in self._segments if i not in window]:
+            self._drop(stale)
+        if index not in self._segments:
+            # Build the current segment on the render thread; it is needed now
+            future: Future = Future()
+            future.set_result(self.segment_factory(index))
+            self._segments[index] = future
+        for ahead in sorted(window - {index}):
+            if ahead not in self._segments:
+                self._segments[ahead] = self._pool.submit(self.segment_factory, ahead)
+        self._current = index
+        if self.on_segment:
+            self.on_segment(index)
+
+    def _drop(self, index: int) -> None:
+        future = self._segments.pop(index)
+        if not future.cancel():
+            # Already built (or still building): close it once it exists
+            future.add_done_callback(_close_segment)
+
+    def to_clip(self) -> VideoClip:
+        """The whole timeline as one moviepy clip (no frame is rendered up front)."""
+        clip = VideoClip(duration=self.duration)
+        clip.frame_function = self.get_frame
+        clip.size = self.size
+        return clip
+
+    def close(self) -> None:
+        """Drop every live segment and stop the prefetch thread."""
+        for index in list(self._segments):
+            self._drop(index)
+        self._current = None
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,144 @@
+"""Node-wide CPU budget shared by concurrent renders.
+
+Every encoder and worker pool sizes itself to the whole machine by default,
+so two renders on one host each start a full set of x264 threads and
+frame workers and both slow down from oversubscription. CpuGovernor hands
+out cores from one node-wide budget instead: a render leases cores before it
+starts and sizes ffmpeg ``-threads`` and its worker pools to the lease.
+
+Leases are small pid-tagged files in a directory under the system temp
+location (shared by every render on the node), created and counted under an
+exclusive file lock, like scratch space reservations. A render asks for the
+cores its backend can use (the moviepy frame loop is one Python process, so
+it asks for few) and gets at most its fair share, ``budget // (renders +
+1)``, or what is left if that is less. Later renders therefore get smaller
+leases, and renders that ask for less than the whole budget pack side by
+side within it. A render never waits for cores: when every core is leased
+it still starts with one, so jobs packed onto a node run concurrently
+instead of queueing. Encoders size their threads and pools once when they
+start, so a running render keeps its lease until it finishes. A lease
+covering every core leaves the encoders' thread defaults alone. Leases of
+processes that died are ignored and removed.
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(cpu_governor=...)
+- eleven_video/processing/scratch.py: same claim-file scheme for disk space
+- eleven_video/config/settings.py: cpu_budget setting
+"""
+import json
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: leases are not serialised between processes
+    fcntl = None
+
+from eleven_video.exceptions.custom_errors import ValidationError
+from eleven_video.processing.scratch import _pid_alive
+
+LEASES_DIR = "eleven_video_cpu_leases"
+
+
+class CpuLease:
+    """Cores leased to one render, returned when it finishes.
+
+    Attributes:
+        cores: Cores granted.
+        budget: Size of the node-wide budget.
+    """
+
+    def __init__(self, path: Optional[Path], cores: int, budget: int):
+        self.path = path
+        self.cores = cores
+        self.budget = budget
+
+    @property
+    def whole_node(self) -> bool:
+        """Whether the lease covers every core, so encoders can keep their own thread defaults."""
+        return self.cores >= (os.cpu_count() or 1)
+
+    def release(self) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "CpuLease":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class CpuGovernor:
+    """Node-wide pool of cores leased to renders.
+
+    Example:
+        governor = CpuGovernor()
+        with governor.acquire() as lease:
+            renderer = ParallelSegmentRenderer(max_workers=lease.cores, cores=lease.cores)
+    """
+
+    def __init__(self, budget: Optional[int] = None, root: Optional[Path] = None):
+        """
+        Args:
+            budget: Cores shared by all renders on this node (default: every core).
+            root: Directory holding the lease files; must be the same for every
+                render on the node (default: the system temp directory).
+
+        Raises:
+            ValidationError: If budget is not positive.
+        """
+        if budget is not None and budget < 1:
+            raise ValidationError(f"CPU budget must be at least 1 core, got {budget}")
+        self.budget = budget or os.cpu_count() or 1
+        self.root = (Path(root) if root else Path(tempfile.gettempdir())) / LEASES_DIR
+
+    def _live_leases(self) -> List[int]:
+        """Cores of each lease held by a live render (leases of dead processes are removed)."""
+        cores = []
+        for path in self.root.glob("*.json"):
+            try:
+                lease = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if _pid_alive(int(lease.get("pid", 0))):
+                cores.append(int(lease.get("cores", 0)))
+            else:
+                path.unlink(missing_ok=True)
+        return cores
+
+    def leased_cores(self) -> int:
+        """Cores held by live renders (leases of dead processes are removed)."""
+        return sum(self._live_leases())
+
+    def fair_share(self, wanted: int, leases: List[int]) -> int:
+        """Cores a new render gets next to ``leases``: its fair share, capped by what is free, at least 1."""
+        share = self.budget // (len(leases) + 1)
+        return max(min(wanted, share, self.budget - sum(leases)), 1)
+
+    def acquire(self, wanted: Optional[int] = None) -> CpuLease:
+        """Lease up to ``wanted`` cores (default: the whole budget), at most a fair share of it.
+
+        Never waits: with every core leased the render gets one core. If the
+        lease directory cannot be used the render gets its share without a
+        lease file rather than failing.
+        """
+        wanted = min(wanted or self.budget, self.budget)
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(self.root / ".lock", "a") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                cores = self.fair_share(wanted, self._live_leases())
+                path = self.root / f"{os.getpid()}-{uuid.uuid4().hex}.json"
+                path.write_text(json.dumps({"pid": os.getpid(), "cores": cores}), encoding="utf-8")
+        except OSError:
+            return CpuLease(None, wanted, self.budget)
+        return CpuLease(path, cores, self.budget)
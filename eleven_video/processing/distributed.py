@@ -0,0 +1,419 @@
+"""Distributed segment rendering through a directory on shared storage.
+
+The parallel backend encodes each image segment in its own process and
+joins the segments by stream copy. DistributedSegmentRenderer spreads those
+same segment encodes over many machines: the originating node writes one
+task file per segment to a job directory on shared storage (NFS, SMB, a
+cluster filesystem), ``eleven-video render-worker`` processes on any
+machine that mounts it claim tasks through lock files and encode them, and
+the originating node joins the finished segments and muxes the narration.
+
+Layout of one job (``<shared_dir>/job-<id>/``, paths in tasks are relative
+to it so mount points may differ between machines)::
+
+    inputs/image_000.png        source images copied from the originating node
+    tasks/segment_0000.json     filter chain, frame count and encoder args
+    tasks/segment_0000.claim    created exclusively by the worker rendering it
+    tasks/segment_0000.done     written once the segment file is complete
+    tasks/segment_0000.failed   error message if the encode failed
+    segments/segment_0000.mp4   encoded segment
+
+A claim is created with O_CREAT|O_EXCL, so only one worker wins it. While
+rendering, the worker refreshes the claim's mtime as a heartbeat; a claim
+not refreshed for CLAIM_TIMEOUT_SECONDS belongs to a worker that died or
+lost the mount, and any worker may take the task over. Segments are encoded
+to a uniquely named part file and renamed into place, so a task rendered
+twice after a takeover race still leaves one complete, identical segment.
+
+Related files:
+- eleven_video/processing/segments.py: render_segment, write_concat_list, concat_segments
+- eleven_video/processing/ffmpeg_backend.py: FilterGraphRenderer (segment filter chains)
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(shared_dir=..., backend="distributed")
+- eleven_video/main.py: render-worker command
+"""
+import json
+import os
+import shutil
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.processing.ffmpeg_backend import FilterGraphRenderer
+from eleven_video.processing.segments import SegmentJob, concat_segments, render_segment, write_concat_list
+
+JOB_PREFIX = "job-"
+
+# Seconds between claim refreshes while a task renders
+HEARTBEAT_SECONDS = 10.0
+
+# A claim not refreshed for this long is considered abandoned
+CLAIM_TIMEOUT_SECONDS = 120.0
+
+# Seconds between scans of the shared directory
+POLL_SECONDS = 1.0
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write a file so readers on other machines never see it half-written."""
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def _without_threads(encoder_args: Sequence[str]) -> List[str]:
+    """Drop ``-threads N``: each worker machine sizes its own encoder."""
+    args: List[str] = []
+    skip = False
+    for arg in encoder_args:
+        if skip:
+            skip = False
+        elif arg == "-threads":
+            skip = True
+        else:
+            args.append(arg)
+    return args
+
+
+def _marker(task_path: Path, kind: str) -> Path:
+    return task_path.with_suffix(f".{kind}")
+
+
+class TaskClaim:
+    """Exclusive claim on one task, kept fresh by a heartbeat thread while held."""
+
+    def __init__(self, task_path: Path, heartbeat: float = HEARTBEAT_SECONDS):
+        self.task_path = task_path
+        self.path = _marker(task_path, "claim")
+        self.heartbeat = heartbeat
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _beat(self) -> None:
+        while not self._stop.wait(self.heartbeat):
+            try:
+                os.utime(self.path)
+            except OSError:
+                return
+
+    def __enter__(self) -> "TaskClaim":
+        self._thread = threading.Thread(target=self._beat, name="claim-heartbeat", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+def claim_task(
+    task_path: Path,
+    claim_timeout: float = CLAIM_TIMEOUT_SECONDS,
+    heartbeat: float = HEARTBEAT_SECONDS,
+) -> Optional[TaskClaim]:
+    """Claim a task unless it is finished or held by a live worker.
+
+    Returns:
+        The claim, or None if another worker has it or the task is finished.
+    """
+    claim_path = _marker(task_path, "claim")
+    for _ in range(2):
+        if _marker(task_path, "done").exists() or _marker(task_path, "failed").exists():
+            return None
+        try:
+            fd = os.open(claim_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            try:
+                age = time.time() - claim_path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if age < claim_timeout:
+                return None
+            # The holder stopped refreshing its claim: take the task over
+            try:
+                claim_path.unlink()
+            except FileNotFoundError:
+                pass
+            continue
+        except FileNotFoundError:
+            # The job directory was removed (job finished or cancelled)
+            return None
+        with os.fdopen(fd, "w") as f:
+            json.dump({"host": socket.gethostname(), "pid": os.getpid()}, f)
+        return TaskClaim(task_path, heartbeat)
+    return None
+
+
+def run_task(task_path: Path) -> None:
+    """Encode the segment of a claimed task and mark it done (or failed).
+
+    Raises:
+        VideoProcessingError: If the encode failed (the task is marked failed first).
+    """
+    task = json.loads(task_path.read_text(encoding="utf-8"))
+    job_dir = task_path.parent.parent
+    output = job_dir / task["output"]
+    part = output.with_name(f"{output.stem}.{uuid.uuid4().hex}.part{output.suffix}")
+    job = SegmentJob(
+        index=task["index"],
+        image_path=str(job_dir / task["image"]),
+        frame_count=task["frames"],
+        filter_chain=task["filter_chain"],
+        output_path=str(part),
+        encoder_args=task["encoder_args"],
+    )
+    started = time.monotonic()
+    try:
+        render_segment(job)
+        os.replace(part, output)
+    except (VideoProcessingError, OSError) as e:
+        part.unlink(missing_ok=True)
+        try:
+            _write_atomic(_marker(task_path, "failed"), f"{socket.gethostname()}: {e}")
+        except OSError:
+            pass  # the job directory is gone (cancelled by the originating node)
+        raise VideoProcessingError(f"{task_path.stem} failed: {e}") from e
+    _write_atomic(_marker(task_path, "done"), json.dumps({
+        "host": socket.gethostname(),
+        "pid": os.getpid(),
+        "seconds": round(time.monotonic() - started, 3),
+    }))
+
+
+class RenderWorker:
+    """Claims and renders segment tasks found under a shared directory.
+
+    Example:
+        RenderWorker(Path("/mnt/render")).run()
+    """
+
+    def __init__(
+        self,
+        shared_dir: Path,
+        job: Optional[str] = None,
+        poll: float = POLL_SECONDS,
+        claim_timeout: float = CLAIM_TIMEOUT_SECONDS,
+        heartbeat: float = HEARTBEAT_SECONDS,
+        on_task: Optional[Callable[[Path, Optional[Exception]], None]] = None,
+    ):
+        """
+        Args:
+            shared_dir: Directory shared with the nodes that submit jobs.
+            job: Only work on this job directory name (default: every job).
+            poll: Seconds between scans when there is nothing to claim.
+            claim_timeout: Age after which another worker's claim is taken over.
+            heartbeat: Seconds between refreshes of this worker's claims.
+            on_task: Called after each task with its path and the error, if any.
+        """
+        self.shared_dir = Path(shared_dir)
+        self.job = job
+        self.poll = poll
+        self.claim_timeout = claim_timeout
+        self.heartbeat = heartbeat
+        self.on_task = on_task
+
+    def pending_tasks(self) -> List[Path]:
+        """Tasks not yet done or failed, oldest job and earliest segment first."""
+        pattern = f"{self.job or JOB_PREFIX + '*'}/tasks/*.json"
+        tasks = []
+        for path in sorted(self.shared_dir.glob(pattern)):
+            if not _marker(path, "done").exists() and not _marker(path, "failed").exists():
+                tasks.append(path)
+        return tasks
+
+    def run_once(self) -> bool:
+        """Claim and render one task.
+
+        Returns:
+            True if a task was rendered (successfully or not), False if none could be claimed.
+        """
+        for task_path in self.pending_tasks():
+            claim = claim_task(task_path, self.claim_timeout, self.heartbeat)
+            if claim is None:
+                continue
+            error = None
+            with claim:
+                try:
+                    run_task(task_path)
+                except (VideoProcessingError, OSError, ValueError) as e:
+                    error = e
+            if self.on_task:
+                self.on_task(task_path, error)
+            return True
+        return False
+
+    def run(
+        self,
+        idle_timeout: Optional[float] = None,
+        max_tasks: Optional[int] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> int:
+        """Render tasks until stopped.
+
+        Args:
+            idle_timeout: Exit after this many seconds with nothing to claim
+                (default: keep polling).
+            max_tasks: Exit after rendering this many tasks.
+            should_stop: Checked between tasks; exit when it returns True.
+
+        Returns:
+            Number of tasks rendered.
+        """
+        count = 0
+        idle_since = time.monotonic()
+        while not (should_stop and should_stop()):
+            if max_tasks is not None and count >= max_tasks:
+                break
+            if self.run_once():
+                count += 1
+                idle_since = time.monotonic()
+                continue
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                break
+            time.sleep(self.poll)
+        return count
+
+
+class DistributedSegmentRenderer:
+    """Renders image segments through render workers sharing a directory.
+
+    The originating node also runs ``local_workers`` render workers for its
+    own job, so a job completes (more slowly) even with no remote worker
+    attached, and tasks abandoned by a dead worker are picked up again.
+
+    Example:
+        renderer = DistributedSegmentRenderer(Path("/mnt/render"), FilterGraphRenderer())
+        renderer.render(paths, "audio.mp3", [96, 96], Path("out.mp4"), (1920, 1080))
+    """
+
+    def __init__(
+        self,
+        shared_dir: Path,
+        graph: Optional[FilterGraphRenderer] = None,
+        local_workers: int = 1,
+        poll: float = POLL_SECONDS,
+        claim_timeout: float = CLAIM_TIMEOUT_SECONDS,
+    ):
+        self.shared_dir = Path(shared_dir)
+        self.graph = graph or FilterGraphRenderer()
+        self.local_workers = local_workers
+        self.poll = poll
+        self.claim_timeout = claim_timeout
+
+    def submit(
+        self,
+        image_paths: Sequence[str],
+        frame_counts: Sequence[int],
+        target_resolution: Tuple[int, int],
+        enable_zoom: bool = True,
+        image_suffixes: Optional[Sequence[str]] = None,
+    ) -> Tuple[Path, List[Path]]:
+        """Copy the inputs to a new job directory and publish one task per segment.
+
+        ``image_suffixes`` gives each copied image its extension (e.g.
+        ``".png"``) when the input paths have none, such as in-memory files;
+        by default the extension of each path is kept.
+
+        Returns:
+            (job directory, task files in timeline order).
+        """
+        job_dir = self.shared_dir / f"{JOB_PREFIX}{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        for name in ("inputs", "tasks", "segments"):
+            (job_dir / name).mkdir(parents=True)
+
+        encoder_args = _without_threads(self.graph.encoder_args())
+        tasks = []
+        for i, (path, frames) in enumerate(zip(image_paths, frame_counts)):
+            if frames <= 0:
+                continue
+            suffix = image_suffixes[i] if image_suffixes is not None else Path(path).suffix
+            image = Path("inputs") / f"image_{i:03d}{suffix}"
+            shutil.copyfile(path, job_dir / image)
+            task_path = job_dir / "tasks" / f"segment_{i:04d}.json"
+            # Written last and atomically: a visible task always has its input in place
+            _write_atomic(task_path, json.dumps({
+                "index": i,
+                "image": image.as_posix(),
+                "frames": frames,
+                "filter_chain": self.graph.segment_chain(i, "0:v", "v", frames, target_resolution, enable_zoom),
+                "output": f"segments/segment_{i:04d}.mp4",
+                "encoder_args": encoder_args,
+            }, indent=2))
+            tasks.append(task_path)
+        return job_dir, tasks
+
+    def render(
+        self,
+        image_paths: Sequence[str],
+        audio_path: str,
+        frame_counts: Sequence[int],
+        output_path: Path,
+        target_resolution: Tuple[int, int],
+        enable_zoom: bool = True,
+        output_format: str = "mp4",
+        on_progress: Optional[Callable[[int], None]] = None,
+        image_suffixes: Optional[Sequence[str]] = None,
+    ) -> int:
+        """Publish the segments, wait for workers to encode them, then concatenate and mux audio.
+
+        ``image_suffixes`` is passed to ``submit``.
+        ``on_progress`` receives the frames of all finished segments. The
+        job directory is removed when the render ends, successfully or not.
+
+        Returns:
+            Number of segments encoded by other worker processes.
+
+        Raises:
+            VideoProcessingError: If a segment fails on any worker or the final join fails.
+        """
+        job_dir, tasks = self.submit(image_paths, frame_counts, target_resolution, enable_zoom, image_suffixes)
+        if not tasks:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise VideoProcessingError("FFmpeg render failed: audio too short for any video frames")
+        frames = {task: json.loads(task.read_text(encoding="utf-8"))["frames"] for task in tasks}
+
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=self.local_workers) if self.local_workers > 0 else None
+        try:
+            for _ in range(self.local_workers):
+                worker = RenderWorker(
+                    self.shared_dir, job=job_dir.name, poll=self.poll, claim_timeout=self.claim_timeout
+                )
+                pool.submit(worker.run, should_stop=stop.is_set)
+
+            while True:
+                failed = [task for task in tasks if _marker(task, "failed").exists()]
+                if failed:
+                    detail = _marker(failed[0], "failed").read_text(encoding="utf-8")
+                    raise VideoProcessingError(f"Segment {failed[0].stem} failed on a render worker: {detail}")
+                done = [task for task in tasks if _marker(task, "done").exists()]
+                if on_progress:
+                    on_progress(sum(frames[task] for task in done))
+                if len(done) == len(tasks):
+                    break
+                time.sleep(self.poll)
+
+            remote = 0
+            for task in tasks:
+                marker = json.loads(_marker(task, "done").read_text(encoding="utf-8"))
+                if (marker.get("host"), marker.get("pid")) != (socket.gethostname(), os.getpid()):
+                    remote += 1
+
+            segments = [job_dir / "segments" / f"{task.stem}.mp4" for task in tasks]
+            list_path = write_concat_list([str(p) for p in segments], job_dir / "segments.txt")
+            concat_segments(list_path, audio_path, output_path, self.graph.audio_codec, output_format)
+            return remote
+        finally:
+            stop.set()
+            if pool is not None:
+                pool.shutdown(wait=True)
+            shutil.rmtree(job_dir, ignore_errors=True)
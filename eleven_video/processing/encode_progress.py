@@ -0,0 +1,123 @@
+"""Encode-rate and ETA reporting for the compile stage.
+
+Every render backend counts the frames it has encoded: ffmpeg through its
+``-progress`` output (see run_ffmpeg), the pipe backend as frames are
+written to the encoder, the parallel backend as segments finish, and
+moviepy through a proglog logger on its frame loop. EncodeProgress turns
+those counts into throttled "frame X of Y (fps, ETA)" progress messages and
+the final frames/sec recorded on the Video. That final rate is always the
+output's frame count over the wall time of the render, not the backend's
+own count: a static slideshow encodes each still only once and the parallel
+backend joins segments by stream copy (some of them cached or resumed), so
+their counts say little about how many frames the output holds.
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler (one EncodeProgress per render)
+- eleven_video/processing/ffmpeg_backend.py: run_ffmpeg(on_progress=...)
+- eleven_video/models/domain.py: Video.encode_fps
+"""
+import time
+from typing import Callable, Optional
+
+from proglog import ProgressBarLogger
+
+# Minimum seconds between two progress messages for the same render
+REPORT_INTERVAL_SECONDS = 5.0
+
+
+def format_eta(seconds: float) -> str:
+    """Short human-readable duration: ``45s``, ``3m 05s``, ``1h 02m``."""
+    seconds = max(int(round(seconds)), 0)
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+class EncodeProgress:
+    """Tracks frames encoded by one render and reports rate and ETA.
+
+    ``update`` may be called as often as the backend likes; a message is
+    sent to the callback at most once per ``interval`` seconds.
+
+    Example:
+        progress = EncodeProgress(2400, progress_callback)
+        renderer.render(..., on_progress=progress.update)
+        encode_fps = progress.finish()
+    """
+
+    def __init__(
+        self,
+        total_frames: int,
+        callback: Optional[Callable[[str], None]] = None,
+        interval: float = REPORT_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.total_frames = total_frames
+        self.callback = callback
+        self.interval = interval
+        self._clock = clock
+        self.start()
+
+    def start(self) -> "EncodeProgress":
+        """(Re)start timing, e.g. when a failed backend falls back to moviepy."""
+        self.frames = 0
+        self._started = self._clock()
+        self._last_report = self._started
+        return self
+
+    @property
+    def elapsed(self) -> float:
+        return self._clock() - self._started
+
+    @property
+    def fps(self) -> float:
+        """Frames encoded per second of wall time so far."""
+        elapsed = self.elapsed
+        return self.frames / elapsed if elapsed > 0 else 0.0
+
+    def message(self) -> str:
+        """Progress line for the current state."""
+        fps = self.fps
+        text = f"Encoding frame {self.frames} of {self.total_frames} ({fps:.1f} fps"
+        if fps > 0:
+            text += f", ETA {format_eta((self.total_frames - self.frames) / fps)}"
+        return text + ")"
+
+    def update(self, frames: int) -> None:
+        """Record that ``frames`` frames have been encoded in total."""
+        self.frames = min(max(frames, self.frames), self.total_frames)
+        now = self._clock()
+        if self.callback and now - self._last_report >= self.interval:
+            self._last_report = now
+            self.callback(self.message())
+
+    def finish(self) -> float:
+        """Mark every frame encoded, report the final rate and return it.
+
+        The rate is ``total_frames`` (the output's frames) over the wall time
+        since ``start()``, whatever counts the backend reported.
+        """
+        self.frames = self.total_frames
+        elapsed = self.elapsed
+        fps = self.total_frames / elapsed if elapsed > 0 else 0.0
+        if self.callback:
+            self.callback(f"Encoded {self.frames} frames in {self.elapsed:.1f}s ({fps:.1f} fps)")
+        return fps
+
+
+class MoviepyProgressLogger(ProgressBarLogger):
+    """proglog logger that forwards moviepy's frame loop to an ``on_progress`` callable."""
+
+    def __init__(self, on_progress: Callable[[int], None]):
+        super().__init__()
+        self._on_progress = on_progress
+
+    def bars_callback(self, bar, attr, value, old_value=None):
+        # write_videofile iterates frames on the "frame_index" bar (audio uses "chunk");
+        # the index is the number of frames already written
+        if bar == "frame_index" and attr == "index":
+            self._on_progress(value)
@@ -0,0 +1,429 @@
+"""FFmpeg filter-graph render backend.
+
+Renders the image slideshow in a single ffmpeg process instead of moviepy's
+per-frame Python callback. Every image is scaled onto an oversampled canvas,
+animated with zoompan (Ken Burns), concatenated, and muxed with the narration
+audio, so compile time is bound by the encoder rather than by Python.
+``render_ladder`` produces several output resolutions from that one graph by
+splitting and rescaling the finished frames, one encoder per resolution.
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler (backend="ffmpeg")
+- eleven_video/exceptions/custom_errors.py: VideoProcessingError
+"""
+import os
+import re
+import shutil
+import subprocess
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, List, Optional, Sequence, Tuple
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.processing.output_formats import muxer_args
+
+# One line of ffmpeg's -progress output, e.g. "frame=240" or "out_time=00:00:10.000000"
+_PROGRESS_LINE = re.compile(r"^(\w+)=(\S*)$")
+
+
+def get_ffmpeg_binary() -> str:
+    """Return the ffmpeg executable used for rendering.
+
+    Prefers the binary moviepy is configured with (imageio-ffmpeg bundles one),
+    falling back to ``ffmpeg`` on PATH.
+
+    Raises:
+        VideoProcessingError: If no ffmpeg executable can be found.
+    """
+    try:
+        from moviepy.config import FFMPEG_BINARY as moviepy_binary
+    except Exception:
+        moviepy_binary = None
+
+    for candidate in (moviepy_binary, "ffmpeg"):
+        if candidate and (os.path.isfile(candidate) or shutil.which(candidate)):
+            return candidate
+
+    raise VideoProcessingError("FFmpeg required but not found. Install FFmpeg and add to PATH.")
+
+
+def run_ffmpeg(args: Sequence[str], on_progress: Optional[Callable[[int], None]] = None) -> None:
+    """Run ffmpeg with the given arguments (binary excluded).
+
+    stdout is inherited, so an output of ``pipe:1`` streams straight to the
+    caller's stdout; stderr is captured for the error message.
+
+    Args:
+        args: ffmpeg arguments after the global options.
+        on_progress: Called with the number of frames encoded so far, from
+            ffmpeg's ``-progress`` reports (about twice a second).
+
+    Raises:
+        VideoProcessingError: If ffmpeg is missing or exits with an error.
+    """
+    cmd = [get_ffmpeg_binary(), "-y", "-hide_banner", "-loglevel", "error"]
+    if on_progress is not None:
+        # key=value progress blocks go to stderr alongside any error lines
+        cmd += ["-progress", "pipe:2", "-nostats"]
+    cmd += list(args)
+    try:
+        if on_progress is None:
+            result = subprocess.run(cmd, stderr=subprocess.PIPE)
+            returncode = result.returncode
+            errors = result.stderr.decode("utf-8", errors="replace").strip().splitlines()
+        else:
+            returncode, errors = _run_with_progress(cmd, on_progress)
+    except FileNotFoundError as e:
+        raise VideoProcessingError(
+            "FFmpeg required but not found. Install FFmpeg and add to PATH."
+        ) from e
+
+    if returncode != 0:
+        # Keep the message short - ffmpeg can emit pages of diagnostics
+        detail = errors[-1] if errors else f"exit code {returncode}"
+        raise VideoProcessingError(f"FFmpeg render failed: {detail}")
+
+
+def _run_with_progress(cmd: List[str], on_progress: Callable[[int], None]) -> Tuple[int, List[str]]:
+    """Run ``cmd`` reading stderr as it arrives; returns (exit code, error lines)."""
+    errors: Deque[str] = deque(maxlen=20)
+    process = subprocess.Popen(cmd, stderr=subprocess.PIPE)
+    with process:
+        for raw in process.stderr:
+            line = raw.decode("utf-8", errors="replace").strip()
+            match = _PROGRESS_LINE.match(line)
+            if match is None:
+                if line:
+                    errors.append(line)
+            elif match.group(1) == "frame" and match.group(2).isdigit():
+                on_progress(int(match.group(2)))
+    return process.returncode, list(errors)
+
+
+def segment_frame_counts(segment_count: int, total_duration: float, fps: int) -> List[int]:
+    """Split a timeline into per-segment frame counts on the fps grid.
+
+    Boundaries are rounded cumulatively so the sum always matches the total
+    frame count of the audio, with no drift across many segments.
+
+    Args:
+        segment_count: Number of equal-length segments (one per image).
+        total_duration: Total timeline duration in seconds.
+        fps: Output frame rate.
+
+    Returns:
+        Number of frames for each segment (may contain zeros for very short timelines).
+    """
+    if segment_count <= 0:
+        return []
+    per_segment = total_duration / segment_count
+    boundaries = [round(i * per_segment * fps) for i in range(segment_count + 1)]
+    return [boundaries[i + 1] - boundaries[i] for i in range(segment_count)]
+
+
+def zoom_scale_range(zoom_direction: str, zoom_factor: float) -> Tuple[float, float]:
+    """Return (start_scale, end_scale) for a zoom direction ("in" or "out")."""
+    if zoom_direction == "in":
+        return 1.0, zoom_factor
+    return zoom_factor, 1.0
+
+
+def ladder_canvas(resolutions: Sequence[Tuple[int, int]]) -> Tuple[int, int]:
+    """Frame size a resolution ladder is rendered at: the widest width by the tallest height.
+
+    Images are stretched to the output size without preserving aspect ratio
+    and zoomed around the center, so a zoom rendered on this canvas and
+    rescaled to each resolution matches a zoom rendered at that resolution.
+    Every rendition is then a downscale (or a copy) along both axes.
+    """
+    return (max(w for w, _ in resolutions), max(h for _, h in resolutions))
+
+
+def split_renditions(
+    input_label: str,
+    resolutions: Sequence[Tuple[int, int]],
+    canvas: Tuple[int, int],
+) -> Tuple[str, List[str]]:
+    """Build filter text that splits ``input_label`` into one stream per resolution.
+
+    Returns:
+        (filter text, output pad label for each resolution in order).
+    """
+    if len(resolutions) == 1:
+        sources = [input_label]
+        chains = []
+    else:
+        sources = [f"l{i}" for i in range(len(resolutions))]
+        chains = [f"[{input_label}]split={len(resolutions)}{''.join(f'[{s}]' for s in sources)}"]
+
+    labels = []
+    for i, ((w, h), source) in enumerate(zip(resolutions, sources)):
+        if (w, h) == tuple(canvas):
+            labels.append(source)
+            continue
+        chains.append(f"[{source}]scale={w}:{h},setsar=1[r{i}]")
+        labels.append(f"r{i}")
+    return ";\n".join(chains), labels
+
+
+class FilterGraphRenderer:
+    """Renders a Ken Burns slideshow with one ffmpeg filter graph.
+
+    Each input image is stretched to the target size multiplied by
+    ``oversample`` (matching the moviepy path, which resizes without
+    preserving aspect ratio), animated with zoompan and concatenated.
+    Oversampling keeps zoompan's integer crop offsets from visibly jittering.
+
+    Example:
+        renderer = FilterGraphRenderer()
+        renderer.render(paths, "audio.mp3", [120, 120], Path("out.mp4"), (1920, 1080))
+    """
+
+    def __init__(
+        self,
+        fps: int = 24,
+        video_codec: str = "libx264",
+        audio_codec: str = "aac",
+        zoom_factor: float = 1.08,
+        oversample: int = 2,
+        encoder_options: Optional[Sequence[str]] = None,
+    ):
+        self.fps = fps
+        self.video_codec = video_codec
+        self.audio_codec = audio_codec
+        self.zoom_factor = zoom_factor
+        self.oversample = oversample
+        self.encoder_options = list(encoder_options or [])
+
+    def segment_chain(
+        self,
+        image_index: int,
+        input_label: str,
+        output_label: str,
+        frames: int,
+        target_resolution: Tuple[int, int],
+        enable_zoom: bool = True,
+        first_frame: int = 0,
+        span: Optional[int] = None,
+    ) -> str:
+        """Build the filter chain that turns one still image into ``frames`` frames.
+
+        Args:
+            image_index: Index of the image in the video (sets zoom direction).
+            input_label: Filter input pad, e.g. ``0:v``.
+            output_label: Filter output pad, e.g. ``v0``.
+            frames: Number of frames to generate.
+            target_resolution: Output (width, height).
+            enable_zoom: Whether to animate with the Ken Burns zoom.
+            first_frame: Frame of the image's zoom the chain starts at, for a
+                part of a segment (may be negative or run past the end, where
+                the zoom is extrapolated, as in transition windows).
+            span: Frames the full zoom runs over (default: ``frames``).
+        """
+        w, h = target_resolution
+        if enable_zoom:
+            # Even indices = zoom in, odd indices = zoom out (Story 2.7)
+            direction = "in" if image_index % 2 == 0 else "out"
+            start, end = zoom_scale_range(direction, self.zoom_factor)
+            step = (end - start) / max((span or frames) - 1, 1)
+            frame_expr = f"(on{first_frame:+d})" if first_frame else "on"
+            zoom_expr = f"{start:.6f}+{step:.9f}*{frame_expr}"
+            base_w, base_h = w * self.oversample, h * self.oversample
+        else:
+            zoom_expr = "1"
+            base_w, base_h = w, h
+
+        return (
+            f"[{input_label}]scale={base_w}:{base_h},setsar=1,"
+            f"zoompan=z='{zoom_expr}':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)'"
+            f":d={frames}:s={w}x{h}:fps={self.fps},format=yuv420p[{output_label}]"
+        )
+
+    def transition_chain(
+        self,
+        outgoing: Tuple[int, int],
+        incoming: Tuple[int, int],
+        tail: int,
+        frames: int,
+        target_resolution: Tuple[int, int],
+        enable_zoom: bool = True,
+    ) -> str:
+        """Build the filter chain of a crossfade window between two segments.
+
+        The window covers the last ``tail`` frames of the outgoing segment and
+        the first ``frames - tail`` frames of the incoming one. Both images
+        keep zooming through the whole window (inputs ``0:v`` and ``1:v``) and
+        are crossfaded into ``[v]``, so the window replaces exactly those
+        frames of the timeline.
+
+        Args:
+            outgoing: (image index, segment frame count) of the segment that ends.
+            incoming: (image index, segment frame count) of the segment that starts.
+            tail: Frames of the window taken from the end of the outgoing segment.
+            frames: Frames in the window.
+            target_resolution: Output (width, height).
+            enable_zoom: Whether to animate with the Ken Burns zoom.
+        """
+        (out_index, out_frames), (in_index, in_frames) = outgoing, incoming
+        fade_out = self.segment_chain(
+            out_index, "0:v", "fa", frames, target_resolution, enable_zoom,
+            first_frame=out_frames - tail, span=out_frames
+        )
+        fade_in = self.segment_chain(
+            in_index, "1:v", "fb", frames, target_resolution, enable_zoom, first_frame=-tail, span=in_frames
+        )
+        return (
+            f"{fade_out};\n{fade_in};\n"
+            f"[fa][fb]xfade=transition=fade:duration={frames / self.fps:.6f}:offset=0,format=yuv420p[v]"
+        )
+
+    @staticmethod
+    def _write_script(graph: str, work_dir: Path) -> Path:
+        """Write a filter graph for ``-filter_complex_script``."""
+        work_dir = Path(work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        script_path = work_dir / "filter_graph.txt"
+        script_path.write_text(graph, encoding="utf-8")
+        return script_path
+
+    def encoder_args(self) -> List[str]:
+        """Video encoder arguments shared by every render path.
+
+        Segments rendered separately must use identical parameters so they
+        can be joined by stream copy.
+        """
+        return [
+            "-c:v", self.video_codec,
+            *self.encoder_options,
+            "-pix_fmt", "yuv420p",
+            "-r", str(self.fps),
+        ]
+
+    def build_filter_graph(
+        self,
+        frame_counts: Sequence[int],
+        target_resolution: Tuple[int, int],
+        enable_zoom: bool = True,
+    ) -> str:
+        """Build the filter_complex script for the given segments.
+
+        Input ``i`` of the graph is the ``i``-th segment with a non-zero frame
+        count; zoom direction still alternates by original image index.
+
+        Returns:
+            Filter graph text with the concatenated video on ``[vout]``.
+        """
+        chains = []
+        labels = []
+        input_index = 0
+
+        for i, frames in enumerate(frame_counts):
+            if frames <= 0:
+                continue
+            chains.append(self.segment_chain(
+                i, f"{input_index}:v", f"v{input_index}", frames, target_resolution, enable_zoom
+            ))
+            labels.append(f"[v{input_index}]")
+            input_index += 1
+
+        chains.append(f"{''.join(labels)}concat=n={len(labels)}:v=1:a=0[vout]")
+        return ";\n".join(chains)
+
+    def render(
+        self,
+        image_paths: Sequence[str],
+        audio_path: str,
+        frame_counts: Sequence[int],
+        output_path: Path,
+        target_resolution: Tuple[int, int],
+        enable_zoom: bool = True,
+        output_format: str = "mp4",
+        on_progress: Optional[Callable[[int], None]] = None,
+        work_dir: Optional[Path] = None,
+    ) -> None:
+        """Render images and audio into ``output_path`` with a single ffmpeg run.
+
+        The filter graph is written to ``work_dir`` (default: next to the
+        inputs, which need not be a writable directory) and passed with
+        ``-filter_complex_script`` so long image lists never hit command-line
+        length limits. ``output_format`` selects the container (see
+        output_formats.OUTPUT_FORMATS); progressive formats are written as
+        the render proceeds. ``on_progress`` receives the frames encoded so far.
+
+        Raises:
+            VideoProcessingError: If ffmpeg is missing or the render fails.
+        """
+        if len(image_paths) != len(frame_counts):
+            raise VideoProcessingError("FFmpeg render failed: frame counts do not match images")
+
+        used_paths = [p for p, frames in zip(image_paths, frame_counts) if frames > 0]
+        if not used_paths:
+            raise VideoProcessingError("FFmpeg render failed: audio too short for any video frames")
+
+        graph = self.build_filter_graph(frame_counts, target_resolution, enable_zoom)
+        script_path = self._write_script(graph, work_dir or Path(used_paths[0]).parent)
+
+        args: List[str] = []
+        for path in used_paths:
+            args += ["-i", str(path)]
+        args += ["-i", str(audio_path)]
+        args += [
+            "-filter_complex_script", str(script_path),
+            "-map", "[vout]",
+            "-map", f"{len(used_paths)}:a",
+            *self.encoder_args(),
+            "-c:a", self.audio_codec,
+            *muxer_args(output_format, output_path),
+        ]
+        run_ffmpeg(args, on_progress=on_progress)
+
+    def render_ladder(
+        self,
+        image_paths: Sequence[str],
+        audio_path: str,
+        frame_counts: Sequence[int],
+        renditions: Sequence[Tuple[Path, Tuple[int, int]]],
+        enable_zoom: bool = True,
+        output_format: str = "mp4",
+        on_progress: Optional[Callable[[int], None]] = None,
+        work_dir: Optional[Path] = None,
+    ) -> None:
+        """Render several resolutions of the same slideshow with one ffmpeg run.
+
+        Images are decoded and zoomed once on the ``ladder_canvas`` of all
+        renditions; the finished frames are split and rescaled inside the
+        graph and each (output path, resolution) pair gets its own encoder.
+        ``on_progress`` receives the frames of the timeline encoded so far.
+        The filter graph is written to ``work_dir`` as in ``render``.
+
+        Raises:
+            VideoProcessingError: If ffmpeg is missing or the render fails.
+        """
+        if len(image_paths) != len(frame_counts):
+            raise VideoProcessingError("FFmpeg render failed: frame counts do not match images")
+
+        used_paths = [p for p, frames in zip(image_paths, frame_counts) if frames > 0]
+        if not used_paths:
+            raise VideoProcessingError("FFmpeg render failed: audio too short for any video frames")
+
+        resolutions = [tuple(resolution) for _, resolution in renditions]
+        canvas = ladder_canvas(resolutions)
+        split, labels = split_renditions("vout", resolutions, canvas)
+        graph = self.build_filter_graph(frame_counts, canvas, enable_zoom)
+        if split:
+            graph += ";\n" + split
+        script_path = self._write_script(graph, work_dir or Path(used_paths[0]).parent)
+
+        args: List[str] = []
+        for path in used_paths:
+            args += ["-i", str(path)]
+        args += ["-i", str(audio_path), "-filter_complex_script", str(script_path)]
+        for (output_path, _), label in zip(renditions, labels):
+            args += [
+                "-map", f"[{label}]",
+                "-map", f"{len(used_paths)}:a",
+                *self.encoder_args(),
+                "-c:a", self.audio_codec,
+                *muxer_args(output_format, output_path),
+            ]
+        run_ffmpeg(args, on_progress=on_progress)
@@ -0,0 +1,126 @@
+"""Shared-memory ring of frame slots between producer processes and the encoder.
+
+When frames are produced in worker processes, returning them through a
+multiprocessing queue pickles every frame (about 6 MB at 1080p), copies it
+through a pipe and unpickles it again before it reaches the encoder. With a
+FrameRing the frames never travel: the ring is one
+``multiprocessing.shared_memory`` block split into fixed-size slots, each
+holding up to ``frames_per_slot`` frames. Producers render straight into a
+slot and the consumer writes the slot's memory to the encoder's stdin.
+
+Index protocol (only small integers cross process boundaries):
+
+1. The consumer takes a free slot (``acquire``) and sends a producer the
+   task together with the slot index.
+2. The producer attaches the ring (once per process), renders into
+   ``frames(slot)`` and reports the slot index and frame count back.
+3. The consumer, in timeline order, writes ``view(slot, count)`` to the
+   encoder and returns the slot (``release``).
+
+Slots are only handed out by the consumer, so a slot is owned by exactly one
+task at a time and the number of slots bounds the frames in flight
+(backpressure from the encoder, as with the threaded producers).
+
+Related files:
+- eleven_video/processing/frame_sink.py: PipeRenderer(processes=True) uses the ring
+- tests/performance/frame_transport_benchmark.py: ring vs multiprocessing.Queue frames/sec
+"""
+import math
+from collections import deque
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class FrameRing:
+    """Fixed-size uint8 frame slots in one shared memory block.
+
+    The process that creates the ring owns it: it hands out slots and
+    unlinks the block on ``close``. Producer processes receive the ring
+    pickled (only its name and geometry are sent) and attach to the block.
+
+    Example:
+        with FrameRing(slots=8, frame_shape=(1080, 1920, 3), frames_per_slot=4) as ring:
+            slot = ring.acquire()
+            ring.frames(slot)[0] = frame          # in a producer
+            sink.write(ring.view(slot, 1))        # in the consumer
+            ring.release(slot)
+    """
+
+    def __init__(
+        self,
+        slots: int,
+        frame_shape: Tuple[int, ...],
+        frames_per_slot: int = 1,
+        name: Optional[str] = None,
+    ):
+        """
+        Args:
+            slots: Number of slots in the ring.
+            frame_shape: Shape of one uint8 frame, e.g. (height, width, 3).
+            frames_per_slot: Frames each slot holds.
+            name: Attach to an existing ring with this shared memory name
+                instead of creating one.
+        """
+        self.slots = slots
+        self.frame_shape = tuple(frame_shape)
+        self.frames_per_slot = frames_per_slot
+        self.frame_bytes = math.prod(self.frame_shape)
+        self.slot_bytes = self.frame_bytes * frames_per_slot
+        self.owner = name is None
+        self._shm: Optional[shared_memory.SharedMemory] = shared_memory.SharedMemory(
+            name=name, create=self.owner, size=self.slots * self.slot_bytes
+        )
+        self._free = deque(range(slots)) if self.owner else deque()
+
+    @property
+    def name(self) -> str:
+        """Shared memory name producers attach with."""
+        return self._shm.name
+
+    def __reduce__(self):
+        # Pickled for producer processes: they attach rather than copy
+        return (FrameRing, (self.slots, self.frame_shape, self.frames_per_slot, self.name))
+
+    @property
+    def free_slots(self) -> int:
+        return len(self._free)
+
+    def acquire(self) -> Optional[int]:
+        """Take a free slot index, or None when every slot is in flight."""
+        return self._free.popleft() if self._free else None
+
+    def release(self, slot: int) -> None:
+        """Return a slot once its frames have been consumed."""
+        self._free.append(slot)
+
+    def frames(self, slot: int) -> np.ndarray:
+        """Writable (frames_per_slot, *frame_shape) array over one slot (no copy)."""
+        return np.ndarray(
+            (self.frames_per_slot,) + self.frame_shape,
+            dtype=np.uint8,
+            buffer=self._shm.buf,
+            offset=slot * self.slot_bytes,
+        )
+
+    def view(self, slot: int, count: Optional[int] = None) -> memoryview:
+        """Bytes of the first ``count`` frames of a slot (default: all), without copying."""
+        count = self.frames_per_slot if count is None else count
+        start = slot * self.slot_bytes
+        return self._shm.buf[start:start + count * self.frame_bytes]
+
+    def close(self) -> None:
+        """Detach from the block; the owner also removes it."""
+        if self._shm is None:
+            return
+        shm, self._shm = self._shm, None
+        shm.close()
+        if self.owner:
+            shm.unlink()
+
+    def __enter__(self) -> "FrameRing":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,484 @@
+"""Raw-frame pipe encoder that bypasses moviepy.
+
+FrameSink runs one ffmpeg subprocess that reads rawvideo (rgb24 or yuv420p)
+on stdin and writes the MP4. PipeRenderer produces frames from the image list
+in worker threads (ZoomRenderer batches) and feeds them to the sink through a
+bounded queue, so encoding applies real backpressure and memory stays flat no
+matter how long the video is. With ``processes=True`` the frames are produced
+in worker processes instead, which render into the slots of a shared-memory
+FrameRing so no frame is pickled on its way to the encoder.
+
+Related files:
+- eleven_video/processing/zoom.py: ZoomRenderer (frame production)
+- eleven_video/processing/frame_ring.py: FrameRing (frames shared with worker processes)
+- eleven_video/processing/image_store.py: SourceImageStore (decode-once source pixels)
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler (backend="pipe")
+"""
+import os
+import queue
+import subprocess
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image as PILImage
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.processing.ffmpeg_backend import get_ffmpeg_binary
+from eleven_video.processing.frame_ring import FrameRing
+from eleven_video.processing.image_store import SourceImageStore
+from eleven_video.processing.output_formats import muxer_args
+from eleven_video.processing.zoom import ImageSource, ZoomRenderer, zoom_base_size
+
+SUPPORTED_PIX_FMTS = ("rgb24", "yuv420p")
+
+
+def rgb_to_yuv420p(frame: np.ndarray) -> bytes:
+    """Convert an (h, w, 3) RGB frame to planar BT.601 limited-range yuv420p bytes.
+
+    Width and height must be even (every Resolution option is).
+    """
+    rgb = frame.astype(np.float32)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    y = 16 + (65.481 * r + 128.553 * g + 24.966 * b) / 255
+    u = 128 + (-37.797 * r - 74.203 * g + 112.0 * b) / 255
+    v = 128 + (112.0 * r - 93.786 * g - 18.214 * b) / 255
+
+    h, w = y.shape
+    # 2x2 chroma subsampling by averaging
+    u = u.reshape(h // 2, 2, w // 2, 2).mean(axis=(1, 3))
+    v = v.reshape(h // 2, 2, w // 2, 2).mean(axis=(1, 3))
+
+    planes = [np.clip(np.rint(p), 0, 255).astype(np.uint8) for p in (y, u, v)]
+    return b"".join(p.tobytes() for p in planes)
+
+
+class FrameSink:
+    """ffmpeg subprocess that encodes raw frames written to its stdin.
+
+    Example:
+        with FrameSink(Path("out.mp4"), (1920, 1080), audio_path="audio.mp3") as sink:
+            for frame in frames:
+                sink.write(sink.pack(frame))
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        resolution: Tuple[int, int],
+        fps: int = 24,
+        pix_fmt: str = "rgb24",
+        encoder_args: Optional[Sequence[str]] = None,
+        audio_path: Optional[str] = None,
+        audio_codec: str = "aac",
+        output_format: str = "mp4",
+    ):
+        if pix_fmt not in SUPPORTED_PIX_FMTS:
+            raise VideoProcessingError(
+                f"Unsupported raw pixel format '{pix_fmt}'. Options: {', '.join(SUPPORTED_PIX_FMTS)}"
+            )
+        self.output_path = output_path
+        self.resolution = resolution
+        self.fps = fps
+        self.pix_fmt = pix_fmt
+        self.encoder_args = list(encoder_args or ["-c:v", "libx264", "-pix_fmt", "yuv420p"])
+        self.audio_path = audio_path
+        self.audio_codec = audio_codec
+        self.output_format = output_format
+        self.frames_written = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._stderr = None
+
+    def build_command(self) -> List[str]:
+        """Return the ffmpeg command line for this sink."""
+        w, h = self.resolution
+        cmd = [
+            get_ffmpeg_binary(), "-y", "-hide_banner", "-loglevel", "error",
+            "-f", "rawvideo",
+            "-pix_fmt", self.pix_fmt,
+            "-s", f"{w}x{h}",
+            "-r", str(self.fps),
+            "-i", "pipe:0",
+        ]
+        if self.audio_path:
+            cmd += ["-i", str(self.audio_path), "-map", "0:v", "-map", "1:a"]
+        cmd += self.encoder_args
+        if self.audio_path:
+            cmd += ["-c:a", self.audio_codec]
+        cmd += muxer_args(self.output_format, self.output_path)
+        return cmd
+
+    def open(self) -> "FrameSink":
+        """Start the ffmpeg process."""
+        # stderr goes to a file so a chatty ffmpeg can never block on a full pipe
+        self._stderr = tempfile.TemporaryFile()
+        try:
+            self._process = subprocess.Popen(
+                self.build_command(), stdin=subprocess.PIPE, stderr=self._stderr
+            )
+        except FileNotFoundError as e:
+            raise VideoProcessingError(
+                "FFmpeg required but not found. Install FFmpeg and add to PATH."
+            ) from e
+        return self
+
+    def pack(self, frame: np.ndarray) -> Union[bytes, memoryview]:
+        """Convert an (h, w, 3) RGB frame to this sink's raw pixel format."""
+        if self.pix_fmt == "yuv420p":
+            return rgb_to_yuv420p(frame)
+        return memoryview(np.ascontiguousarray(frame, dtype=np.uint8)).cast("B")
+
+    def frame_bytes(self) -> int:
+        """Size of one packed frame in this sink's raw pixel format."""
+        w, h = self.resolution
+        return w * h * 3 // 2 if self.pix_fmt == "yuv420p" else w * h * 3
+
+    def write(self, data: Union[bytes, memoryview], frames: int = 1) -> None:
+        """Write ``frames`` consecutive packed frames; blocks while the encoder is busy (backpressure)."""
+        try:
+            self._process.stdin.write(data)
+        except (BrokenPipeError, OSError) as e:
+            self._raise_failure(e)
+        self.frames_written += frames
+
+    def close(self) -> None:
+        """Finish encoding and wait for ffmpeg to exit.
+
+        Raises:
+            VideoProcessingError: If ffmpeg exits with an error.
+        """
+        if self._process is None:
+            return
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        returncode = self._process.wait()
+        if returncode != 0:
+            self._raise_failure()
+        self._cleanup()
+
+    def abort(self) -> None:
+        """Kill ffmpeg without finishing the file (used on producer errors)."""
+        if self._process is not None and self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        self._cleanup()
+
+    def _raise_failure(self, cause: Optional[BaseException] = None) -> None:
+        if self._process.poll() is None:
+            self._process.kill()
+        self._process.wait()
+        self._stderr.seek(0)
+        stderr = self._stderr.read().decode("utf-8", errors="replace").strip()
+        self._cleanup()
+        detail = stderr.splitlines()[-1] if stderr else "encoder exited early"
+        raise VideoProcessingError(f"FFmpeg render failed: {detail}") from cause
+
+    def _cleanup(self) -> None:
+        if self._stderr is not None:
+            self._stderr.close()
+            self._stderr = None
+        self._process = None
+
+    def __enter__(self) -> "FrameSink":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+# Per-process state of a frame producer process (see PipeRenderer processes=True)
+_producer: Dict[str, object] = {}
+
+
+def _init_producer(
+    ring: FrameRing,
+    store: Tuple[str, int, Tuple[int, int]],
+    frame_counts: Sequence[int],
+    settings: Dict[str, object],
+) -> None:
+    """Attach the frame ring and the source store once per producer process."""
+    _producer.clear()
+    _producer.update(ring=ring, store=SourceImageStore(*store), frame_counts=list(frame_counts),
+                     settings=settings, renderers={})
+
+
+def _produce_into_slot(chunk: Tuple[int, int, int], slot: int) -> int:
+    """Render one chunk into a ring slot; returns the number of frames written."""
+    segment, start, stop = chunk
+    ring: FrameRing = _producer["ring"]
+    store: SourceImageStore = _producer["store"]
+    settings = _producer["settings"]
+    renderers: Dict[int, ZoomRenderer] = _producer["renderers"]
+    if segment not in renderers:
+        # Chunks arrive roughly in timeline order: drop renderers of earlier segments
+        for done in [s for s in renderers if s < segment]:
+            del renderers[done]
+            store.release(done)
+        renderers[segment] = ZoomRenderer(
+            store[segment],
+            settings["target_resolution"],
+            _producer["frame_counts"][segment] / settings["fps"],
+            zoom_direction="in" if segment % 2 == 0 else "out",
+            zoom_factor=settings["zoom_factor"],
+            fps=settings["fps"],
+            frame_resample=settings["frame_resample"],
+        )
+    renderer = renderers[segment]
+    count = stop - start
+    out = ring.frames(slot)[:count]
+    if settings["pix_fmt"] == "yuv420p":
+        for i, frame in enumerate(renderer.render_frames(range(start, stop))):
+            out[i] = np.frombuffer(rgb_to_yuv420p(frame), dtype=np.uint8)
+    else:
+        renderer.render_frames(range(start, stop), out=out)
+    return count
+
+
+class PipeRenderer:
+    """Produces frames in worker threads and streams them into a FrameSink.
+
+    Work is split into chunks of ``batch_size`` frames. A feeder thread
+    submits chunks to the thread pool in timeline order and puts their
+    futures on a bounded queue; the main thread writes them to the sink in
+    the same order. At most ``max_buffered_frames`` frames are ever held in
+    memory, independent of video length.
+
+    With ``processes=True`` (and a ``work_dir`` for the source store) the
+    chunks are rendered by a process pool into the slots of a FrameRing;
+    only chunk and slot indices are sent between processes.
+
+    Example:
+        renderer = PipeRenderer(fps=24)
+        renderer.render(image_paths, "audio.mp3", [96, 96], Path("out.mp4"), (1920, 1080))
+    """
+
+    def __init__(
+        self,
+        fps: int = 24,
+        zoom_factor: float = 1.08,
+        encoder_args: Optional[Sequence[str]] = None,
+        audio_codec: str = "aac",
+        pix_fmt: str = "rgb24",
+        workers: Optional[int] = None,
+        batch_size: int = 4,
+        max_buffered_frames: int = 32,
+        frame_resample: int = PILImage.BILINEAR,
+        processes: bool = False,
+    ):
+        self.fps = fps
+        self.zoom_factor = zoom_factor
+        self.encoder_args = encoder_args
+        self.audio_codec = audio_codec
+        self.pix_fmt = pix_fmt
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.max_buffered_frames = max_buffered_frames
+        self.frame_resample = frame_resample
+        self.processes = processes
+
+    def _chunks(self, frame_counts: Sequence[int]) -> List[Tuple[int, int, int]]:
+        """(segment, first_frame, stop_frame) chunks in timeline order."""
+        chunks = []
+        for segment, frames in enumerate(frame_counts):
+            for start in range(0, frames, self.batch_size):
+                chunks.append((segment, start, min(start + self.batch_size, frames)))
+        return chunks
+
+    def render(
+        self,
+        sources: Sequence[ImageSource],
+        audio_path: Optional[str],
+        frame_counts: Sequence[int],
+        output_path: Path,
+        target_resolution: Tuple[int, int],
+        enable_zoom: bool = True,
+        work_dir: Optional[Path] = None,
+        output_format: str = "mp4",
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        """Render every segment through the pipe encoder.
+
+        Args:
+            sources: Image files, encoded bytes or arrays (one per segment).
+            audio_path: Narration audio to mux, or None for a silent video.
+            frame_counts: Frames per segment (see segment_frame_counts).
+            output_path: Destination MP4.
+            target_resolution: Output (width, height).
+            enable_zoom: Whether to animate with the Ken Burns zoom.
+            work_dir: Scratch directory for a SourceImageStore. When given, every
+                image is decoded and oversampled up front and frames are read
+                from the memory-mapped store; otherwise each segment decodes
+                its image when its first chunk is produced. Producer
+                processes need the store; without one frames are produced
+                in threads.
+            output_format: Container written by the sink (see output_formats).
+            on_progress: Called with the number of frames written to the
+                encoder after each chunk.
+
+        Returns:
+            Number of frames encoded.
+
+        Raises:
+            VideoProcessingError: If frame production or encoding fails.
+        """
+        chunks = self._chunks(frame_counts)
+        if not chunks:
+            raise VideoProcessingError("FFmpeg render failed: audio too short for any video frames")
+
+        zoom_factor = self.zoom_factor if enable_zoom else 1.0
+        store: Optional[SourceImageStore] = None
+        if work_dir is not None:
+            try:
+                store = SourceImageStore.build(
+                    sources, zoom_base_size(target_resolution, zoom_factor), work_dir, workers=self.workers
+                )
+            except (OSError, ValueError) as e:
+                raise VideoProcessingError(f"Frame production failed: {e}") from e
+            sources = store
+
+        sink = FrameSink(
+            output_path, target_resolution, fps=self.fps, pix_fmt=self.pix_fmt,
+            encoder_args=self.encoder_args, audio_path=audio_path, audio_codec=self.audio_codec,
+            output_format=output_format
+        )
+        if self.processes and store is not None:
+            return self._render_in_processes(sink, store, chunks, frame_counts, zoom_factor, on_progress)
+
+        renderers: Dict[int, ZoomRenderer] = {}
+        locks = {segment: threading.Lock() for segment in range(len(frame_counts))}
+        remaining = {segment: -(-frames // self.batch_size) for segment, frames in enumerate(frame_counts)}
+
+        def renderer_for(segment: int) -> ZoomRenderer:
+            # Each image is decoded and oversampled once, by whichever chunk gets there first
+            with locks[segment]:
+                if segment not in renderers:
+                    renderers[segment] = ZoomRenderer(
+                        sources[segment],
+                        target_resolution,
+                        frame_counts[segment] / self.fps,
+                        zoom_direction="in" if segment % 2 == 0 else "out",
+                        zoom_factor=zoom_factor,
+                        fps=self.fps,
+                        frame_resample=self.frame_resample,
+                    )
+                return renderers[segment]
+
+        def produce(chunk: Tuple[int, int, int]) -> List[Union[bytes, memoryview]]:
+            segment, start, stop = chunk
+            frames = renderer_for(segment).render_frames(range(start, stop))
+            return [sink.pack(frame) for frame in frames]
+
+        window = max(self.max_buffered_frames // self.batch_size, 1)
+        pending: "queue.Queue[Optional[Future]]" = queue.Queue(maxsize=window)
+        stop_feeding = threading.Event()
+
+        def feed(pool: ThreadPoolExecutor) -> None:
+            for chunk in chunks:
+                if stop_feeding.is_set():
+                    break
+                # Blocks while the queue is full - backpressure from the encoder
+                pending.put(pool.submit(produce, chunk))
+            pending.put(None)
+
+        with sink, ThreadPoolExecutor(max_workers=self.workers) as pool:
+            feeder = threading.Thread(target=feed, args=(pool,), daemon=True)
+            feeder.start()
+            try:
+                for chunk in chunks:
+                    future = pending.get()
+                    for data in future.result():
+                        sink.write(data)
+                    if on_progress:
+                        on_progress(sink.frames_written)
+                    segment = chunk[0]
+                    remaining[segment] -= 1
+                    if remaining[segment] == 0:
+                        renderers.pop(segment, None)
+                        if store is not None:
+                            store.release(segment)
+            except Exception as e:
+                stop_feeding.set()
+                # Drain so the feeder can finish and the pool can shut down
+                while feeder.is_alive() or not pending.empty():
+                    try:
+                        item = pending.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    if item is not None:
+                        item.cancel()
+                if isinstance(e, VideoProcessingError):
+                    raise
+                raise VideoProcessingError(f"Frame production failed: {e}") from e
+            finally:
+                feeder.join()
+                if store is not None:
+                    store.close()
+            return sink.frames_written
+
+    def _render_in_processes(
+        self,
+        sink: FrameSink,
+        store: SourceImageStore,
+        chunks: List[Tuple[int, int, int]],
+        frame_counts: Sequence[int],
+        zoom_factor: float,
+        on_progress: Optional[Callable[[int], None]],
+    ) -> int:
+        """Produce chunks in worker processes that render into FrameRing slots.
+
+        A chunk is only submitted once a slot is free, so the ring bounds the
+        frames in flight; slots are written to the sink in timeline order and
+        reused as soon as their bytes reach the encoder.
+        """
+        w, h = sink.resolution
+        frame_shape = (sink.frame_bytes(),) if self.pix_fmt == "yuv420p" else (h, w, 3)
+        slots = max(self.max_buffered_frames // self.batch_size, 1)
+        settings = {
+            "target_resolution": sink.resolution, "fps": self.fps, "zoom_factor": zoom_factor,
+            "frame_resample": self.frame_resample, "pix_fmt": self.pix_fmt,
+        }
+        in_flight: "deque[Tuple[Tuple[int, int, int], int, Future]]" = deque()
+        next_chunk = iter(chunks)
+        try:
+            with FrameRing(slots, frame_shape, self.batch_size) as ring, sink, ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_producer,
+                initargs=(ring, (str(store.path), len(store), store.size), frame_counts, settings),
+            ) as pool:
+                try:
+                    while True:
+                        while ring.free_slots:
+                            chunk = next(next_chunk, None)
+                            if chunk is None:
+                                break
+                            slot = ring.acquire()
+                            in_flight.append((chunk, slot, pool.submit(_produce_into_slot, chunk, slot)))
+                        if not in_flight:
+                            break
+                        chunk, slot, future = in_flight.popleft()
+                        count = future.result()
+                        with ring.view(slot, count) as data:
+                            sink.write(data, frames=count)
+                        ring.release(slot)
+                        if on_progress:
+                            on_progress(sink.frames_written)
+                except BaseException:
+                    for _, _, future in in_flight:
+                        future.cancel()
+                    raise
+                return sink.frames_written
+        except VideoProcessingError:
+            raise
+        except Exception as e:
+            raise VideoProcessingError(f"Frame production failed: {e}") from e
+        finally:
+            store.close()
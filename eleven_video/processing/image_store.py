@@ -0,0 +1,126 @@
+"""Decoded, pre-scaled source images in one memory-mapped array.
+
+Without a store every image is decoded by its own clip or renderer, and the
+moviepy path keeps a decoded array (plus an oversampled copy) alive for each
+image for the whole concatenation. SourceImageStore decodes every image once
+in a thread pool, resizes it to the render's oversampled base size, and
+writes the pixels into a single file in the scratch directory that is then
+opened as a read-only ``np.memmap``.
+Renderers then read crop windows straight from the mapping, so frame
+production does no decode work and the pixels live in reclaimable page
+cache instead of the process heap.
+
+Related files:
+- eleven_video/processing/zoom.py: ZoomRenderer (reads crop windows from store slices)
+- eleven_video/processing/frame_sink.py: PipeRenderer (releases finished images)
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler (moviepy and pipe backends)
+"""
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image as PILImage
+
+from eleven_video.processing.zoom import ImageSource, _load_source
+
+
+class SourceImageStore:
+    """Read-only (count, height, width, 3) uint8 pixel array backed by a file.
+
+    Example:
+        store = SourceImageStore.build(image_paths, (2073, 1166), work_dir)
+        renderer = ZoomRenderer(store[0], (1920, 1080), duration=4.0)
+    """
+
+    FILE_NAME = "sources.rgb"
+
+    def __init__(self, path: Path, count: int, size: Tuple[int, int]):
+        """Open an existing store file (see ``build``)."""
+        self.path = Path(path)
+        self.size = size
+        width, height = size
+        self._pixels: Optional[np.memmap] = np.memmap(
+            self.path, dtype=np.uint8, mode="r", shape=(count, height, width, 3)
+        )
+
+    @classmethod
+    def build(
+        cls,
+        sources: Sequence[ImageSource],
+        size: Tuple[int, int],
+        work_dir: Path,
+        workers: Optional[int] = None,
+        resample: int = PILImage.LANCZOS,
+    ) -> "SourceImageStore":
+        """Decode and resize every source into a new store file.
+
+        Args:
+            sources: Image files, encoded bytes, PIL images or arrays.
+            size: (width, height) every image is resized to.
+            work_dir: Scratch directory for the pixel file.
+            workers: Decode threads (default: number of cores).
+            resample: Pillow filter for the one-time resize.
+
+        Raises:
+            OSError: If an image cannot be decoded or the file cannot be written.
+        """
+        work_dir = Path(work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        path = work_dir / cls.FILE_NAME
+        width, height = size
+        image_bytes = width * height * 3
+
+        lock = threading.Lock()
+
+        # Written with file writes rather than through a mapping, so the
+        # pixels never count against this process's resident memory
+        with open(path, "wb") as f:
+            f.truncate(image_bytes * len(sources))
+
+            def decode(index: int) -> None:
+                img = _load_source(sources[index])
+                if img.size != size:
+                    img = img.resize(size, resample)
+                data = img.tobytes()
+                with lock:
+                    f.seek(index * image_bytes)
+                    f.write(data)
+
+            with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+                list(pool.map(decode, range(len(sources))))
+        return cls(path, len(sources), size)
+
+    def __len__(self) -> int:
+        return len(self._pixels)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """Pixels of one image as a (height, width, 3) view into the mapping (no copy)."""
+        return self._pixels[index]
+
+    def release(self, index: int) -> None:
+        """Tell the OS one image's pages are no longer needed (they are re-read on access)."""
+        raw = getattr(self._pixels, "_mmap", None)
+        if raw is None or not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        width, height = self.size
+        image_bytes = width * height * 3
+        start = index * image_bytes
+        aligned = start - start % mmap.PAGESIZE
+        length = start + image_bytes - aligned
+        length -= length % mmap.PAGESIZE
+        if length > 0:
+            raw.madvise(mmap.MADV_DONTNEED, aligned, length)
+
+    def close(self) -> None:
+        """Unmap the pixels (the file is removed with the scratch directory)."""
+        self._pixels = None
+
+    def __enter__(self) -> "SourceImageStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,76 @@
+"""In-memory files that ffmpeg, moviepy and worker processes open by path.
+
+Every backend reads its inputs by path: ffmpeg takes ``-i`` arguments,
+moviepy's AudioFileClip starts its own ffmpeg reader, and segment and frame
+workers run in other processes. Copying each Image and Audio buffer to a
+temp file only so they can read it back costs a write and a read of every
+byte on the scratch disk. A MemoryFile instead holds the bytes in an
+anonymous in-memory file (``memfd_create``) and hands out its
+``/proc/<pid>/fd/<fd>`` path. Any process of the same user can open that
+path while the creating process keeps the file open; the bytes never reach
+a disk, and Pillow, ffmpeg and the workers read them straight from memory.
+
+The file is seekable, so consumers that probe or read the input twice
+(the MP3 duration fallback, copy-mode muxing, the background AAC transcode)
+work as they do on a regular file, which a pipe would not allow.
+
+``memfd_create`` and ``/proc`` are Linux-only; elsewhere the compiler
+writes its temp files as before (see ``memory_files_supported``).
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler._stage_inputs
+"""
+import os
+from typing import Optional
+
+
+def memory_files_supported() -> bool:
+    """Whether MemoryFile works on this system (``memfd_create`` and ``/proc``)."""
+    return hasattr(os, "memfd_create") and os.path.isdir(f"/proc/{os.getpid()}/fd")
+
+
+class MemoryFile:
+    """Bytes in an anonymous in-memory file, readable through ``path``.
+
+    The path is only valid while the file is open and in the process that
+    created it (or its children); close it once every reader has finished.
+
+    Example:
+        with MemoryFile(audio.data, "audio.mp3") as audio_file:
+            run_ffmpeg(["-i", audio_file.path, ...])
+    """
+
+    def __init__(self, data: bytes, name: str = "input"):
+        """Copy ``data`` into a new in-memory file.
+
+        Args:
+            data: File contents.
+            name: Label shown for the file in ``/proc`` (for debugging only).
+
+        Raises:
+            OSError: If the in-memory file cannot be created or written.
+        """
+        self.name = name
+        self.size = len(data)
+        self._fd: Optional[int] = os.memfd_create(name, os.MFD_CLOEXEC)
+        try:
+            with memoryview(data) as view:
+                written = 0
+                while written < len(view):
+                    written += os.write(self._fd, view[written:])
+        except BaseException:
+            self.close()
+            raise
+        self.path = f"/proc/{os.getpid()}/fd/{self._fd}"
+
+    def close(self) -> None:
+        """Release the memory; the path stops working."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "MemoryFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
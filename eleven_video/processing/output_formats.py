@@ -0,0 +1,89 @@
+"""Output container formats, including progressive ones written during the render.
+
+A regular MP4 is only usable once the render finishes: ``+faststart`` moves
+the index to the front of the file as a final pass. Two progressive formats
+are readable while ffmpeg is still writing:
+
+- ``"fmp4"``: fragmented MP4 (an empty ``moov`` followed by self-contained
+  fragments), which can also be written to stdout (output path ``-``).
+- ``"hls"``: an HLS event playlist plus MPEG-TS segments, appended as each
+  segment is closed.
+
+Keyframes are forced every ``FRAGMENT_SECONDS`` so fragments and segments
+are short and evenly sized.
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(output_format=...)
+- eleven_video/processing/ffmpeg_backend.py, frame_sink.py, slideshow.py, segments.py: writers
+- eleven_video/processing/audio_mux.py: mux_audio (remux into the output format)
+"""
+from pathlib import Path
+from typing import List, Union
+
+# "mp4": regular MP4 with the index moved to the front when the render finishes
+OUTPUT_FORMATS = ("mp4", "fmp4", "hls")
+
+# Output path that streams the video to stdout (fragmented MP4 only)
+STDOUT = "-"
+
+FRAGMENT_SECONDS = 2
+
+_SUFFIXES = {"mp4": ".mp4", "fmp4": ".mp4", "hls": ".m3u8"}
+
+
+def is_stdout(output_path: Union[str, Path]) -> bool:
+    """Whether ``output_path`` means "write to stdout"."""
+    return str(output_path) == STDOUT
+
+
+def output_suffix(output_format: str) -> str:
+    """File extension for an output format (the playlist for HLS)."""
+    return _SUFFIXES[output_format]
+
+
+def hls_segment_pattern(playlist_path: Path) -> Path:
+    """Segment file pattern written next to an HLS playlist (``video_00000.ts``, ...)."""
+    playlist_path = Path(playlist_path)
+    return playlist_path.with_name(f"{playlist_path.stem}_%05d.ts")
+
+
+def muxer_args(output_format: str, output_path: Union[str, Path], keyframes: bool = True) -> List[str]:
+    """Trailing ffmpeg output options for ``output_format``, ending with the output target.
+
+    Args:
+        output_format: One of OUTPUT_FORMATS.
+        output_path: Destination file, HLS playlist, or ``-`` for stdout.
+        keyframes: Force keyframes on the fragment grid. Pass False when the
+            video stream is copied rather than encoded.
+    """
+    target = "pipe:1" if is_stdout(output_path) else str(output_path)
+    if output_format == "mp4":
+        return ["-movflags", "+faststart", target]
+
+    args = []
+    if keyframes:
+        args += ["-force_key_frames", f"expr:gte(t,n_forced*{FRAGMENT_SECONDS})"]
+    if output_format == "fmp4":
+        return args + [
+            "-f", "mp4",
+            "-movflags", "+frag_keyframe+empty_moov+default_base_moof",
+            target,
+        ]
+    return args + [
+        "-f", "hls",
+        "-hls_time", str(FRAGMENT_SECONDS),
+        "-hls_playlist_type", "event",
+        "-hls_segment_filename", str(hls_segment_pattern(Path(output_path))),
+        target,
+    ]
+
+
+def output_size(output_format: str, output_path: Path) -> int:
+    """Bytes written for an output (playlist plus segments for HLS, 0 for stdout)."""
+    output_path = Path(output_path)
+    if is_stdout(output_path) or not output_path.exists():
+        return 0
+    size = output_path.stat().st_size
+    if output_format == "hls":
+        size += sum(p.stat().st_size for p in output_path.parent.glob(f"{output_path.stem}_*.ts"))
+    return size
@@ -0,0 +1,103 @@
+"""Named render profiles trading encode speed against quality.
+
+A RenderProfile bundles the encoder and frame-production settings that used
+to be fixed class constants on FFmpegVideoCompiler: x264 preset and CRF,
+encoder thread count, output frame rate and the per-frame resampling filter.
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(profile=...)
+- eleven_video/main.py: generate --profile
+- eleven_video/config/settings.py: default_render_profile
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Tuple, Union
+
+from PIL import Image as PILImage
+
+from eleven_video.exceptions.custom_errors import ValidationError
+
+# Resampling filters for frames produced in Python (moviepy and pipe backends)
+_PIL_RESAMPLE = {
+    "bilinear": PILImage.BILINEAR,
+    "bicubic": PILImage.BICUBIC,
+    "lanczos": PILImage.LANCZOS,
+}
+
+
+@dataclass(frozen=True)
+class RenderProfile:
+    """Encoder speed/quality settings for one render.
+
+    Attributes:
+        name: Profile name (draft, standard, archival).
+        preset: x264 preset (ultrafast ... veryslow).
+        crf: x264 constant rate factor (lower is higher quality, 23 is x264's default).
+        threads: Encoder threads; 0 lets the encoder pick (one per core).
+        fps: Output frame rate.
+        resample: Per-frame resampling filter for Python-rendered zoom frames
+            ("bilinear", "bicubic" or "lanczos").
+        oversample: Canvas oversampling for the ffmpeg zoompan filter graph.
+    """
+    name: str
+    preset: str
+    crf: int
+    threads: int
+    fps: int
+    resample: str
+    oversample: int = 2
+
+    @property
+    def pil_resample(self) -> int:
+        """Pillow resampling constant for ``resample``."""
+        return _PIL_RESAMPLE[self.resample]
+
+    def x264_args(self) -> List[str]:
+        """Encoder options for this profile (ffmpeg command-line form)."""
+        args = ["-preset", self.preset, "-crf", str(self.crf)]
+        if self.threads:
+            args += ["-threads", str(self.threads)]
+        return args
+
+
+RENDER_PROFILES: Dict[str, RenderProfile] = {
+    # Fast review renders: fewest frames, cheapest filter, fastest x264 preset
+    "draft": RenderProfile("draft", preset="ultrafast", crf=28, threads=0, fps=15, resample="bilinear"),
+    # Matches the previous fixed output (24 fps, x264 defaults)
+    "standard": RenderProfile("standard", preset="medium", crf=23, threads=0, fps=24, resample="bilinear"),
+    "archival": RenderProfile("archival", preset="slow", crf=18, threads=0, fps=30, resample="lanczos"),
+}
+
+DEFAULT_RENDER_PROFILE = "standard"
+
+# Low-resolution proxy for review: cheapest filters, no canvas oversampling
+PREVIEW_PROFILE = RenderProfile("preview", preset="ultrafast", crf=30, threads=0, fps=12, resample="bilinear", oversample=1)
+PREVIEW_SHORT_SIDE = 360
+
+
+def get_render_profile(name: Union[str, RenderProfile, None] = None) -> RenderProfile:
+    """Look up a render profile by name (case-insensitive).
+
+    Args:
+        name: Profile name, a RenderProfile (returned as-is), or None for the default profile.
+
+    Raises:
+        ValidationError: If the name is not a known profile.
+    """
+    if isinstance(name, RenderProfile):
+        return name
+    key = (name or DEFAULT_RENDER_PROFILE).lower().strip()
+    if key not in RENDER_PROFILES:
+        raise ValidationError(
+            f"Unknown render profile '{name}'. Options: {', '.join(RENDER_PROFILES)}"
+        )
+    return RENDER_PROFILES[key]
+
+
+def proxy_resolution(resolution: Tuple[int, int], short_side: int = PREVIEW_SHORT_SIDE) -> Tuple[int, int]:
+    """Scale a (width, height) so its shorter side is ``short_side``, keeping aspect ratio.
+
+    Both dimensions are rounded to even numbers as yuv420p requires.
+    """
+    width, height = resolution
+    scale = short_side / min(width, height)
+    return (max(2, round(width * scale / 2) * 2), max(2, round(height * scale / 2) * 2))
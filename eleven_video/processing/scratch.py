@@ -0,0 +1,150 @@
+"""Scratch space for compile intermediates: location, size estimate and reservation.
+
+Every compile writes its inputs (images, narration) and intermediates (source
+pixel store, pre-scaled stills, encoded segments, remux inputs) to a scratch
+directory. By default that is the system temp location; pointing it at tmpfs
+or local NVMe keeps the render off slow or network-backed ``/tmp``.
+
+Before anything is written the compiler estimates how much scratch the
+render needs and reserves it. Reservations are small files in the scratch
+root, so concurrent renders on the same node see each other's claims; a
+render that does not fit fails up front instead of filling the disk part-way
+or spilling elsewhere. The check is conservative: space already used by
+another render is counted both in the free space and in its reservation.
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(scratch_dir=...)
+- eleven_video/config/settings.py: scratch_dir setting
+- eleven_video/main.py: generate --scratch-dir
+"""
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: reservations are not serialised between processes
+    fcntl = None
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+
+RESERVATIONS_DIR = ".eleven_video_reservations"
+
+# H.264 at the profiles' CRF stays well below this for slideshows; used as an upper bound
+ENCODED_BITS_PER_PIXEL = 0.15
+
+# Headroom on top of the estimate (container overhead, filesystem blocks)
+SCRATCH_MARGIN = 1.25
+
+
+def encoded_video_bytes(resolution, frame_count: int) -> int:
+    """Upper-bound size of ``frame_count`` encoded frames at ``resolution``."""
+    w, h = resolution
+    return int(w * h * frame_count * ENCODED_BITS_PER_PIXEL / 8)
+
+
+def format_bytes(size: float) -> str:
+    """Human-readable size, e.g. ``1.4 GB``."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} B" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+class ScratchReservation:
+    """A claim on scratch space, released when the render finishes."""
+
+    def __init__(self, path: Path, size: int):
+        self.path = path
+        self.size = size
+
+    def release(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "ScratchReservation":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class ScratchSpace:
+    """Scratch root where compile work directories are created.
+
+    Example:
+        scratch = ScratchSpace(Path("/mnt/nvme/eleven-video"))
+        with scratch.reserve(estimate), scratch.work_dir() as temp_dir:
+            ...
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else Path(tempfile.gettempdir())
+
+    def free_bytes(self) -> int:
+        return shutil.disk_usage(self.root).free
+
+    def reserved_bytes(self) -> int:
+        """Space claimed by other live renders (stale claims are removed)."""
+        total = 0
+        for path in (self.root / RESERVATIONS_DIR).glob("*.json"):
+            try:
+                claim = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if _pid_alive(int(claim.get("pid", 0))):
+                total += int(claim.get("bytes", 0))
+            else:
+                path.unlink(missing_ok=True)
+        return total
+
+    def reserve(self, size: int) -> ScratchReservation:
+        """Claim ``size`` bytes of scratch space.
+
+        Raises:
+            VideoProcessingError: If the scratch root cannot be created or has
+                less free space than ``size`` plus other renders' claims.
+        """
+        reservations = self.root / RESERVATIONS_DIR
+        try:
+            reservations.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise VideoProcessingError(f"Cannot use scratch directory {self.root}: {e}") from e
+
+        with open(reservations / ".lock", "a") as lock:
+            if fcntl is not None:
+                # One check-and-claim at a time, so two renders cannot both take the last gigabyte
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            available = self.free_bytes() - self.reserved_bytes()
+            if size > available:
+                raise VideoProcessingError(
+                    f"Not enough scratch space in {self.root}: the render needs about "
+                    f"{format_bytes(size)} but {format_bytes(max(available, 0))} is available. "
+                    "Free some space or choose a larger scratch directory."
+                )
+            path = reservations / f"{os.getpid()}-{uuid.uuid4().hex}.json"
+            path.write_text(json.dumps({"pid": os.getpid(), "bytes": size}), encoding="utf-8")
+        return ScratchReservation(path, size)
+
+    def work_dir(self) -> tempfile.TemporaryDirectory:
+        """A fresh temporary work directory under the scratch root."""
+        return tempfile.TemporaryDirectory(prefix="eleven_video_", dir=self.root)
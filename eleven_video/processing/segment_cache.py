@@ -0,0 +1,175 @@
+"""Content-addressed cache of encoded video segments.
+
+ParallelSegmentRenderer encodes every image segment to its own H.264 file
+and joins them by stream copy. SegmentCache keeps those files between
+renders, keyed by everything that determines their bytes: the image
+content, the segment's filter chain (frame count, zoom direction,
+resolution, fps) and the encoder arguments (render profile). Re-rendering
+after swapping one image or changing one segment's timing then re-encodes
+only the affected segments and stream-copies the rest.
+
+The cache directory is capped in size; the least recently used segments
+are evicted first (file mtime is refreshed on every hit).
+
+Related files:
+- eleven_video/processing/segments.py: ParallelSegmentRenderer (cache=...)
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(segment_cache=...)
+- eleven_video/orchestrator/video_pipeline.py: VideoPipeline(segment_cache_dir=...), `generate --segment-cache`
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+
+import platformdirs
+
+from eleven_video.config.persistence import APP_NAME
+
+# Bump when the segment render pipeline changes in a way the key does not capture
+CACHE_VERSION = "1"
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GiB
+
+
+def default_cache_dir() -> Path:
+    """OS-standard cache directory for encoded segments."""
+    return Path(platformdirs.user_cache_dir(APP_NAME)) / "segments"
+
+
+def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SegmentCache:
+    """Size-capped LRU store of encoded segments on disk.
+
+    Example:
+        cache = SegmentCache(max_bytes=512 * 1024 ** 2)
+        key = cache.key(image_hash, filter_chain, encoder_args)
+        path = cache.get(key) or cache.put(key, freshly_encoded_path)
+    """
+
+    SUFFIX = ".mp4"
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(image_hash: str, filter_chain: str, encoder_args: Sequence[str]) -> str:
+        """Cache key for one segment.
+
+        ``-threads`` is excluded: it changes with the worker count but not
+        whether segments can be joined by stream copy.
+        """
+        args: List[str] = []
+        skip = False
+        for arg in encoder_args:
+            if skip:
+                skip = False
+                continue
+            if arg == "-threads":
+                skip = True
+                continue
+            args.append(arg)
+
+        digest = hashlib.sha256()
+        for part in (CACHE_VERSION, image_hash, filter_chain, "\0".join(args)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Location of the segment for ``key`` (whether or not it exists)."""
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the cached segment for ``key`` and mark it recently used, or None."""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, source: Path, evict: bool = True) -> Path:
+        """Move an encoded segment into the cache and evict old entries.
+
+        The file is renamed into place atomically, so concurrent renders never
+        see a partial segment.
+
+        Args:
+            key: Cache key from ``key()``.
+            source: Encoded segment file (moved, not copied).
+            evict: Enforce the size cap now; pass False when several segments
+                are added for one render and call ``evict()`` afterwards.
+
+        Returns:
+            Path of the cached segment.
+        """
+        target = self.path_for(key)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.move(str(source), tmp_name)
+            os.replace(tmp_name, target)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        if evict:
+            self.evict(keep=[target])
+        return target
+
+    def size_bytes(self) -> int:
+        """Total size of cached segments."""
+        return sum(p.stat().st_size for p in self._entries())
+
+    def evict(self, keep: Iterable[Path] = ()) -> int:
+        """Delete least recently used segments until the cache fits ``max_bytes``.
+
+        Args:
+            keep: Segments that must survive (those used by the current render).
+
+        Returns:
+            Number of segments removed.
+        """
+        keep = {Path(p) for p in keep}
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if path in keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached segment."""
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+
+    def _entries(self) -> List[Path]:
+        return list(self.cache_dir.glob(f"*{self.SUFFIX}"))
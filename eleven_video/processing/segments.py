@@ -0,0 +1,303 @@
+"""Parallel per-segment rendering with stream-copy concatenation.
+
+Each image segment is rendered to its own intermediate H.264 file in a
+process pool, all with identical encoder parameters. The segments are then
+joined with the ffmpeg concat demuxer by stream copy (no re-encode) while the
+narration audio is muxed in, so compile time scales with the number of cores.
+
+Crossfade transitions keep that structure. Instead of compositing the whole
+video, each boundary gets a short transition window of its own: the
+outgoing segment gives up its last frames, the incoming one its first, and
+a separate intermediate file crossfades the two (still zooming) images over
+exactly those frames. Segment bodies stay ordinary single-image encodes, so
+they are still rendered in parallel, cached and joined by stream copy;
+changing one image re-encodes its body and the two windows next to it.
+
+Related files:
+- eleven_video/processing/ffmpeg_backend.py: FilterGraphRenderer (filter chains, encoder args)
+- eleven_video/processing/segment_cache.py: SegmentCache (reuse of unchanged segments)
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler (backend="parallel")
+"""
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.processing.compile_journal import CompileJournal
+from eleven_video.processing.ffmpeg_backend import FilterGraphRenderer, run_ffmpeg
+from eleven_video.processing.output_formats import muxer_args
+from eleven_video.processing.segment_cache import SegmentCache, hash_file
+
+
+@dataclass
+class SegmentJob:
+    """One image segment to encode to an intermediate file.
+
+    Attributes:
+        index: Position of the segment in the video.
+        image_path: Source image file.
+        frame_count: Number of frames to encode.
+        filter_chain: Filter chain from ``[0:v]`` to ``[v]``.
+        output_path: Intermediate segment file (.mp4).
+        encoder_args: Video encoder arguments (identical across segments).
+        extra_inputs: Further input images (the incoming image of a transition window).
+    """
+    index: int
+    image_path: str
+    frame_count: int
+    filter_chain: str
+    output_path: str
+    encoder_args: List[str] = field(default_factory=list)
+    extra_inputs: List[str] = field(default_factory=list)
+
+    @property
+    def inputs(self) -> List[str]:
+        return [self.image_path, *self.extra_inputs]
+
+    @property
+    def signature(self) -> str:
+        """What the intermediate holds, for resuming: frame count and filter chain (not input paths)."""
+        chain = hashlib.sha256(self.filter_chain.encode("utf-8")).hexdigest()[:16]
+        return f"{self.frame_count}:{chain}"
+
+
+def render_segment(job: SegmentJob) -> str:
+    """Encode one segment with ffmpeg (runs inside a worker process).
+
+    Returns:
+        Path of the encoded segment.
+
+    Raises:
+        VideoProcessingError: If ffmpeg fails.
+    """
+    inputs: List[str] = []
+    for path in job.inputs:
+        inputs += ["-i", path]
+    run_ffmpeg([
+        *inputs,
+        "-filter_complex", job.filter_chain,
+        "-map", "[v]",
+        "-frames:v", str(job.frame_count),
+        *job.encoder_args,
+        "-an",
+        job.output_path,
+    ])
+    return job.output_path
+
+
+def write_concat_list(segment_paths: Sequence[str], list_path: Path) -> Path:
+    """Write an ffmpeg concat-demuxer list for the given files.
+
+    Paths are written absolute with single quotes escaped, as the demuxer
+    expects.
+    """
+    lines = []
+    for path in segment_paths:
+        escaped = str(Path(path).resolve()).replace("'", "'\\''")
+        lines.append(f"file '{escaped}'")
+    list_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return list_path
+
+
+def concat_segments(
+    list_path: Path,
+    audio_path: str,
+    output_path: Path,
+    audio_codec: str = "aac",
+    output_format: str = "mp4",
+) -> None:
+    """Join segments by stream copy and mux the narration audio into ``output_format``.
+
+    Raises:
+        VideoProcessingError: If ffmpeg fails.
+    """
+    run_ffmpeg([
+        "-f", "concat",
+        "-safe", "0",
+        "-i", str(list_path),
+        "-i", str(audio_path),
+        "-map", "0:v",
+        "-map", "1:a",
+        "-c:v", "copy",
+        "-c:a", audio_codec,
+        *muxer_args(output_format, output_path, keyframes=False),
+    ])
+
+
+def transition_windows(frame_counts: Sequence[int], transition_frames: int) -> List[Tuple[int, int]]:
+    """(tail, length) of the crossfade window at each boundary between consecutive segments.
+
+    A window takes ``tail`` frames from the end of the outgoing segment and
+    ``length - tail`` from the start of the incoming one. It is at most half
+    of either segment, so every body keeps frames of its own; boundaries
+    where that leaves fewer than two frames get a hard cut, ``(0, 0)``.
+    """
+    windows = []
+    for before, after in zip(frame_counts, frame_counts[1:]):
+        length = min(transition_frames, before // 2, after // 2)
+        windows.append((length // 2, length) if length >= 2 else (0, 0))
+    return windows
+
+
+class ParallelSegmentRenderer:
+    """Renders image segments concurrently and joins them by stream copy.
+
+    Worker count defaults to the number of cores; each ffmpeg process gets
+    an equal share of the cores as encoder threads so the pool does not
+    oversubscribe the machine. ``cores`` limits both to part of the machine
+    (e.g. a CpuLease when other renders share the node). With
+    ``transition_frames`` consecutive segments are crossfaded over that many
+    frames, each window encoded as its own intermediate (see module docstring).
+
+    Example:
+        renderer = ParallelSegmentRenderer(FilterGraphRenderer())
+        renderer.render(paths, "audio.mp3", [96, 96], Path("out.mp4"), (1920, 1080), work_dir)
+    """
+
+    def __init__(
+        self,
+        graph: Optional[FilterGraphRenderer] = None,
+        max_workers: Optional[int] = None,
+        cores: Optional[int] = None,
+        transition_frames: int = 0,
+    ):
+        self.graph = graph or FilterGraphRenderer()
+        self.cores = cores or os.cpu_count() or 1
+        self.max_workers = max_workers or self.cores
+        self.transition_frames = transition_frames
+
+    def build_jobs(
+        self,
+        image_paths: Sequence[str],
+        frame_counts: Sequence[int],
+        target_resolution: Tuple[int, int],
+        work_dir: Path,
+        enable_zoom: bool = True,
+    ) -> List[SegmentJob]:
+        """Create one job per segment with a non-zero frame count, plus one per transition window.
+
+        Jobs are in timeline order: each segment's body, then the window
+        into the next segment.
+        """
+        used = [(i, frames) for i, frames in enumerate(frame_counts) if frames > 0]
+        windows = transition_windows([frames for _, frames in used], self.transition_frames)
+        count = len(used) + sum(1 for _, length in windows if length)
+        workers = max(min(self.max_workers, count), 1)
+        threads = max(self.cores // workers, 1)
+        encoder_args = self.graph.encoder_args() + ["-threads", str(threads)]
+
+        heads = [0] + [length - tail for tail, length in windows]
+        tails = [tail for tail, _ in windows] + [0]
+        jobs = []
+        for k, (i, frames) in enumerate(used):
+            body = frames - heads[k] - tails[k]
+            jobs.append(SegmentJob(
+                index=i,
+                image_path=str(image_paths[i]),
+                frame_count=body,
+                filter_chain=self.graph.segment_chain(
+                    i, "0:v", "v", body, target_resolution, enable_zoom, first_frame=heads[k], span=frames
+                ),
+                output_path=str(work_dir / f"segment_{i:04d}.mp4"),
+                encoder_args=encoder_args,
+            ))
+            if k < len(windows) and windows[k][1]:
+                tail, length = windows[k]
+                j, next_frames = used[k + 1]
+                jobs.append(SegmentJob(
+                    index=i,
+                    image_path=str(image_paths[i]),
+                    frame_count=length,
+                    filter_chain=self.graph.transition_chain(
+                        (i, frames), (j, next_frames), tail, length, target_resolution, enable_zoom
+                    ),
+                    output_path=str(work_dir / f"transition_{i:04d}.mp4"),
+                    encoder_args=encoder_args,
+                    extra_inputs=[str(image_paths[j])],
+                ))
+        return jobs
+
+    def render(
+        self,
+        image_paths: Sequence[str],
+        audio_path: str,
+        frame_counts: Sequence[int],
+        output_path: Path,
+        target_resolution: Tuple[int, int],
+        work_dir: Path,
+        enable_zoom: bool = True,
+        cache: Optional[SegmentCache] = None,
+        output_format: str = "mp4",
+        on_progress: Optional[Callable[[int], None]] = None,
+        journal: Optional[CompileJournal] = None,
+    ) -> int:
+        """Encode every segment in parallel, then concatenate and mux audio.
+
+        With a cache, segments whose image, timing, zoom, resolution and
+        encoder settings are unchanged are reused as-is and only the rest
+        are encoded; new segments are added to the cache. ``on_progress``
+        receives the frames finished so far (cached segments count at once,
+        encoded ones as each segment completes). With a journal, segments
+        completed by an earlier, interrupted run of the same job are kept
+        and every newly encoded segment is recorded as its result arrives.
+
+        Returns:
+            Number of intermediates encoded, segments and transition windows
+            (the rest came from the cache or journal).
+
+        Raises:
+            VideoProcessingError: If any segment or the final join fails.
+        """
+        work_dir = Path(work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+
+        jobs = self.build_jobs(image_paths, frame_counts, target_resolution, work_dir, enable_zoom)
+        if not jobs:
+            raise VideoProcessingError("FFmpeg render failed: audio too short for any video frames")
+
+        # Keyed by intermediate file: a segment and its outgoing transition share an index
+        segment_paths: Dict[str, str] = {}
+        keys: Dict[str, str] = {}
+        pending = jobs
+        if cache is not None:
+            pending = []
+            for job in jobs:
+                image_hash = "+".join(hash_file(path) for path in job.inputs)
+                keys[job.output_path] = cache.key(image_hash, job.filter_chain, job.encoder_args)
+                cached = cache.get(keys[job.output_path])
+                if cached is not None:
+                    segment_paths[job.output_path] = str(cached)
+                else:
+                    pending.append(job)
+        if journal is not None:
+            for job in pending:
+                if journal.is_complete(job.output_path, job.signature):
+                    segment_paths[job.output_path] = job.output_path
+            pending = [job for job in pending if job.output_path not in segment_paths]
+
+        done_frames = sum(job.frame_count for job in jobs if job.output_path in segment_paths)
+        if on_progress and done_frames:
+            on_progress(done_frames)
+        if pending:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(pending))) as pool:
+                # Results arrive in timeline order; each is recorded before the next is awaited
+                for job, path in zip(pending, pool.map(render_segment, pending)):
+                    if cache is not None:
+                        path = str(cache.put(keys[job.output_path], Path(path), evict=False))
+                    elif journal is not None:
+                        journal.mark_complete(path, job.signature)
+                    segment_paths[job.output_path] = path
+                    done_frames += job.frame_count
+                    if on_progress:
+                        on_progress(done_frames)
+
+        ordered = [segment_paths[job.output_path] for job in jobs]
+        list_path = write_concat_list(ordered, work_dir / "segments.txt")
+        concat_segments(list_path, audio_path, output_path, self.graph.audio_codec, output_format)
+        if cache is not None:
+            # Enforce the size cap only once this render no longer needs its segments
+            cache.evict(keep=[Path(p) for p in ordered])
+        return len(pending)
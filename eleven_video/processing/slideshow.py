@@ -0,0 +1,192 @@
+"""Static-slideshow fast path for videos without zoom.
+
+When the Ken Burns zoom is disabled every frame of a segment is identical,
+so nothing needs to be composited per frame. StaticSlideshowRenderer scales
+each image to the target resolution once, lists the stills in an ffmpeg
+concat-demuxer file with per-image durations, and encodes with x264's
+``stillimage`` tuning. The output is variable frame rate on the 1/fps time
+base: each still is encoded once and held until the next one, so a 10-minute
+video costs a few hundred encoded frames instead of 14,400.
+
+Related files:
+- eleven_video/processing/ffmpeg_backend.py: run_ffmpeg, segment_frame_counts
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler (enable_zoom=False)
+"""
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from PIL import Image as PILImage
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.processing.ffmpeg_backend import run_ffmpeg
+from eleven_video.processing.output_formats import muxer_args
+
+
+class StaticSlideshowRenderer:
+    """Renders still images with the concat demuxer, one scale per image.
+
+    Images are stretched to the target size (matching the moviepy path,
+    which resizes without preserving aspect ratio). Segment durations are
+    taken from per-segment frame counts so boundaries land exactly on the
+    output frame grid.
+
+    Example:
+        renderer = StaticSlideshowRenderer()
+        renderer.render(paths, "audio.mp3", [240, 240], Path("out.mp4"), (1920, 1080), work_dir)
+    """
+
+    def __init__(
+        self,
+        fps: int = 24,
+        video_codec: str = "libx264",
+        audio_codec: str = "aac",
+        max_workers: Optional[int] = None,
+        encoder_options: Optional[Sequence[str]] = None,
+    ):
+        self.fps = fps
+        self.video_codec = video_codec
+        self.audio_codec = audio_codec
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.encoder_options = list(encoder_options or [])
+
+    def encoder_args(self) -> List[str]:
+        """Video encoder arguments tuned for still content.
+
+        Frames keep the concat demuxer's timestamps (``-fps_mode vfr``) on a
+        1/fps time base instead of being duplicated to a constant rate.
+        """
+        args = ["-c:v", self.video_codec]
+        if self.video_codec == "libx264":
+            args += ["-tune", "stillimage"]
+        return args + self.encoder_options + [
+            "-pix_fmt", "yuv420p",
+            "-fps_mode", "vfr",
+            "-enc_time_base", f"1/{self.fps}",
+        ]
+
+    def prescale(
+        self,
+        image_paths: Sequence[str],
+        target_resolution: Tuple[int, int],
+        work_dir: Path,
+    ) -> List[str]:
+        """Scale every image to ``target_resolution`` once and save it as PNG.
+
+        Returns:
+            Paths of the scaled stills, in input order.
+        """
+        work_dir.mkdir(parents=True, exist_ok=True)
+
+        def scale(item: Tuple[int, str]) -> str:
+            i, path = item
+            out_path = work_dir / f"still_{i:04d}.png"
+            with PILImage.open(path) as img:
+                img = img.convert("RGB")
+                if img.size != tuple(target_resolution):
+                    img = img.resize(target_resolution, PILImage.LANCZOS)
+                # Low compression - the file is read once by ffmpeg and discarded
+                img.save(out_path, compress_level=1)
+            return str(out_path)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(scale, enumerate(image_paths)))
+
+    def write_concat_list(
+        self,
+        still_paths: Sequence[str],
+        frame_counts: Sequence[int],
+        list_path: Path,
+    ) -> Path:
+        """Write a concat-demuxer list with a duration for every still.
+
+        The demuxer ignores the duration of the final entry, and the encoder
+        gives the final frame a single frame period. The last still is
+        therefore listed a second time for the timeline's last frame, so the
+        video ends exactly ``sum(frame_counts) / fps`` after it starts.
+        """
+        entries = [(path, frames) for path, frames in zip(still_paths, frame_counts) if frames > 0]
+        lines = []
+        for i, (path, frames) in enumerate(entries):
+            quoted = str(Path(path).resolve()).replace("'", "'\\''")
+            lines.append(f"file '{quoted}'")
+            if i < len(entries) - 1:
+                lines.append(f"duration {frames / self.fps:.6f}")
+            elif frames > 1:
+                # Held until the last frame, which the repeated entry fills
+                lines.append(f"duration {(frames - 1) / self.fps:.6f}")
+                lines.append(f"file '{quoted}'")
+        list_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return list_path
+
+    def entry_end_frames(self, frame_counts: Sequence[int]) -> List[int]:
+        """Timeline frame at which each entry of ``write_concat_list`` ends.
+
+        Each entry is encoded as one frame, so after ``n`` encoded frames the
+        video covers the timeline up to ``entry_end_frames(...)[n - 1]``.
+        """
+        counts = [frames for frames in frame_counts if frames > 0]
+        ends = list(itertools.accumulate(counts))
+        if counts and counts[-1] > 1:
+            # The last still is listed twice: held until the last frame, which the repeat fills
+            ends[-1:] = [ends[-1] - 1, ends[-1]]
+        return ends
+
+    def render(
+        self,
+        image_paths: Sequence[str],
+        audio_path: str,
+        frame_counts: Sequence[int],
+        output_path: Path,
+        target_resolution: Tuple[int, int],
+        work_dir: Path,
+        output_format: str = "mp4",
+        on_progress: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        """Pre-scale the images and encode the slideshow with the audio.
+
+        ``output_format`` selects the container (see output_formats);
+        ``on_progress`` receives the frames of the timeline written so far.
+        ffmpeg's frame count cannot be used for that (each still is encoded
+        once however long it is shown) and neither can its ``out_time``,
+        which lags far behind for variable-frame-rate stills, so each
+        encoded frame is mapped to the end of the concat entry it encodes.
+
+        Raises:
+            VideoProcessingError: If there are no frames or ffmpeg fails.
+        """
+        if len(image_paths) != len(frame_counts):
+            raise VideoProcessingError("FFmpeg render failed: frame counts do not match images")
+
+        total_frames = sum(frame_counts)
+        if total_frames <= 0:
+            raise VideoProcessingError("FFmpeg render failed: audio too short for any video frames")
+
+        work_dir = Path(work_dir)
+        used = [(p, f) for p, f in zip(image_paths, frame_counts) if f > 0]
+        stills = self.prescale([p for p, _ in used], target_resolution, work_dir)
+        list_path = self.write_concat_list(stills, [f for _, f in used], work_dir / "stills.txt")
+
+        report = None
+        if on_progress is not None:
+            entry_ends = self.entry_end_frames([f for _, f in used])
+
+            def report(encoded: int) -> None:
+                if encoded > 0:
+                    on_progress(entry_ends[min(encoded, len(entry_ends)) - 1])
+
+        run_ffmpeg([
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(list_path),
+            "-i", str(audio_path),
+            "-map", "0:v",
+            "-map", "1:a",
+            *self.encoder_args(),
+            # Video and audio end together, on the last frame of the timeline
+            "-t", f"{total_frames / self.fps:.6f}",
+            "-c:a", self.audio_codec,
+            *muxer_args(output_format, output_path),
+        ], on_progress=report)
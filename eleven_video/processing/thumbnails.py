@@ -0,0 +1,230 @@
+"""Poster frame and seek-bar thumbnail sprite, rendered from the source images.
+
+Publishing needs a poster image and a sprite sheet of thumbnails for the
+player's seek bar. Both used to come from decoding the finished MP4 in a
+separate ffmpeg pass. ThumbnailRenderer produces them during the compile
+instead: the frame shown at any time is fully determined by the segment
+timings (segment_frame_counts) and the Ken Burns crop window at that point
+of the segment, so each thumbnail is one resample of the source image.
+
+Sources can be the pre-scaled pixels of a SourceImageStore the render
+already decoded (nothing is decoded again; only the crop window is read) or
+image files, each decoded at most once and, for JPEG, at the smallest DCT
+scale that still covers the thumbnails.
+
+Alongside the sprite a WebVTT index maps time ranges to sprite tiles
+(``sprite.jpg#xywh=x,y,w,h``), the format web players read for seek-bar
+previews.
+
+Related files:
+- eleven_video/processing/zoom.py: ZoomRenderer (same crop windows, frame by frame)
+- eleven_video/processing/ffmpeg_backend.py: segment_frame_counts, zoom_scale_range
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler (Video.poster_path, sprite_path)
+"""
+import math
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image as PILImage
+
+from eleven_video.processing.ffmpeg_backend import zoom_scale_range
+from eleven_video.processing.zoom import ImageSource, _load_source
+
+# Seconds of video covered by one sprite tile
+SPRITE_INTERVAL_SECONDS = 10.0
+
+# Tile width in pixels (height follows the video's aspect ratio)
+SPRITE_TILE_WIDTH = 160
+
+# Tiles per sprite row
+SPRITE_COLUMNS = 10
+
+# Where in the first segment the poster is taken (0 = first frame, 1 = last)
+POSTER_POSITION = 0.5
+
+JPEG_QUALITY = 85
+
+# Extra source pixels around a crop window, as in ZoomRenderer
+_WINDOW_MARGIN = 4
+
+
+def poster_path(output_path: Path) -> Path:
+    """``video.mp4`` -> ``video.poster.jpg``."""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.poster.jpg")
+
+
+def sprite_path(output_path: Path) -> Path:
+    """``video.mp4`` -> ``video.sprite.jpg`` (its WebVTT index is ``video.sprite.vtt``)."""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.sprite.jpg")
+
+
+def zoom_window(progress: float, zoom_direction: str = "in", zoom_factor: float = 1.08) -> Tuple[float, ...]:
+    """Crop window of a zoom frame as fractions (left, top, right, bottom) of the source.
+
+    The zoom stretches the source to the base size and crops a window of
+    ``base / scale`` around the center (see ZoomRenderer); relative to the
+    source that window does not depend on the base size.
+    """
+    start, end = zoom_scale_range(zoom_direction, zoom_factor)
+    scale = start + (end - start) * progress
+    half = 1 / scale / 2
+    return (0.5 - half, 0.5 - half, 0.5 + half, 0.5 + half)
+
+
+def _vtt_time(seconds: float) -> str:
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3600_000)
+    minutes, millis = divmod(millis, 60_000)
+    seconds, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{millis:03d}"
+
+
+class ThumbnailRenderer:
+    """Renders the poster and the seek-bar sprite of one video.
+
+    Example:
+        renderer = ThumbnailRenderer(fps=24, zoom_factor=1.08)
+        renderer.render(store_or_paths, frame_counts, (1920, 1080), Path("video.mp4"))
+    """
+
+    def __init__(
+        self,
+        fps: int = 24,
+        zoom_factor: float = 1.08,
+        interval: float = SPRITE_INTERVAL_SECONDS,
+        tile_width: int = SPRITE_TILE_WIDTH,
+        columns: int = SPRITE_COLUMNS,
+        resample: int = PILImage.BILINEAR,
+    ):
+        """
+        Args:
+            fps: Frame rate of the video the segment frame counts are on.
+            zoom_factor: Ken Burns zoom factor (1.0 for videos without zoom).
+            interval: Seconds of video per sprite tile.
+            tile_width: Sprite tile width; the height keeps the video's aspect ratio.
+            columns: Tiles per sprite row.
+            resample: Pillow filter for the crop-and-scale of each thumbnail.
+        """
+        self.fps = fps
+        self.zoom_factor = zoom_factor
+        self.interval = interval
+        self.tile_width = tile_width
+        self.columns = columns
+        self.resample = resample
+
+    def tile_size(self, resolution: Tuple[int, int]) -> Tuple[int, int]:
+        w, h = resolution
+        tile_h = max(int(round(self.tile_width * h / w / 2)) * 2, 2)
+        return (self.tile_width, tile_h)
+
+    def sample_times(self, duration: float) -> List[float]:
+        """Start time of every sprite tile."""
+        count = max(int(math.ceil(duration / self.interval - 1e-9)), 1)
+        return [i * self.interval for i in range(count)]
+
+    def frame_at(self, frame_counts: Sequence[int], t: float) -> Tuple[int, float]:
+        """(segment index, progress through that segment) of the frame shown at time ``t``."""
+        total = sum(frame_counts)
+        frame = min(max(int(t * self.fps), 0), max(total - 1, 0))
+        for segment, count in enumerate(frame_counts):
+            if frame < count:
+                return segment, frame / count
+            frame -= count
+        return len(frame_counts) - 1, 0.0
+
+    def window(self, segment: int, progress: float) -> Tuple[float, ...]:
+        """Source crop window of a frame (segments alternate zoom in and out)."""
+        return zoom_window(progress, "in" if segment % 2 == 0 else "out", self.zoom_factor)
+
+    def render(
+        self,
+        sources: Sequence[ImageSource],
+        frame_counts: Sequence[int],
+        resolution: Tuple[int, int],
+        output_path: Path,
+    ) -> Tuple[Path, Path, Path]:
+        """Write the poster, sprite and sprite index next to ``output_path``.
+
+        Args:
+            sources: One source per segment: pre-scaled store pixels (read
+                in place) or image files/bytes (decoded once each).
+            frame_counts: Frames per segment on the ``fps`` grid.
+            resolution: (width, height) of the video; the poster has this size.
+            output_path: Video path the thumbnail file names are derived from.
+
+        Returns:
+            (poster path, sprite path, WebVTT index path).
+
+        Raises:
+            OSError: If a source cannot be decoded or a file cannot be written.
+        """
+        duration = sum(frame_counts) / self.fps
+        tile_w, tile_h = self.tile_size(resolution)
+        times = self.sample_times(duration)
+        frames = [self.frame_at(frame_counts, t) for t in times]
+
+        # Decode each file source once, only as large as its largest use needs
+        needed: Dict[int, Tuple[int, int]] = {0: resolution}
+        for segment, _ in frames:
+            needed.setdefault(segment, (tile_w, tile_h))
+        decoded = {
+            segment: self._open(sources[segment], size) for segment, size in needed.items()
+        }
+
+        poster = poster_path(output_path)
+        self._crop(decoded[0], self.window(0, POSTER_POSITION), resolution).save(
+            poster, "JPEG", quality=JPEG_QUALITY
+        )
+
+        rows = int(math.ceil(len(times) / self.columns))
+        sheet = PILImage.new("RGB", (tile_w * min(len(times), self.columns), tile_h * rows))
+        cues = ["WEBVTT", ""]
+        sprite = sprite_path(output_path)
+        for i, (t, (segment, progress)) in enumerate(zip(times, frames)):
+            x, y = (i % self.columns) * tile_w, (i // self.columns) * tile_h
+            sheet.paste(self._crop(decoded[segment], self.window(segment, progress), (tile_w, tile_h)), (x, y))
+            end = min(t + self.interval, duration)
+            cues += [f"{_vtt_time(t)} --> {_vtt_time(end)}", f"{sprite.name}#xywh={x},{y},{tile_w},{tile_h}", ""]
+        sheet.save(sprite, "JPEG", quality=JPEG_QUALITY)
+
+        index = sprite.with_suffix(".vtt")
+        index.write_text("\n".join(cues), encoding="utf-8")
+        return poster, sprite, index
+
+    def _open(self, source: ImageSource, size: Tuple[int, int]) -> Union[np.ndarray, PILImage.Image]:
+        """Store pixels as they are; anything else decoded at the smallest sufficient scale."""
+        if isinstance(source, np.ndarray) and source.dtype == np.uint8 and source.ndim == 3:
+            return source
+        if isinstance(source, (str, Path)):
+            img = PILImage.open(source)
+            # JPEG decodes at 1/2, 1/4 or 1/8 scale while still covering the
+            # zoomed-in window (at most 1/zoom_factor of the image) at ``size``
+            w, h = size
+            img.draft("RGB", (int(w * self.zoom_factor), int(h * self.zoom_factor)))
+            return img.convert("RGB")
+        return _load_source(source)
+
+    def _crop(
+        self,
+        source: Union[np.ndarray, PILImage.Image],
+        window: Tuple[float, ...],
+        size: Tuple[int, int],
+    ) -> PILImage.Image:
+        """One resample of a fractional crop window to ``size``."""
+        if isinstance(source, PILImage.Image):
+            w, h = source.size
+            box = (window[0] * w, window[1] * h, window[2] * w, window[3] * h)
+            return source.resize(size, self.resample, box=box)
+
+        # Read only the window (plus filter margin) from the pixel array
+        h, w = source.shape[:2]
+        left, top, right, bottom = window[0] * w, window[1] * h, window[2] * w, window[3] * h
+        x0 = max(int(math.floor(left)) - _WINDOW_MARGIN, 0)
+        y0 = max(int(math.floor(top)) - _WINDOW_MARGIN, 0)
+        x1 = min(int(math.ceil(right)) + _WINDOW_MARGIN, w)
+        y1 = min(int(math.ceil(bottom)) + _WINDOW_MARGIN, h)
+        region = PILImage.fromarray(np.ascontiguousarray(source[y0:y1, x0:x1]))
+        return region.resize(size, self.resample, box=(left - x0, top - y0, right - x0, bottom - y0))
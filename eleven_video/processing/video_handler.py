@@ -9,15 +9,43 @@ Related files:
 - eleven_video/api/interfaces.py: VideoCompiler protocol
 - eleven_video/exceptions/custom_errors.py: VideoProcessingError
 """
+import contextlib
 import os
-import tempfile
+from dataclasses import replace
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
-from moviepy import ImageClip, AudioFileClip, concatenate_videoclips
+from moviepy import ImageClip, AudioFileClip, VideoClip, concatenate_videoclips
 
 from eleven_video.models.domain import Audio, Image, Video, Resolution
 from eleven_video.exceptions.custom_errors import ValidationError, VideoProcessingError
+from eleven_video.processing.audio_mux import AUDIO_MODES, AudioTranscode, mux_audio
+from eleven_video.processing.calibration import Calibration
+from eleven_video.processing.ffmpeg_backend import FilterGraphRenderer, segment_frame_counts
+from eleven_video.processing.compile_journal import CompileJournal, job_key
+from eleven_video.processing.compositor import StreamingCompositor
+from eleven_video.processing.cpu_governor import CpuGovernor
+from eleven_video.processing.distributed import DistributedSegmentRenderer
+from eleven_video.processing.encode_progress import EncodeProgress, MoviepyProgressLogger
+from eleven_video.processing.frame_sink import PipeRenderer
+from eleven_video.processing.image_store import SourceImageStore
+from eleven_video.processing.memory_files import MemoryFile, memory_files_supported
+from eleven_video.processing.output_formats import OUTPUT_FORMATS, is_stdout, output_size
+from eleven_video.processing.profiles import PREVIEW_PROFILE, RenderProfile, get_render_profile, proxy_resolution
+from eleven_video.processing.scratch import SCRATCH_MARGIN, ScratchSpace, encoded_video_bytes, format_bytes
+from eleven_video.processing.segment_cache import SegmentCache
+from eleven_video.processing.segments import ParallelSegmentRenderer, transition_windows
+from eleven_video.processing.slideshow import StaticSlideshowRenderer
+from eleven_video.processing.thumbnails import ThumbnailRenderer
+from eleven_video.processing.zoom import ZoomRenderer, zoom_base_size
+from eleven_video.utils.mp3 import mp3_duration
+
+
+def rendition_path(output_path: Path, resolution: Tuple[int, int]) -> Path:
+    """Output path of one resolution in a ladder: ``video.mp4`` -> ``video_1280x720.mp4``."""
+    output_path = Path(output_path)
+    w, h = resolution
+    return output_path.with_name(f"{output_path.stem}_{w}x{h}{output_path.suffix}")
 
 
 class FFmpegVideoCompiler:
@@ -25,25 +53,262 @@ class FFmpegVideoCompiler:
     
     Uses moviepy (FFmpeg wrapper) to create video files from image
     sequences and audio tracks. Output is 1920x1080 H.264/AAC MP4.
+    The ``backend="ffmpeg"`` option renders the same output with a single
+    ffmpeg filter graph instead of moviepy's Python frame loop.
+    
+    Frame rate, x264 preset/CRF/threads and the per-frame resampling filter
+    come from the render profile (see eleven_video/processing/profiles.py).
     
     Example:
-        compiler = FFmpegVideoCompiler()
+        compiler = FFmpegVideoCompiler(profile="draft")
         video = compiler.compile_video(images, audio, Path("output.mp4"))
     """
     
-    # Output specifications per architecture
+    # Output specifications per architecture (fps comes from the render profile)
     OUTPUT_RESOLUTION = (1920, 1080)
-    OUTPUT_FPS = 24
     VIDEO_CODEC = "libx264"
     AUDIO_CODEC = "aac"
     # Zoom effect settings (Story 2.7)
     ZOOM_SCALE_FACTOR = 1.08  # 8% zoom (subtle, within 5-10% range)
     
-    # TODO: [Performance] _apply_zoom_effect uses per-frame PIL processing which is slow for HD video.
-    # Future optimization: Replace with direct FFmpeg filter graph (scale+crop) for 100x performance.
-    # Current implementation is "good enough" for MVP but will bottleneck scaling.
+    # Render backends: "moviepy" composites frames in Python (per-frame PIL zoom),
+    # "ffmpeg" renders the whole slideshow in one filter graph (encoder-bound),
+    # "parallel" encodes each image segment in its own process and joins by stream copy,
+    # "pipe" streams raw frames from worker threads into one ffmpeg encoder,
+    # "distributed" hands segments to render workers through a shared directory.
+    SUPPORTED_BACKENDS = ("moviepy", "ffmpeg", "parallel", "pipe", "distributed")
+    # Backend planned from the machine's calibration (see calibration.py)
+    AUTO_BACKEND = "auto"
+    # Cores leased for a moviepy render: its frame loop runs in one Python
+    # process, next to the ffmpeg writer it pipes into
+    MOVIEPY_CORES = 2
+    
+    def __init__(
+        self,
+        profile: Union[str, RenderProfile, None] = None,
+        segment_cache: Optional[SegmentCache] = None,
+        audio_mode: str = "aac",
+        output_format: str = "mp4",
+        scratch_dir: Optional[Path] = None,
+        thumbnails: bool = True,
+        cpu_governor: Optional[CpuGovernor] = None,
+        shared_dir: Optional[Path] = None,
+        calibration: Optional[Calibration] = None,
+        segment_workers: Optional[int] = None,
+        transition_seconds: float = 0.0
+    ):
+        """Create a compiler.
+        
+        Args:
+            profile: Render profile name ("draft", "standard", "archival") or a
+                RenderProfile; default "standard".
+            segment_cache: Cache of encoded segments for the "parallel" backend;
+                unchanged segments are reused across renders instead of re-encoded.
+            audio_mode: "aac" encodes the narration inside the render (default),
+                "copy" muxes the MP3 unchanged, "transcode" encodes AAC once in a
+                separate ffmpeg process while the video renders.
+            output_format: "mp4" (default), or a progressive format readable while
+                the render is running: "fmp4" (fragmented MP4, can stream to
+                stdout with output path "-") or "hls" (event playlist plus
+                segments). Output is progressive on the ffmpeg, pipe and
+                no-zoom paths with audio_mode "aac" or "copy"; other
+                combinations write the same format when the render finishes.
+            scratch_dir: Where inputs and intermediates are written during a
+                compile, e.g. a tmpfs or local NVMe mount (default: the system
+                temp directory). The space a compile needs is estimated and
+                reserved there before rendering starts (see scratch.py).
+            thumbnails: Write a poster image and a seek-bar thumbnail sprite
+                (with its WebVTT index) next to the output, rendered from the
+                source images rather than the encoded video (see thumbnails.py).
+            cpu_governor: Node-wide CPU budget each compile leases cores from
+                (default: every core of this machine, shared with other
+                renders through lease files). When other renders hold cores,
+                ffmpeg -threads and the worker pools are sized to the lease.
+            shared_dir: Directory on shared storage for the "distributed"
+                backend: segment tasks are published there and encoded by
+                `eleven-video render-worker` processes on any machine that
+                mounts it (see distributed.py).
+            calibration: Measurements of this machine (`eleven-video calibrate`,
+                see calibration.py) that ``backend="auto"`` plans renders
+                with: the fastest backend for the resolution and image count,
+                and the parallel backend's worker layout.
+            segment_workers: Segments the "parallel" backend encodes at once
+                (default: one per leased core), each with an equal share of
+                the cores as encoder threads.
+            transition_seconds: Crossfade between consecutive images (default 0,
+                hard cuts). Only the short windows around each cut are
+                composited and encoded; the segment bodies stay separate
+                stream-copyable (and cacheable) encodes, so compiles with
+                transitions always use the "parallel" backend (see segments.py).
+            
+        Raises:
+            ValidationError: If the profile name, audio mode or output format is
+                unknown, or transition_seconds is negative.
+        """
+        if audio_mode not in AUDIO_MODES:
+            raise ValidationError(
+                f"Unsupported audio mode '{audio_mode}'. Options: {', '.join(AUDIO_MODES)}"
+            )
+        if output_format not in OUTPUT_FORMATS:
+            raise ValidationError(
+                f"Unsupported output format '{output_format}'. Options: {', '.join(OUTPUT_FORMATS)}"
+            )
+        if transition_seconds < 0:
+            raise ValidationError(f"Transition length must not be negative, got {transition_seconds}")
+        self.profile: RenderProfile = get_render_profile(profile)
+        self.segment_cache = segment_cache
+        self.audio_mode = audio_mode
+        self.output_format = output_format
+        self.scratch = ScratchSpace(scratch_dir)
+        self.thumbnails = thumbnails
+        self.cpu_governor = cpu_governor or CpuGovernor()
+        # Cores leased for the compile in progress; None uses every core (encoder defaults)
+        self._cores: Optional[int] = None
+        # File name of each staged input by path (in-memory paths have no extension)
+        self._input_names: Dict[str, str] = {}
+        self.shared_dir = Path(shared_dir) if shared_dir else None
+        self.calibration = calibration
+        self.segment_workers = segment_workers
+        self.transition_seconds = transition_seconds
+        # Parallel worker count planned for the compile in progress (backend="auto")
+        self._planned_workers: Optional[int] = None
     
     def compile_video(
+        self,
+        images: List[Image],
+        audio: Audio,
+        output_path: Path,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        enable_zoom: bool = True,
+        resolution: Union[Resolution, Sequence[Resolution], None] = None,
+        backend: str = "moviepy",
+        work_dir: Optional[Path] = None
+    ) -> Union[Video, List[Video]]:
+        """Compile images and audio into synchronized video.
+        
+        Args:
+            images: List of Image domain models to include in video.
+            audio: Audio domain model for the video soundtrack.
+            output_path: Path where the video will be saved (the playlist for
+                HLS), or "-" to stream fragmented MP4 to stdout.
+            progress_callback: Optional callback for progress updates.
+            enable_zoom: Whether to apply Ken Burns zoom effects (default True).
+            resolution: Output resolution (default 1080p), or a list of
+                resolutions to render as a ladder. Each ladder output is written
+                next to ``output_path`` with the size appended to the file name
+                (see rendition_path). On the "ffmpeg" backend the whole ladder
+                shares one decode/zoom pass; other backends render each
+                resolution in turn from the same temp inputs.
+            backend: Render backend, "moviepy" (default), "ffmpeg", "parallel",
+                "pipe" or "distributed" (needs shared_dir), or "auto" to use
+                the backend the calibration plans as fastest (moviepy without
+                a calibration; the static slideshow path with zoom disabled).
+                The ffmpeg-based backends fall back to moviepy if rendering fails
+                (except in a resumable compile, see work_dir). With zoom
+                disabled they all use the static-slideshow fast path.
+            work_dir: Named directory for a resumable compile (see
+                compile_journal.CompileJournal). Intermediates and a state
+                file are kept there instead of in a temp directory; if the
+                compile is interrupted, calling it again with the same inputs,
+                settings and work_dir continues from the last completed
+                segment. Resumable compiles always render per-image segments
+                (the "parallel" backend) so there is progress to keep, and a
+                failed render raises instead of falling back to moviepy, so the
+                completed segments stay for the next attempt. The directory is
+                removed when the compile succeeds.
+            
+        Returns:
+            Video domain model with file path, duration, and size, or one
+            Video per resolution (in order) when a list was given.
+            
+        Raises:
+            ValidationError: If images or audio are empty/invalid, a
+                resolution list is empty or has duplicates, the distributed
+                backend is chosen without a shared_dir, stdout output
+                is requested for anything but a single fragmented MP4, or
+                work_dir has unrelated content.
+            VideoProcessingError: If FFmpeg fails or disk errors occur.
+        """
+        # Validation (AC6)
+        self._validate_inputs(images, audio)
+        
+        if backend != self.AUTO_BACKEND and backend not in self.SUPPORTED_BACKENDS:
+            raise ValidationError(
+                f"Unknown render backend '{backend}'. "
+                f"Options: {', '.join(self.SUPPORTED_BACKENDS + (self.AUTO_BACKEND,))}"
+            )
+        if backend == "distributed" and self.shared_dir is None:
+            raise ValidationError("The distributed backend needs a shared directory (shared_dir)")
+        
+        if is_stdout(output_path):
+            if self.output_format != "fmp4":
+                raise ValidationError("Only fragmented MP4 (output format 'fmp4') can be streamed to stdout")
+            if isinstance(resolution, (list, tuple)):
+                raise ValidationError("A resolution ladder cannot be streamed to stdout")
+        
+        if isinstance(resolution, (list, tuple)):
+            targets = [(res.value["width"], res.value["height"]) for res in resolution]
+            if not targets:
+                raise ValidationError("Resolution ladder must contain at least one resolution")
+            if len(set(targets)) != len(targets):
+                raise ValidationError("Resolution ladder contains duplicate resolutions")
+            outputs = [(rendition_path(output_path, target), target) for target in targets]
+        else:
+            # Determine target resolution (Story 3.8)
+            res_enum = resolution or Resolution.HD_1080P
+            outputs = [(output_path, (res_enum.value["width"], res_enum.value["height"]))]
+        
+        self._planned_workers = None
+        if backend == self.AUTO_BACKEND:
+            backend = self._planned_backend(images, audio, outputs, enable_zoom, progress_callback)
+        
+        if self.transition_seconds and backend != "parallel":
+            # Transition windows are encoded between per-image segments
+            backend = "parallel"
+            if progress_callback:
+                progress_callback(f"Crossfading images over {self.transition_seconds:g}s on the parallel backend")
+        
+        journal = None
+        if work_dir is not None:
+            # Only per-image segments leave completed work behind to resume from
+            backend = "parallel"
+            journal = CompileJournal(work_dir)
+            resumed = journal.begin(self._job_key(images, audio, outputs, enable_zoom))
+            if progress_callback and resumed:
+                progress_callback(f"Resuming compile in {work_dir}")
+        
+        videos = self._compile(images, audio, outputs, progress_callback, enable_zoom, backend, journal=journal)
+        return videos if isinstance(resolution, (list, tuple)) else videos[0]
+    
+    def _planned_backend(
+        self,
+        images: List[Image],
+        audio: Audio,
+        outputs: List[Tuple[Path, Tuple[int, int]]],
+        enable_zoom: bool,
+        progress_callback: Optional[Callable[[str], None]]
+    ) -> str:
+        """Backend for ``backend="auto"``: the calibration's plan for the largest output."""
+        if not enable_zoom:
+            return "ffmpeg"
+        if self.calibration is None:
+            return "moviepy"
+        duration = audio.duration_seconds or mp3_duration(audio.data) or 0.0
+        target = max((resolution for _, resolution in outputs), key=lambda r: r[0] * r[1])
+        plan = self.calibration.plan(
+            target, len(images), int(round(duration * self.profile.fps)), cores=self.cpu_governor.budget
+        )
+        if plan.backend == "parallel":
+            self._planned_workers = plan.workers
+        if progress_callback:
+            layout = f", {plan.workers} workers x {plan.threads} threads" if plan.backend == "parallel" else ""
+            progress_callback(
+                f"Render plan: {plan.backend} backend{layout} "
+                f"(about {plan.estimated_seconds:.0f}s from calibration)"
+            )
+        return plan.backend
+    
+    def compile_preview(
         self,
         images: List[Image],
         audio: Audio,
@@ -52,84 +317,173 @@ class FFmpegVideoCompiler:
         enable_zoom: bool = True,
         resolution: Optional[Resolution] = None
     ) -> Video:
-        """Compile images and audio into synchronized video.
+        """Render a low-resolution proxy of the video for review.
+        
+        The proxy uses the same images, audio and zoom as the full render at
+        360p (short side, same aspect ratio) and 12 fps with the cheapest
+        encoder settings, so it costs a small fraction of a full encode.
         
         Args:
             images: List of Image domain models to include in video.
             audio: Audio domain model for the video soundtrack.
-            output_path: Path where the MP4 video will be saved.
+            output_path: Path where the proxy MP4 will be saved.
             progress_callback: Optional callback for progress updates.
             enable_zoom: Whether to apply Ken Burns zoom effects (default True).
+            resolution: Resolution of the full render the proxy stands in for (default 1080p).
             
         Returns:
-            Video domain model with file path, duration, and size.
+            Video domain model for the proxy.
             
         Raises:
             ValidationError: If images or audio are empty/invalid.
             VideoProcessingError: If FFmpeg fails or disk errors occur.
         """
-        # Validation (AC6)
         self._validate_inputs(images, audio)
         
-        # Determine target resolution (Story 3.8)
         res_enum = resolution or Resolution.HD_1080P
-        target_resolution = (res_enum.value["width"], res_enum.value["height"])
+        target_resolution = proxy_resolution((res_enum.value["width"], res_enum.value["height"]))
+        
+        if progress_callback:
+            progress_callback(f"Rendering preview ({target_resolution[0]}x{target_resolution[1]})...")
+        
+        preview = type(self)(
+            profile=PREVIEW_PROFILE, audio_mode=self.audio_mode, scratch_dir=self.scratch.root, thumbnails=False,
+            cpu_governor=self.cpu_governor
+        )
+        outputs = [(output_path, target_resolution)]
+        return preview._compile(images, audio, outputs, progress_callback, enable_zoom, "ffmpeg")[0]
+    
+    def _compile(
+        self,
+        images: List[Image],
+        audio: Audio,
+        outputs: List[Tuple[Path, Tuple[int, int]]],
+        progress_callback: Optional[Callable[[str], None]],
+        enable_zoom: bool,
+        backend: str,
+        journal: Optional[CompileJournal] = None
+    ) -> List[Video]:
+        """Stage inputs once and render every (output path, resolution) pair (inputs already validated).
+        
+        With a journal, its work directory replaces the temp directory and
+        is only removed once every output is written. Cores are leased from
+        the CPU governor for the whole compile.
+        
+        Raises:
+            VideoProcessingError: If the scratch space cannot hold the render's intermediates.
+        """
+        scratch = ScratchSpace(journal.work_dir.parent) if journal is not None else self.scratch
+        needed = self._scratch_bytes(images, audio, outputs, enable_zoom, backend, journal is not None)
+        reservation = scratch.reserve(needed)
+        if progress_callback:
+            progress_callback(f"Reserved {format_bytes(needed)} of scratch space in {scratch.root}")
         
         # Use temporary directory for all temp files (AC6 - cleanup)
-        with tempfile.TemporaryDirectory(prefix="eleven_video_") as temp_dir:
+        work_dir = (
+            contextlib.nullcontext(str(journal.work_dir)) if journal is not None
+            else scratch.work_dir()
+        )
+        # The ffmpeg-based backends scale with cores and take a fair share of the budget
+        wanted = self.MOVIEPY_CORES if backend == "moviepy" and enable_zoom else None
+        lease = self.cpu_governor.acquire(wanted)
+        if not lease.whole_node:
+            self._cores = lease.cores
+            if progress_callback:
+                progress_callback(f"Using {lease.cores} of {lease.budget} cores (CPU budget shared with other renders)")
+        
+        with lease, reservation, work_dir as temp_dir, contextlib.ExitStack() as cleanup:
+            cleanup.callback(setattr, self, "_cores", None)
+            output_path = outputs[0][0]
             try:
-                # Write images and audio to temp files
-                image_paths = self._write_temp_images(images, temp_dir, progress_callback)
-                audio_path = self._write_temp_audio(audio, temp_dir)
+                # Images and audio stay in memory, readable by path (no temp file round trip)
+                image_paths, audio_path = self._stage_inputs(images, audio, temp_dir, cleanup)
                 
                 # Get audio duration for image timing
                 audio_duration = self._get_audio_duration(audio, audio_path)
                 
-                # Calculate duration per image (AC3)
-                duration_per_image = audio_duration / len(images)
+                # Transcode mode: encode the audio alongside the render, remux at the end
+                transcode = None
+                render_paths = [path for path, _ in outputs]
+                render_format = self.output_format
+                if self.audio_mode == "transcode":
+                    transcode = cleanup.enter_context(
+                        AudioTranscode(audio_path, Path(temp_dir) / "audio.m4a", self.AUDIO_CODEC)
+                    )
+                    render_paths = [Path(temp_dir) / f"video{i}.mp4" for i in range(len(outputs))]
+                    render_format = "mp4"
+                renditions = [(render_path, target) for render_path, (_, target) in zip(render_paths, outputs)]
                 
-                # Create video clips from images with optional zoom effects (Story 2.7)
-                clips = self._create_image_clips(
-                    image_paths, 
-                    duration_per_image, 
-                    progress_callback,
-                    enable_zoom=enable_zoom,
-                    target_resolution=target_resolution
-                )
+                pending = renditions
+                encode_fps = {}
+                if len(renditions) > 1 and backend == "ffmpeg" and enable_zoom:
+                    try:
+                        ladder_fps = self._render_ladder(
+                            image_paths,
+                            audio_path,
+                            audio_duration,
+                            renditions,
+                            progress_callback,
+                            output_format=render_format,
+                            work_dir=Path(temp_dir)
+                        )
+                        encode_fps = {render_path: ladder_fps for render_path, _ in renditions}
+                        pending = []
+                    except VideoProcessingError as e:
+                        if progress_callback:
+                            progress_callback(f"Warning: single-pass ladder failed ({e}), rendering each resolution")
                 
-                # Concatenate and add audio
-                if progress_callback:
-                    progress_callback("Compiling video...")
+                for render_path, target_resolution in pending:
+                    # Each ladder rung gets its own scratch space for stills, segments and stores
+                    work_root = Path(temp_dir)
+                    if len(renditions) > 1:
+                        work_root = work_root / f"{target_resolution[0]}x{target_resolution[1]}"
+                    encode_fps[render_path] = self._render_output(
+                        image_paths,
+                        audio_path,
+                        audio_duration,
+                        render_path,
+                        progress_callback,
+                        enable_zoom,
+                        target_resolution,
+                        backend,
+                        work_root,
+                        output_format=render_format,
+                        journal=journal
+                    )
                 
-                final_clip = concatenate_videoclips(clips, method="compose")
-                audio_clip = AudioFileClip(audio_path)
-                final_clip = final_clip.with_audio(audio_clip)
+                thumbnails = (None, None, None)
+                if self.thumbnails and not is_stdout(outputs[0][0]) and Path(render_paths[0]).exists():
+                    # One set per compile, from the first output (a ladder shares it)
+                    work_root = Path(temp_dir)
+                    if len(renditions) > 1:
+                        work_root = work_root / f"{outputs[0][1][0]}x{outputs[0][1][1]}"
+                    thumbnails = self._render_thumbnails(
+                        image_paths, audio_duration, outputs[0], enable_zoom, work_root, progress_callback
+                    )
                 
-                # Write output video (AC5)
-                final_clip.write_videofile(
-                    str(output_path),
-                    codec=self.VIDEO_CODEC,
-                    audio_codec=self.AUDIO_CODEC,
-                    fps=self.OUTPUT_FPS,
-                    logger=None  # Suppress verbose output
-                )
+                if transcode is not None:
+                    transcoded = transcode.wait()
+                    for render_path, (final_path, _) in zip(render_paths, outputs):
+                        mux_audio(render_path, transcoded, final_path, output_format=self.output_format)
                 
-                # Clean up clips
-                final_clip.close()
-                audio_clip.close()
-                for clip in clips:
-                    clip.close()
-                
-                # Create Video domain model (AC7)
-                file_size = output_path.stat().st_size if output_path.exists() else 0
-                
-                return Video(
-                    file_path=output_path,
-                    duration_seconds=audio_duration,
-                    file_size_bytes=file_size,
-                    codec="h264",
-                    resolution=target_resolution
-                )
+                # Create Video domain models (AC7)
+                videos = []
+                for render_path, (output_path, target_resolution) in zip(render_paths, outputs):
+                    file_size = output_size(self.output_format, output_path)
+                    videos.append(Video(
+                        file_path=output_path,
+                        duration_seconds=audio_duration,
+                        file_size_bytes=file_size,
+                        codec="h264",
+                        resolution=target_resolution,
+                        encode_fps=round(encode_fps[render_path], 2),
+                        poster_path=thumbnails[0],
+                        sprite_path=thumbnails[1],
+                        sprite_index_path=thumbnails[2]
+                    ))
+                if journal is not None:
+                    journal.finish()
+                return videos
                 
             except ValidationError:
                 raise
@@ -148,6 +502,585 @@ class FFmpegVideoCompiler:
             except Exception as e:
                 raise VideoProcessingError(f"Video processing failed: {e}") from e
     
+    def _render_output(
+        self,
+        image_paths: List[str],
+        audio_path: str,
+        audio_duration: float,
+        output_path: Path,
+        progress_callback: Optional[Callable[[str], None]],
+        enable_zoom: bool,
+        target_resolution: Tuple[int, int],
+        backend: str,
+        work_root: Path,
+        output_format: str = "mp4",
+        journal: Optional[CompileJournal] = None
+    ) -> float:
+        """Render one output with the given backend, falling back to moviepy on ffmpeg failures.
+        
+        Returns:
+            Frames encoded per second of wall time (of the backend that produced the output).
+        
+        Raises:
+            VideoProcessingError: If a resumable compile (journal) fails; it is
+                not retried with moviepy, which would discard its progress.
+        """
+        total_frames = sum(segment_frame_counts(len(image_paths), audio_duration, self.profile.fps))
+        encode_progress = EncodeProgress(total_frames, progress_callback)
+        if backend != "moviepy":
+            try:
+                if not enable_zoom and journal is None and not self.transition_seconds:
+                    # Static frames need no per-frame work on any ffmpeg backend
+                    self._render_static_slideshow(
+                        image_paths,
+                        audio_path,
+                        audio_duration,
+                        output_path,
+                        progress_callback,
+                        target_resolution=target_resolution,
+                        work_dir=work_root / "stills",
+                        output_format=output_format,
+                        encode_progress=encode_progress
+                    )
+                elif backend == "parallel":
+                    self._render_parallel_segments(
+                        image_paths,
+                        audio_path,
+                        audio_duration,
+                        output_path,
+                        progress_callback,
+                        enable_zoom=enable_zoom,
+                        target_resolution=target_resolution,
+                        work_dir=work_root / "segments",
+                        output_format=output_format,
+                        encode_progress=encode_progress,
+                        journal=journal
+                    )
+                elif backend == "distributed":
+                    self._render_distributed_segments(
+                        image_paths,
+                        audio_path,
+                        audio_duration,
+                        output_path,
+                        progress_callback,
+                        enable_zoom=enable_zoom,
+                        target_resolution=target_resolution,
+                        output_format=output_format,
+                        encode_progress=encode_progress
+                    )
+                elif backend == "pipe":
+                    self._render_with_frame_pipe(
+                        image_paths,
+                        audio_path,
+                        audio_duration,
+                        output_path,
+                        progress_callback,
+                        enable_zoom=enable_zoom,
+                        target_resolution=target_resolution,
+                        work_dir=work_root / "sources",
+                        output_format=output_format,
+                        encode_progress=encode_progress
+                    )
+                else:
+                    self._render_with_filter_graph(
+                        image_paths,
+                        audio_path,
+                        audio_duration,
+                        output_path,
+                        progress_callback,
+                        enable_zoom=enable_zoom,
+                        target_resolution=target_resolution,
+                        work_dir=work_root,
+                        output_format=output_format,
+                        encode_progress=encode_progress
+                    )
+            except VideoProcessingError as e:
+                if journal is not None:
+                    # A moviepy render would finish the job and remove the completed segments
+                    raise VideoProcessingError(
+                        f"{backend} backend failed ({e}); completed segments are kept in "
+                        f"{journal.work_dir} for the next attempt"
+                    ) from e
+                # Fallback: moviepy path on any ffmpeg render failure
+                if progress_callback:
+                    progress_callback(f"Warning: {backend} backend failed ({e}), using moviepy")
+                backend = "moviepy"
+                encode_progress.start()
+        
+        if backend == "moviepy":
+            self._render_with_moviepy(
+                image_paths,
+                audio_path,
+                audio_duration,
+                output_path,
+                progress_callback,
+                enable_zoom=enable_zoom,
+                target_resolution=target_resolution,
+                work_dir=work_root / "sources",
+                output_format=output_format,
+                encode_progress=encode_progress
+            )
+        return encode_progress.finish()
+    
+    def _render_with_moviepy(
+        self,
+        image_paths: List[str],
+        audio_path: str,
+        audio_duration: float,
+        output_path: Path,
+        progress_callback: Optional[Callable[[str], None]],
+        enable_zoom: bool = True,
+        target_resolution: tuple = (1920, 1080),
+        work_dir: Optional[Path] = None,
+        output_format: str = "mp4",
+        encode_progress: Optional[EncodeProgress] = None
+    ) -> None:
+        """Render the video through moviepy's per-frame compositing loop.
+        
+        With a work_dir, images are decoded once into a SourceImageStore and a
+        StreamingCompositor builds each image's clip only while it is on
+        screen, so memory stays flat however long the video is.
+        
+        moviepy writes a regular MP4; other output formats and the non-aac
+        audio modes are produced by a stream-copy remux once it finishes.
+        """
+        # Calculate duration per image (AC3)
+        duration_per_image = audio_duration / len(image_paths)
+        
+        store = None
+        if work_dir is not None:
+            zoom_factor = self.ZOOM_SCALE_FACTOR if enable_zoom else 1.0
+            try:
+                store = SourceImageStore.build(
+                    image_paths, zoom_base_size(target_resolution, zoom_factor), work_dir, workers=self._cores
+                )
+            except (OSError, ValueError):
+                # Images Pillow cannot read go through moviepy's own reader
+                store = None
+        
+        compositor = None
+        if store is not None:
+            # Clips are built lazily while the timeline is written (current + next only)
+            total = len(image_paths)
+            compositor = StreamingCompositor(
+                lambda i: self._store_clip(store, i, duration_per_image, enable_zoom, target_resolution),
+                [duration_per_image] * total,
+                target_resolution,
+                on_segment=(lambda i: progress_callback(f"Processing image {i + 1} of {total}"))
+                if progress_callback else None
+            )
+            clips = []
+            if progress_callback:
+                progress_callback("Compiling video...")
+            final_clip = compositor.to_clip()
+        else:
+            # Create video clips from images with optional zoom effects (Story 2.7)
+            clips = self._create_image_clips(
+                image_paths, 
+                duration_per_image, 
+                progress_callback,
+                enable_zoom=enable_zoom,
+                target_resolution=target_resolution
+            )
+            
+            # Concatenate and add audio
+            if progress_callback:
+                progress_callback("Compiling video...")
+            
+            final_clip = concatenate_videoclips(clips, method="compose")
+        audio_clip = None
+        if self.audio_mode == "aac":
+            audio_clip = AudioFileClip(audio_path)
+            final_clip = final_clip.with_audio(audio_clip)
+        # Otherwise audio is muxed afterwards by stream copy, outside the frame loop
+        remux = audio_clip is None or output_format != "mp4"
+        video_path = output_path
+        if remux:
+            render_dir = Path(work_dir) if work_dir is not None else Path(output_path).parent
+            render_dir.mkdir(parents=True, exist_ok=True)
+            video_path = render_dir / "moviepy_render.mp4"
+        
+        # Write output video (AC5)
+        final_clip.write_videofile(
+            str(video_path),
+            codec=self.VIDEO_CODEC,
+            audio_codec=self.AUDIO_CODEC,
+            audio=audio_clip is not None,
+            fps=self.profile.fps,
+            preset=self.profile.preset,
+            threads=self._encoder_threads() or None,
+            ffmpeg_params=["-crf", str(self.profile.crf)],
+            # No console bar; frame counts feed the encode progress messages instead
+            logger=MoviepyProgressLogger(encode_progress.update) if encode_progress else None
+        )
+        
+        # Clean up clips
+        final_clip.close()
+        if audio_clip is not None:
+            audio_clip.close()
+        for clip in clips:
+            clip.close()
+        if compositor is not None:
+            compositor.close()
+        if store is not None:
+            store.close()
+        
+        if remux:
+            mux_audio(video_path, None if audio_clip is not None else audio_path, output_path, output_format=output_format)
+    
+    def _render_with_filter_graph(
+        self,
+        image_paths: List[str],
+        audio_path: str,
+        audio_duration: float,
+        output_path: Path,
+        progress_callback: Optional[Callable[[str], None]],
+        enable_zoom: bool = True,
+        target_resolution: tuple = (1920, 1080),
+        work_dir: Optional[Path] = None,
+        output_format: str = "mp4",
+        encode_progress: Optional[EncodeProgress] = None
+    ) -> None:
+        """Render the video with a single ffmpeg filter graph (backend="ffmpeg")."""
+        frame_counts = segment_frame_counts(len(image_paths), audio_duration, self.profile.fps)
+        renderer = self._filter_graph_renderer()
+        
+        if progress_callback:
+            progress_callback("Compiling video...")
+        
+        renderer.render(
+            image_paths,
+            audio_path,
+            frame_counts,
+            output_path,
+            target_resolution,
+            enable_zoom=enable_zoom,
+            output_format=output_format,
+            on_progress=encode_progress.update if encode_progress else None,
+            work_dir=work_dir
+        )
+    
+    def _render_ladder(
+        self,
+        image_paths: List[str],
+        audio_path: str,
+        audio_duration: float,
+        renditions: List[Tuple[Path, Tuple[int, int]]],
+        progress_callback: Optional[Callable[[str], None]],
+        output_format: str = "mp4",
+        work_dir: Optional[Path] = None
+    ) -> float:
+        """Render every (output path, resolution) pair from one filter graph (backend="ffmpeg").
+        
+        Returns:
+            Timeline frames encoded per second of wall time (each frame in every resolution).
+        """
+        frame_counts = segment_frame_counts(len(image_paths), audio_duration, self.profile.fps)
+        renderer = self._filter_graph_renderer()
+        encode_progress = EncodeProgress(sum(frame_counts), progress_callback)
+        
+        if progress_callback:
+            progress_callback(f"Compiling video ({len(renditions)} resolutions in one pass)...")
+        
+        renderer.render_ladder(
+            image_paths, audio_path, frame_counts, renditions,
+            output_format=output_format, on_progress=encode_progress.update, work_dir=work_dir
+        )
+        return encode_progress.finish()
+    
+    def _render_parallel_segments(
+        self,
+        image_paths: List[str],
+        audio_path: str,
+        audio_duration: float,
+        output_path: Path,
+        progress_callback: Optional[Callable[[str], None]],
+        enable_zoom: bool = True,
+        target_resolution: tuple = (1920, 1080),
+        work_dir: Optional[Path] = None,
+        output_format: str = "mp4",
+        encode_progress: Optional[EncodeProgress] = None,
+        journal: Optional[CompileJournal] = None
+    ) -> None:
+        """Encode segments in a process pool and join them by stream copy (backend="parallel")."""
+        frame_counts = segment_frame_counts(len(image_paths), audio_duration, self.profile.fps)
+        workers = self._planned_workers or self.segment_workers
+        workers = min(workers, self._cores or workers) if workers else self._cores
+        transition_frames = int(round(self.transition_seconds * self.profile.fps))
+        renderer = ParallelSegmentRenderer(
+            self._filter_graph_renderer(), max_workers=workers, cores=self._cores,
+            transition_frames=transition_frames
+        )
+        
+        if progress_callback:
+            progress_callback(f"Compiling video ({len(image_paths)} segments in parallel)...")
+        
+        encoded = renderer.render(
+            image_paths,
+            audio_path,
+            frame_counts,
+            output_path,
+            target_resolution,
+            work_dir or Path(image_paths[0]).parent / "segments",
+            enable_zoom=enable_zoom,
+            cache=self.segment_cache,
+            output_format=output_format,
+            on_progress=encode_progress.update if encode_progress else None,
+            journal=journal
+        )
+        
+        used = [frames for frames in frame_counts if frames > 0]
+        total = len(used) + sum(1 for _, length in transition_windows(used, transition_frames) if length)
+        if progress_callback and self.segment_cache is not None:
+            progress_callback(f"Reused {total - encoded} of {total} cached segments")
+        elif progress_callback and journal is not None and encoded < total:
+            progress_callback(f"Resumed {total - encoded} of {total} segments from an earlier run")
+    
+    def _render_distributed_segments(
+        self,
+        image_paths: List[str],
+        audio_path: str,
+        audio_duration: float,
+        output_path: Path,
+        progress_callback: Optional[Callable[[str], None]],
+        enable_zoom: bool = True,
+        target_resolution: tuple = (1920, 1080),
+        output_format: str = "mp4",
+        encode_progress: Optional[EncodeProgress] = None
+    ) -> None:
+        """Publish segments to render workers in shared_dir and join them (backend="distributed")."""
+        frame_counts = segment_frame_counts(len(image_paths), audio_duration, self.profile.fps)
+        renderer = DistributedSegmentRenderer(self.shared_dir, self._filter_graph_renderer())
+        
+        if progress_callback:
+            progress_callback(f"Compiling video ({len(image_paths)} segments via render workers in {self.shared_dir})...")
+        
+        remote = renderer.render(
+            image_paths,
+            audio_path,
+            frame_counts,
+            output_path,
+            target_resolution,
+            enable_zoom=enable_zoom,
+            output_format=output_format,
+            on_progress=encode_progress.update if encode_progress else None,
+            # Workers decode copies of the inputs, which need the extension a MemoryFile path lacks
+            image_suffixes=[Path(self._input_names.get(path, path)).suffix for path in image_paths]
+        )
+        
+        if progress_callback:
+            total = sum(1 for frames in frame_counts if frames > 0)
+            progress_callback(f"Render workers encoded {remote} of {total} segments")
+    
+    def _render_with_frame_pipe(
+        self,
+        image_paths: List[str],
+        audio_path: str,
+        audio_duration: float,
+        output_path: Path,
+        progress_callback: Optional[Callable[[str], None]],
+        enable_zoom: bool = True,
+        target_resolution: tuple = (1920, 1080),
+        work_dir: Optional[Path] = None,
+        output_format: str = "mp4",
+        encode_progress: Optional[EncodeProgress] = None
+    ) -> None:
+        """Stream raw frames from frame workers into one ffmpeg encoder (backend="pipe").
+        
+        With more than one core the frames are produced in worker processes
+        that hand them to the encoder through a shared-memory FrameRing.
+        """
+        frame_counts = segment_frame_counts(len(image_paths), audio_duration, self.profile.fps)
+        cores = self._cores or os.cpu_count() or 1
+        renderer = PipeRenderer(
+            fps=self.profile.fps,
+            zoom_factor=self.ZOOM_SCALE_FACTOR,
+            encoder_args=self._filter_graph_renderer().encoder_args(),
+            audio_codec=self._audio_codec(),
+            workers=self._cores,
+            frame_resample=self.profile.pil_resample,
+            processes=cores > 1
+        )
+        
+        if progress_callback:
+            progress_callback("Compiling video...")
+        
+        renderer.render(
+            image_paths,
+            audio_path,
+            frame_counts,
+            output_path,
+            target_resolution,
+            enable_zoom=enable_zoom,
+            work_dir=work_dir,
+            output_format=output_format,
+            on_progress=encode_progress.update if encode_progress else None
+        )
+    
+    def _render_static_slideshow(
+        self,
+        image_paths: List[str],
+        audio_path: str,
+        audio_duration: float,
+        output_path: Path,
+        progress_callback: Optional[Callable[[str], None]],
+        target_resolution: tuple = (1920, 1080),
+        work_dir: Optional[Path] = None,
+        output_format: str = "mp4",
+        encode_progress: Optional[EncodeProgress] = None
+    ) -> None:
+        """Encode pre-scaled stills through the concat demuxer (zoom disabled)."""
+        frame_counts = segment_frame_counts(len(image_paths), audio_duration, self.profile.fps)
+        renderer = StaticSlideshowRenderer(
+            fps=self.profile.fps,
+            video_codec=self.VIDEO_CODEC,
+            audio_codec=self._audio_codec(),
+            max_workers=self._cores,
+            encoder_options=self._encoder_options()
+        )
+        
+        if progress_callback:
+            progress_callback("Compiling video...")
+        
+        renderer.render(
+            image_paths,
+            audio_path,
+            frame_counts,
+            output_path,
+            target_resolution,
+            work_dir or Path(image_paths[0]).parent / "stills",
+            output_format=output_format,
+            on_progress=encode_progress.update if encode_progress else None
+        )
+    
+    def _render_thumbnails(
+        self,
+        image_paths: List[str],
+        audio_duration: float,
+        output: Tuple[Path, Tuple[int, int]],
+        enable_zoom: bool,
+        work_root: Path,
+        progress_callback: Optional[Callable[[str], None]]
+    ) -> Tuple[Optional[Path], Optional[Path], Optional[Path]]:
+        """Write the poster and thumbnail sprite of one output.
+        
+        Reads the SourceImageStore the moviepy or pipe render left in
+        ``work_root`` when there is one, otherwise decodes the image files.
+        A failure only costs the thumbnails, not the video.
+        
+        Returns:
+            (poster, sprite, sprite index) paths, or Nones if they could not be written.
+        """
+        output_path, target_resolution = output
+        zoom_factor = self.ZOOM_SCALE_FACTOR if enable_zoom else 1.0
+        frame_counts = segment_frame_counts(len(image_paths), audio_duration, self.profile.fps)
+        renderer = ThumbnailRenderer(fps=self.profile.fps, zoom_factor=zoom_factor)
+        
+        store = None
+        store_path = work_root / "sources" / SourceImageStore.FILE_NAME
+        base_w, base_h = zoom_base_size(target_resolution, zoom_factor)
+        if store_path.exists() and store_path.stat().st_size == len(image_paths) * base_w * base_h * 3:
+            store = SourceImageStore(store_path, len(image_paths), (base_w, base_h))
+        
+        try:
+            with contextlib.nullcontext() if store is None else store:
+                paths = renderer.render(
+                    image_paths if store is None else store, frame_counts, target_resolution, output_path
+                )
+        except (OSError, ValueError) as e:
+            if progress_callback:
+                progress_callback(f"Warning: could not write poster and thumbnails ({e})")
+            return None, None, None
+        if progress_callback:
+            progress_callback(f"Poster and thumbnail sprite written next to {output_path.name}")
+        return paths
+    
+    def _scratch_bytes(
+        self,
+        images: List[Image],
+        audio: Audio,
+        outputs: List[Tuple[Path, Tuple[int, int]]],
+        enable_zoom: bool,
+        backend: str,
+        resumable: bool = False
+    ) -> int:
+        """Upper estimate of the scratch space a compile writes, mirroring _render_output.
+        
+        Counts the inputs (only where they cannot stay in memory, see
+        _stage_inputs) plus, per output, the source pixel store
+        (moviepy, pipe), pre-scaled stills (no zoom), encoded segments
+        (parallel) and any intermediate MP4 that is remuxed afterwards.
+        """
+        duration = audio.duration_seconds or mp3_duration(audio.data) or 0.0
+        frames = round(duration * self.profile.fps)
+        total = 0
+        if not memory_files_supported():
+            total += sum(len(image.data) for image in images) + len(audio.data)
+        if self.audio_mode == "transcode":
+            # AAC at the default bitrate is no larger than the narration MP3
+            total += len(audio.data)
+        
+        for _, target in outputs:
+            encoded = encoded_video_bytes(target, frames)
+            if backend != "moviepy" and not enable_zoom and not resumable and not self.transition_seconds:
+                w, h = target
+                total += len(images) * w * h * 3
+            elif backend == "parallel":
+                total += encoded
+            elif backend in ("moviepy", "pipe"):
+                w, h = zoom_base_size(target, self.ZOOM_SCALE_FACTOR if enable_zoom else 1.0)
+                total += len(images) * w * h * 3
+            if self.audio_mode == "transcode":
+                total += encoded
+            elif backend == "moviepy" and (self.audio_mode != "aac" or self.output_format != "mp4"):
+                total += encoded
+        return int(total * SCRATCH_MARGIN)
+    
+    def _job_key(
+        self,
+        images: List[Image],
+        audio: Audio,
+        outputs: List[Tuple[Path, Tuple[int, int]]],
+        enable_zoom: bool
+    ) -> str:
+        """Identity of a compile for resuming: inputs plus everything that shapes the output."""
+        settings = (
+            self.profile,
+            self.audio_mode,
+            self.output_format,
+            self.ZOOM_SCALE_FACTOR,
+            enable_zoom,
+            audio.duration_seconds,
+            tuple(target for _, target in outputs),
+            self.transition_seconds,
+        )
+        return job_key([image.data for image in images] + [audio.data], settings)
+    
+    def _filter_graph_renderer(self) -> FilterGraphRenderer:
+        """Create a FilterGraphRenderer with this compiler's output settings."""
+        return FilterGraphRenderer(
+            fps=self.profile.fps,
+            video_codec=self.VIDEO_CODEC,
+            audio_codec=self._audio_codec(),
+            zoom_factor=self.ZOOM_SCALE_FACTOR,
+            oversample=self.profile.oversample,
+            encoder_options=self._encoder_options()
+        )
+    
+    def _encoder_threads(self) -> int:
+        """x264 threads: the profile's count, capped at the leased cores (0 = encoder default)."""
+        if self._cores is None:
+            return self.profile.threads
+        return min(self.profile.threads or self._cores, self._cores)
+    
+    def _encoder_options(self) -> List[str]:
+        """Profile encoder options with the thread count limited to the CPU lease."""
+        return replace(self.profile, threads=self._encoder_threads()).x264_args()
+    
+    def _audio_codec(self) -> str:
+        """Audio codec for the ffmpeg backends ("copy" unless encoding AAC in the render)."""
+        return self.AUDIO_CODEC if self.audio_mode == "aac" else "copy"
+    
     def _validate_inputs(self, images: List[Image], audio: Audio) -> None:
         """Validate input parameters.
         
@@ -163,45 +1096,55 @@ class FFmpegVideoCompiler:
         if not audio.data:
             raise ValidationError("Cannot compile video: audio data is empty")
     
-    def _write_temp_images(
-        self, 
-        images: List[Image], 
+    def _stage_inputs(
+        self,
+        images: List[Image],
+        audio: Audio,
         temp_dir: str,
-        progress_callback: Optional[Callable[[str], None]]
-    ) -> List[str]:
-        """Write images to temporary files.
+        cleanup: contextlib.ExitStack
+    ) -> Tuple[List[str], str]:
+        """Make the image and audio buffers readable by path for every backend.
+        
+        Each buffer is held in a MemoryFile that ffmpeg, moviepy, Pillow and
+        worker processes open straight from memory; ``cleanup`` closes them
+        when the compile ends. Where in-memory files are not supported the
+        buffers are written to ``temp_dir`` instead.
         
         Returns:
-            List of paths to temporary image files.
+            (image paths, audio path).
         """
+        names = [f"image_{i:03d}.{'png' if 'png' in image.mime_type else 'jpg'}" for i, image in enumerate(images)]
+        buffers = [image.data for image in images]
+        names.append("audio.mp3")
+        buffers.append(audio.data)
+        
+        in_memory = memory_files_supported()
         paths = []
-        for i, image in enumerate(images):
-            ext = "png" if "png" in image.mime_type else "jpg"
-            path = os.path.join(temp_dir, f"image_{i:03d}.{ext}")
+        for name, data in zip(names, buffers):
+            if in_memory:
+                paths.append(cleanup.enter_context(MemoryFile(data, name)).path)
+                continue
+            path = os.path.join(temp_dir, name)
             with open(path, "wb") as f:
-                f.write(image.data)
+                f.write(data)
             paths.append(path)
-        return paths
-    
-    def _write_temp_audio(self, audio: Audio, temp_dir: str) -> str:
-        """Write audio to temporary file.
-        
-        Returns:
-            Path to temporary audio file.
-        """
-        path = os.path.join(temp_dir, "audio.mp3")
-        with open(path, "wb") as f:
-            f.write(audio.data)
-        return path
+        self._input_names = dict(zip(paths, names))
+        cleanup.callback(setattr, self, "_input_names", {})
+        return paths[:-1], paths[-1]
     
     def _get_audio_duration(self, audio: Audio, audio_path: str) -> float:
         """Get audio duration in seconds.
         
-        Uses audio.duration_seconds if available, otherwise reads from file.
+        Uses audio.duration_seconds if available, then the MP3 frame headers,
+        otherwise reads from file.
         """
         if audio.duration_seconds is not None:
             return audio.duration_seconds
         
+        duration = mp3_duration(audio.data)
+        if duration is not None:
+            return duration
+        
         # Calculate from audio file
         with AudioFileClip(audio_path) as clip:
             return clip.duration
@@ -212,7 +1155,8 @@ class FFmpegVideoCompiler:
         duration_per_image: float,
         progress_callback: Optional[Callable[[str], None]],
         enable_zoom: bool = True,
-        target_resolution: tuple = (1920, 1080)
+        target_resolution: tuple = (1920, 1080),
+        store: Optional[SourceImageStore] = None
     ) -> List:
         """Create video clips from images with optional zoom effects.
         
@@ -221,6 +1165,8 @@ class FFmpegVideoCompiler:
             duration_per_image: Duration each image should display.
             progress_callback: Optional progress callback.
             enable_zoom: Whether to apply Ken Burns zoom effects.
+            store: Pre-scaled pixels for every image (see SourceImageStore);
+                clips then read from the store instead of decoding the files.
             
         Returns:
             List of ImageClip objects.
@@ -233,6 +1179,10 @@ class FFmpegVideoCompiler:
                 progress_callback(f"Processing image {i + 1} of {total}")
             
             try:
+                if store is not None:
+                    clips.append(self._store_clip(store, i, duration_per_image, enable_zoom, target_resolution))
+                    continue
+                
                 # Create clip and set duration
                 clip = ImageClip(path)
                 clip = clip.with_duration(duration_per_image)
@@ -258,6 +1208,51 @@ class FFmpegVideoCompiler:
         
         return clips
     
+    def _store_clip(
+        self,
+        store: SourceImageStore,
+        index: int,
+        duration: float,
+        enable_zoom: bool,
+        target_resolution: tuple
+    ):
+        """Clip for one image whose frames are read from the source store.
+        
+        The store already holds the image at the oversampled base size (or
+        the target size without zoom), so no decode or resize happens here.
+        """
+        renderer = None
+        if enable_zoom:
+            renderer = ZoomRenderer(
+                store[index],
+                target_resolution,
+                duration,
+                # Even indices = zoom in, odd indices = zoom out (Story 2.7)
+                zoom_direction="in" if index % 2 == 0 else "out",
+                zoom_factor=self.ZOOM_SCALE_FACTOR,
+                fps=self.profile.fps,
+                frame_resample=self.profile.pil_resample
+            )
+        started = False
+        
+        def frame_function(t):
+            nonlocal started
+            if not started and index > 0:
+                # Clips play in order: the previous image's pages can be dropped
+                store.release(index - 1)
+            started = True
+            if renderer is None:
+                # Without zoom the store already holds the image at the output size
+                return store[index]
+            return renderer.frame_at(t, cache=False)
+        
+        # Size is set directly: VideoClip(frame_function) would render frame 0
+        # of every clip up front, touching every image's pixels at once
+        clip = VideoClip(duration=duration)
+        clip.frame_function = frame_function
+        clip.size = tuple(target_resolution)
+        return clip
+    
     def _apply_zoom_effect(
         self,
         clip: "ImageClip",
@@ -266,61 +1261,40 @@ class FFmpegVideoCompiler:
     ) -> "ImageClip":
         """Apply Ken Burns-style zoom effect to an image clip.
         
-        Uses moviepy's fl() method for frame-level transformation.
-        The zoom effect scales the image and center-crops to maintain
-        the 1920x1080 output resolution.
+        Frames come from a ZoomRenderer, which decodes and oversamples the
+        image once and precomputes every crop rectangle, so each frame costs
+        one resample. The zoom scales the image and center-crops to maintain
+        the target output resolution.
         
         Args:
             clip: The base ImageClip to apply the effect to.
             zoom_direction: "in" for zoom-in (1.0 → 1.08), "out" for zoom-out (1.08 → 1.0).
+            target_resolution: Output (width, height).
             
         Returns:
             Modified clip with zoom effect applied.
         """
-        from PIL import Image as PILImage
-        import numpy as np
+        from eleven_video.processing.zoom import ZoomRenderer
         
-        # Zoom parameters (subtle 5-10% change)
-        zoom_factor = self.ZOOM_SCALE_FACTOR  # 1.08
-        if zoom_direction == "in":
-            start_scale, end_scale = 1.0, zoom_factor
-        else:
-            start_scale, end_scale = zoom_factor, 1.0
-        
-        w, h = target_resolution
         duration = clip.duration
+        renderer = None
         
         def zoom_effect(get_frame, t):
-            """Apply zoom for frame at time t."""
-            # Linear interpolation of scale
-            progress = t / duration if duration > 0 else 0
-            scale = start_scale + (end_scale - start_scale) * progress
-            
-            # Calculate dimensions for scaled frame
-            new_w, new_h = int(w * scale), int(h * scale)
-            
-            # Get frame and resize
-            frame = get_frame(t)
-            
-            # Use PIL for high-quality resize
-            img = PILImage.fromarray(frame)
-            
-            # For zoom-out, first upscale to max needed size to avoid quality loss
-            # This ensures we never upscale from a smaller image
-            max_scale = max(start_scale, end_scale)
-            base_w, base_h = int(w * max_scale), int(h * max_scale)
-            if img.size != (base_w, base_h):
-                img = img.resize((base_w, base_h), PILImage.LANCZOS)
-            
-            # Now scale to current frame's target size
-            img_scaled = img.resize((new_w, new_h), PILImage.LANCZOS)
-            
-            # Center crop to output resolution
-            x_off = (new_w - w) // 2
-            y_off = (new_h - h) // 2
-            img_cropped = img_scaled.crop((x_off, y_off, x_off + w, y_off + h))
-            
-            return np.array(img_cropped)
+            """Return the zoomed frame at time t."""
+            nonlocal renderer
+            if renderer is None:
+                # ImageClip frames are static - build the base image once
+                renderer = ZoomRenderer(
+                    get_frame(0),
+                    target_resolution,
+                    duration,
+                    zoom_direction=zoom_direction,
+                    zoom_factor=self.ZOOM_SCALE_FACTOR,
+                    fps=self.profile.fps,
+                    frame_resample=self.profile.pil_resample
+                )
+            return renderer.frame_at(t)
         
-        # Apply frame-level transformation
-        return clip.fl(zoom_effect)
+        # Apply frame-level transformation (fl() on moviepy 1.x, transform() on 2.x)
+        transform = getattr(clip, "fl", None) or clip.transform
+        return transform(zoom_effect)
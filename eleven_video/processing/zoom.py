@@ -0,0 +1,210 @@
+"""Precomputed Ken Burns zoom frame generator.
+
+ZoomRenderer decodes and oversamples a source image once, precomputes the
+crop rectangle of every frame on the output fps grid as NumPy arrays, and
+produces each frame with a single box-resample from the cached base image.
+The previous per-frame path re-upscaled the source to the base size and then
+resized it a second time for every frame.
+
+Frames are still resampled one at a time: ``render_frames`` takes a batch of
+indices and fills one output array, but each frame is its own Pillow resize.
+That saves roughly 4x per frame over the old path, not an order of
+magnitude; a NumPy resample of the whole batch measured about 2.5x slower
+per 1080p frame than Pillow's C resize, so the per-frame resize stays.
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler._apply_zoom_effect
+- eleven_video/processing/ffmpeg_backend.py: zoom_scale_range
+- eleven_video/processing/image_store.py: SourceImageStore (pre-scaled base pixels)
+"""
+import io
+import math
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image as PILImage
+
+from eleven_video.processing.ffmpeg_backend import zoom_scale_range
+
+ImageSource = Union[np.ndarray, PILImage.Image, bytes, str]
+
+# Extra source pixels around a crop window so the resampling filter sees the
+# same neighbourhood as when resizing from the full base image
+_WINDOW_MARGIN = 4
+
+
+def zoom_base_size(target_resolution: Tuple[int, int], zoom_factor: float = 1.08) -> Tuple[int, int]:
+    """Oversampled base image size for a zoom: the target size times the largest zoom scale."""
+    w, h = target_resolution
+    max_scale = max(zoom_scale_range("in", zoom_factor))
+    return (int(w * max_scale), int(h * max_scale))
+
+
+def _load_source(source: ImageSource) -> PILImage.Image:
+    """Decode an image source (array, PIL image, encoded bytes or path) to RGB."""
+    if isinstance(source, PILImage.Image):
+        img = source
+    elif isinstance(source, np.ndarray):
+        img = PILImage.fromarray(source.astype(np.uint8, copy=False))
+    elif isinstance(source, bytes):
+        img = PILImage.open(io.BytesIO(source))
+    else:
+        img = PILImage.open(source)
+    return img.convert("RGB")
+
+
+class ZoomRenderer:
+    """Generates Ken Burns zoom frames for one image.
+
+    The zoom matches the moviepy path: the source is stretched to the target
+    size times the largest zoom scale, scaled linearly between the start and
+    end scale over the clip duration, and center-cropped to the target size.
+    Crop windows are kept as float rectangles, so each frame is one resample
+    of the cached base image with no integer-offset jitter.
+
+    The one-time oversample uses ``resample`` (LANCZOS). Per-frame resampling
+    only ever shrinks the base by at most the zoom factor, where ``frame_resample``
+    (BILINEAR) is visually indistinguishable and several times cheaper.
+
+    A uint8 array source that already has the base size (a SourceImageStore
+    slice) is not copied: each frame reads only its crop window from it, so a
+    renderer holds no pixel memory of its own.
+
+    Attributes:
+        base: Oversampled RGB base image, decoded once (None when reading
+            from pre-scaled pixels).
+        pixels: Pre-scaled (h, w, 3) base pixels, or None.
+        base_size: (width, height) of the base image.
+        boxes: (frame_count, 4) float array of crop boxes in base coordinates.
+
+    Example:
+        renderer = ZoomRenderer(image_bytes, (1920, 1080), duration=4.0, zoom_direction="in")
+        frames = renderer.render_frames(range(renderer.frame_count))
+    """
+
+    def __init__(
+        self,
+        source: ImageSource,
+        target_resolution: Tuple[int, int],
+        duration: float,
+        zoom_direction: str = "in",
+        zoom_factor: float = 1.08,
+        fps: int = 24,
+        resample: int = PILImage.LANCZOS,
+        frame_resample: int = PILImage.BILINEAR,
+    ):
+        self.target_resolution = target_resolution
+        self.duration = duration
+        self.fps = fps
+        self.resample = resample
+        self.frame_resample = frame_resample
+        self.start_scale, self.end_scale = zoom_scale_range(zoom_direction, zoom_factor)
+
+        self.base_size = zoom_base_size(target_resolution, zoom_factor)
+        base_w, base_h = self.base_size
+        if isinstance(source, np.ndarray) and source.dtype == np.uint8 and source.shape == (base_h, base_w, 3):
+            self.base = None
+            self.pixels: Optional[np.ndarray] = source
+        else:
+            source_img = _load_source(source)
+            self.base = source_img if source_img.size == self.base_size else source_img.resize(self.base_size, resample)
+            self.pixels = None
+
+        frame_count = max(int(math.ceil(duration * fps - 1e-9)), 1)
+        self.boxes = self._boxes_for_times(np.arange(frame_count) / fps)
+
+        self._last_index: Optional[int] = None
+        self._last_frame: Optional[np.ndarray] = None
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames on the fps grid."""
+        return len(self.boxes)
+
+    @property
+    def is_static(self) -> bool:
+        """Whether every frame is identical (zoom factor of 1.0)."""
+        return self.start_scale == self.end_scale
+
+    def _boxes_for_times(self, times: np.ndarray) -> np.ndarray:
+        """Vectorized crop boxes (left, top, right, bottom) for the given times."""
+        if self.duration > 0:
+            progress = times / self.duration
+        else:
+            progress = np.zeros_like(times, dtype=float)
+        scales = self.start_scale + (self.end_scale - self.start_scale) * progress
+
+        base_w, base_h = self.base_size
+        # Scaling the base to (w*s, h*s) and center-cropping w x h is the same
+        # as cropping a (base_w/s, base_h/s) window and resizing it once.
+        half_w = base_w / scales / 2
+        half_h = base_h / scales / 2
+        cx, cy = base_w / 2, base_h / 2
+        return np.stack([cx - half_w, cy - half_h, cx + half_w, cy + half_h], axis=1)
+
+    def _render_box(self, box: Sequence[float], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Resample one crop box of the base image to the target resolution."""
+        if self.pixels is None:
+            frame = np.asarray(self.base.resize(self.target_resolution, self.frame_resample, box=tuple(box)))
+        else:
+            frame = self._render_window(box)
+        if out is None:
+            return frame
+        out[...] = frame
+        return out
+
+    def _render_window(self, box: Sequence[float]) -> np.ndarray:
+        """Resample a crop box read directly from the pre-scaled pixel array."""
+        left, top, right, bottom = box
+        base_h, base_w = self.pixels.shape[:2]
+        x0 = max(int(math.floor(left)) - _WINDOW_MARGIN, 0)
+        y0 = max(int(math.floor(top)) - _WINDOW_MARGIN, 0)
+        x1 = min(int(math.ceil(right)) + _WINDOW_MARGIN, base_w)
+        y1 = min(int(math.ceil(bottom)) + _WINDOW_MARGIN, base_h)
+        window = PILImage.fromarray(np.ascontiguousarray(self.pixels[y0:y1, x0:x1]))
+        shifted = (left - x0, top - y0, right - x0, bottom - y0)
+        return np.asarray(window.resize(self.target_resolution, self.frame_resample, box=shifted))
+
+    def render_frames(self, indices: Sequence[int], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Render a batch of frames by index as a (k, h, w, 3) uint8 array (read-only if static).
+
+        The batch shares one output array, but each frame is resampled by
+        its own Pillow resize (see module docstring); only static segments
+        resample once for the whole batch. ``out`` is a writable
+        (k, h, w, 3) array to render into instead, e.g. a FrameRing slot.
+        """
+        w, h = self.target_resolution
+        indices = list(indices)
+        if self.is_static:
+            # Static segments resample once and repeat the frame (read-only view)
+            frame = self._render_box(self.boxes[0])
+            if out is not None:
+                out[...] = frame
+                return out
+            return np.broadcast_to(frame, (len(indices), h, w, 3))
+
+        batch = np.empty((len(indices), h, w, 3), dtype=np.uint8) if out is None else out
+        for slot, index in enumerate(indices):
+            self._render_box(self.boxes[index], out=batch[slot])
+        return batch
+
+    def frame_at(self, t: float, cache: bool = True) -> np.ndarray:
+        """Return the frame at time ``t`` (seconds).
+
+        Times on the fps grid use the precomputed boxes and reuse the last
+        frame when asked for the same index twice; off-grid times are
+        computed directly so other output frame rates stay exact.
+        ``cache=False`` keeps no frame alive between calls.
+        """
+        position = t * self.fps
+        index = int(round(position))
+        if abs(position - index) > 1e-6:
+            return self._render_box(self._boxes_for_times(np.array([t]))[0])
+
+        index = min(max(index, 0), self.frame_count - 1)
+        if not cache:
+            return self._render_box(self.boxes[index])
+        if index != self._last_index:
+            self._last_frame = self._render_box(self.boxes[index])
+            self._last_index = index
+        return self._last_frame
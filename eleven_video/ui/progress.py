@@ -149,12 +149,18 @@ class VideoPipelineProgress:
         
         # Calculate file size in MB
         file_size_mb = video.file_size_bytes / (1024 * 1024)
+        preview_line = f"Preview: {video.preview_path}\n" if video.preview_path is not None else ""
+        poster_line = f"Poster: {video.poster_path}\n" if video.poster_path is not None else ""
+        encode_line = f"Encode: {video.encode_fps:.1f} fps\n" if video.encode_fps is not None else ""
         
         self.console.print(Panel.fit(
             f"[green]✅ Video Generated Successfully![/green]\n\n"
             f"Output: {output_path}\n"
+            f"{preview_line}"
+            f"{poster_line}"
             f"Duration: {video.duration_seconds:.1f}s\n"
             f"Size: {file_size_mb:.1f} MB\n"
+            f"{encode_line}"
             f"Total time: {total_time:.1f}s",
             title="Complete",
             border_style="green"
@@ -15,6 +15,7 @@ from rich.live import Live
 from rich.console import Console
 
 from eleven_video.monitoring.usage import UsageMonitor
+from eleven_video.ui.console import console as default_console
 
 
 
@@ -180,7 +181,7 @@ class UsageDisplay:
             return  # Already running
         
         self._stop_event.clear()
-        effective_console = console or self.console or Console()
+        effective_console = console or self.console or default_console
         
         def _update_loop():
             with Live(self, console=effective_console, refresh_per_second=1) as live:
@@ -209,5 +210,5 @@ class UsageDisplay:
         Args:
             console: Console to render to.
         """
-        effective_console = console or self.console or Console()
+        effective_console = console or self.console or default_console
         effective_console.print(self)
@@ -0,0 +1,198 @@
+"""Pure-Python MP3 duration from frame headers.
+
+ElevenLabs returns narration as an MP3 byte buffer. Knowing its exact
+duration at TTS time lets the compiler size segments without starting
+ffmpeg (AudioFileClip) just to decode the file and read its length.
+
+The duration comes from, in order of preference:
+- a Xing/Info header (frame count) with the LAME extension's encoder delay
+  and padding, which gives sample-exact length for LAME-encoded files,
+- a VBRI header (Fraunhofer VBR frame count),
+- otherwise a walk over every frame header (CBR streams, no tag).
+
+Related files:
+- eleven_video/api/elevenlabs.py: ElevenLabsAdapter fills Audio.duration_seconds
+- eleven_video/processing/video_handler.py: _get_audio_duration (ffmpeg fallback)
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+# Bitrates in kbps by [version is MPEG-1][layer][index]
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+# Sample rates by version bits (0 = MPEG-2.5, 2 = MPEG-2, 3 = MPEG-1)
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+
+@dataclass(frozen=True)
+class FrameHeader:
+    """Decoded 4-byte MPEG audio frame header.
+
+    Attributes:
+        mpeg1: True for MPEG-1, False for MPEG-2 / 2.5.
+        layer: 1, 2 or 3.
+        sample_rate: Samples per second.
+        frame_length: Frame size in bytes including the header.
+        samples: PCM samples per channel in the frame.
+        mono: Single-channel mode.
+    """
+    mpeg1: bool
+    layer: int
+    sample_rate: int
+    frame_length: int
+    samples: int
+    mono: bool
+
+
+def parse_frame_header(data: bytes, offset: int) -> Optional[FrameHeader]:
+    """Decode the frame header at ``offset``, or None if it is not a valid header."""
+    if offset + 4 > len(data):
+        return None
+    b1, b2, b3 = data[offset + 1], data[offset + 2], data[offset + 3]
+    if data[offset] != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version_bits = (b1 >> 3) & 0x3
+    layer = 4 - ((b1 >> 1) & 0x3)
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x3
+    if version_bits == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version_bits == 3
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version_bits][rate_index]
+    padding = (b2 >> 1) & 0x1
+
+    if layer == 1:
+        samples = 384
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 2 or mpeg1:
+        samples = 1152
+        frame_length = 144 * bitrate // sample_rate + padding
+    else:
+        samples = 576
+        frame_length = 72 * bitrate // sample_rate + padding
+
+    return FrameHeader(
+        mpeg1=mpeg1,
+        layer=layer,
+        sample_rate=sample_rate,
+        frame_length=frame_length,
+        samples=samples,
+        mono=(b3 >> 6) == 3,
+    )
+
+
+def _skip_id3v2(data: bytes) -> int:
+    """Offset of the first byte after a leading ID3v2 tag (0 if none)."""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = 0
+    for b in data[6:10]:
+        size = (size << 7) | (b & 0x7F)
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _find_first_frame(data: bytes, start: int) -> Optional[int]:
+    """Offset of the first frame header confirmed by a following header."""
+    offset = data.find(b"\xff", start)
+    while 0 <= offset < len(data) - 3:
+        header = parse_frame_header(data, offset)
+        if header is not None:
+            following = offset + header.frame_length
+            # Accept a lone frame that ends the buffer; otherwise require a second header
+            if following == len(data) or parse_frame_header(data, following) is not None:
+                return offset
+        offset = data.find(b"\xff", offset + 1)
+    return None
+
+
+def _xing_duration(data: bytes, offset: int, header: FrameHeader) -> Optional[float]:
+    """Duration from a Xing/Info tag (plus LAME delay/padding) in the first frame."""
+    if header.layer != 3:
+        return None
+    if header.mpeg1:
+        side_info = 17 if header.mono else 32
+    else:
+        side_info = 9 if header.mono else 17
+    pos = offset + 4 + side_info
+    if data[pos:pos + 4] not in (b"Xing", b"Info") or pos + 8 > len(data):
+        return None
+
+    flags = int.from_bytes(data[pos + 4:pos + 8], "big")
+    if not flags & 0x1:
+        return None
+    frames = int.from_bytes(data[pos + 8:pos + 12], "big")
+    lame = pos + 12
+    if flags & 0x2:
+        lame += 4
+    if flags & 0x4:
+        lame += 100
+    if flags & 0x8:
+        lame += 4
+
+    total_samples = frames * header.samples
+    if lame + 24 <= min(offset + header.frame_length, len(data)):
+        # LAME extension (encoder string "LAME3.100", "Lavc61.3." ...): 12-bit
+        # encoder delay and 12-bit end padding, 21 bytes into the tag
+        packed = int.from_bytes(data[lame + 21:lame + 24], "big")
+        delay, pad = packed >> 12, packed & 0xFFF
+        if delay + pad < total_samples:
+            total_samples -= delay + pad
+    return total_samples / header.sample_rate
+
+
+def _vbri_duration(data: bytes, offset: int, header: FrameHeader) -> Optional[float]:
+    """Duration from a Fraunhofer VBRI tag (32 bytes after the first frame header)."""
+    pos = offset + 4 + 32
+    if data[pos:pos + 4] != b"VBRI" or pos + 18 > len(data):
+        return None
+    frames = int.from_bytes(data[pos + 14:pos + 18], "big")
+    return frames * header.samples / header.sample_rate
+
+
+def mp3_duration(data: bytes) -> Optional[float]:
+    """Exact duration of an MP3 byte buffer in seconds, without decoding.
+
+    Args:
+        data: Complete MP3 file contents.
+
+    Returns:
+        Duration in seconds, or None if no complete MPEG audio frame is found.
+    """
+    start = _find_first_frame(data, _skip_id3v2(data))
+    if start is None:
+        return None
+    first = parse_frame_header(data, start)
+
+    duration = _xing_duration(data, start, first)
+    if duration is None:
+        duration = _vbri_duration(data, start, first)
+    if duration is not None:
+        return duration
+
+    # No tag: count every complete frame (a truncated final frame is dropped, as decoders do)
+    samples = 0
+    offset = start
+    while True:
+        header = parse_frame_header(data, offset)
+        if header is None or offset + header.frame_length > len(data):
+            break
+        samples += header.samples
+        offset += header.frame_length
+    if samples == 0:
+        return None
+    return samples / first.sample_rate
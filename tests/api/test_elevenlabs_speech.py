@@ -152,6 +152,23 @@ class TestTTSGenerationSuccess:
         call_kwargs = mock_client.text_to_speech.convert.call_args.kwargs
         assert call_kwargs.get("voice_id") == custom_voice
 
+    def test_generate_speech_sets_duration_from_mp3_headers(self, mock_elevenlabs_sdk):
+        """
+        GIVEN the SDK returns 50 CBR MP3 frames (128 kbps, 44.1 kHz)
+        WHEN generating speech
+        THEN duration_seconds is read from the frame headers (50 x 1152 samples).
+        """
+        from eleven_video.api.elevenlabs import ElevenLabsAdapter
+        
+        mock_client_cls, mock_client, _ = mock_elevenlabs_sdk
+        frame = b'\xff\xfb\x90\x00' + bytes(413)
+        mock_client.text_to_speech.convert.return_value = iter([frame * 25, frame * 25])
+        
+        adapter = ElevenLabsAdapter(api_key="test-key")
+        audio = adapter.generate_speech("Test script")
+        
+        assert audio.duration_seconds == pytest.approx(50 * 1152 / 44100)
+
 
 # =============================================================================
 # Story 2.2: AC2 - API Key Security Tests
@@ -0,0 +1,65 @@
+"""
+Tests for the calibrate command.
+
+Related files:
+- eleven_video/main.py: calibrate
+- eleven_video/processing/calibration.py: calibrate, Calibration
+"""
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.main import app
+from eleven_video.processing.calibration import BackendTiming, Calibration
+
+runner = CliRunner()
+
+
+def _calibration():
+    return Calibration(
+        profile="standard", ffmpeg_version="7.0.2", encoders=["libx264", "h264_nvenc"], cores=4,
+        resample_megapixels_per_second=50.0, encode_megapixels_per_second=20.0,
+        timings=[BackendTiming("ffmpeg", 1, 0.05, 2.0), BackendTiming("parallel", 4, 0.06, 0.5)],
+    )
+
+
+def test_calibrate_measures_saves_and_prints_plans(tmp_path):
+    """
+    GIVEN a machine that calibrates successfully
+    WHEN calibrate runs
+    THEN the results are cached and the planned backends are shown
+    """
+    calibration = _calibration()
+    with patch("eleven_video.processing.calibration.calibrate", return_value=calibration) as mock_run, \
+         patch.object(Calibration, "save") as mock_save:
+        result = runner.invoke(app, ["calibrate", "--render-profile", "standard"])
+
+    assert result.exit_code == 0
+    assert mock_run.call_args.args[0] == "standard"
+    mock_save.assert_called_once()
+    assert "libx264, h264_nvenc" in result.stdout
+    assert "parallel" in result.stdout and "ffmpeg" in result.stdout
+
+
+def test_calibrate_show_without_cache():
+    with patch.object(Calibration, "load", return_value=None):
+        result = runner.invoke(app, ["calibrate", "--show"])
+
+    assert result.exit_code == 1
+    assert "No current calibration" in result.stdout
+
+
+def test_calibrate_reports_failure():
+    with patch("eleven_video.processing.calibration.calibrate", side_effect=VideoProcessingError("ffmpeg missing")):
+        result = runner.invoke(app, ["calibrate"])
+
+    assert result.exit_code == 1
+    assert "Calibration failed" in result.stdout
+
+
+def test_calibrate_rejects_unknown_profile():
+    result = runner.invoke(app, ["calibrate", "--render-profile", "turbo"])
+
+    assert result.exit_code == 1
+    assert "Invalid render profile" in result.stdout
@@ -0,0 +1,31 @@
+"""
+Tests for the render-worker command.
+
+Related files:
+- eleven_video/main.py: render_worker
+- eleven_video/processing/distributed.py: RenderWorker
+"""
+from typer.testing import CliRunner
+
+from eleven_video.main import app
+
+runner = CliRunner()
+
+
+def test_render_worker_exits_when_idle(tmp_path):
+    """
+    GIVEN an empty shared directory and --idle-timeout 0
+    WHEN render-worker runs
+    THEN it exits cleanly after rendering nothing
+    """
+    result = runner.invoke(app, ["render-worker", "--shared-dir", str(tmp_path), "--idle-timeout", "0"])
+
+    assert result.exit_code == 0
+    assert "finished after 0 segments" in result.stdout
+
+
+def test_render_worker_rejects_missing_directory(tmp_path):
+    result = runner.invoke(app, ["render-worker", "--shared-dir", str(tmp_path / "missing")])
+
+    assert result.exit_code == 1
+    assert "Invalid shared directory" in result.stdout
@@ -265,6 +265,35 @@ class TestDurationValidation:
             assert settings.default_duration_minutes is None
 
 
+class TestSettingsRenderProfile:
+    """Tests for the default_render_profile preference."""
+
+    @pytest.mark.parametrize("value,expected", [
+        ("draft", "draft"),
+        ("Archival", "archival"),
+        (" standard ", "standard"),
+        ("turbo", None),
+        ("", None),
+        (5, None),
+    ])
+    def test_render_profile_normalized_or_dropped(self, monkeypatch, value, expected):
+        """
+        GIVEN a JSON config with default_render_profile set
+        WHEN Settings is instantiated
+        THEN known profiles are normalized and unknown values become None
+        """
+        config_data = {"default_render_profile": value}
+
+        monkeypatch.setenv("ELEVENLABS_API_KEY", "test-key")
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+
+        with patch("eleven_video.config.settings.load_config", return_value=config_data):
+            from eleven_video.config.settings import Settings
+            settings = Settings()
+
+            assert settings.default_render_profile == expected
+
+
 # =============================================================================
 # Task 1.6: Settings defaults to None when not in config
 # =============================================================================
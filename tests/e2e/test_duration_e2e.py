@@ -64,6 +64,8 @@ def test_generate_command_with_duration(mock_pipeline_spy, mock_all_apis):
         image_model_id="dummy_image_model",
         gemini_model_id="models/gemini-2.5-flash",
         duration_minutes=3,
-        resolution=Resolution.HD_1080P
+        resolution=Resolution.HD_1080P,
+        enable_zoom=True,
+        render_mode="full"
     )
 
@@ -56,7 +56,9 @@ class TestCLIImageModelIntegration:
             image_model_id="gemini-3-flash",
             gemini_model_id=None,
             duration_minutes=None,
-            resolution=Resolution.HD_1080P
+            resolution=Resolution.HD_1080P,
+            enable_zoom=True,
+            render_mode="full"
         )
 
     def test_generate_with_short_flags(self):
@@ -86,7 +88,9 @@ class TestCLIImageModelIntegration:
             image_model_id="imagen-3",
             gemini_model_id=None,
             duration_minutes=None,
-            resolution=Resolution.HD_1080P
+            resolution=Resolution.HD_1080P,
+            enable_zoom=True,
+            render_mode="full"
         )
 
     def test_generate_without_image_model_flag_completes_successfully(self):
@@ -35,5 +35,5 @@ class TestResolutionE2E:
          # Verify compile_video called with correct resolution
          mock_compile.assert_called_with(
              ANY, ANY, ANY, progress_callback=ANY, 
-             resolution=Resolution.PORTRAIT
+             resolution=Resolution.PORTRAIT, enable_zoom=True, backend="moviepy"
          )
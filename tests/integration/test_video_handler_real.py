@@ -90,7 +90,6 @@ class TestVideoHandlerReal:
             pass
 
     @pytest.mark.integration
-    @pytest.mark.xfail(reason="moviepy 2.x ImageClip doesn't have fl() method - requires moviepy 1.x or API update")
     def test_zoom_effect_logic_real(self):
         """Verify _apply_zoom_effect actually transforms frames without error using real moviepy."""
         from moviepy import ImageClip
@@ -69,6 +69,66 @@ def test_pipeline_orchestration_success(pipeline, mock_adapters):
     gemini.generate_images.assert_called_once()
     compiler.compile_video.assert_called_once()
 
+def test_pipeline_no_zoom_uses_static_fast_path(pipeline, mock_adapters):
+    """
+    GIVEN zoom disabled
+    WHEN generate is called
+    THEN the compiler is asked for a static render on the ffmpeg backend
+    """
+    _, _, compiler = mock_adapters
+
+    pipeline.generate(prompt="test topic", enable_zoom=False)
+
+    kwargs = compiler.compile_video.call_args.kwargs
+    assert kwargs["enable_zoom"] is False
+    assert kwargs["backend"] == "ffmpeg"
+
+def test_pipeline_preview_mode_skips_full_render(pipeline, mock_adapters):
+    """
+    GIVEN render_mode="preview"
+    WHEN generate is called
+    THEN only the low-resolution proxy is rendered and returned
+    """
+    _, _, compiler = mock_adapters
+    compiler.compile_preview.side_effect = lambda images, audio, path, **kwargs: Video(
+        file_path=path, duration_seconds=10.0, file_size_bytes=10, resolution=(640, 360)
+    )
+
+    video = pipeline.generate(prompt="test topic", render_mode="preview")
+
+    compiler.compile_video.assert_not_called()
+    assert video.file_path.name.endswith("_preview.mp4")
+
+def test_pipeline_both_mode_renders_preview_first(pipeline, mock_adapters):
+    """
+    GIVEN render_mode="both"
+    WHEN generate is called
+    THEN the proxy is rendered before the full video and linked from it
+    """
+    _, _, compiler = mock_adapters
+    calls = []
+    compiler.compile_preview.side_effect = lambda images, audio, path, **kwargs: calls.append("preview") or Video(
+        file_path=path, duration_seconds=10.0, file_size_bytes=10
+    )
+    compiler.compile_video.side_effect = lambda *args, **kwargs: calls.append("full") or Video(
+        file_path=Path("video.mp4"), duration_seconds=10.0, file_size_bytes=1024
+    )
+
+    video = pipeline.generate(prompt="test topic", render_mode="both")
+
+    assert calls == ["preview", "full"]
+    assert video.preview_path.name.endswith("_preview.mp4")
+
+def test_pipeline_rejects_unknown_render_mode(pipeline, mock_adapters):
+    """An unknown render mode fails before any API call."""
+    from eleven_video.exceptions.custom_errors import ValidationError
+    gemini, _, _ = mock_adapters
+
+    with pytest.raises(ValidationError):
+        pipeline.generate(prompt="test topic", render_mode="draft")
+
+    gemini.generate_script.assert_not_called()
+
 def test_pipeline_progress_callbacks(pipeline, mock_adapters):
     """
     GIVEN a pipeline with progress tracking
@@ -111,3 +171,157 @@ def test_pipeline_error_handling(pipeline, mock_adapters):
         pipeline.generate("topic")
         
     mock_progress.fail_stage.assert_called()
+
+def test_pipeline_progressive_format_uses_pipe_backend(mock_settings, mock_adapters):
+    """
+    GIVEN output_format="hls" with zoom enabled
+    WHEN generate is called
+    THEN the compiler writes an HLS playlist from the pipe backend's encoder
+    """
+    _, _, compiler = mock_adapters
+    pipeline = VideoPipeline(settings=mock_settings, output_format="hls")
+
+    pipeline.generate(prompt="test topic")
+
+    args, kwargs = compiler.compile_video.call_args
+    assert kwargs["backend"] == "pipe"
+    assert args[2].suffix == ".m3u8"
+
+def test_pipeline_streams_to_stdout_path(mock_settings, mock_adapters):
+    """An explicit output path of "-" is handed to the compiler unchanged."""
+    _, _, compiler = mock_adapters
+    pipeline = VideoPipeline(settings=mock_settings, output_format="fmp4", output_path=Path("-"))
+
+    pipeline.generate(prompt="test topic")
+
+    assert compiler.compile_video.call_args.args[2] == Path("-")
+
+def test_pipeline_cpu_budget_setting(mock_adapters):
+    """
+    GIVEN the cpu_budget setting
+    WHEN the pipeline creates its compiler
+    THEN the compiler leases cores from a governor with that budget
+    """
+    _, _, compiler = mock_adapters
+    settings = Settings(
+        elevenlabs_api_key="test_key", gemini_api_key="test_key", project_root="/tmp", cpu_budget=4
+    )
+    pipeline = VideoPipeline(settings=settings)
+
+    pipeline.generate(prompt="test topic")
+
+    from eleven_video.orchestrator.video_pipeline import FFmpegVideoCompiler
+    assert FFmpegVideoCompiler.call_args.kwargs["cpu_governor"].budget == 4
+
+def test_pipeline_shared_dir_uses_distributed_backend(mock_settings, mock_adapters, tmp_path):
+    """A shared directory sends the segment encodes to render workers."""
+    _, _, compiler = mock_adapters
+    pipeline = VideoPipeline(settings=mock_settings, shared_dir=tmp_path)
+
+    pipeline.generate(prompt="test topic")
+
+    assert compiler.compile_video.call_args.kwargs["backend"] == "distributed"
+
+def test_pipeline_plans_backend_from_calibration(mock_settings, mock_adapters):
+    """
+    GIVEN a zoomed MP4 render
+    WHEN generate is called
+    THEN the compiler gets this machine's cached calibration and plans the backend itself
+    """
+    _, _, compiler = mock_adapters
+    calibration = MagicMock()
+    pipeline = VideoPipeline(settings=mock_settings, render_profile="draft")
+
+    with patch("eleven_video.orchestrator.video_pipeline.Calibration.load", return_value=calibration) as mock_load:
+        pipeline.generate(prompt="test topic")
+
+    from eleven_video.orchestrator.video_pipeline import FFmpegVideoCompiler
+    mock_load.assert_called_once_with("draft")
+    assert FFmpegVideoCompiler.call_args.kwargs["calibration"] is calibration
+    assert compiler.compile_video.call_args.kwargs["backend"] == "auto"
+
+def test_pipeline_passes_transition_to_compiler(mock_settings, mock_adapters):
+    """A transition length reaches the compiler, which encodes the crossfade windows."""
+    pipeline = VideoPipeline(settings=mock_settings, transition_seconds=0.5)
+
+    pipeline.generate(prompt="test topic")
+
+    from eleven_video.orchestrator.video_pipeline import FFmpegVideoCompiler
+    assert FFmpegVideoCompiler.call_args.kwargs["transition_seconds"] == 0.5
+
+def test_pipeline_work_dir_journals_the_compile(mock_settings, mock_adapters, tmp_path):
+    """
+    GIVEN a work directory
+    WHEN generate succeeds
+    THEN the compile keeps its progress under it, and the directory is removed afterwards
+    """
+    _, _, compiler = mock_adapters
+    work_dir = tmp_path / "work"
+    seen = {}
+    compiler.compile_video.side_effect = lambda *args, **kwargs: seen.update(
+        compile_dir=kwargs["work_dir"], saved=sorted(p.name for p in (work_dir / "assets").iterdir())
+    ) or Video(file_path=Path("video.mp4"), duration_seconds=10.0, file_size_bytes=1024)
+    pipeline = VideoPipeline(settings=mock_settings, work_dir=work_dir)
+
+    pipeline.generate(prompt="test topic")
+
+    assert seen == {"compile_dir": work_dir / "compile", "saved": ["audio.mp3", "image_000.png", "manifest.json"]}
+    assert not work_dir.exists()
+
+def test_pipeline_rerun_reuses_saved_assets(mock_settings, mock_adapters, tmp_path):
+    """
+    GIVEN a run that generated its assets and then crashed while compiling
+    WHEN the same request runs again with the same work directory
+    THEN the script, narration and images are not generated again and the compile gets the saved ones
+    """
+    gemini, eleven, compiler = mock_adapters
+    work_dir = tmp_path / "work"
+    compiler.compile_video.side_effect = RuntimeError("killed")
+    with pytest.raises(RuntimeError):
+        VideoPipeline(settings=mock_settings, work_dir=work_dir).generate(prompt="test topic", voice_id="v1")
+    gemini.reset_mock()
+    eleven.reset_mock()
+    compiler.compile_video.side_effect = None
+
+    VideoPipeline(settings=mock_settings, work_dir=work_dir).generate(prompt="test topic", voice_id="v1")
+
+    gemini.generate_script.assert_not_called()
+    eleven.generate_speech.assert_not_called()
+    gemini.generate_images.assert_not_called()
+    images, audio = compiler.compile_video.call_args.args[:2]
+    assert [image.data for image in images] == [b"img"]
+    assert (audio.data, audio.duration_seconds) == (b"audio", 10.0)
+
+def test_pipeline_other_request_regenerates_assets(mock_settings, mock_adapters, tmp_path):
+    """Assets saved for another prompt are not reused."""
+    gemini, _, compiler = mock_adapters
+    work_dir = tmp_path / "work"
+    compiler.compile_video.side_effect = RuntimeError("killed")
+    with pytest.raises(RuntimeError):
+        VideoPipeline(settings=mock_settings, work_dir=work_dir).generate(prompt="first topic")
+    compiler.compile_video.side_effect = None
+
+    VideoPipeline(settings=mock_settings, work_dir=work_dir).generate(prompt="second topic")
+
+    assert gemini.generate_script.call_count == 2
+
+def test_pipeline_segment_cache_renders_parallel_segments(mock_settings, mock_adapters, tmp_path):
+    """
+    GIVEN a segment cache directory
+    WHEN a zoomed MP4 is generated
+    THEN the compiler gets a cache in that directory and renders per-image segments it can reuse
+    """
+    _, _, compiler = mock_adapters
+    pipeline = VideoPipeline(settings=mock_settings, segment_cache_dir=tmp_path / "cache")
+
+    pipeline.generate(prompt="test topic")
+
+    from eleven_video.orchestrator.video_pipeline import FFmpegVideoCompiler
+    assert FFmpegVideoCompiler.call_args.kwargs["segment_cache"].cache_dir == tmp_path / "cache"
+    assert compiler.compile_video.call_args.kwargs["backend"] == "parallel"
+
+def test_pipeline_without_segment_cache_has_none(pipeline, mock_adapters):
+    pipeline.generate(prompt="test topic")
+
+    from eleven_video.orchestrator.video_pipeline import FFmpegVideoCompiler
+    assert FFmpegVideoCompiler.call_args.kwargs["segment_cache"] is None
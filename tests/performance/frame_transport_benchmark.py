@@ -0,0 +1,136 @@
+"""
+Frame transport microbenchmark: FrameRing slots vs a multiprocessing.Queue.
+
+Measures only the hand-off of frames from producer processes to the
+consumer that feeds the encoder, so the numbers show what each transport
+costs per frame. Producers fill each frame with a constant (a memset, far
+cheaper than rendering) and the consumer writes every frame, in timeline
+order, to the null device the way PipeRenderer writes to ffmpeg's stdin.
+
+- ``queue``: producers put each frame on a ``multiprocessing.Queue``; it is
+  pickled, copied through a pipe and unpickled in the consumer.
+- ``ring``: producers render into a FrameRing slot and send back only the
+  slot index; the consumer writes the slot's shared memory directly.
+
+Both transports keep the same number of frames in flight.
+
+Usage:
+    python -m tests.performance.frame_transport_benchmark
+    python -m tests.performance.frame_transport_benchmark --resolution 1280x720 --frames 600 --producers 4
+
+Related files:
+- eleven_video/processing/frame_ring.py: FrameRing (what is measured)
+- eleven_video/processing/frame_sink.py: PipeRenderer(processes=True)
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from eleven_video.processing.frame_ring import FrameRing
+
+TRANSPORTS = ("queue", "ring")
+DEFAULT_RESOLUTION = (1920, 1080)
+DEFAULT_FRAMES = 240
+DEFAULT_IN_FLIGHT = 8
+
+
+def _queue_producer(shape: Tuple[int, ...], tasks, results) -> None:
+    for index in iter(tasks.get, None):
+        frame = np.empty(shape, dtype=np.uint8)
+        frame.fill(index % 256)
+        results.put((index, frame))
+
+
+def _ring_producer(ring: FrameRing, tasks, results) -> None:
+    for index, slot in iter(tasks.get, None):
+        ring.frames(slot)[0].fill(index % 256)
+        results.put((index, slot))
+
+
+def run_transport(
+    transport: str,
+    resolution: Tuple[int, int] = DEFAULT_RESOLUTION,
+    frames: int = DEFAULT_FRAMES,
+    producers: int = 2,
+    in_flight: int = DEFAULT_IN_FLIGHT,
+) -> Dict[str, float]:
+    """Move ``frames`` frames from producer processes to the consumer.
+
+    Returns:
+        frames, wall_seconds and frames_per_second. Raises AssertionError if
+        a frame arrives out of order or with the wrong contents.
+    """
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unknown transport '{transport}'. Options: {', '.join(TRANSPORTS)}")
+    w, h = resolution
+    shape = (h, w, 3)
+    tasks, results = multiprocessing.Queue(), multiprocessing.Queue()
+    ring = FrameRing(in_flight, shape) if transport == "ring" else None
+    target, args = (_ring_producer, (ring, tasks, results)) if ring else (_queue_producer, (shape, tasks, results))
+    workers = [multiprocessing.Process(target=target, args=args, daemon=True) for _ in range(producers)]
+    for worker in workers:
+        worker.start()
+
+    def submit(index: int) -> None:
+        tasks.put((index, ring.acquire()) if ring else index)
+
+    start = time.perf_counter()
+    try:
+        with open(os.devnull, "wb") as sink:
+            for index in range(min(in_flight, frames)):
+                submit(index)
+            waiting = {}
+            for index in range(frames):
+                while index not in waiting:
+                    done, payload = results.get()
+                    waiting[done] = payload
+                payload = waiting.pop(index)
+                if ring:
+                    assert ring.frames(payload)[0, 0, 0, 0] == index % 256
+                    with ring.view(payload) as data:
+                        sink.write(data)
+                    ring.release(payload)
+                else:
+                    assert payload[0, 0, 0] == index % 256
+                    sink.write(memoryview(payload).cast("B"))
+                if index + in_flight < frames:
+                    submit(index + in_flight)
+        elapsed = time.perf_counter() - start
+    finally:
+        for _ in workers:
+            tasks.put(None)
+        for worker in workers:
+            worker.join(timeout=10)
+        if ring:
+            ring.close()
+    return {"frames": frames, "wall_seconds": elapsed, "frames_per_second": frames / elapsed}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Frame transport microbenchmark (FrameRing vs Queue)")
+    parser.add_argument("--resolution", default="x".join(map(str, DEFAULT_RESOLUTION)), help="WIDTHxHEIGHT")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--producers", type=int, default=2)
+    parser.add_argument("--in-flight", type=int, default=DEFAULT_IN_FLIGHT)
+    args = parser.parse_args(argv)
+
+    resolution = tuple(int(v) for v in args.resolution.lower().split("x"))
+    results = {
+        transport: run_transport(transport, resolution, args.frames, args.producers, args.in_flight)
+        for transport in TRANSPORTS
+    }
+    print(f"{'transport':<12}{'frames':>8}{'wall s':>9}{'fps':>9}")
+    for transport, r in results.items():
+        print(f"{transport:<12}{r['frames']:>8}{r['wall_seconds']:>9.2f}{r['frames_per_second']:>9.1f}")
+    speedup = results["ring"]["frames_per_second"] / results["queue"]["frames_per_second"]
+    print(f"ring is {speedup:.1f}x the queue's frames/sec")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+"""
+Render throughput benchmark: frames/sec, wall time and peak RSS of FFmpegVideoCompiler.
+
+Sweeps every Resolution, zoom on and off, and 15/75/150 images. Inputs are
+synthetic textured images and silent audio generated locally, so no API
+calls are made. Each case runs in its own interpreter so peak RSS (of the
+Python process and of its largest ffmpeg child) belongs to that case alone.
+Results are written as JSON and compared with the checked-in baseline
+(render_baseline.json): a case regresses when its frames/sec drops, or
+its peak RSS grows, by more than the tolerance.
+
+Baselines are machine-specific. Regenerate one on the machine that runs the
+comparison (CI runner or workstation) before relying on it.
+
+Usage:
+    python -m tests.performance.render_benchmark --output results.json
+    python -m tests.performance.render_benchmark --cases hd_720p-zoom-15 square-static-75
+    python -m tests.performance.render_benchmark --write-baseline
+    ELEVEN_VIDEO_BENCHMARK=1 pytest tests/performance/test_render_benchmark.py -s
+
+Related files:
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler (what is measured)
+- eleven_video/orchestrator/video_pipeline.py: backend choice mirrored by default_backend
+- tests/performance/render_baseline.json: checked-in baseline
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from PIL import Image as PILImage
+
+try:
+    import resource
+except ImportError:  # Windows: no peak RSS
+    resource = None
+
+from eleven_video.models.domain import Audio, Image, Resolution
+from eleven_video.processing.profiles import get_render_profile
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import create_silent_mp3_bytes
+
+IMAGE_COUNTS = (15, 75, 150)
+SECONDS_PER_IMAGE = 1.0
+PROFILE = "standard"
+DEFAULT_TOLERANCE = 0.25
+BASELINE_PATH = Path(__file__).with_name("render_baseline.json")
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Settings that must match for results to be comparable with a baseline
+_SETTINGS_KEYS = ("seconds_per_image", "profile", "backend")
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One point of the sweep."""
+
+    resolution: Resolution
+    enable_zoom: bool
+    image_count: int
+
+    @property
+    def name(self) -> str:
+        """Stable case id, e.g. ``hd_1080p-zoom-150``."""
+        return f"{self.resolution.name.lower()}-{'zoom' if self.enable_zoom else 'static'}-{self.image_count}"
+
+    @classmethod
+    def from_name(cls, name: str) -> "BenchmarkCase":
+        resolution, zoom, count = name.rsplit("-", 2)
+        return cls(Resolution[resolution.upper()], zoom == "zoom", int(count))
+
+
+def benchmark_cases(
+    resolutions: Sequence[Resolution] = tuple(Resolution),
+    zoom: Sequence[bool] = (True, False),
+    image_counts: Sequence[int] = IMAGE_COUNTS,
+) -> List[BenchmarkCase]:
+    """Every combination of resolution, zoom and image count."""
+    return [
+        BenchmarkCase(resolution, enable_zoom, count)
+        for resolution in resolutions
+        for enable_zoom in zoom
+        for count in image_counts
+    ]
+
+
+def default_backend(enable_zoom: bool) -> str:
+    """Backend the pipeline uses for a regular MP4 render."""
+    return "moviepy" if enable_zoom else "ffmpeg"
+
+
+def synthetic_images(count: int, size=(960, 540)) -> List[Image]:
+    """Gradient plus noise PNGs, so the encoder has realistic work to do."""
+    w, h = size
+    x = np.linspace(0, 255, w, dtype=np.float32)
+    y = np.linspace(0, 255, h, dtype=np.float32)[:, None]
+    base = np.stack([x + 0 * y, y + 0 * x, (x + y) / 2], axis=-1)
+    images = []
+    for i in range(count):
+        rng = np.random.default_rng(i)
+        pixels = np.clip(np.roll(base, i * 37, axis=1) + rng.normal(0, 6, base.shape), 0, 255)
+        buf = io.BytesIO()
+        PILImage.fromarray(pixels.astype(np.uint8)).save(buf, format="PNG")
+        images.append(Image(data=buf.getvalue(), mime_type="image/png"))
+    return images
+
+
+def _peak_rss_mb(who: int) -> Optional[float]:
+    if resource is None:
+        return None
+    kb = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return round(kb / (1024 * 1024) if sys.platform == "darwin" else kb / 1024, 1)
+
+
+def run_case(
+    case: BenchmarkCase,
+    seconds_per_image: float = SECONDS_PER_IMAGE,
+    profile: str = PROFILE,
+    backend: Optional[str] = None,
+) -> Dict:
+    """Render one case in this process and measure it.
+
+    Peak RSS covers the whole process, so call this in a fresh interpreter
+    (see run_case_isolated) for per-case numbers.
+    """
+    backend = backend or default_backend(case.enable_zoom)
+    duration = case.image_count * seconds_per_image
+    images = synthetic_images(case.image_count)
+    audio = Audio(data=create_silent_mp3_bytes(duration), duration_seconds=duration)
+    compiler = FFmpegVideoCompiler(profile=profile)
+    updates: List[str] = []
+
+    with tempfile.TemporaryDirectory(prefix="eleven_video_bench_") as out_dir:
+        start = time.perf_counter()
+        video = compiler.compile_video(
+            images, audio, Path(out_dir) / "bench.mp4", progress_callback=updates.append,
+            enable_zoom=case.enable_zoom, resolution=case.resolution, backend=backend
+        )
+        wall = time.perf_counter() - start
+
+    frames = round(duration * get_render_profile(profile).fps)
+    return {
+        "resolution": list(video.resolution),
+        "enable_zoom": case.enable_zoom,
+        "image_count": case.image_count,
+        "frames": frames,
+        "wall_seconds": round(wall, 3),
+        "frames_per_second": round(frames / wall, 2),
+        "peak_rss_mb": _peak_rss_mb(resource.RUSAGE_SELF) if resource else None,
+        "peak_child_rss_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None,
+        "fell_back": any("Warning" in u for u in updates),
+    }
+
+
+def run_case_isolated(
+    case: BenchmarkCase,
+    seconds_per_image: float = SECONDS_PER_IMAGE,
+    profile: str = PROFILE,
+    backend: Optional[str] = None,
+) -> Dict:
+    """Run one case in a fresh interpreter and return its measurements."""
+    cmd = [
+        sys.executable, "-m", "tests.performance.render_benchmark", "--run-case", case.name,
+        "--seconds-per-image", str(seconds_per_image), "--profile", profile,
+    ]
+    if backend:
+        cmd += ["--backend", backend]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env, cwd=REPO_ROOT)
+    if result.returncode != 0:
+        raise RuntimeError(f"Benchmark case {case.name} failed: {result.stderr.strip()[-500:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_sweep(
+    cases: Sequence[BenchmarkCase],
+    seconds_per_image: float = SECONDS_PER_IMAGE,
+    profile: str = PROFILE,
+    backend: Optional[str] = None,
+    on_result=None,
+) -> Dict:
+    """Run every case in isolation and collect the results with the machine and settings."""
+    results = {}
+    for case in cases:
+        results[case.name] = run_case_isolated(case, seconds_per_image, profile, backend)
+        if on_result:
+            on_result(case.name, results[case.name])
+    return {
+        "settings": {"seconds_per_image": seconds_per_image, "profile": profile, "backend": backend or "default"},
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+    """Regressions of ``current`` against ``baseline``.
+
+    A case regresses when frames/sec falls below ``baseline * (1 - tolerance)``
+    or peak RSS rises above ``baseline * (1 + tolerance)``. Cases missing
+    from either side are not compared.
+
+    Returns:
+        One message per regression (empty when everything is within tolerance).
+
+    Raises:
+        ValueError: If the two runs used different benchmark settings.
+    """
+    for key in _SETTINGS_KEYS:
+        if current["settings"].get(key) != baseline["settings"].get(key):
+            raise ValueError(
+                f"Benchmark setting '{key}' differs from the baseline "
+                f"({current['settings'].get(key)!r} vs {baseline['settings'].get(key)!r})"
+            )
+
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        floor = base["frames_per_second"] * (1 - tolerance)
+        if result["frames_per_second"] < floor:
+            regressions.append(
+                f"{name}: {result['frames_per_second']:.1f} frames/s, baseline "
+                f"{base['frames_per_second']:.1f} (floor {floor:.1f})"
+            )
+        for key in ("peak_rss_mb", "peak_child_rss_mb"):
+            if result.get(key) is None or base.get(key) is None:
+                continue
+            ceiling = base[key] * (1 + tolerance)
+            if result[key] > ceiling:
+                regressions.append(
+                    f"{name}: {key} {result[key]:.0f} MB, baseline {base[key]:.0f} MB (ceiling {ceiling:.0f})"
+                )
+    return regressions
+
+
+def format_table(sweep: Dict) -> str:
+    """Human-readable table of a sweep's results."""
+    lines = [f"{'case':<26}{'frames':>8}{'wall s':>9}{'fps':>8}{'rss MB':>9}{'ffmpeg MB':>11}"]
+    for name, r in sweep["results"].items():
+        lines.append(
+            f"{name:<26}{r['frames']:>8}{r['wall_seconds']:>9.1f}{r['frames_per_second']:>8.1f}"
+            f"{r['peak_rss_mb'] or 0:>9.0f}{r['peak_child_rss_mb'] or 0:>11.0f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Render throughput benchmark for FFmpegVideoCompiler")
+    parser.add_argument("--cases", nargs="*", help="Case names to run (default: the full sweep)")
+    parser.add_argument("--seconds-per-image", type=float, default=SECONDS_PER_IMAGE)
+    parser.add_argument("--profile", default=PROFILE)
+    parser.add_argument("--backend", help="Force one backend (default: moviepy with zoom, ffmpeg without)")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--write-baseline", action="store_true", help="Overwrite the baseline with this run")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_case:
+        # Child mode: one case, JSON on the last stdout line
+        case = BenchmarkCase.from_name(args.run_case)
+        print(json.dumps(run_case(case, args.seconds_per_image, args.profile, args.backend)))
+        return 0
+
+    cases = [BenchmarkCase.from_name(n) for n in args.cases] if args.cases else benchmark_cases()
+    sweep = run_sweep(
+        cases, args.seconds_per_image, args.profile, args.backend,
+        on_result=lambda name, r: print(f"{name}: {r['frames_per_second']:.1f} frames/s", file=sys.stderr)
+    )
+    print(format_table(sweep))
+
+    if args.output:
+        args.output.write_text(json.dumps(sweep, indent=2) + "\n", encoding="utf-8")
+    if args.write_baseline:
+        args.baseline.write_text(json.dumps(sweep, indent=2) + "\n", encoding="utf-8")
+        return 0
+    if args.baseline.exists():
+        regressions = compare(sweep, json.loads(args.baseline.read_text(encoding="utf-8")), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+Frame transport microbenchmark: both transports deliver every frame, and the opt-in comparison.
+
+The 1080p comparison only runs with ELEVEN_VIDEO_BENCHMARK=1:
+
+    ELEVEN_VIDEO_BENCHMARK=1 pytest tests/performance/test_frame_transport_benchmark.py -s
+
+Related files:
+- tests/performance/frame_transport_benchmark.py: benchmark harness (also runnable as a module)
+- eleven_video/processing/frame_ring.py: FrameRing
+"""
+import os
+
+import pytest
+
+from tests.performance.frame_transport_benchmark import TRANSPORTS, run_transport
+
+
+class TestFrameTransportBenchmark:
+    """Benchmark harness."""
+
+    @pytest.mark.parametrize("transport", TRANSPORTS)
+    def test_transport_delivers_every_frame_in_order(self, transport):
+        """
+        GIVEN two producer processes and more frames than fit in flight
+        WHEN frames are moved through the transport
+        THEN every frame arrives in order with its contents (checked by the harness).
+        """
+        result = run_transport(transport, resolution=(64, 36), frames=40, producers=2, in_flight=4)
+
+        assert result["frames"] == 40
+        assert result["frames_per_second"] > 0
+
+    def test_unknown_transport_rejected(self):
+        with pytest.raises(ValueError, match="Unknown transport"):
+            run_transport("pipe")
+
+    @pytest.mark.skipif(not os.environ.get("ELEVEN_VIDEO_BENCHMARK"), reason="set ELEVEN_VIDEO_BENCHMARK=1 to run")
+    def test_ring_outpaces_queue_at_1080p(self):
+        queue = run_transport("queue")
+        ring = run_transport("ring")
+        print(f"\nqueue: {queue['frames_per_second']:.1f} fps, ring: {ring['frames_per_second']:.1f} fps")
+
+        assert ring["frames_per_second"] > queue["frames_per_second"]
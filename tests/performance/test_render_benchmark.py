@@ -0,0 +1,143 @@
+"""
+Render throughput benchmark: sweep definition, baseline comparison and the opt-in run.
+
+The full sweep (every Resolution x zoom on/off x 15/75/150 images) takes
+over an hour on a small machine, so it only runs with ELEVEN_VIDEO_BENCHMARK=1:
+
+    ELEVEN_VIDEO_BENCHMARK=1 pytest tests/performance/test_render_benchmark.py -s
+
+Set ELEVEN_VIDEO_BENCHMARK_OUTPUT to keep the results JSON.
+
+Related files:
+- tests/performance/render_benchmark.py: benchmark harness (also runnable as a module)
+- tests/performance/render_baseline.json: checked-in baseline
+"""
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from eleven_video.models.domain import Resolution
+from tests.performance.render_benchmark import (
+    BASELINE_PATH,
+    BenchmarkCase,
+    benchmark_cases,
+    compare,
+    format_table,
+    run_case_isolated,
+    run_sweep,
+)
+from tests.support.factories.media_factory import ffmpeg_available
+
+
+def _sweep(results, **settings):
+    base = {"seconds_per_image": 1.0, "profile": "standard", "backend": "default"}
+    return {"settings": {**base, **settings}, "machine": {}, "results": results}
+
+
+def _result(fps, rss=200.0, child_rss=300.0):
+    return {"frames_per_second": fps, "peak_rss_mb": rss, "peak_child_rss_mb": child_rss}
+
+
+class TestSweep:
+    """Benchmark case definition."""
+
+    def test_sweep_covers_every_resolution_zoom_and_count(self):
+        """
+        GIVEN the default sweep
+        WHEN cases are listed
+        THEN every Resolution member is rendered with zoom on and off at 15, 75 and 150 images.
+        """
+        cases = benchmark_cases()
+
+        assert len(cases) == len(Resolution) * 2 * 3
+        assert {c.resolution for c in cases} == set(Resolution)
+        assert {c.image_count for c in cases} == {15, 75, 150}
+        assert {c.enable_zoom for c in cases} == {True, False}
+
+    def test_case_names_round_trip(self):
+        """Case names identify cases in results files and on the command line."""
+        case = BenchmarkCase(Resolution.PORTRAIT, False, 75)
+
+        assert case.name == "portrait-static-75"
+        assert BenchmarkCase.from_name(case.name) == case
+
+    def test_baseline_covers_the_sweep(self):
+        """The checked-in baseline has a result for every case in the sweep."""
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+
+        assert set(baseline["results"]) == {c.name for c in benchmark_cases()}
+        assert not any(r["fell_back"] for r in baseline["results"].values())
+
+
+class TestCompare:
+    """Regression detection against a baseline."""
+
+    def test_within_tolerance_passes(self):
+        """Small slowdowns and memory growth inside the tolerance are not regressions."""
+        baseline = _sweep({"a": _result(100.0)})
+        current = _sweep({"a": _result(80.0, rss=240.0)})
+
+        assert compare(current, baseline, tolerance=0.25) == []
+
+    def test_slower_render_regresses(self):
+        """
+        GIVEN a case rendering 30% fewer frames per second than the baseline
+        WHEN compared with a 25% tolerance
+        THEN it is reported as a regression.
+        """
+        regressions = compare(_sweep({"a": _result(70.0)}), _sweep({"a": _result(100.0)}), tolerance=0.25)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("a: 70.0 frames/s")
+
+    def test_memory_growth_regresses(self):
+        """A peak RSS above the tolerance is a regression, for Python and ffmpeg alike."""
+        regressions = compare(
+            _sweep({"a": _result(100.0, rss=300.0, child_rss=500.0)}),
+            _sweep({"a": _result(100.0)}),
+        )
+
+        assert [m.split()[1] for m in regressions] == ["peak_rss_mb", "peak_child_rss_mb"]
+
+    def test_new_cases_are_not_compared(self):
+        """Cases missing from the baseline are skipped."""
+        assert compare(_sweep({"new": _result(1.0)}), _sweep({})) == []
+
+    def test_different_settings_rejected(self):
+        """Results rendered with other settings cannot be compared."""
+        with pytest.raises(ValueError, match="profile"):
+            compare(_sweep({}, profile="draft"), _sweep({}))
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestBenchmarkRun:
+    """Running cases for real."""
+
+    def test_isolated_case_reports_measurements(self):
+        """One small case runs in its own interpreter and reports every metric."""
+        result = run_case_isolated(BenchmarkCase(Resolution.HD_720P, False, 15), seconds_per_image=0.2)
+
+        assert result["frames"] == 72
+        assert result["wall_seconds"] > 0
+        assert result["frames_per_second"] > 0
+        assert result["fell_back"] is False
+        assert "hd_720p-static-15" in format_table({"results": {"hd_720p-static-15": result}})
+
+    @pytest.mark.skipif(not os.environ.get("ELEVEN_VIDEO_BENCHMARK"), reason="set ELEVEN_VIDEO_BENCHMARK=1 to run")
+    def test_full_sweep_against_baseline(self, tmp_path):
+        """
+        GIVEN the full sweep
+        WHEN it is rendered on this machine
+        THEN no case regresses beyond the tolerance of the checked-in baseline.
+        """
+        sweep = run_sweep(benchmark_cases())
+        output = Path(os.environ.get("ELEVEN_VIDEO_BENCHMARK_OUTPUT") or tmp_path / "render_benchmark.json")
+        output.write_text(json.dumps(sweep, indent=2) + "\n", encoding="utf-8")
+        print("\n" + format_table(sweep))
+
+        regressions = compare(sweep, json.loads(BASELINE_PATH.read_text(encoding="utf-8")))
+
+        assert not regressions, "\n".join(regressions)
@@ -0,0 +1,79 @@
+"""
+Render profile benchmark: encode time and output size per profile.
+
+Renders the same short Ken Burns slideshow with every built-in profile on
+the ffmpeg backend and prints a table of wall-clock encode time and file
+size. Its timing assertions depend on the host, so it only runs with
+ELEVEN_VIDEO_BENCHMARK=1 (``-s`` shows the table):
+
+    ELEVEN_VIDEO_BENCHMARK=1 pytest tests/performance/test_render_profiles_benchmark.py -s
+
+Related files:
+- eleven_video/processing/profiles.py: RENDER_PROFILES
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(profile=...)
+"""
+import io
+import os
+import time
+
+import numpy as np
+import pytest
+from PIL import Image as PILImage
+
+from eleven_video.models.domain import Audio, Image, Resolution
+from eleven_video.processing.profiles import RENDER_PROFILES
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import create_silent_mp3_bytes, ffmpeg_available
+
+IMAGE_COUNT = 4
+DURATION_SECONDS = 4.0
+
+
+def _textured_png(seed: int, size=(960, 540)) -> bytes:
+    """Gradient plus noise so encoder settings visibly change the output size."""
+    rng = np.random.default_rng(seed)
+    w, h = size
+    x = np.linspace(0, 255, w, dtype=np.float32)
+    y = np.linspace(0, 255, h, dtype=np.float32)[:, None]
+    base = np.stack([x + 0 * y, y + 0 * x, (x + y) / 2], axis=-1)
+    noisy = np.clip(base + rng.normal(0, 6, base.shape), 0, 255).astype(np.uint8)
+    buf = io.BytesIO()
+    PILImage.fromarray(noisy).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestRenderProfileBenchmark:
+    """Encode time and output size for each render profile."""
+
+    @pytest.mark.skipif(not os.environ.get("ELEVEN_VIDEO_BENCHMARK"), reason="set ELEVEN_VIDEO_BENCHMARK=1 to run")
+    def test_profile_encode_time_and_size(self, tmp_path):
+        """
+        GIVEN the same images and audio
+        WHEN rendered with each profile
+        THEN draft is the fastest to encode and archival the largest file.
+        """
+        images = [Image(data=_textured_png(i), mime_type="image/png") for i in range(IMAGE_COUNT)]
+        audio = Audio(data=create_silent_mp3_bytes(DURATION_SECONDS), duration_seconds=DURATION_SECONDS)
+
+        results = {}
+        for name in RENDER_PROFILES:
+            compiler = FFmpegVideoCompiler(profile=name)
+            updates = []
+            start = time.perf_counter()
+            video = compiler.compile_video(
+                images, audio, tmp_path / f"{name}.mp4",
+                progress_callback=updates.append, resolution=Resolution.HD_720P, backend="ffmpeg"
+            )
+            elapsed = time.perf_counter() - start
+            assert not any("Warning" in u for u in updates), updates
+            results[name] = (elapsed, video.file_size_bytes)
+
+        print(f"\nRender profiles ({IMAGE_COUNT} images, {DURATION_SECONDS:.0f}s, 720p, ffmpeg backend)")
+        print(f"{'profile':<10}{'encode s':>10}{'size KiB':>10}{'x realtime':>12}")
+        for name, (elapsed, size) in results.items():
+            print(f"{name:<10}{elapsed:>10.2f}{size / 1024:>10.0f}{DURATION_SECONDS / elapsed:>12.1f}")
+
+        assert results["draft"][0] < results["archival"][0]
+        assert results["draft"][1] < results["archival"][1]
@@ -0,0 +1,85 @@
+"""
+Streaming compositor memory test: a 60-minute timeline in a fixed RSS budget.
+
+Renders a synthetic 60-minute video (360 ten-second segments) through
+StreamingCompositor in a subprocess. Every segment holds 16 MB of pixels,
+so keeping them all alive would need almost 6 GB; the streaming ceiling is
+two segments. Peak RSS is compared with an import-only subprocess so the
+budget does not depend on the interpreter or library footprint.
+
+Related files:
+- eleven_video/processing/compositor.py: StreamingCompositor (documented memory ceiling)
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.support.factories.media_factory import ffmpeg_available
+
+resource = pytest.importorskip("resource")
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SEGMENT_COUNT = 360
+SEGMENT_SECONDS = 10.0
+SEGMENT_MB = 16
+RSS_BUDGET_MB = 5 * SEGMENT_MB + 64
+
+_PRELUDE = """
+import resource, sys
+import numpy as np
+from eleven_video.processing.compositor import StreamingCompositor
+"""
+
+_RENDER = """
+class Segment:
+    def __init__(self, index):
+        self.pixels = np.full((2048, 2048, 4), index % 255, dtype=np.uint8)
+    def get_frame(self, t):
+        return np.ascontiguousarray(self.pixels[:90, :160, :3])
+    def close(self):
+        self.pixels = None
+
+compositor = StreamingCompositor(Segment, [{seconds}] * {count}, (160, 90))
+compositor.to_clip().write_videofile(
+    sys.argv[1], fps=1, codec="libx264", preset="ultrafast", audio=False, logger=None
+)
+compositor.close()
+"""
+
+_REPORT = """
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def _peak_rss_mb(script: str, *args: str) -> float:
+    """Run ``script`` in a fresh interpreter and return its peak RSS in MB."""
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    result = subprocess.run(
+        [sys.executable, "-c", script, *args], capture_output=True, text=True, env=env, timeout=600
+    )
+    assert result.returncode == 0, result.stderr
+    kb = int(result.stdout.strip().splitlines()[-1])
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return kb / (1024 * 1024) if sys.platform == "darwin" else kb / 1024
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+def test_sixty_minute_render_within_rss_budget(tmp_path):
+    """
+    GIVEN a 60-minute timeline of 360 segments holding 16 MB each
+    WHEN it is rendered through StreamingCompositor
+    THEN peak RSS stays within a fixed budget above the import-only baseline.
+    """
+    output = tmp_path / "long.mp4"
+    baseline = _peak_rss_mb(_PRELUDE + _REPORT)
+    render = _RENDER.format(seconds=SEGMENT_SECONDS, count=SEGMENT_COUNT)
+
+    peak = _peak_rss_mb(_PRELUDE + render + _REPORT, str(output))
+
+    assert output.stat().st_size > 0
+    print(f"\nbaseline {baseline:.0f} MB, 60-minute render peak {peak:.0f} MB")
+    assert peak - baseline < RSS_BUDGET_MB
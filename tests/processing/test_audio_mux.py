@@ -0,0 +1,137 @@
+"""
+Tests for narration audio muxing outside the render loop.
+
+Related files:
+- eleven_video/processing/audio_mux.py: AudioTranscode, mux_audio
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(audio_mode=...)
+"""
+import subprocess
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eleven_video.exceptions.custom_errors import ValidationError, VideoProcessingError
+from eleven_video.models.domain import Audio, Image
+from eleven_video.processing.audio_mux import AudioTranscode
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+)
+
+
+def _audio_codec_of(path) -> str:
+    """Codec name of the first audio stream, from ffmpeg's input summary."""
+    from eleven_video.processing.ffmpeg_backend import get_ffmpeg_binary
+    stderr = subprocess.run(
+        [get_ffmpeg_binary(), "-hide_banner", "-i", str(path)], capture_output=True, text=True
+    ).stderr
+    line = next(line for line in stderr.splitlines() if "Audio:" in line)
+    return line.split("Audio:")[1].split()[0].rstrip(",")
+
+
+class TestAudioModeSelection:
+    """How each audio mode reaches the renderers."""
+
+    def test_unknown_mode_rejected(self):
+        """An unknown audio mode fails fast."""
+        with pytest.raises(ValidationError, match="aac, copy, transcode"):
+            FFmpegVideoCompiler(audio_mode="flac")
+
+    def test_default_encodes_aac_in_render(self, tmp_path):
+        """The default mode keeps AAC encoding inside the ffmpeg render."""
+        with patch("eleven_video.processing.video_handler.FilterGraphRenderer") as mock_renderer:
+            FFmpegVideoCompiler().compile_video(
+                [create_image()], create_audio(duration_seconds=1.0), tmp_path / "out.mp4", backend="ffmpeg"
+            )
+
+        assert mock_renderer.call_args.kwargs["audio_codec"] == "aac"
+
+    def test_copy_mode_stream_copies_mp3(self, tmp_path):
+        """
+        GIVEN audio_mode="copy"
+        WHEN rendering on the ffmpeg backend
+        THEN the renderer muxes the audio with -c:a copy straight into the output.
+        """
+        output = tmp_path / "out.mp4"
+        with patch("eleven_video.processing.video_handler.FilterGraphRenderer") as mock_renderer:
+            FFmpegVideoCompiler(audio_mode="copy").compile_video(
+                [create_image()], create_audio(duration_seconds=1.0), output, backend="ffmpeg"
+            )
+
+        assert mock_renderer.call_args.kwargs["audio_codec"] == "copy"
+        assert mock_renderer.return_value.render.call_args.args[3] == output
+
+    def test_transcode_mode_overlaps_render_and_remuxes(self, tmp_path):
+        """
+        GIVEN audio_mode="transcode"
+        WHEN rendering
+        THEN the transcode starts before the render and the final file is a remux of both.
+        """
+        output = tmp_path / "out.mp4"
+        events = []
+        compiler = FFmpegVideoCompiler(audio_mode="transcode")
+        compiler._render_with_filter_graph = MagicMock(side_effect=lambda *a, **k: events.append("render"))
+
+        with patch("eleven_video.processing.video_handler.AudioTranscode") as mock_transcode, \
+             patch("eleven_video.processing.video_handler.mux_audio") as mock_mux:
+            mock_transcode.side_effect = lambda *a: events.append("transcode") or MagicMock()
+            compiler.compile_video([create_image()], create_audio(duration_seconds=1.0), output, backend="ffmpeg")
+
+        assert events == ["transcode", "render"]
+        render_path = compiler._render_with_filter_graph.call_args.args[3]
+        assert render_path != output
+        video_in, _, final = mock_mux.call_args.args
+        assert (video_in, final) == (render_path, output)
+
+    def test_moviepy_copy_mode_writes_video_only(self, tmp_path):
+        """The moviepy path skips audio in the frame loop and muxes the MP3 afterwards."""
+        compiler = FFmpegVideoCompiler(audio_mode="copy")
+        compiler._create_image_clips = MagicMock(return_value=[MagicMock()])
+        final_clip = MagicMock()
+
+        with patch("eleven_video.processing.video_handler.concatenate_videoclips", return_value=final_clip), \
+             patch("eleven_video.processing.video_handler.AudioFileClip") as mock_audio_clip, \
+             patch("eleven_video.processing.video_handler.mux_audio") as mock_mux:
+            compiler.compile_video([create_image()], create_audio(), tmp_path / "out.mp4")
+
+        assert final_clip.write_videofile.call_args.kwargs["audio"] is False
+        mock_audio_clip.assert_not_called()
+        assert mock_mux.call_args.args[2] == tmp_path / "out.mp4"
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestAudioMuxReal:
+    """Real renders through the ffmpeg binary."""
+
+    @pytest.mark.parametrize("mode,codec", [("aac", "aac"), ("copy", "mp3"), ("transcode", "aac")])
+    def test_output_audio_codec(self, tmp_path, mode, codec):
+        """
+        GIVEN each audio mode
+        WHEN a short video is compiled on the ffmpeg backend
+        THEN the output carries the expected audio stream and no fallback occurs.
+        """
+        images = [Image(data=create_png_bytes((64, 36), (255, 0, 0)), mime_type="image/png")]
+        audio = Audio(data=create_silent_mp3_bytes(1.0), duration_seconds=1.0)
+        output = tmp_path / "out.mp4"
+        updates = []
+
+        FFmpegVideoCompiler(profile="draft", audio_mode=mode).compile_video(
+            images, audio, output, progress_callback=updates.append, backend="ffmpeg"
+        )
+
+        assert not any("Warning" in u for u in updates), updates
+        assert _audio_codec_of(output) == codec
+
+    def test_failed_transcode_raises(self, tmp_path):
+        """A transcode of invalid input reports the ffmpeg error."""
+        source = tmp_path / "bad.mp3"
+        source.write_bytes(b"not audio")
+
+        with AudioTranscode(str(source), tmp_path / "out.m4a") as transcode:
+            with pytest.raises(VideoProcessingError, match="Audio transcode failed"):
+                transcode.wait()
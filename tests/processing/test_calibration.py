@@ -0,0 +1,192 @@
+"""
+Tests for the self-calibrating render planner.
+
+Related files:
+- eleven_video/processing/calibration.py: Calibration, calibrate, probe_ffmpeg
+- eleven_video/processing/video_handler.py: compile_video(backend="auto")
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eleven_video.processing.calibration import (
+    BackendTiming,
+    Calibration,
+    _fit,
+    calibrate,
+    probe_ffmpeg,
+    worker_layouts,
+)
+from eleven_video.processing.cpu_governor import CpuGovernor
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import create_audio, create_image
+
+ENCODERS_LISTING = """Encoders:
+ V..... = Video
+ ------
+ V....D libx264              libx264 H.264 / AVC / MPEG-4 AVC (codec h264)
+ V....D h264_nvenc           NVIDIA NVENC H.264 encoder (codec h264)
+ A....D aac                  AAC (Advanced Audio Coding)
+"""
+
+
+def _calibration(timings, cores=4, ffmpeg_version="7.0.2"):
+    return Calibration(
+        profile="standard", ffmpeg_version=ffmpeg_version, encoders=["libx264"], cores=cores,
+        resample_megapixels_per_second=50.0, encode_megapixels_per_second=20.0, timings=timings,
+    )
+
+
+# ffmpeg: cheap per pixel but costly per image; parallel: cheap per image
+TIMINGS = [
+    BackendTiming("moviepy", 1, 0.2, 0.1),
+    BackendTiming("ffmpeg", 1, 0.05, 2.0),
+    BackendTiming("parallel", 2, 0.08, 0.2),
+    BackendTiming("parallel", 4, 0.06, 0.5),
+]
+
+
+class TestProbe:
+    """ffmpeg version and encoder discovery."""
+
+    def test_reads_version_and_video_encoders(self):
+        outputs = [
+            MagicMock(stdout="ffmpeg version 7.0.2-static https://johnvansickle.com\n"),
+            MagicMock(stdout=ENCODERS_LISTING),
+        ]
+        with patch("eleven_video.processing.calibration.get_ffmpeg_binary", return_value="ffmpeg"), \
+             patch("eleven_video.processing.calibration.subprocess.run", side_effect=outputs):
+            version, encoders = probe_ffmpeg()
+
+        assert version == "7.0.2-static"
+        assert encoders == ["libx264", "h264_nvenc"]
+        assert _calibration([], ffmpeg_version=version).h264_encoders == ["libx264"]
+
+
+class TestPlan:
+    """Backend and layout chosen from the timings."""
+
+    def test_fit_separates_pixel_and_image_costs(self):
+        """
+        GIVEN two runs of the same length, 2 x 3s and 6 x 1s, where the second took 2s longer
+        WHEN the cost model is fitted
+        THEN each extra image costs 0.5s and the rest is spread over the frame pixels.
+        """
+        timing = _fit("pipe", 1, [4.0, 6.0], [(2, 3.0), (6, 1.0)], (1000, 1000), 10)
+
+        assert timing.seconds_per_image == pytest.approx(0.5)
+        assert timing.seconds_per_megapixel == pytest.approx(3.0 / 60)
+
+    def test_image_count_changes_the_plan(self):
+        """Few long segments favour the filter graph; many short ones the parallel encoders."""
+        calibration = _calibration(TIMINGS)
+
+        few = calibration.plan((1920, 1080), image_count=2, frame_count=2400)
+        many = calibration.plan((1920, 1080), image_count=200, frame_count=2400)
+
+        assert few.backend == "ffmpeg"
+        assert (many.backend, many.workers, many.threads) == ("parallel", 4, 1)
+
+    def test_layouts_wider_than_the_cores_are_skipped(self):
+        plan = _calibration(TIMINGS).plan((1920, 1080), image_count=200, frame_count=2400, cores=2)
+
+        assert (plan.backend, plan.workers, plan.threads) == ("parallel", 2, 1)
+
+    def test_worker_layouts(self):
+        assert worker_layouts(1) == [1]
+        assert worker_layouts(8) == [1, 4, 8]
+
+
+class TestCache:
+    """Saving and loading the calibration."""
+
+    def test_round_trip(self, tmp_path):
+        calibration = _calibration(TIMINGS)
+        path = calibration.save(tmp_path / "calibration.json")
+
+        with patch("eleven_video.processing.calibration.os.cpu_count", return_value=4), \
+             patch("eleven_video.processing.calibration.probe_ffmpeg", return_value=("7.0.2", [])):
+            loaded = Calibration.load(path=path)
+
+        assert loaded == calibration
+
+    @pytest.mark.parametrize("cores,ffmpeg_version", [(8, "7.0.2"), (4, "7.1")])
+    def test_stale_cache_ignored(self, tmp_path, cores, ffmpeg_version):
+        """A calibration from another core count or ffmpeg build no longer describes the machine."""
+        path = _calibration(TIMINGS).save(tmp_path / "calibration.json")
+
+        with patch("eleven_video.processing.calibration.os.cpu_count", return_value=cores), \
+             patch("eleven_video.processing.calibration.probe_ffmpeg", return_value=(ffmpeg_version, [])):
+            assert Calibration.load(path=path) is None
+
+    def test_missing_or_corrupt_cache(self, tmp_path):
+        (tmp_path / "bad.json").write_text("{not json")
+
+        assert Calibration.load(path=tmp_path / "missing.json") is None
+        assert Calibration.load(path=tmp_path / "bad.json") is None
+
+
+class TestCalibrate:
+    """Measurement loop (renders mocked)."""
+
+    def test_times_every_backend_and_skips_failures(self):
+        """
+        GIVEN a machine where the pipe backend fails
+        WHEN calibrating on four cores
+        THEN every parallel layout is timed and the pipe backend is left out.
+        """
+        def fake_render(compiler, images, audio, output_path, resolution, backend):
+            if backend == "pipe":
+                return None
+            return 1.0 + len(images) * 0.1 * (compiler.segment_workers or 1)
+
+        with patch("eleven_video.processing.calibration.probe_ffmpeg", return_value=("7.0.2", ["libx264"])), \
+             patch("eleven_video.processing.calibration.os.cpu_count", return_value=4), \
+             patch("eleven_video.processing.calibration.measure_resample", return_value=50.0), \
+             patch("eleven_video.processing.calibration.measure_encode", return_value=20.0), \
+             patch("eleven_video.processing.calibration.silent_audio", return_value=create_audio()), \
+             patch("eleven_video.processing.calibration.synthetic_image", return_value=create_image()), \
+             patch("eleven_video.processing.calibration._time_render", side_effect=fake_render):
+            calibration = calibrate("draft")
+
+        assert [(t.backend, t.workers) for t in calibration.timings] == [
+            ("moviepy", 1), ("ffmpeg", 1), ("parallel", 1), ("parallel", 2), ("parallel", 4)
+        ]
+        assert (calibration.profile, calibration.cores) == ("draft", 4)
+
+
+class TestAutoBackend:
+    """compile_video(backend="auto")."""
+
+    def test_calibrated_plan_picks_backend_and_workers(self, tmp_path):
+        """The planned parallel layout sizes the segment pool."""
+        compiler = FFmpegVideoCompiler(
+            calibration=_calibration(TIMINGS), cpu_governor=CpuGovernor(budget=4, root=tmp_path)
+        )
+        updates = []
+
+        with patch("eleven_video.processing.video_handler.ParallelSegmentRenderer") as mock_renderer:
+            compiler.compile_video(
+                [create_image() for _ in range(40)], create_audio(duration_seconds=40.0),
+                tmp_path / "out.mp4", progress_callback=updates.append, backend="auto"
+            )
+
+        assert mock_renderer.call_args.kwargs["max_workers"] == 4
+        assert any(u.startswith("Render plan: parallel backend, 4 workers x 1 threads") for u in updates)
+
+    def test_without_calibration_uses_moviepy(self, tmp_path):
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_moviepy = MagicMock()
+
+        compiler.compile_video([create_image()], create_audio(), tmp_path / "out.mp4", backend="auto")
+
+        compiler._render_with_moviepy.assert_called_once()
+
+    def test_zoom_off_uses_static_slideshow(self, tmp_path):
+        compiler = FFmpegVideoCompiler(calibration=_calibration(TIMINGS))
+        compiler._render_static_slideshow = MagicMock()
+
+        compiler.compile_video(
+            [create_image()], create_audio(), tmp_path / "out.mp4", enable_zoom=False, backend="auto"
+        )
+
+        compiler._render_static_slideshow.assert_called_once()
@@ -0,0 +1,294 @@
+"""
+Tests for resumable compiles (named work directory plus state file).
+
+Related files:
+- eleven_video/processing/compile_journal.py: CompileJournal, job_key
+- eleven_video/processing/segments.py: ParallelSegmentRenderer(journal=...)
+- eleven_video/processing/video_handler.py: compile_video(work_dir=...)
+"""
+import json
+from pathlib import Path
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eleven_video.exceptions.custom_errors import ValidationError, VideoProcessingError
+from eleven_video.models.domain import Audio, Image
+from eleven_video.processing.compile_journal import STATE_FILE, CompileJournal, job_key
+from eleven_video.processing.ffmpeg_backend import FilterGraphRenderer
+from eleven_video.processing.segments import ParallelSegmentRenderer
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+)
+
+
+def _fake_render_segment(job):
+    with open(job.output_path, "wb") as f:
+        f.write(b"x" * 100)
+    return job.output_path
+
+
+class TestCompileJournal:
+    """State file bookkeeping."""
+
+    def test_completed_files_survive_a_restart(self, tmp_path):
+        """
+        GIVEN a journal that recorded one finished segment
+        WHEN the same job opens the directory again
+        THEN that segment is complete and nothing else is.
+        """
+        work_dir = tmp_path / "job"
+        journal = CompileJournal(work_dir)
+        assert journal.begin("job-1") == 0
+        (work_dir / "segments").mkdir()
+        (work_dir / "segments" / "segment_0000.mp4").write_bytes(b"x")
+        (work_dir / "segments" / "segment_0001.mp4").write_bytes(b"partial")
+        journal.mark_complete(work_dir / "segments" / "segment_0000.mp4")
+
+        resumed = CompileJournal(work_dir)
+
+        assert resumed.begin("job-1") == 1
+        assert resumed.is_complete(work_dir / "segments" / "segment_0000.mp4")
+        assert not resumed.is_complete(work_dir / "segments" / "segment_0001.mp4")
+        state = json.loads((work_dir / STATE_FILE).read_text())
+        assert state["completed"] == ["segments/segment_0000.mp4"]
+
+    def test_deleted_file_is_not_complete(self, tmp_path):
+        """A recorded file that has since disappeared is encoded again."""
+        journal = CompileJournal(tmp_path / "job")
+        journal.begin("job-1")
+        path = tmp_path / "job" / "a.mp4"
+        path.write_bytes(b"x")
+        journal.mark_complete(path)
+        path.unlink()
+
+        assert not journal.is_complete(path)
+
+    def test_different_signature_is_not_complete(self, tmp_path):
+        """A file written for other content (frames, filter chain) is encoded again."""
+        journal = CompileJournal(tmp_path / "job")
+        journal.begin("job-1")
+        path = tmp_path / "job" / "segment_0000.mp4"
+        path.write_bytes(b"x")
+        journal.mark_complete(path, "48:abc")
+
+        resumed = CompileJournal(tmp_path / "job")
+        resumed.begin("job-1")
+
+        assert resumed.is_complete(path, "48:abc")
+        assert not resumed.is_complete(path, "42:def")
+
+    def test_other_job_clears_directory(self, tmp_path):
+        """Intermediates of a different job are discarded rather than reused."""
+        work_dir = tmp_path / "job"
+        journal = CompileJournal(work_dir)
+        journal.begin("job-1")
+        (work_dir / "a.mp4").write_bytes(b"x")
+        journal.mark_complete(work_dir / "a.mp4")
+
+        assert CompileJournal(work_dir).begin("job-2") == 0
+        assert sorted(p.name for p in work_dir.iterdir()) == [STATE_FILE]
+
+    def test_unrelated_directory_rejected(self, tmp_path):
+        """A non-empty directory without compile state is never cleared."""
+        (tmp_path / "notes.txt").write_text("keep me")
+
+        with pytest.raises(ValidationError, match="not empty"):
+            CompileJournal(tmp_path).begin("job-1")
+        assert (tmp_path / "notes.txt").exists()
+
+    def test_finish_removes_directory(self, tmp_path):
+        journal = CompileJournal(tmp_path / "job")
+        journal.begin("job-1")
+
+        journal.finish()
+
+        assert not (tmp_path / "job").exists()
+
+    def test_job_key_covers_inputs_and_settings(self):
+        base = job_key([b"image", b"audio"], ("standard", True))
+
+        assert job_key([b"image", b"audio"], ("standard", True)) == base
+        assert job_key([b"image2", b"audio"], ("standard", True)) != base
+        assert job_key([b"image", b"audio"], ("standard", False)) != base
+
+
+class TestResumedSegments:
+    """ParallelSegmentRenderer with a journal."""
+
+    def test_rerun_encodes_only_missing_segments(self, tmp_path):
+        """
+        GIVEN a work directory where two of three segments were completed
+        WHEN the render runs again with the same journal
+        THEN only the third segment is encoded.
+        """
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"image_{i:03d}.png"
+            path.write_bytes(create_png_bytes((64, 36), (i * 80, 0, 0)))
+            paths.append(str(path))
+        work_dir = tmp_path / "job"
+        journal = CompileJournal(work_dir)
+        journal.begin("job-1")
+        segments = work_dir / "segments"
+        segments.mkdir()
+        renderer = ParallelSegmentRenderer(FilterGraphRenderer(), max_workers=1)
+        for job in renderer.build_jobs(paths, [24, 24, 24], (160, 90), segments)[:2]:
+            Path(job.output_path).write_bytes(b"x")
+            journal.mark_complete(job.output_path, job.signature)
+        encoded_jobs = []
+
+        with patch("eleven_video.processing.segments.ProcessPoolExecutor") as mock_pool, \
+             patch("eleven_video.processing.segments.concat_segments"):
+            mock_pool.return_value.__enter__.return_value.map = lambda fn, jobs: [
+                encoded_jobs.append(j.index) or _fake_render_segment(j) for j in jobs
+            ]
+            encoded = renderer.render(paths, "a.mp3", [24, 24, 24], tmp_path / "o.mp4", (160, 90),
+                                      segments, journal=journal)
+
+        assert (encoded, encoded_jobs) == (1, [2])
+        assert journal.is_complete(segments / "segment_0002.mp4")
+        assert len((segments / "segments.txt").read_text().splitlines()) == 3
+
+
+    def test_bodies_recorded_without_transitions_are_not_reused_with_them(self, tmp_path):
+        """
+        GIVEN a work directory holding full-length hard-cut segments
+        WHEN the render resumes with crossfade transitions
+        THEN the shortened bodies and the windows are all encoded, none reused.
+        """
+        paths = []
+        for i in range(2):
+            path = tmp_path / f"image_{i:03d}.png"
+            path.write_bytes(create_png_bytes((64, 36), (i * 80, 0, 0)))
+            paths.append(str(path))
+        work_dir = tmp_path / "job"
+        journal = CompileJournal(work_dir)
+        journal.begin("job-1")
+        segments = work_dir / "segments"
+        segments.mkdir()
+        for job in ParallelSegmentRenderer(FilterGraphRenderer()).build_jobs(paths, [48, 48], (160, 90), segments):
+            Path(job.output_path).write_bytes(b"x")
+            journal.mark_complete(job.output_path, job.signature)
+        renderer = ParallelSegmentRenderer(FilterGraphRenderer(), max_workers=1, transition_frames=12)
+
+        with patch("eleven_video.processing.segments.ProcessPoolExecutor") as mock_pool, \
+             patch("eleven_video.processing.segments.concat_segments"):
+            mock_pool.return_value.__enter__.return_value.map = lambda fn, jobs: [
+                _fake_render_segment(j) for j in jobs
+            ]
+            encoded = renderer.render(paths, "a.mp3", [48, 48], tmp_path / "o.mp4", (160, 90),
+                                      segments, journal=journal)
+
+        assert encoded == 3
+
+
+class TestCompilerWorkDir:
+    """compile_video(work_dir=...)."""
+
+    def test_work_dir_renders_segments_and_is_removed_on_success(self, tmp_path):
+        """A resumable compile uses the segment renderer in the work directory and cleans up after."""
+        compiler = FFmpegVideoCompiler()
+        compiler._render_parallel_segments = MagicMock()
+        work_dir = tmp_path / "job"
+
+        compiler.compile_video(
+            [create_image()], create_audio(), tmp_path / "video.mp4", enable_zoom=False, work_dir=work_dir
+        )
+
+        call = compiler._render_parallel_segments.call_args
+        assert call.kwargs["work_dir"] == work_dir / "segments"
+        assert isinstance(call.kwargs["journal"], CompileJournal)
+        assert not work_dir.exists()
+
+    def test_transition_length_is_part_of_the_job(self):
+        """A resume with another transition length is a different job, so the work directory is cleared."""
+        args = ([create_image()], create_audio(), [("video.mp4", (1280, 720))], True)
+
+        cut = FFmpegVideoCompiler()._job_key(*args)
+        faded = FFmpegVideoCompiler(transition_seconds=0.5)._job_key(*args)
+
+        assert cut != faded
+
+    def test_failed_compile_keeps_work_dir(self, tmp_path):
+        """
+        GIVEN a resumable compile whose segment render fails
+        WHEN compile_video runs
+        THEN it raises without falling back to moviepy, and the state file stays for the next attempt.
+        """
+        compiler = FFmpegVideoCompiler()
+        compiler._render_parallel_segments = MagicMock(side_effect=VideoProcessingError("killed"))
+        compiler._render_with_moviepy = MagicMock()
+        work_dir = tmp_path / "job"
+
+        with pytest.raises(VideoProcessingError, match="kept in"):
+            compiler.compile_video([create_image()], create_audio(), tmp_path / "video.mp4", work_dir=work_dir)
+
+        compiler._render_with_moviepy.assert_not_called()
+        assert (work_dir / STATE_FILE).exists()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestResumeReal:
+    """Interrupted compile resumed with real ffmpeg."""
+
+    def test_interrupted_compile_resumes_from_completed_segments(self, tmp_path):
+        """
+        GIVEN a compile that encoded every segment and then died while joining them
+        WHEN it is run again with the same work directory
+        THEN no segment is re-encoded and the joined video holds every frame.
+        """
+        import imageio_ffmpeg
+
+        images = [Image(data=create_png_bytes((64, 36), c), mime_type="image/png") for c in [(255, 0, 0), (0, 0, 255)]]
+        audio = Audio(data=create_silent_mp3_bytes(2.0), duration_seconds=2.0)
+        work_dir = tmp_path / "job"
+        compiler = FFmpegVideoCompiler(profile="draft")
+
+        with patch("eleven_video.processing.segments.concat_segments", side_effect=VideoProcessingError("killed")):
+            with pytest.raises(VideoProcessingError):
+                compiler.compile_video(images, audio, tmp_path / "video.mp4", work_dir=work_dir)
+
+        updates = []
+        video = compiler.compile_video(
+            images, audio, tmp_path / "video.mp4", progress_callback=updates.append, work_dir=work_dir
+        )
+
+        assert "Resumed 2 of 2 segments from an earlier run" in updates
+        frames, _ = imageio_ffmpeg.count_frames_and_secs(str(video.file_path))
+        assert frames == 30
+        assert not work_dir.exists()
+
+    def test_resume_with_other_transition_keeps_audio_length(self, tmp_path):
+        """
+        GIVEN a hard-cut compile that died while joining its segments
+        WHEN it is run again in the same work directory with a crossfade
+        THEN nothing is resumed and the video is exactly as long as the audio.
+        """
+        import imageio_ffmpeg
+
+        images = [Image(data=create_png_bytes((64, 36), c), mime_type="image/png")
+                  for c in [(255, 0, 0), (0, 255, 0), (0, 0, 255)]]
+        audio = Audio(data=create_silent_mp3_bytes(3.0), duration_seconds=3.0)
+        work_dir = tmp_path / "job"
+
+        with patch("eleven_video.processing.segments.concat_segments", side_effect=VideoProcessingError("killed")):
+            with pytest.raises(VideoProcessingError):
+                FFmpegVideoCompiler(profile="draft").compile_video(
+                    images, audio, tmp_path / "video.mp4", work_dir=work_dir
+                )
+
+        updates = []
+        video = FFmpegVideoCompiler(profile="draft", transition_seconds=0.5).compile_video(
+            images, audio, tmp_path / "video.mp4", progress_callback=updates.append, work_dir=work_dir
+        )
+
+        assert not any(u.startswith("Resumed") for u in updates)
+        frames, _ = imageio_ffmpeg.count_frames_and_secs(str(video.file_path))
+        assert frames == 45
@@ -0,0 +1,133 @@
+"""
+Tests for the bounded-memory streaming compositor.
+
+Related files:
+- eleven_video/processing/compositor.py: StreamingCompositor implementation
+- eleven_video/processing/video_handler.py: _render_with_moviepy (store-backed path)
+"""
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from eleven_video.processing.compositor import StreamingCompositor
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import create_audio, create_png_bytes
+from eleven_video.models.domain import Image
+
+
+class FakeSegment:
+    """Segment clip whose frames encode (segment, local time)."""
+
+    built = []
+    closed = []
+
+    def __init__(self, index):
+        self.index = index
+        FakeSegment.built.append(index)
+
+    def get_frame(self, t):
+        return np.array([self.index, t])
+
+    def close(self):
+        FakeSegment.closed.append(self.index)
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_segments():
+    FakeSegment.built = []
+    FakeSegment.closed = []
+
+
+class TestTimeline:
+    """Mapping timeline time to segments."""
+
+    def test_frames_come_from_the_right_segment(self):
+        """
+        GIVEN segments of 1s, 2s and 1s
+        WHEN frames are requested across the timeline
+        THEN each comes from its segment at the segment-local time.
+        """
+        compositor = StreamingCompositor(FakeSegment, [1.0, 2.0, 1.0], (16, 9))
+
+        assert compositor.duration == 4.0
+        assert compositor.get_frame(0.5).tolist() == [0, 0.5]
+        assert compositor.get_frame(1.0).tolist() == [1, 0.0]
+        assert compositor.get_frame(2.5).tolist() == [1, 1.5]
+        assert compositor.get_frame(3.99).tolist()[0] == 2
+        # Past the end clamps to the last segment
+        assert compositor.get_frame(4.2).tolist()[0] == 2
+        compositor.close()
+
+    def test_clip_has_size_and_duration_without_rendering(self):
+        """to_clip() builds no segment until a frame is requested."""
+        compositor = StreamingCompositor(FakeSegment, [1.0] * 5, (16, 9))
+
+        clip = compositor.to_clip()
+
+        assert clip.size == (16, 9)
+        assert clip.duration == 5.0
+        assert FakeSegment.built == []
+        compositor.close()
+
+
+class TestMemoryCeiling:
+    """Only the current and next segments are alive."""
+
+    def test_at_most_two_segments_alive(self):
+        """
+        GIVEN a 100-segment timeline
+        WHEN it is played from start to end
+        THEN no more than two segments are ever live and every segment is closed.
+        """
+        compositor = StreamingCompositor(FakeSegment, [1.0] * 100, (16, 9))
+        peak = 0
+
+        for t in np.arange(0, 100, 0.25):
+            compositor.get_frame(t)
+            peak = max(peak, len(compositor.live_segments))
+        compositor.close()
+
+        assert peak == 2
+        assert sorted(FakeSegment.built) == list(range(100))
+        assert sorted(FakeSegment.closed) == list(range(100))
+
+    def test_next_segment_prefetched(self):
+        """Entering a segment starts building the following one."""
+        compositor = StreamingCompositor(FakeSegment, [1.0] * 3, (16, 9))
+
+        compositor.get_frame(0.0)
+
+        assert compositor.live_segments == [0, 1]
+        compositor.close()
+
+    def test_progress_reported_per_segment(self):
+        """on_segment fires once per segment as playback enters it."""
+        entered = []
+        compositor = StreamingCompositor(FakeSegment, [1.0] * 3, (16, 9), on_segment=entered.append)
+
+        for t in np.arange(0, 3, 0.5):
+            compositor.get_frame(t)
+        compositor.close()
+
+        assert entered == [0, 1, 2]
+
+
+class TestCompilerUsesCompositor:
+    """The moviepy backend streams store-backed clips."""
+
+    def test_store_path_does_not_concatenate(self, tmp_path):
+        """With decodable images the moviepy path writes a compositor clip, not a concatenation."""
+        compiler = FFmpegVideoCompiler()
+        images = [Image(data=create_png_bytes(), mime_type="image/png") for _ in range(3)]
+        updates = []
+
+        with patch("eleven_video.processing.video_handler.concatenate_videoclips") as mock_concat, \
+             patch("eleven_video.processing.video_handler.AudioFileClip"), \
+             patch("eleven_video.processing.compositor.VideoClip") as mock_clip:
+            compiler.compile_video(images, create_audio(duration_seconds=3.0), tmp_path / "out.mp4",
+                                   progress_callback=updates.append)
+
+        mock_concat.assert_not_called()
+        final = mock_clip.return_value.with_audio.return_value
+        final.write_videofile.assert_called_once()
+        assert mock_clip.call_args.kwargs["duration"] == pytest.approx(3.0)
@@ -0,0 +1,187 @@
+"""
+Tests for the node-wide CPU budget shared by concurrent renders.
+
+Related files:
+- eleven_video/processing/cpu_governor.py: CpuGovernor, CpuLease
+- eleven_video/processing/segments.py: ParallelSegmentRenderer(cores=...)
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(cpu_governor=...)
+"""
+import json
+import os
+import threading
+
+import pytest
+from unittest.mock import patch
+
+from eleven_video.exceptions.custom_errors import ValidationError
+from eleven_video.processing.cpu_governor import LEASES_DIR, CpuGovernor
+from eleven_video.processing.segments import ParallelSegmentRenderer
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import create_audio, create_image
+
+
+class TestCpuGovernor:
+    """Lease files and core accounting."""
+
+    def test_lone_render_gets_whole_budget(self, tmp_path):
+        governor = CpuGovernor(budget=8, root=tmp_path)
+
+        with governor.acquire() as lease:
+            assert lease.cores == 8
+            assert json.loads(lease.path.read_text()) == {"pid": os.getpid(), "cores": 8}
+
+        assert governor.leased_cores() == 0
+
+    def test_later_renders_share_what_is_left(self, tmp_path):
+        """
+        GIVEN a budget of 8 cores with 6 leased
+        WHEN another render starts
+        THEN it gets the remaining 2, and after the first render finishes the next gets a fair half.
+        """
+        governor = CpuGovernor(budget=8, root=tmp_path)
+        first = governor.acquire(wanted=6)
+
+        second = governor.acquire()
+
+        assert (first.cores, second.cores) == (6, 2)
+        first.release()
+        assert governor.acquire().cores == 4
+
+    def test_fair_share_of_the_budget(self):
+        """A new render gets budget // (renders + 1), or what is free if that is less, and at least 1."""
+        governor = CpuGovernor(budget=8)
+
+        assert governor.fair_share(8, []) == 8
+        assert governor.fair_share(8, [4]) == 4
+        assert governor.fair_share(8, [4, 2]) == 2
+        assert governor.fair_share(8, [8]) == 1
+        assert governor.fair_share(1, [2]) == 1
+
+    def test_full_budget_still_starts_next_render(self, tmp_path):
+        """
+        GIVEN a render holding the whole budget
+        WHEN another render asks for cores
+        THEN it starts right away with one core instead of waiting for the first to finish.
+        """
+        governor = CpuGovernor(budget=4, root=tmp_path)
+
+        with governor.acquire() as first, governor.acquire() as second:
+            assert (first.cores, second.cores) == (4, 1)
+
+    def test_small_leases_pack_within_budget(self, tmp_path):
+        """
+        GIVEN eight renders that each want 2 cores, starting at once on a 16-core budget
+        WHEN each holds its lease for a moment
+        THEN all of them run side by side with their 2 cores and the leases never exceed 16.
+        """
+        governor = CpuGovernor(budget=16, root=tmp_path)
+        granted, totals = [], []
+        lock = threading.Lock()
+        all_started = threading.Barrier(8, timeout=10)
+
+        def render():
+            with governor.acquire(wanted=2) as lease:
+                with lock:
+                    granted.append(lease.cores)
+                    totals.append(governor.leased_cores())
+                all_started.wait()
+
+        threads = [threading.Thread(target=render) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert granted == [2] * 8
+        assert max(totals) <= 16
+        assert governor.leased_cores() == 0
+
+    def test_dead_process_leases_are_dropped(self, tmp_path):
+        leases = tmp_path / LEASES_DIR
+        leases.mkdir()
+        (leases / "dead.json").write_text(json.dumps({"pid": 2 ** 22 + 1, "cores": 8}))
+        governor = CpuGovernor(budget=8, root=tmp_path)
+
+        assert governor.acquire().cores == 8
+        assert not (leases / "dead.json").exists()
+
+    def test_budget_must_be_positive(self):
+        with pytest.raises(ValidationError, match="at least 1 core"):
+            CpuGovernor(budget=0)
+
+    def test_segment_threads_follow_leased_cores(self, tmp_path):
+        """With 4 leased cores and 2 workers, each segment encoder gets 2 threads."""
+        renderer = ParallelSegmentRenderer(max_workers=2, cores=4)
+        jobs = renderer.build_jobs(["a.png"] * 4, [24] * 4, (1280, 720), tmp_path)
+
+        args = jobs[0].encoder_args
+        assert args[args.index("-threads") + 1] == "2"
+
+
+class TestCompilerCpuBudget:
+    """FFmpegVideoCompiler sizing its encoders to the lease."""
+
+    def _compile(self, compiler, tmp_path, **kwargs):
+        with patch("eleven_video.processing.video_handler.FilterGraphRenderer") as mock_renderer:
+            compiler.compile_video(
+                [create_image()], create_audio(), tmp_path / "out.mp4", backend="ffmpeg", **kwargs
+            )
+        return mock_renderer.call_args.kwargs["encoder_options"]
+
+    def test_shared_node_limits_encoder_threads(self, tmp_path):
+        """
+        GIVEN an 8-core node where another render holds 5 cores
+        WHEN a compile runs
+        THEN x264 gets -threads 3 and the limit is reported.
+        """
+        governor = CpuGovernor(budget=8, root=tmp_path)
+        other = governor.acquire(wanted=5)
+        compiler = FFmpegVideoCompiler(profile="draft", cpu_governor=governor)
+        updates = []
+
+        with patch("eleven_video.processing.cpu_governor.os.cpu_count", return_value=8):
+            options = self._compile(compiler, tmp_path, progress_callback=updates.append)
+
+        assert options[-2:] == ["-threads", "3"]
+        assert "Using 3 of 8 cores (CPU budget shared with other renders)" in updates
+        assert compiler._cores is None
+        assert governor.leased_cores() == 5
+        other.release()
+
+    def test_whole_node_keeps_encoder_defaults(self, tmp_path):
+        """A render with every core leaves the thread count to x264."""
+        compiler = FFmpegVideoCompiler(profile="draft", cpu_governor=CpuGovernor(root=tmp_path))
+
+        assert "-threads" not in self._compile(compiler, tmp_path)
+
+    def test_concurrent_compiles_share_the_budget(self, tmp_path):
+        """
+        GIVEN a 4-core budget
+        WHEN two moviepy compiles run at the same time
+        THEN both start without waiting for the other, and their leases add up to no more than 4.
+        """
+        governor = CpuGovernor(budget=4, root=tmp_path)
+        both_rendering = threading.Barrier(2, timeout=10)
+        leased, errors = [], []
+
+        def render(*args, **kwargs):
+            leased.append(governor.leased_cores())
+            both_rendering.wait()
+
+        def run(i):
+            compiler = FFmpegVideoCompiler(profile="draft", cpu_governor=governor)
+            compiler._render_with_moviepy = render
+            try:
+                compiler.compile_video([create_image()], create_audio(), tmp_path / f"out{i}.mp4")
+            except Exception as e:  # surfaced below; a broken barrier means one compile waited
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=20)
+
+        assert errors == []
+        assert max(leased) <= 4
+        assert governor.leased_cores() == 0
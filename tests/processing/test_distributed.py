@@ -0,0 +1,202 @@
+"""
+Tests for distributed segment rendering through a shared directory.
+
+Related files:
+- eleven_video/processing/distributed.py: DistributedSegmentRenderer, RenderWorker, claim_task
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(shared_dir=..., backend="distributed")
+- eleven_video/main.py: render-worker command
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+from unittest.mock import patch
+
+from eleven_video.exceptions.custom_errors import ValidationError, VideoProcessingError
+from eleven_video.processing.distributed import (
+    DistributedSegmentRenderer,
+    RenderWorker,
+    claim_task,
+)
+from eleven_video.processing.ffmpeg_backend import FilterGraphRenderer
+from eleven_video.processing.memory_files import memory_files_supported
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+)
+
+
+def _images(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"image_{i:03d}.png"
+        path.write_bytes(create_png_bytes((64, 36), (i * 60, 0, 255 - i * 60)))
+        paths.append(str(path))
+    return paths
+
+
+def _fake_render_segment(job):
+    with open(job.output_path, "wb") as f:
+        f.write(b"segment")
+    return job.output_path
+
+
+class TestTaskClaims:
+    """Lock-file claims on published tasks."""
+
+    def _task(self, tmp_path):
+        renderer = DistributedSegmentRenderer(tmp_path / "shared", FilterGraphRenderer(encoder_options=["-threads", "4"]))
+        (tmp_path / "shared").mkdir()
+        return renderer.submit(_images(tmp_path, 2), [24, 24], (160, 90))
+
+    def test_submit_publishes_relative_tasks_with_inputs(self, tmp_path):
+        """
+        GIVEN two segments
+        WHEN they are submitted
+        THEN each task names a copied input and output relative to the job, without -threads.
+        """
+        job_dir, tasks = self._task(tmp_path)
+
+        task = json.loads(tasks[1].read_text())
+        assert task["image"] == "inputs/image_001.png" and (job_dir / task["image"]).exists()
+        assert task["output"] == "segments/segment_0001.mp4"
+        assert task["frames"] == 24
+        assert "-threads" not in task["encoder_args"]
+
+    def test_claim_is_exclusive_until_released(self, tmp_path):
+        _, tasks = self._task(tmp_path)
+
+        claim = claim_task(tasks[0])
+        assert claim is not None
+        assert claim_task(tasks[0]) is None
+        with claim:
+            pass
+
+        assert claim_task(tasks[0]) is not None
+
+    def test_stale_claim_is_taken_over(self, tmp_path):
+        """A claim whose heartbeat stopped longer ago than the timeout can be claimed again."""
+        _, tasks = self._task(tmp_path)
+        claim_task(tasks[0])
+        stale = time.time() - 300
+        os.utime(tasks[0].with_suffix(".claim"), (stale, stale))
+
+        assert claim_task(tasks[0], claim_timeout=120) is not None
+
+    def test_done_task_is_not_claimed(self, tmp_path):
+        _, tasks = self._task(tmp_path)
+        tasks[0].with_suffix(".done").write_text("{}")
+
+        assert claim_task(tasks[0]) is None
+        assert len(RenderWorker(tmp_path / "shared").pending_tasks()) == 1
+
+
+class TestDistributedRender:
+    """Coordinator waiting on workers and joining segments."""
+
+    def test_local_worker_renders_and_job_is_removed(self, tmp_path):
+        """With no remote worker the originating node renders every segment itself."""
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        renderer = DistributedSegmentRenderer(shared, local_workers=1, poll=0.01)
+        progress = []
+
+        with patch("eleven_video.processing.distributed.render_segment", side_effect=_fake_render_segment), \
+             patch("eleven_video.processing.distributed.concat_segments") as mock_concat:
+            remote = renderer.render(_images(tmp_path, 3), "a.mp3", [10, 10, 10], tmp_path / "out.mp4",
+                                     (160, 90), on_progress=progress.append)
+
+        assert remote == 0
+        assert progress[-1] == 30
+        mock_concat.assert_called_once()
+        assert list(shared.iterdir()) == []
+
+    def test_failed_segment_fails_the_render(self, tmp_path):
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        renderer = DistributedSegmentRenderer(shared, local_workers=1, poll=0.01)
+
+        with patch("eleven_video.processing.distributed.render_segment",
+                   side_effect=VideoProcessingError("encoder crashed")):
+            with pytest.raises(VideoProcessingError, match="segment_0000 failed on a render worker.*encoder crashed"):
+                renderer.render(_images(tmp_path, 1), "a.mp3", [10], tmp_path / "out.mp4", (160, 90))
+
+        assert list(shared.iterdir()) == []
+
+    @pytest.mark.skipif(not memory_files_supported(), reason="memfd_create not available")
+    def test_in_memory_inputs_keep_their_extension(self, tmp_path):
+        """
+        GIVEN a compile whose inputs are staged as in-memory files (paths without an extension)
+        WHEN its segments are published to the shared directory
+        THEN the copies workers decode are named after each image's MIME type.
+        """
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        compiler = FFmpegVideoCompiler(shared_dir=shared, thumbnails=False)
+        decoded = []
+
+        def render(job):
+            decoded.extend(os.path.basename(path) for path in job.inputs)
+            return _fake_render_segment(job)
+
+        images = [create_image(mime_type="image/png"), create_image(mime_type="image/jpeg")]
+        with patch("eleven_video.processing.distributed.render_segment", side_effect=render), \
+             patch("eleven_video.processing.distributed.concat_segments"), \
+             patch("eleven_video.processing.distributed.POLL_SECONDS", 0.01):
+            compiler.compile_video(images, create_audio(duration_seconds=2.0), tmp_path / "out.mp4",
+                                   backend="distributed")
+
+        assert sorted(decoded) == ["image_000.png", "image_001.jpg"]
+
+    def test_compiler_requires_shared_dir(self, tmp_path):
+        with pytest.raises(ValidationError, match="shared directory"):
+            FFmpegVideoCompiler().compile_video(
+                [create_image()], create_audio(), tmp_path / "out.mp4", backend="distributed"
+            )
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestRenderWorkersReal:
+    """Several render-worker processes sharing one directory."""
+
+    def test_worker_processes_render_every_segment(self, tmp_path):
+        """
+        GIVEN two `render-worker` processes watching a shared directory
+        WHEN a compile publishes four segments there without rendering locally
+        THEN the workers encode all of them and the joined video holds every frame.
+        """
+        import imageio_ffmpeg
+
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-m", "eleven_video.main", "render-worker", "--shared-dir", str(shared)],
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+            )
+            for _ in range(2)
+        ]
+        try:
+            audio = tmp_path / "audio.mp3"
+            audio.write_bytes(create_silent_mp3_bytes(2.0))
+            graph = FilterGraphRenderer(fps=12, encoder_options=["-preset", "ultrafast"])
+            renderer = DistributedSegmentRenderer(shared, graph, local_workers=0, poll=0.1)
+
+            remote = renderer.render(_images(tmp_path, 4), str(audio), [6, 6, 6, 6], tmp_path / "out.mp4", (160, 90))
+        finally:
+            for worker in workers:
+                worker.terminate()
+            logs = [worker.communicate(timeout=30)[0] for worker in workers]
+
+        assert remote == 4
+        assert sum(log.count("Rendered segment_") for log in logs) == 4
+        frames, _ = imageio_ffmpeg.count_frames_and_secs(str(tmp_path / "out.mp4"))
+        assert frames == 24
@@ -0,0 +1,189 @@
+"""
+Tests for encode-rate and ETA reporting during compilation.
+
+Related files:
+- eleven_video/processing/encode_progress.py: EncodeProgress, MoviepyProgressLogger
+- eleven_video/processing/ffmpeg_backend.py: run_ffmpeg(on_progress=...)
+- eleven_video/processing/video_handler.py: Video.encode_fps
+"""
+import functools
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.processing.encode_progress import EncodeProgress, MoviepyProgressLogger, format_eta
+from eleven_video.processing.ffmpeg_backend import run_ffmpeg
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import create_audio, create_image, ffmpeg_available
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestEncodeProgress:
+    """Throttled frames/fps/ETA messages."""
+
+    def test_reports_rate_and_eta_at_most_once_per_interval(self):
+        """
+        GIVEN frame updates twice a second
+        WHEN ten seconds of encoding pass with a 5 s interval
+        THEN two messages are sent, each with frames, fps and ETA.
+        """
+        clock = FakeClock()
+        messages = []
+        progress = EncodeProgress(1200, messages.append, interval=5.0, clock=clock)
+
+        for step in range(1, 21):
+            clock.now += 0.5
+            progress.update(step * 30)
+
+        assert messages == [
+            "Encoding frame 300 of 1200 (60.0 fps, ETA 15s)",
+            "Encoding frame 600 of 1200 (60.0 fps, ETA 10s)",
+        ]
+
+    def test_finish_reports_and_returns_fps(self):
+        """Finishing counts every frame and reports the overall rate."""
+        clock = FakeClock()
+        messages = []
+        progress = EncodeProgress(480, messages.append, clock=clock)
+        clock.now += 16.0
+
+        assert progress.finish() == 30.0
+        assert messages == ["Encoded 480 frames in 16.0s (30.0 fps)"]
+
+    def test_restart_discards_earlier_attempt(self):
+        """After a backend fallback the rate covers the new attempt only."""
+        clock = FakeClock()
+        progress = EncodeProgress(100, clock=clock)
+        progress.update(50)
+        clock.now += 50.0
+        progress.start()
+        clock.now += 10.0
+
+        assert progress.frames == 0
+        assert progress.finish() == 10.0
+
+    def test_counts_never_go_backwards_or_past_total(self):
+        """Out-of-order or overshooting counts are clamped."""
+        progress = EncodeProgress(100)
+        progress.update(60)
+        progress.update(40)
+        assert progress.frames == 60
+        progress.update(150)
+        assert progress.frames == 100
+
+    @pytest.mark.parametrize("seconds,text", [(7.4, "7s"), (185, "3m 05s"), (3720, "1h 02m"), (-3, "0s")])
+    def test_format_eta(self, seconds, text):
+        assert format_eta(seconds) == text
+
+    def test_moviepy_logger_forwards_frame_index(self):
+        """Only moviepy's video frame loop counts; the audio chunk bar is ignored."""
+        frames = []
+        logger = MoviepyProgressLogger(frames.append)
+
+        for _ in logger.iter_bar(chunk=range(3)):
+            pass
+        for _ in logger.iter_bar(frame_index=range(4)):
+            pass
+
+        assert frames == [0, 1, 2, 3, 4]
+
+
+class TestCompilerEncodeRate:
+    """Encode progress threaded through compile_video."""
+
+    def test_video_records_encode_fps(self, tmp_path):
+        """
+        GIVEN a backend reporting frames as it encodes
+        WHEN compile_video finishes
+        THEN the final rate is reported and stored on the Video.
+        """
+        compiler = FFmpegVideoCompiler(profile="draft")
+        compiler._render_with_filter_graph = MagicMock(
+            side_effect=lambda *args, **kwargs: kwargs["encode_progress"].update(10)
+        )
+        updates = []
+
+        video = compiler.compile_video(
+            [create_image(), create_image()], create_audio(duration_seconds=4.0),
+            tmp_path / "video.mp4", progress_callback=updates.append, backend="ffmpeg"
+        )
+
+        assert video.encode_fps > 0
+        assert any(u.startswith("Encoded 60 frames in ") for u in updates)
+
+    def test_fallback_times_the_moviepy_render(self, tmp_path):
+        """When a backend falls back, the moviepy render gets a restarted tracker."""
+        def fail_midway(*args, **kwargs):
+            kwargs["encode_progress"].update(20)
+            raise VideoProcessingError("boom")
+
+        frames_at_fallback = []
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_frame_pipe = MagicMock(side_effect=fail_midway)
+        compiler._render_with_moviepy = MagicMock(
+            side_effect=lambda *args, **kwargs: frames_at_fallback.append(kwargs["encode_progress"].frames)
+        )
+
+        compiler.compile_video([create_image()], create_audio(), tmp_path / "video.mp4", backend="pipe")
+
+        assert frames_at_fallback == [0]
+
+    @pytest.mark.parametrize("backend,renderer,reported", [
+        ("ffmpeg", "_render_static_slideshow", 3),   # VFR stills: one encoded frame per image
+        ("parallel", "_render_parallel_segments", 2),  # segments finished, then stream-copied
+    ])
+    def test_encode_fps_counts_output_frames(self, tmp_path, backend, renderer, reported):
+        """
+        GIVEN a backend whose own count is not the output's frame count
+        WHEN its render takes 2 seconds of wall time
+        THEN encode_fps is the 45 output frames (3 s at the draft profile's 15 fps) over those 2 seconds.
+        """
+        clock = FakeClock()
+
+        def render(*args, **kwargs):
+            kwargs["encode_progress"].update(reported)
+            clock.now += 2.0
+
+        compiler = FFmpegVideoCompiler(profile="draft", thumbnails=False)
+        setattr(compiler, renderer, MagicMock(side_effect=render))
+
+        with patch("eleven_video.processing.video_handler.EncodeProgress",
+                   functools.partial(EncodeProgress, clock=clock)):
+            video = compiler.compile_video(
+                [create_image()] * 3, create_audio(duration_seconds=3.0), tmp_path / "video.mp4",
+                enable_zoom=backend != "ffmpeg", backend=backend
+            )
+
+        assert video.encode_fps == 22.5
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestFfmpegProgressReal:
+    """ffmpeg -progress parsing against the real binary."""
+
+    def test_run_ffmpeg_reports_frames(self, tmp_path):
+        """Frame counts arrive while encoding and end at the output's frame count."""
+        frames = []
+        run_ffmpeg([
+            "-f", "lavfi", "-i", "color=c=red:s=64x36:r=24:d=2",
+            "-c:v", "libx264", str(tmp_path / "out.mp4"),
+        ], on_progress=frames.append)
+
+        assert frames and frames[-1] == 48
+        assert frames == sorted(frames)
+
+    def test_errors_are_not_hidden_by_progress_lines(self, tmp_path):
+        """The error detail is ffmpeg's message, not a progress key=value line."""
+        with pytest.raises(VideoProcessingError, match="No such file"):
+            run_ffmpeg(["-i", str(tmp_path / "missing.png"), str(tmp_path / "out.mp4")], on_progress=print)
@@ -0,0 +1,214 @@
+"""
+Tests for the FFmpeg filter-graph render backend.
+
+Covers frame-count splitting, filter graph construction, the ffmpeg command
+line, backend selection in FFmpegVideoCompiler.compile_video, and a real
+render through the bundled ffmpeg binary.
+
+Related files:
+- eleven_video/processing/ffmpeg_backend.py: FilterGraphRenderer implementation
+- eleven_video/processing/video_handler.py: compile_video(backend="ffmpeg")
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eleven_video.exceptions.custom_errors import ValidationError, VideoProcessingError
+from eleven_video.processing.ffmpeg_backend import (
+    FilterGraphRenderer,
+    run_ffmpeg,
+    segment_frame_counts,
+)
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+)
+
+
+class TestSegmentFrameCounts:
+    """Frame counts per image on the fps grid."""
+
+    def test_counts_sum_to_total_frames(self):
+        """
+        GIVEN a timeline that does not divide evenly into the fps grid
+        WHEN it is split into segments
+        THEN the counts sum to the audio's total frame count (no drift).
+        """
+        counts = segment_frame_counts(7, 10.0, 24)
+
+        assert sum(counts) == 240
+        assert max(counts) - min(counts) <= 1
+
+    def test_no_segments(self):
+        """An empty image list yields no segments."""
+        assert segment_frame_counts(0, 10.0, 24) == []
+
+
+class TestFilterGraph:
+    """Filter graph construction."""
+
+    def test_zoom_alternates_direction(self):
+        """
+        GIVEN zoom enabled
+        WHEN the graph is built for two segments
+        THEN the first zooms in from 1.0 and the second zooms out from 1.08.
+        """
+        renderer = FilterGraphRenderer()
+        graph = renderer.build_filter_graph([48, 48], (1920, 1080))
+
+        chains = graph.split(";\n")
+        assert "z='1.000000+" in chains[0]
+        assert "z='1.080000+-" in chains[1]
+        assert "scale=3840:2160" in chains[0]
+        assert "s=1920x1080" in chains[0]
+        assert chains[-1] == "[v0][v1]concat=n=2:v=1:a=0[vout]"
+
+    def test_static_graph_has_no_oversample(self):
+        """Without zoom, images are scaled straight to the target size."""
+        renderer = FilterGraphRenderer()
+        graph = renderer.build_filter_graph([24], (1280, 720), enable_zoom=False)
+
+        assert "scale=1280:720" in graph
+        assert "z='1'" in graph
+
+    def test_zero_frame_segments_are_skipped(self):
+        """Segments with no frames are left out of the graph and inputs are renumbered."""
+        renderer = FilterGraphRenderer()
+        graph = renderer.build_filter_graph([0, 24, 24], (1280, 720))
+
+        assert "[0:v]" in graph and "[1:v]" in graph and "[2:v]" not in graph
+        # Zoom direction still follows the original image index
+        assert "z='1.080000+-" in graph.split(";\n")[0]
+
+
+class TestRenderCommand:
+    """ffmpeg invocation."""
+
+    def test_render_maps_video_and_audio(self, tmp_path):
+        """
+        GIVEN two image paths and an audio path
+        WHEN render is called
+        THEN ffmpeg receives every input, the graph script, and the audio map.
+        """
+        image_paths = [str(tmp_path / "image_000.png"), str(tmp_path / "image_001.png")]
+        renderer = FilterGraphRenderer()
+
+        with patch("eleven_video.processing.ffmpeg_backend.run_ffmpeg") as mock_run:
+            renderer.render(image_paths, "audio.mp3", [24, 24], tmp_path / "out.mp4", (1280, 720))
+
+        args = mock_run.call_args.args[0]
+        assert args.count("-i") == 3
+        assert args[args.index("[vout]") - 1] == "-map"
+        assert args[args.index("2:a") - 1] == "-map"
+        assert (tmp_path / "filter_graph.txt").exists()
+
+    def test_run_ffmpeg_raises_on_failure(self):
+        """A non-zero ffmpeg exit is surfaced as VideoProcessingError with the last stderr line."""
+        failed = MagicMock(returncode=1, stderr=b"noise\nInvalid argument")
+        with patch("eleven_video.processing.ffmpeg_backend.get_ffmpeg_binary", return_value="ffmpeg"), \
+             patch("eleven_video.processing.ffmpeg_backend.subprocess.run", return_value=failed):
+            with pytest.raises(VideoProcessingError, match="Invalid argument"):
+                run_ffmpeg(["-i", "x"])
+
+    def test_run_ffmpeg_missing_binary(self):
+        """A missing executable gives the same install hint as the moviepy path."""
+        with patch("eleven_video.processing.ffmpeg_backend.get_ffmpeg_binary", return_value="ffmpeg"), \
+             patch("eleven_video.processing.ffmpeg_backend.subprocess.run", side_effect=FileNotFoundError()):
+            with pytest.raises(VideoProcessingError, match="FFmpeg required"):
+                run_ffmpeg([])
+
+
+class TestBackendSelection:
+    """compile_video(backend=...) dispatch."""
+
+    def test_ffmpeg_backend_uses_filter_graph(self, tmp_path):
+        """
+        GIVEN backend="ffmpeg"
+        WHEN compile_video runs
+        THEN the filter-graph renderer is used and moviepy is not.
+        """
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_moviepy = MagicMock()
+
+        with patch("eleven_video.processing.video_handler.FilterGraphRenderer") as mock_renderer:
+            video = compiler.compile_video(
+                [create_image(), create_image()], create_audio(duration_seconds=4.0),
+                tmp_path / "out.mp4", backend="ffmpeg"
+            )
+
+        mock_renderer.return_value.render.assert_called_once()
+        frame_counts = mock_renderer.return_value.render.call_args.args[2]
+        assert frame_counts == [48, 48]
+        compiler._render_with_moviepy.assert_not_called()
+        assert video.duration_seconds == 4.0
+
+    def test_ffmpeg_backend_falls_back_to_moviepy(self, tmp_path):
+        """
+        GIVEN the filter-graph render fails
+        WHEN compile_video runs with backend="ffmpeg"
+        THEN a warning is reported and the moviepy path renders instead.
+        """
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_filter_graph = MagicMock(side_effect=VideoProcessingError("boom"))
+        compiler._render_with_moviepy = MagicMock()
+        updates = []
+
+        compiler.compile_video(
+            [create_image()], create_audio(), tmp_path / "out.mp4",
+            progress_callback=updates.append, backend="ffmpeg"
+        )
+
+        compiler._render_with_moviepy.assert_called_once()
+        assert any("Warning: ffmpeg backend failed" in u for u in updates)
+
+    def test_default_backend_is_moviepy(self, tmp_path):
+        """The moviepy path stays the default."""
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_moviepy = MagicMock()
+        compiler._render_with_filter_graph = MagicMock()
+
+        compiler.compile_video([create_image()], create_audio(), tmp_path / "out.mp4")
+
+        compiler._render_with_moviepy.assert_called_once()
+        compiler._render_with_filter_graph.assert_not_called()
+
+    def test_unknown_backend_rejected(self, tmp_path):
+        """An unknown backend name is a validation error."""
+        compiler = FFmpegVideoCompiler()
+        with pytest.raises(ValidationError, match="Unknown render backend"):
+            compiler.compile_video([create_image()], create_audio(), tmp_path / "out.mp4", backend="gpu")
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestFilterGraphRenderReal:
+    """Real renders through the ffmpeg binary."""
+
+    def test_render_produces_synchronized_video(self, tmp_path):
+        """
+        GIVEN two small images and 2 seconds of audio
+        WHEN rendered with the filter-graph backend
+        THEN the MP4 has 48 frames at the target size.
+        """
+        import imageio_ffmpeg
+
+        image_paths = []
+        for i, color in enumerate([(255, 0, 0), (0, 0, 255)]):
+            path = tmp_path / f"image_{i:03d}.png"
+            path.write_bytes(create_png_bytes((64, 36), color))
+            image_paths.append(str(path))
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(create_silent_mp3_bytes(2.0))
+        output = tmp_path / "out.mp4"
+
+        FilterGraphRenderer().render(image_paths, str(audio_path), [24, 24], output, (160, 90))
+
+        frames, _ = imageio_ffmpeg.count_frames_and_secs(str(output))
+        assert frames == 48
+        reader = imageio_ffmpeg.read_frames(str(output))
+        meta = next(reader)
+        reader.close()
+        assert tuple(meta["size"]) == (160, 90)
@@ -0,0 +1,120 @@
+"""
+Tests for the shared-memory frame ring and process-based frame producers.
+
+Related files:
+- eleven_video/processing/frame_ring.py: FrameRing
+- eleven_video/processing/frame_sink.py: PipeRenderer(processes=True)
+- eleven_video/processing/video_handler.py: _render_with_frame_pipe
+"""
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from unittest.mock import patch
+
+from eleven_video.processing.cpu_governor import CpuGovernor
+from eleven_video.processing.frame_ring import FrameRing
+from eleven_video.processing.frame_sink import PipeRenderer
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    ffmpeg_available,
+)
+
+
+def _fill_slot(ring, slot, value):
+    ring.frames(slot)[:] = value
+    return slot
+
+
+class TestFrameRing:
+    """Slot bookkeeping and shared memory."""
+
+    def test_slots_are_handed_out_until_released(self):
+        """
+        GIVEN a ring of two slots
+        WHEN both are acquired
+        THEN no slot is free until one is released.
+        """
+        with FrameRing(2, (2, 2, 3)) as ring:
+            first, second = ring.acquire(), ring.acquire()
+
+            assert (first, second) == (0, 1)
+            assert ring.acquire() is None
+            ring.release(first)
+            assert ring.acquire() == first
+
+    def test_view_covers_requested_frames(self):
+        """A partly filled slot exposes only the frames written to it."""
+        with FrameRing(2, (2, 2, 3), frames_per_slot=4) as ring:
+            ring.frames(1)[:2] = [[[[1] * 3] * 2] * 2, [[[2] * 3] * 2] * 2]
+
+            with ring.view(1, 2) as data:
+                assert bytes(data) == bytes([1] * 12 + [2] * 12)
+            with ring.view(1) as data:
+                assert len(data) == 4 * 12
+
+    def test_pickled_ring_attaches_to_same_memory(self):
+        """Producers get the ring by name, not a copy of its frames."""
+        with FrameRing(1, (2, 2, 3)) as ring:
+            attached = pickle.loads(pickle.dumps(ring))
+            attached.frames(0)[:] = 7
+
+            assert not attached.owner
+            assert ring.frames(0).max() == 7
+            attached.close()
+
+    def test_producer_process_writes_into_slot(self):
+        """A frame rendered in another process is visible to the consumer without a copy back."""
+        with FrameRing(2, (4, 4, 3)) as ring:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                slot = pool.submit(_fill_slot, ring, 1, 99).result()
+
+            assert slot == 1
+            assert ring.frames(1).min() == ring.frames(1).max() == 99
+
+
+class TestPipeBackendProcesses:
+    """The compiler chooses process producers when it has more than one core."""
+
+    @pytest.mark.parametrize("cores,processes", [(1, False), (4, True)])
+    def test_processes_follow_core_count(self, tmp_path, cores, processes):
+        with patch("eleven_video.processing.video_handler.os.cpu_count", return_value=cores), \
+             patch("eleven_video.processing.video_handler.PipeRenderer") as mock_renderer:
+            compiler = FFmpegVideoCompiler(cpu_governor=CpuGovernor(root=tmp_path))
+            compiler.compile_video(
+                [create_image()], create_audio(duration_seconds=1.0), tmp_path / "out.mp4", backend="pipe"
+            )
+
+        assert mock_renderer.call_args.kwargs["processes"] is processes
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestProcessProducersReal:
+    """Process producers through the ring against the threaded producers."""
+
+    @pytest.mark.parametrize("pix_fmt", ["rgb24", "yuv420p"])
+    def test_process_render_matches_thread_render(self, tmp_path, pix_fmt):
+        """
+        GIVEN three images with zoom
+        WHEN rendered once with thread producers and once with process producers
+        THEN both videos decode to the same frames.
+        """
+        import imageio_ffmpeg
+
+        sources = [create_png_bytes((96, 54), (i * 80, 120, 40)) for i in range(3)]
+        decoded = []
+        for processes in (False, True):
+            output = tmp_path / f"out_{processes}.mp4"
+            frames = PipeRenderer(pix_fmt=pix_fmt, workers=2, batch_size=3, processes=processes).render(
+                sources, None, [10, 7, 12], output, (160, 90), work_dir=tmp_path / f"work_{processes}"
+            )
+            assert frames == 29
+            reader = imageio_ffmpeg.read_frames(str(output))
+            next(reader)
+            decoded.append(b"".join(reader))
+
+        assert decoded[0] == decoded[1]
@@ -0,0 +1,170 @@
+"""
+Tests for the raw-frame pipe encoder (FrameSink / PipeRenderer).
+
+Related files:
+- eleven_video/processing/frame_sink.py: FrameSink, PipeRenderer
+- eleven_video/processing/video_handler.py: compile_video(backend="pipe")
+"""
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.processing.frame_sink import FrameSink, PipeRenderer, rgb_to_yuv420p
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+)
+
+
+class TestFrameSinkCommand:
+    """ffmpeg command construction."""
+
+    def test_reads_rawvideo_from_stdin(self, tmp_path):
+        """
+        GIVEN a sink for 1280x720 rgb24 frames with audio
+        WHEN the command is built
+        THEN ffmpeg reads rawvideo from pipe:0 and maps the audio input.
+        """
+        sink = FrameSink(tmp_path / "out.mp4", (1280, 720), audio_path="audio.mp3")
+        with patch("eleven_video.processing.frame_sink.get_ffmpeg_binary", return_value="ffmpeg"):
+            cmd = sink.build_command()
+
+        assert cmd[cmd.index("-f") + 1] == "rawvideo"
+        assert cmd[cmd.index("-s") + 1] == "1280x720"
+        assert cmd[cmd.index("-pix_fmt") + 1] == "rgb24"
+        assert "pipe:0" in cmd
+        assert "1:a" in cmd
+
+    def test_silent_video_has_no_audio_map(self, tmp_path):
+        """Without an audio path only the video stream is written."""
+        sink = FrameSink(tmp_path / "out.mp4", (1280, 720))
+        with patch("eleven_video.processing.frame_sink.get_ffmpeg_binary", return_value="ffmpeg"):
+            cmd = sink.build_command()
+
+        assert "-c:a" not in cmd
+
+    def test_rejects_unknown_pixel_format(self, tmp_path):
+        """Only rgb24 and yuv420p are accepted on stdin."""
+        with pytest.raises(VideoProcessingError, match="Unsupported raw pixel format"):
+            FrameSink(tmp_path / "out.mp4", (1280, 720), pix_fmt="rgba")
+
+
+class TestPixelPacking:
+    """Raw frame packing."""
+
+    def test_rgb24_pack_is_frame_bytes(self, tmp_path):
+        """rgb24 frames are passed through unchanged."""
+        frame = np.arange(4 * 2 * 3, dtype=np.uint8).reshape(2, 4, 3)
+        packed = FrameSink(tmp_path / "o.mp4", (4, 2)).pack(frame)
+
+        assert bytes(packed) == frame.tobytes()
+
+    def test_yuv420p_plane_sizes_and_values(self):
+        """yuv420p is one full luma plane plus two quarter-size chroma planes."""
+        white = np.full((4, 4, 3), 255, dtype=np.uint8)
+        data = rgb_to_yuv420p(white)
+
+        assert len(data) == 16 + 4 + 4
+        assert data[0] == 235  # limited-range white
+        assert data[16] == 128 and data[20] == 128
+
+
+class TestPipeRendererScheduling:
+    """Chunking and ordering."""
+
+    def test_chunks_follow_timeline(self):
+        """Segments are split into batch-sized chunks in timeline order."""
+        renderer = PipeRenderer(batch_size=4)
+
+        assert renderer._chunks([6, 0, 3]) == [(0, 0, 4), (0, 4, 6), (2, 0, 3)]
+
+    def test_frames_written_in_order_with_bounded_buffer(self, tmp_path):
+        """
+        GIVEN several worker threads and a tiny buffer
+        WHEN frames are rendered
+        THEN the sink receives every frame in timeline order.
+        """
+        written = []
+        sink = MagicMock()
+        sink.__enter__ = MagicMock(return_value=sink)
+        sink.__exit__ = MagicMock(return_value=False)
+        sink.pack = lambda frame: int(frame[0, 0, 0])
+        sink.write = written.append
+
+        class FakeZoom:
+            def __init__(self, source, *args, **kwargs):
+                self.value = source
+
+            def render_frames(self, indices):
+                return np.stack([np.full((2, 2, 3), self.value * 10 + i, dtype=np.uint8) for i in indices])
+
+        renderer = PipeRenderer(workers=4, batch_size=2, max_buffered_frames=2)
+        with patch("eleven_video.processing.frame_sink.FrameSink", return_value=sink), \
+             patch("eleven_video.processing.frame_sink.ZoomRenderer", FakeZoom):
+            renderer.render([1, 2, 3], None, [5, 3, 4], tmp_path / "out.mp4", (2, 2))
+
+        assert written == [10, 11, 12, 13, 14, 20, 21, 22, 30, 31, 32, 33]
+
+    def test_producer_error_aborts_render(self, tmp_path):
+        """A failing frame producer surfaces as VideoProcessingError."""
+        sink = MagicMock()
+        sink.__enter__ = MagicMock(return_value=sink)
+        sink.__exit__ = MagicMock(return_value=False)
+
+        renderer = PipeRenderer(workers=2, batch_size=1, max_buffered_frames=1)
+        with patch("eleven_video.processing.frame_sink.FrameSink", return_value=sink), \
+             patch("eleven_video.processing.frame_sink.ZoomRenderer", side_effect=OSError("bad image")):
+            with pytest.raises(VideoProcessingError, match="bad image"):
+                renderer.render(["a.png"] * 3, None, [4, 4, 4], tmp_path / "out.mp4", (2, 2))
+
+
+class TestPipeBackendSelection:
+    """compile_video(backend="pipe") dispatch."""
+
+    def test_pipe_backend_dispatch(self, tmp_path):
+        """backend="pipe" renders through PipeRenderer instead of moviepy."""
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_moviepy = MagicMock()
+
+        with patch("eleven_video.processing.video_handler.PipeRenderer") as mock_renderer:
+            compiler.compile_video(
+                [create_image(), create_image()], create_audio(duration_seconds=2.0),
+                tmp_path / "out.mp4", backend="pipe"
+            )
+
+        mock_renderer.return_value.render.assert_called_once()
+        assert mock_renderer.return_value.render.call_args.args[2] == [24, 24]
+        compiler._render_with_moviepy.assert_not_called()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestPipeRenderReal:
+    """Real renders through the ffmpeg binary."""
+
+    @pytest.mark.parametrize("pix_fmt", ["rgb24", "yuv420p"])
+    def test_pipe_render_produces_video(self, tmp_path, pix_fmt):
+        """
+        GIVEN two images and 2 seconds of audio
+        WHEN rendered through the pipe encoder
+        THEN the MP4 has every frame at the target size.
+        """
+        import imageio_ffmpeg
+
+        sources = [create_png_bytes((64, 36), (255, 0, 0)), create_png_bytes((64, 36), (0, 0, 255))]
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(create_silent_mp3_bytes(2.0))
+        output = tmp_path / "out.mp4"
+
+        frames = PipeRenderer(pix_fmt=pix_fmt, workers=2).render(
+            sources, str(audio_path), [24, 24], output, (160, 90)
+        )
+
+        assert frames == 48
+        count, _ = imageio_ffmpeg.count_frames_and_secs(str(output))
+        assert count == 48
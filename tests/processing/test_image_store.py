@@ -0,0 +1,150 @@
+"""
+Tests for the memory-mapped source image store.
+
+Related files:
+- eleven_video/processing/image_store.py: SourceImageStore implementation
+- eleven_video/processing/zoom.py: ZoomRenderer reading crop windows from store slices
+- eleven_video/processing/video_handler.py: moviepy and pipe backends
+"""
+import numpy as np
+import pytest
+from unittest.mock import patch
+from PIL import Image as PILImage
+
+from eleven_video.models.domain import Audio, Image
+from eleven_video.processing.image_store import SourceImageStore
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from eleven_video.processing.zoom import ZoomRenderer, zoom_base_size
+from tests.support.factories.media_factory import (
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+)
+
+
+@pytest.fixture
+def noisy_pngs(tmp_path):
+    """Three 96x54 noise images written as PNG files."""
+    rng = np.random.default_rng(7)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"image_{i:03d}.png"
+        PILImage.fromarray(rng.integers(0, 255, (54, 96, 3), dtype=np.uint8)).save(path)
+        paths.append(str(path))
+    return paths
+
+
+class TestStoreBuild:
+    """Decode-once, pre-scaled storage."""
+
+    def test_pixels_match_one_time_resize(self, tmp_path, noisy_pngs):
+        """
+        GIVEN three source images
+        WHEN the store is built at the zoom base size
+        THEN each slice equals a single LANCZOS resize of the decoded source.
+        """
+        size = zoom_base_size((160, 90))
+
+        with SourceImageStore.build(noisy_pngs, size, tmp_path / "store", workers=2) as store:
+            assert len(store) == 3
+            for i, path in enumerate(noisy_pngs):
+                with PILImage.open(path) as img:
+                    expected = np.asarray(img.convert("RGB").resize(size, PILImage.LANCZOS))
+                assert store[i].shape == (size[1], size[0], 3)
+                assert np.array_equal(store[i], expected)
+
+    def test_release_keeps_data_readable(self, tmp_path, noisy_pngs):
+        """Released pages are re-read from the file on the next access."""
+        with SourceImageStore.build(noisy_pngs, (160, 90), tmp_path / "store") as store:
+            before = np.array(store[1])
+            store.release(1)
+            assert np.array_equal(store[1], before)
+
+    def test_undecodable_source_raises_oserror(self, tmp_path):
+        """Bytes Pillow cannot read fail the build."""
+        with pytest.raises(OSError):
+            SourceImageStore.build([b"not an image"], (160, 90), tmp_path / "store")
+
+
+class TestZoomFromStore:
+    """ZoomRenderer reading windows from pre-scaled pixels."""
+
+    def test_store_slice_matches_decoded_base(self, tmp_path, noisy_pngs):
+        """
+        GIVEN the same pre-scaled pixels as a store slice and as a PIL image
+        WHEN both renderers produce every frame
+        THEN the store renderer holds no base copy and frames match within rounding.
+        """
+        target = (160, 90)
+        with SourceImageStore.build(noisy_pngs, zoom_base_size(target), tmp_path / "store") as store:
+            from_store = ZoomRenderer(store[0], target, 1.0, "out")
+            from_image = ZoomRenderer(PILImage.fromarray(np.array(store[0])), target, 1.0, "out")
+
+            assert from_store.base is None
+            assert np.shares_memory(from_store.pixels, store[0])
+            diff = np.abs(
+                from_store.render_frames(range(24)).astype(int) - from_image.render_frames(range(24))
+            )
+            assert diff.max() <= 1
+
+
+class TestCompilerUsesStore:
+    """Backends build the store in the scratch directory."""
+
+    def test_moviepy_clips_read_from_store(self, tmp_path, noisy_pngs):
+        """_create_image_clips with a store decodes nothing and yields output-size clips."""
+        compiler = FFmpegVideoCompiler()
+        with SourceImageStore.build(noisy_pngs, zoom_base_size((160, 90)), tmp_path / "store") as store, \
+             patch("eleven_video.processing.video_handler.ImageClip") as mock_image_clip:
+            clips = compiler._create_image_clips(noisy_pngs, 1.0, None, True, (160, 90), store=store)
+
+            mock_image_clip.assert_not_called()
+            assert [clip.size for clip in clips] == [(160, 90)] * 3
+            assert clips[1].get_frame(0.5).shape == (90, 160, 3)
+
+    def test_pipe_backend_passes_scratch_dir(self, tmp_path):
+        """The pipe backend hands PipeRenderer a scratch directory for the store."""
+        compiler = FFmpegVideoCompiler()
+        images = [Image(data=create_png_bytes(), mime_type="image/png")]
+        audio = Audio(data=b"audio", duration_seconds=1.0)
+
+        with patch("eleven_video.processing.video_handler.PipeRenderer") as mock_renderer:
+            compiler.compile_video(images, audio, tmp_path / "out.mp4", backend="pipe")
+
+        assert mock_renderer.return_value.render.call_args.kwargs["work_dir"].name == "sources"
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestStoreRenderReal:
+    """Real renders reading from the store."""
+
+    # Without zoom the pipe backend hands off to the static slideshow path
+    @pytest.mark.parametrize("backend,enable_zoom", [("moviepy", True), ("moviepy", False), ("pipe", True)])
+    def test_render_from_store(self, tmp_path, backend, enable_zoom):
+        """
+        GIVEN two solid-colour images and 2 seconds of audio
+        WHEN compiled on a store-backed backend
+        THEN every frame is written and each half shows its image's colour.
+        """
+        import imageio_ffmpeg
+
+        colors = [(255, 0, 0), (0, 0, 255)]
+        images = [Image(data=create_png_bytes((64, 36), c), mime_type="image/png") for c in colors]
+        audio = Audio(data=create_silent_mp3_bytes(2.0), duration_seconds=2.0)
+        output = tmp_path / "out.mp4"
+        updates = []
+
+        FFmpegVideoCompiler(profile="draft").compile_video(
+            images, audio, output, progress_callback=updates.append,
+            enable_zoom=enable_zoom, backend=backend
+        )
+
+        assert not any("Warning" in u for u in updates), updates
+        reader = imageio_ffmpeg.read_frames(str(output))
+        meta = next(reader)
+        frames = [np.frombuffer(f, dtype=np.uint8).reshape(1080, 1920, 3) for f in reader]
+        assert meta["size"] == (1920, 1080)
+        assert len(frames) == 30
+        assert frames[2][540, 960, 0] > 200 and frames[2][540, 960, 2] < 50
+        assert frames[-3][540, 960, 2] > 200 and frames[-3][540, 960, 0] < 50
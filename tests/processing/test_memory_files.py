@@ -0,0 +1,149 @@
+"""
+Tests for compiling from in-memory inputs instead of temp files.
+
+Related files:
+- eleven_video/processing/memory_files.py: MemoryFile, memory_files_supported
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler._stage_inputs
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eleven_video.models.domain import Resolution
+from eleven_video.processing.memory_files import MemoryFile, memory_files_supported
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+)
+
+requires_memory_files = pytest.mark.skipif(not memory_files_supported(), reason="memfd_create not available")
+
+
+@requires_memory_files
+class TestMemoryFile:
+    """Bytes readable by path without a file on disk."""
+
+    def test_path_reads_back_the_bytes(self):
+        with MemoryFile(b"narration", "audio.mp3") as memory_file:
+            with open(memory_file.path, "rb") as f:
+                assert f.read() == b"narration"
+            assert memory_file.size == 9
+
+    def test_other_process_opens_the_path(self):
+        """ffmpeg and pool workers are other processes; they open the same path."""
+        with MemoryFile(b"x" * 100_000, "image_000.png") as memory_file:
+            result = subprocess.run(
+                [sys.executable, "-c", f"print(len(open({memory_file.path!r}, 'rb').read()))"],
+                capture_output=True, text=True, check=True
+            )
+
+        assert result.stdout.strip() == "100000"
+
+    def test_close_releases_the_path(self):
+        memory_file = MemoryFile(b"data")
+        memory_file.close()
+        memory_file.close()
+
+        assert not os.path.exists(memory_file.path)
+
+
+class TestStagedInputs:
+    """FFmpegVideoCompiler keeps images and audio in memory during a compile."""
+
+    @requires_memory_files
+    def test_no_input_bytes_written_to_scratch(self, tmp_path):
+        """
+        GIVEN a compile through a scratch directory
+        WHEN the backend renders
+        THEN it reads images and audio from in-memory files and the scratch directory holds none of them.
+        """
+        compiler = FFmpegVideoCompiler(scratch_dir=tmp_path / "scratch")
+        seen = {}
+
+        def render(image_paths, audio_path, *args, **kwargs):
+            seen["inputs"] = [open(path, "rb").read() for path in [*image_paths, audio_path]]
+            seen["scratch"] = [p.name for p in kwargs["work_dir"].iterdir()]
+
+        compiler._render_with_filter_graph = MagicMock(side_effect=render)
+        images = [create_image(create_png_bytes(color=(i * 50, 0, 0))) for i in range(3)]
+        audio = create_audio()
+
+        compiler.compile_video(images, audio, tmp_path / "video.mp4", backend="ffmpeg")
+
+        assert seen["inputs"] == [image.data for image in images] + [audio.data]
+        assert seen["scratch"] == []
+
+    @requires_memory_files
+    def test_memory_files_closed_after_compile(self, tmp_path):
+        compiler = FFmpegVideoCompiler()
+        paths = []
+        compiler._render_with_filter_graph = MagicMock(
+            side_effect=lambda image_paths, audio_path, *args, **kwargs: paths.extend([*image_paths, audio_path])
+        )
+
+        compiler.compile_video([create_image()], create_audio(), tmp_path / "video.mp4", backend="ffmpeg")
+
+        assert paths and not any(os.path.exists(path) for path in paths)
+
+    def test_falls_back_to_temp_files(self, tmp_path):
+        """Without memfd support the inputs are written to the compile's temp directory."""
+        compiler = FFmpegVideoCompiler(scratch_dir=tmp_path / "scratch")
+        names = []
+        compiler._render_with_filter_graph = MagicMock(
+            side_effect=lambda image_paths, audio_path, *args, **kwargs: names.extend(
+                os.path.basename(path) for path in [*image_paths, audio_path]
+            )
+        )
+
+        with patch("eleven_video.processing.video_handler.memory_files_supported", return_value=False):
+            compiler.compile_video([create_image(), create_image()], create_audio(), tmp_path / "video.mp4",
+                                   backend="ffmpeg")
+
+        assert names == ["image_000.png", "image_001.png", "audio.mp3"]
+
+    @requires_memory_files
+    def test_scratch_estimate_leaves_out_inputs(self):
+        """Inputs held in memory take no scratch space."""
+        compiler = FFmpegVideoCompiler()
+        args = ([create_image(b"x" * 10**6)], create_audio(b"y" * 10**6, duration_seconds=1.0),
+                [("video.mp4", (1280, 720))], True, "ffmpeg")
+
+        in_memory = compiler._scratch_bytes(*args)
+        with patch("eleven_video.processing.video_handler.memory_files_supported", return_value=False):
+            on_disk = compiler._scratch_bytes(*args)
+
+        assert on_disk - in_memory >= 2 * 10**6
+
+
+@pytest.mark.integration
+@requires_memory_files
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestMemoryInputsReal:
+    """Real renders whose ffmpeg processes and pool workers read the in-memory inputs."""
+
+    @pytest.mark.parametrize("backend", ["ffmpeg", "parallel"])
+    def test_compile_from_memory(self, tmp_path, backend):
+        """
+        GIVEN two images and two seconds of audio
+        WHEN compiled on an ffmpeg backend
+        THEN the video has every frame of the timeline.
+        """
+        import imageio_ffmpeg
+
+        images = [create_image(create_png_bytes((64, 36), color)) for color in [(255, 0, 0), (0, 0, 255)]]
+        audio = create_audio(create_silent_mp3_bytes(2.0), duration_seconds=2.0)
+        output = tmp_path / "video.mp4"
+
+        FFmpegVideoCompiler(thumbnails=False).compile_video(
+            images, audio, output, resolution=Resolution.HD_720P, backend=backend
+        )
+
+        frames, _ = imageio_ffmpeg.count_frames_and_secs(str(output))
+        assert frames == 48
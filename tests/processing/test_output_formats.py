@@ -0,0 +1,204 @@
+"""
+Tests for progressive output formats (fragmented MP4, HLS, stdout).
+
+Related files:
+- eleven_video/processing/output_formats.py: muxer_args, output_size
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(output_format=...)
+- eleven_video/processing/frame_sink.py: FrameSink(output_format=...)
+"""
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eleven_video.exceptions.custom_errors import ValidationError
+from eleven_video.models.domain import Resolution
+from eleven_video.processing.frame_sink import FrameSink
+from eleven_video.processing.output_formats import muxer_args, output_size
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import create_audio, create_image, ffmpeg_available
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestMuxerArgs:
+    """Container options appended to every ffmpeg writer."""
+
+    def test_mp4_keeps_faststart(self):
+        """The default format is unchanged: a faststart MP4."""
+        assert muxer_args("mp4", Path("out.mp4")) == ["-movflags", "+faststart", "out.mp4"]
+
+    def test_fmp4_to_stdout(self):
+        """
+        GIVEN fragmented MP4 to "-"
+        WHEN muxer args are built
+        THEN fragments start on forced keyframes and ffmpeg writes to pipe:1.
+        """
+        args = muxer_args("fmp4", "-")
+
+        assert args[-1] == "pipe:1"
+        assert "+frag_keyframe+empty_moov+default_base_moof" in args
+        assert args[args.index("-f") + 1] == "mp4"
+        assert "-force_key_frames" in args
+
+    def test_hls_writes_event_playlist_and_segments(self, tmp_path):
+        """HLS writes an event playlist with segments named after it."""
+        args = muxer_args("hls", tmp_path / "video.m3u8")
+
+        assert args[args.index("-hls_playlist_type") + 1] == "event"
+        assert args[args.index("-hls_segment_filename") + 1] == str(tmp_path / "video_%05d.ts")
+        assert args[-1] == str(tmp_path / "video.m3u8")
+
+    def test_stream_copy_skips_keyframe_forcing(self):
+        """Remuxes copy the video stream, so no keyframes are forced."""
+        assert "-force_key_frames" not in muxer_args("hls", Path("video.m3u8"), keyframes=False)
+
+    def test_hls_size_includes_segments(self, tmp_path):
+        """The size of an HLS output is the playlist plus its segments."""
+        (tmp_path / "video.m3u8").write_bytes(b"x" * 10)
+        (tmp_path / "video_00000.ts").write_bytes(b"x" * 100)
+        (tmp_path / "other_00000.ts").write_bytes(b"x" * 1000)
+
+        assert output_size("hls", tmp_path / "video.m3u8") == 110
+        assert output_size("fmp4", Path("-")) == 0
+
+
+class TestCompilerOutputFormat:
+    """compile_video with a progressive output format."""
+
+    def test_unknown_format_rejected(self):
+        """An unknown output format fails fast."""
+        with pytest.raises(ValidationError, match="mp4, fmp4, hls"):
+            FFmpegVideoCompiler(output_format="webm")
+
+    def test_stdout_requires_fragmented_mp4(self, tmp_path):
+        """A faststart MP4 needs a seekable file, so stdout is fmp4 only."""
+        with pytest.raises(ValidationError, match="fmp4"):
+            FFmpegVideoCompiler().compile_video([create_image()], create_audio(), Path("-"))
+
+    def test_stdout_ladder_rejected(self):
+        """Only one output can go to stdout."""
+        with pytest.raises(ValidationError, match="ladder"):
+            FFmpegVideoCompiler(output_format="fmp4").compile_video(
+                [create_image()], create_audio(), Path("-"),
+                resolution=[Resolution.HD_720P, Resolution.SQUARE]
+            )
+
+    def test_ffmpeg_backend_writes_format_directly(self, tmp_path):
+        """
+        GIVEN output_format="hls" on the ffmpeg backend
+        WHEN compile_video runs
+        THEN the filter-graph render writes the playlist itself (progressively).
+        """
+        output = tmp_path / "video.m3u8"
+        with patch("eleven_video.processing.video_handler.FilterGraphRenderer") as mock_renderer:
+            FFmpegVideoCompiler(output_format="hls").compile_video(
+                [create_image()], create_audio(duration_seconds=1.0), output, backend="ffmpeg"
+            )
+
+        call = mock_renderer.return_value.render.call_args
+        assert call.args[3] == output
+        assert call.kwargs["output_format"] == "hls"
+
+    def test_transcode_renders_mp4_then_muxes_format(self, tmp_path):
+        """In transcode mode the render is a plain MP4 and the final mux writes the format."""
+        output = tmp_path / "video.m3u8"
+        compiler = FFmpegVideoCompiler(audio_mode="transcode", output_format="hls")
+        compiler._render_with_filter_graph = MagicMock()
+
+        with patch("eleven_video.processing.video_handler.AudioTranscode"), \
+             patch("eleven_video.processing.video_handler.mux_audio") as mock_mux:
+            compiler.compile_video([create_image()], create_audio(), output, backend="ffmpeg")
+
+        render_call = compiler._render_with_filter_graph.call_args
+        assert render_call.args[3].suffix == ".mp4"
+        assert render_call.kwargs["output_format"] == "mp4"
+        assert mock_mux.call_args.args[2] == output
+        assert mock_mux.call_args.kwargs["output_format"] == "hls"
+
+    def test_moviepy_remuxes_into_format(self, tmp_path):
+        """moviepy writes a regular MP4 (with its AAC audio), which is then remuxed unchanged."""
+        output = tmp_path / "video.mp4"
+        compiler = FFmpegVideoCompiler(output_format="fmp4")
+        compiler._create_image_clips = MagicMock(return_value=[MagicMock()])
+        final_clip = MagicMock()
+
+        with patch("eleven_video.processing.video_handler.concatenate_videoclips", return_value=final_clip), \
+             patch("eleven_video.processing.video_handler.AudioFileClip"), \
+             patch("eleven_video.processing.video_handler.mux_audio") as mock_mux:
+            compiler.compile_video([create_image()], create_audio(), output)
+
+        written = final_clip.with_audio.return_value.write_videofile.call_args.args[0]
+        assert written != str(output)
+        assert mock_mux.call_args.args == (Path(written), None, output)
+        assert mock_mux.call_args.kwargs["output_format"] == "fmp4"
+
+
+def _solid_frames(count, size=(160, 90)):
+    w, h = size
+    return [np.full((h, w, 3), (i * 7) % 255, dtype=np.uint8) for i in range(count)]
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestProgressiveOutputReal:
+    """Real progressive writes through the ffmpeg binary."""
+
+    def test_hls_segments_appear_before_render_finishes(self, tmp_path):
+        """
+        GIVEN a FrameSink writing HLS
+        WHEN a few seconds of frames have been written but the sink is still open
+        THEN the playlist already lists a finished segment, and the closed playlist ends the event.
+        """
+        playlist = tmp_path / "video.m3u8"
+        sink = FrameSink(playlist, (160, 90), fps=24, output_format="hls").open()
+        try:
+            for frame in _solid_frames(24 * 5):
+                sink.write(sink.pack(frame))
+            sink._process.stdin.flush()
+            deadline = time.time() + 20
+            while time.time() < deadline and "#EXTINF" not in (
+                playlist.read_text() if playlist.exists() else ""
+            ):
+                time.sleep(0.1)
+            assert "#EXTINF" in playlist.read_text()
+            assert "#EXT-X-ENDLIST" not in playlist.read_text()
+        finally:
+            sink.close()
+
+        assert "#EXT-X-ENDLIST" in playlist.read_text()
+        assert len(list(tmp_path.glob("video_*.ts"))) >= 2
+
+    def test_fmp4_streams_to_stdout(self, tmp_path):
+        """
+        GIVEN a compile to "-" with output_format="fmp4"
+        WHEN it runs in a subprocess
+        THEN stdout carries a fragmented MP4 that ffmpeg can decode.
+        """
+        script = (
+            "from pathlib import Path\n"
+            "from eleven_video.models.domain import Audio, Image\n"
+            "from eleven_video.processing.video_handler import FFmpegVideoCompiler\n"
+            "from tests.support.factories.media_factory import create_png_bytes, create_silent_mp3_bytes\n"
+            "images = [Image(data=create_png_bytes((64, 36), c), mime_type='image/png') "
+            "for c in [(255, 0, 0), (0, 0, 255)]]\n"
+            "audio = Audio(data=create_silent_mp3_bytes(2.0), duration_seconds=2.0)\n"
+            "FFmpegVideoCompiler(profile='draft', output_format='fmp4').compile_video("
+            "images, audio, Path('-'), backend='pipe')\n"
+        )
+        env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, env=env, timeout=300)
+
+        assert result.returncode == 0, result.stderr.decode()
+        assert result.stdout[4:8] == b"ftyp"
+        assert b"moof" in result.stdout
+        streamed = tmp_path / "streamed.mp4"
+        streamed.write_bytes(result.stdout)
+        import imageio_ffmpeg
+        frames, _ = imageio_ffmpeg.count_frames_and_secs(str(streamed))
+        assert frames == 30  # draft profile: 15 fps
@@ -0,0 +1,171 @@
+"""
+Tests for parallel per-segment encoding with stream-copy concatenation.
+
+Related files:
+- eleven_video/processing/segments.py: ParallelSegmentRenderer implementation
+- eleven_video/processing/video_handler.py: compile_video(backend="parallel")
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.processing.ffmpeg_backend import FilterGraphRenderer
+from eleven_video.processing.segments import (
+    ParallelSegmentRenderer,
+    SegmentJob,
+    concat_segments,
+    render_segment,
+    write_concat_list,
+)
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+)
+
+
+class TestSegmentJobs:
+    """Job construction."""
+
+    def test_one_job_per_non_empty_segment(self, tmp_path):
+        """
+        GIVEN three images where one has no frames
+        WHEN jobs are built
+        THEN only the two non-empty segments get jobs, keeping their image index.
+        """
+        renderer = ParallelSegmentRenderer(max_workers=2)
+        jobs = renderer.build_jobs(["a.png", "b.png", "c.png"], [24, 0, 24], (1280, 720), tmp_path)
+
+        assert [job.index for job in jobs] == [0, 2]
+        assert jobs[1].output_path.endswith("segment_0002.mp4")
+
+    def test_encoder_args_identical_across_segments(self, tmp_path):
+        """Every segment uses the same encoder parameters so they can be stream-copied."""
+        renderer = ParallelSegmentRenderer(max_workers=4)
+        jobs = renderer.build_jobs(["a.png", "b.png"], [24, 24], (1280, 720), tmp_path)
+
+        assert jobs[0].encoder_args == jobs[1].encoder_args
+        assert "libx264" in jobs[0].encoder_args
+
+    def test_threads_split_across_workers(self, tmp_path):
+        """ffmpeg thread count is the core count divided by the worker count."""
+        with patch("eleven_video.processing.segments.os.cpu_count", return_value=16):
+            renderer = ParallelSegmentRenderer(max_workers=4)
+            jobs = renderer.build_jobs(["a.png"] * 8, [24] * 8, (1280, 720), tmp_path)
+
+        args = jobs[0].encoder_args
+        assert args[args.index("-threads") + 1] == "4"
+
+    def test_zoom_direction_follows_image_index(self, tmp_path):
+        """Segment filter chains alternate zoom in/out by image index."""
+        renderer = ParallelSegmentRenderer()
+        jobs = renderer.build_jobs(["a.png", "b.png"], [24, 24], (1280, 720), tmp_path)
+
+        assert "z='1.000000+" in jobs[0].filter_chain
+        assert "z='1.080000+-" in jobs[1].filter_chain
+
+
+class TestConcat:
+    """Concat demuxer list and stream-copy join."""
+
+    def test_concat_list_escapes_quotes(self, tmp_path):
+        """Single quotes in paths are escaped for the concat demuxer."""
+        list_path = write_concat_list([str(tmp_path / "it's.mp4")], tmp_path / "list.txt")
+
+        assert "it'\\''s.mp4'" in list_path.read_text()
+
+    def test_concat_uses_stream_copy(self, tmp_path):
+        """The join copies video and encodes only the audio."""
+        with patch("eleven_video.processing.segments.run_ffmpeg") as mock_run:
+            concat_segments(tmp_path / "list.txt", "audio.mp3", tmp_path / "out.mp4")
+
+        args = mock_run.call_args.args[0]
+        assert args[args.index("-c:v") + 1] == "copy"
+        assert args[args.index("-f") + 1] == "concat"
+
+    def test_render_segment_limits_frames(self, tmp_path):
+        """Each segment encodes exactly its frame count with no audio."""
+        job = SegmentJob(0, "a.png", 48, "[0:v]null[v]", str(tmp_path / "s.mp4"), ["-c:v", "libx264"])
+        with patch("eleven_video.processing.segments.run_ffmpeg") as mock_run:
+            render_segment(job)
+
+        args = mock_run.call_args.args[0]
+        assert args[args.index("-frames:v") + 1] == "48"
+        assert "-an" in args
+
+    def test_render_without_frames_raises(self, tmp_path):
+        """A timeline with no frames at all cannot be rendered."""
+        with pytest.raises(VideoProcessingError):
+            ParallelSegmentRenderer().render(["a.png"], "a.mp3", [0], tmp_path / "o.mp4", (1280, 720), tmp_path)
+
+
+class TestParallelBackendSelection:
+    """compile_video(backend="parallel") dispatch."""
+
+    def test_parallel_backend_dispatch(self, tmp_path):
+        """
+        GIVEN backend="parallel"
+        WHEN compile_video runs
+        THEN the parallel segment renderer is used with a work dir inside the temp dir.
+        """
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_moviepy = MagicMock()
+
+        with patch("eleven_video.processing.video_handler.ParallelSegmentRenderer") as mock_renderer:
+            compiler.compile_video(
+                [create_image(), create_image()], create_audio(duration_seconds=2.0),
+                tmp_path / "out.mp4", backend="parallel"
+            )
+
+        render_args = mock_renderer.return_value.render.call_args.args
+        assert render_args[2] == [24, 24]
+        assert render_args[5].name == "segments"
+        compiler._render_with_moviepy.assert_not_called()
+
+    def test_parallel_backend_falls_back_to_moviepy(self, tmp_path):
+        """A failed parallel render falls back to moviepy with a warning."""
+        compiler = FFmpegVideoCompiler()
+        compiler._render_parallel_segments = MagicMock(side_effect=VideoProcessingError("boom"))
+        compiler._render_with_moviepy = MagicMock()
+        updates = []
+
+        compiler.compile_video(
+            [create_image()], create_audio(), tmp_path / "out.mp4",
+            progress_callback=updates.append, backend="parallel"
+        )
+
+        compiler._render_with_moviepy.assert_called_once()
+        assert any("parallel backend failed" in u for u in updates)
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestParallelRenderReal:
+    """Real parallel renders through the ffmpeg binary."""
+
+    def test_segments_join_without_reencode(self, tmp_path):
+        """
+        GIVEN three images and 3 seconds of audio
+        WHEN rendered in parallel segments
+        THEN the joined MP4 holds every frame of every segment.
+        """
+        import imageio_ffmpeg
+
+        image_paths = []
+        for i, color in enumerate([(255, 0, 0), (0, 255, 0), (0, 0, 255)]):
+            path = tmp_path / f"image_{i:03d}.png"
+            path.write_bytes(create_png_bytes((64, 36), color))
+            image_paths.append(str(path))
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(create_silent_mp3_bytes(3.0))
+        output = tmp_path / "out.mp4"
+
+        renderer = ParallelSegmentRenderer(FilterGraphRenderer(), max_workers=3)
+        renderer.render(image_paths, str(audio_path), [24, 24, 24], output, (160, 90), tmp_path / "segments")
+
+        frames, _ = imageio_ffmpeg.count_frames_and_secs(str(output))
+        assert frames == 72
+        assert len(list((tmp_path / "segments").glob("segment_*.mp4"))) == 3
@@ -0,0 +1,180 @@
+"""
+Tests for named render profiles (draft, standard, archival).
+
+Related files:
+- eleven_video/processing/profiles.py: RenderProfile, get_render_profile
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(profile=...)
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+from PIL import Image as PILImage
+
+from eleven_video.exceptions.custom_errors import ValidationError
+from eleven_video.models.domain import Resolution
+from eleven_video.processing.profiles import (
+    PREVIEW_PROFILE,
+    RENDER_PROFILES,
+    get_render_profile,
+    proxy_resolution,
+)
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+)
+
+
+class TestProfileLookup:
+    """Profile names and settings."""
+
+    def test_default_profile_is_standard(self):
+        """No name selects the standard profile (previous fixed output: 24 fps, x264 defaults)."""
+        profile = get_render_profile()
+
+        assert profile.name == "standard"
+        assert profile.fps == 24
+        assert profile.x264_args() == ["-preset", "medium", "-crf", "23"]
+
+    def test_lookup_is_case_insensitive(self):
+        """Profile names are matched case-insensitively."""
+        assert get_render_profile(" Draft ").name == "draft"
+
+    def test_unknown_profile_raises(self):
+        """Unknown names raise ValidationError listing the options."""
+        with pytest.raises(ValidationError, match="draft, standard, archival"):
+            get_render_profile("turbo")
+
+    def test_profiles_ordered_by_speed(self):
+        """
+        GIVEN the built-in profiles
+        WHEN their settings are compared
+        THEN draft is cheapest (fewest frames, highest CRF) and archival is best quality.
+        """
+        draft, standard, archival = (RENDER_PROFILES[n] for n in ("draft", "standard", "archival"))
+
+        assert draft.fps < standard.fps <= archival.fps
+        assert draft.crf > standard.crf > archival.crf
+        assert draft.pil_resample == PILImage.BILINEAR
+        assert archival.pil_resample == PILImage.LANCZOS
+
+    def test_threads_only_passed_when_set(self):
+        """threads=0 leaves the thread count to the encoder."""
+        from dataclasses import replace
+
+        profile = replace(get_render_profile("draft"), threads=3)
+
+        assert profile.x264_args()[-2:] == ["-threads", "3"]
+        assert "-threads" not in get_render_profile("draft").x264_args()
+
+
+class TestCompilerProfiles:
+    """FFmpegVideoCompiler honours the selected profile."""
+
+    def test_unknown_profile_rejected_at_construction(self):
+        """An unknown profile fails fast."""
+        with pytest.raises(ValidationError):
+            FFmpegVideoCompiler(profile="turbo")
+
+    def test_profile_fps_sets_frame_counts(self, tmp_path):
+        """
+        GIVEN the draft profile (15 fps)
+        WHEN compiling two images over 2 seconds on the ffmpeg backend
+        THEN each segment gets 15 frames.
+        """
+        compiler = FFmpegVideoCompiler(profile="draft")
+
+        with patch("eleven_video.processing.video_handler.FilterGraphRenderer") as mock_renderer:
+            compiler.compile_video(
+                [create_image(), create_image()], create_audio(duration_seconds=2.0),
+                tmp_path / "out.mp4", backend="ffmpeg"
+            )
+
+        assert mock_renderer.call_args.kwargs["fps"] == 15
+        assert mock_renderer.call_args.kwargs["encoder_options"] == ["-preset", "ultrafast", "-crf", "28"]
+        assert mock_renderer.return_value.render.call_args.args[2] == [15, 15]
+
+    def test_moviepy_write_uses_profile_encoder_settings(self, tmp_path):
+        """The moviepy path passes fps, preset and CRF to write_videofile."""
+        compiler = FFmpegVideoCompiler(profile="archival")
+        compiler._create_image_clips = MagicMock(return_value=[MagicMock()])
+        final_clip = MagicMock()
+        final_clip.with_audio.return_value = final_clip
+
+        with patch("eleven_video.processing.video_handler.concatenate_videoclips", return_value=final_clip), \
+             patch("eleven_video.processing.video_handler.AudioFileClip"):
+            compiler.compile_video([create_image()], create_audio(), tmp_path / "out.mp4")
+
+        kwargs = final_clip.write_videofile.call_args.kwargs
+        assert kwargs["fps"] == 30
+        assert kwargs["preset"] == "slow"
+        assert kwargs["ffmpeg_params"] == ["-crf", "18"]
+
+
+class TestPreviewProxy:
+    """Low-resolution proxy renders (compile_preview)."""
+
+    @pytest.mark.parametrize("full,proxy", [
+        ((1920, 1080), (640, 360)),
+        ((1080, 1920), (360, 640)),
+        ((1080, 1080), (360, 360)),
+        ((1280, 720), (640, 360)),
+    ])
+    def test_proxy_keeps_aspect_with_360_short_side(self, full, proxy):
+        """The proxy's shorter side is 360 px for every output resolution."""
+        assert proxy_resolution(full) == proxy
+
+    def test_preview_profile_is_cheapest(self):
+        """The preview profile is 12 fps with no canvas oversampling."""
+        assert PREVIEW_PROFILE.fps == 12
+        assert PREVIEW_PROFILE.oversample == 1
+        assert PREVIEW_PROFILE.preset == "ultrafast"
+        assert "preview" not in RENDER_PROFILES
+
+    def test_preview_renders_proxy_on_ffmpeg_backend(self, tmp_path):
+        """
+        GIVEN a standard-profile compiler and a portrait video
+        WHEN compile_preview runs
+        THEN the filter graph renders 360x640 at 12 fps without oversampling.
+        """
+        compiler = FFmpegVideoCompiler()
+
+        with patch("eleven_video.processing.video_handler.FilterGraphRenderer") as mock_renderer:
+            video = compiler.compile_preview(
+                [create_image(), create_image()], create_audio(duration_seconds=2.0),
+                tmp_path / "preview.mp4", resolution=Resolution.PORTRAIT
+            )
+
+        kwargs = mock_renderer.call_args.kwargs
+        assert kwargs["fps"] == 12
+        assert kwargs["oversample"] == 1
+        render_args = mock_renderer.return_value.render.call_args.args
+        assert render_args[2] == [12, 12]
+        assert render_args[4] == (360, 640)
+        assert video.resolution == (360, 640)
+        # The compiler's own profile is untouched
+        assert compiler.profile.name == "standard"
+
+    @pytest.mark.integration
+    @pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+    def test_preview_real_render(self, tmp_path):
+        """A real proxy render has the proxy size and 12 fps frame count."""
+        import imageio_ffmpeg
+        from eleven_video.models.domain import Audio, Image
+
+        images = [Image(data=create_png_bytes((320, 180), c), mime_type="image/png")
+                  for c in [(255, 0, 0), (0, 0, 255)]]
+        audio = Audio(data=create_silent_mp3_bytes(2.0), duration_seconds=2.0)
+        output = tmp_path / "preview.mp4"
+        updates = []
+
+        FFmpegVideoCompiler().compile_preview(images, audio, output, progress_callback=updates.append)
+
+        reader = imageio_ffmpeg.read_frames(str(output))
+        meta = next(reader)
+        frames = sum(1 for _ in reader)
+        assert meta["size"] == (640, 360)
+        assert frames == 24
+        assert not any("Warning" in u for u in updates)
@@ -0,0 +1,198 @@
+"""
+Tests for single-pass multi-resolution output (resolution ladders).
+
+Related files:
+- eleven_video/processing/ffmpeg_backend.py: ladder_canvas, split_renditions, FilterGraphRenderer.render_ladder
+- eleven_video/processing/video_handler.py: compile_video(resolution=[...]), rendition_path
+"""
+from pathlib import Path
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eleven_video.exceptions.custom_errors import ValidationError, VideoProcessingError
+from eleven_video.models.domain import Audio, Image, Resolution
+from eleven_video.processing.ffmpeg_backend import FilterGraphRenderer, ladder_canvas, split_renditions
+from eleven_video.processing.video_handler import FFmpegVideoCompiler, rendition_path
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+)
+
+LADDER = [Resolution.HD_1080P, Resolution.HD_720P, Resolution.SQUARE]
+
+
+class TestLadderGraph:
+    """Split-and-scale filter construction."""
+
+    def test_canvas_covers_every_rendition(self):
+        """Landscape plus square renders on the widest width and tallest height."""
+        assert ladder_canvas([(1920, 1080), (1280, 720)]) == (1920, 1080)
+        assert ladder_canvas([(1920, 1080), (1080, 1920)]) == (1920, 1920)
+
+    def test_split_scales_all_but_canvas_size(self):
+        """
+        GIVEN a ladder whose first rendition matches the canvas
+        WHEN the split filter is built
+        THEN it is passed through unscaled and the others are rescaled.
+        """
+        text, labels = split_renditions("vout", [(1920, 1080), (1280, 720)], (1920, 1080))
+
+        assert text.split(";\n") == [
+            "[vout]split=2[l0][l1]",
+            "[l1]scale=1280:720,setsar=1[r1]",
+        ]
+        assert labels == ["l0", "r1"]
+
+    def test_single_rendition_needs_no_split(self):
+        """One rendition at the canvas size maps the graph output directly."""
+        assert split_renditions("vout", [(1280, 720)], (1280, 720)) == ("", ["vout"])
+
+    def test_render_ladder_command_has_one_output_per_rendition(self, tmp_path):
+        """
+        GIVEN two images and a three-rung ladder
+        WHEN render_ladder is called
+        THEN one ffmpeg run decodes each input once and writes three outputs.
+        """
+        image_paths = [str(tmp_path / "image_000.png"), str(tmp_path / "image_001.png")]
+        renditions = [(tmp_path / f"out{i}.mp4", res) for i, res in enumerate([(1920, 1080), (1280, 720), (1080, 1080)])]
+
+        with patch("eleven_video.processing.ffmpeg_backend.run_ffmpeg") as mock_run:
+            FilterGraphRenderer().render_ladder(image_paths, "audio.mp3", [24, 24], renditions)
+
+        mock_run.assert_called_once()
+        args = mock_run.call_args.args[0]
+        assert args.count("-i") == 3
+        assert [args[i + 1] for i, a in enumerate(args) if a == "-map" and args[i + 1].startswith("[")] == [
+            "[l0]", "[r1]", "[r2]"
+        ]
+        assert all(str(path) in args for path, _ in renditions)
+        graph = (tmp_path / "filter_graph.txt").read_text()
+        assert "s=1920x1080" in graph
+        assert "split=3" in graph
+
+
+class TestCompileLadder:
+    """compile_video with a list of resolutions."""
+
+    def test_rendition_paths(self):
+        """Ladder outputs are named after the requested output with the size appended."""
+        assert rendition_path(Path("out/video.mp4"), (1280, 720)) == Path("out/video_1280x720.mp4")
+
+    def test_ffmpeg_backend_renders_ladder_in_one_pass(self, tmp_path):
+        """
+        GIVEN three resolutions on the ffmpeg backend
+        WHEN compile_video runs
+        THEN one ladder render produces them all and one Video per resolution is returned.
+        """
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_filter_graph = MagicMock()
+        updates = []
+
+        with patch("eleven_video.processing.video_handler.FilterGraphRenderer") as mock_renderer:
+            videos = compiler.compile_video(
+                [create_image(), create_image()], create_audio(duration_seconds=4.0),
+                tmp_path / "video.mp4", progress_callback=updates.append,
+                resolution=LADDER, backend="ffmpeg"
+            )
+
+        mock_renderer.return_value.render_ladder.assert_called_once()
+        compiler._render_with_filter_graph.assert_not_called()
+        renditions = mock_renderer.return_value.render_ladder.call_args.args[3]
+        assert [res for _, res in renditions] == [(1920, 1080), (1280, 720), (1080, 1080)]
+        assert [v.file_path.name for v in videos] == [
+            "video_1920x1080.mp4", "video_1280x720.mp4", "video_1080x1080.mp4"
+        ]
+        assert [v.resolution for v in videos] == [(1920, 1080), (1280, 720), (1080, 1080)]
+        assert "Compiling video (3 resolutions in one pass)..." in updates
+
+    def test_other_backends_render_each_resolution(self, tmp_path):
+        """The moviepy backend renders every rung from the same staged inputs."""
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_moviepy = MagicMock()
+        compiler._stage_inputs = MagicMock(wraps=compiler._stage_inputs)
+
+        videos = compiler.compile_video(
+            [create_image()], create_audio(), tmp_path / "video.mp4", resolution=LADDER[:2]
+        )
+
+        assert compiler._stage_inputs.call_count == 1
+        calls = compiler._render_with_moviepy.call_args_list
+        assert [c.kwargs["target_resolution"] for c in calls] == [(1920, 1080), (1280, 720)]
+        assert [c.args[3] for c in calls] == [v.file_path for v in videos]
+
+    def test_failed_ladder_renders_each_resolution(self, tmp_path):
+        """If the single-pass graph fails, each resolution is rendered on its own."""
+        compiler = FFmpegVideoCompiler()
+        compiler._render_ladder = MagicMock(side_effect=VideoProcessingError("boom"))
+        compiler._render_with_filter_graph = MagicMock()
+        updates = []
+
+        compiler.compile_video(
+            [create_image()], create_audio(), tmp_path / "video.mp4",
+            progress_callback=updates.append, resolution=LADDER[:2], backend="ffmpeg"
+        )
+
+        assert compiler._render_with_filter_graph.call_count == 2
+        assert any("Warning: single-pass ladder failed" in u for u in updates)
+
+    def test_single_resolution_still_returns_video(self, tmp_path):
+        """A plain Resolution keeps returning one Video at the given path."""
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_moviepy = MagicMock()
+
+        video = compiler.compile_video(
+            [create_image()], create_audio(), tmp_path / "video.mp4", resolution=Resolution.HD_720P
+        )
+
+        assert video.file_path == tmp_path / "video.mp4"
+        assert video.resolution == (1280, 720)
+
+    @pytest.mark.parametrize("ladder,message", [
+        ([], "at least one resolution"),
+        ([Resolution.HD_720P, Resolution.HD_720P], "duplicate"),
+    ])
+    def test_invalid_ladder_rejected(self, tmp_path, ladder, message):
+        """Empty ladders and repeated resolutions fail validation."""
+        with pytest.raises(ValidationError, match=message):
+            FFmpegVideoCompiler().compile_video(
+                [create_image()], create_audio(), tmp_path / "video.mp4", resolution=ladder
+            )
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestLadderRenderReal:
+    """Real single-pass ladder render."""
+
+    def test_ladder_outputs_each_resolution(self, tmp_path):
+        """
+        GIVEN a two-image video rendered as a 720p + square ladder
+        WHEN compiled on the ffmpeg backend
+        THEN each output has its own size, every frame, and the colours of its images.
+        """
+        import imageio_ffmpeg
+
+        colors = [(255, 0, 0), (0, 0, 255)]
+        images = [Image(data=create_png_bytes((64, 36), c), mime_type="image/png") for c in colors]
+        audio = Audio(data=create_silent_mp3_bytes(2.0), duration_seconds=2.0)
+        updates = []
+
+        videos = FFmpegVideoCompiler(profile="draft").compile_video(
+            images, audio, tmp_path / "video.mp4", progress_callback=updates.append,
+            resolution=[Resolution.HD_720P, Resolution.SQUARE], backend="ffmpeg"
+        )
+
+        assert not any("Warning" in u for u in updates), updates
+        for video, (w, h) in zip(videos, [(1280, 720), (1080, 1080)]):
+            reader = imageio_ffmpeg.read_frames(str(video.file_path))
+            meta = next(reader)
+            frames = [np.frombuffer(f, dtype=np.uint8).reshape(h, w, 3) for f in reader]
+            assert tuple(meta["size"]) == (w, h)
+            assert len(frames) == 30
+            assert frames[2][h // 2, w // 2, 0] > 200 and frames[2][h // 2, w // 2, 2] < 50
+            assert frames[-3][h // 2, w // 2, 2] > 200 and frames[-3][h // 2, w // 2, 0] < 50
@@ -0,0 +1,126 @@
+"""
+Tests for the configurable scratch directory and space reservation.
+
+Related files:
+- eleven_video/processing/scratch.py: ScratchSpace, ScratchReservation
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(scratch_dir=...)
+"""
+import json
+import os
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.processing.scratch import RESERVATIONS_DIR, ScratchSpace, format_bytes
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import create_audio, create_image
+
+GB = 1024 ** 3
+
+
+class TestScratchSpace:
+    """Reservation files and the free-space check."""
+
+    def test_reserve_writes_claim_and_release_removes_it(self, tmp_path):
+        """
+        GIVEN a scratch root with room for the render
+        WHEN space is reserved and then released
+        THEN a claim with this process's pid exists only while reserved.
+        """
+        scratch = ScratchSpace(tmp_path)
+
+        with scratch.reserve(1000) as reservation:
+            claim = json.loads(reservation.path.read_text())
+            assert claim == {"pid": os.getpid(), "bytes": 1000}
+            assert scratch.reserved_bytes() == 1000
+
+        assert not reservation.path.exists()
+        assert scratch.reserved_bytes() == 0
+
+    def test_insufficient_space_fails_before_claiming(self, tmp_path):
+        """A render larger than the free space is refused with both sizes in the message."""
+        scratch = ScratchSpace(tmp_path)
+
+        with patch.object(ScratchSpace, "free_bytes", return_value=GB):
+            with pytest.raises(VideoProcessingError, match="needs about 2.0 GB but 1.0 GB is available"):
+                scratch.reserve(2 * GB)
+
+        assert list((tmp_path / RESERVATIONS_DIR).glob("*.json")) == []
+
+    def test_live_claims_count_and_stale_claims_are_dropped(self, tmp_path):
+        """
+        GIVEN a claim by a running render and one left by a dead process
+        WHEN another render reserves space
+        THEN only the running render's claim reduces the space available.
+        """
+        reservations = tmp_path / RESERVATIONS_DIR
+        reservations.mkdir()
+        (reservations / "live.json").write_text(json.dumps({"pid": os.getppid(), "bytes": GB}))
+        (reservations / "stale.json").write_text(json.dumps({"pid": 2 ** 22 + 1, "bytes": 5 * GB}))
+        scratch = ScratchSpace(tmp_path)
+
+        with patch.object(ScratchSpace, "free_bytes", return_value=3 * GB):
+            scratch.reserve(2 * GB).release()
+            with pytest.raises(VideoProcessingError, match="2.0 GB is available"):
+                scratch.reserve(2 * GB + 1)
+
+        assert not (reservations / "stale.json").exists()
+
+    def test_work_dir_is_created_under_root(self, tmp_path):
+        with ScratchSpace(tmp_path).work_dir() as work_dir:
+            assert os.path.dirname(work_dir) == str(tmp_path)
+
+    @pytest.mark.parametrize("size,text", [(512, "512 B"), (1536, "1.5 KB"), (3 * GB, "3.0 GB")])
+    def test_format_bytes(self, size, text):
+        assert format_bytes(size) == text
+
+
+class TestCompilerScratch:
+    """FFmpegVideoCompiler(scratch_dir=...)."""
+
+    def test_compile_reserves_and_works_in_scratch_dir(self, tmp_path):
+        """
+        GIVEN a compiler with a scratch directory
+        WHEN a video is compiled
+        THEN the render works under it, the reservation is reported and released afterwards.
+        """
+        scratch_dir = tmp_path / "scratch"
+        compiler = FFmpegVideoCompiler(scratch_dir=scratch_dir)
+        work_dirs = []
+        compiler._render_with_filter_graph = MagicMock(
+            side_effect=lambda images, *args, **kwargs: work_dirs.append(str(kwargs["work_dir"]))
+        )
+        updates = []
+
+        compiler.compile_video(
+            [create_image()], create_audio(), tmp_path / "video.mp4",
+            progress_callback=updates.append, backend="ffmpeg"
+        )
+
+        assert os.path.dirname(work_dirs[0]) == str(scratch_dir)
+        assert any(u.startswith("Reserved ") and str(scratch_dir) in u for u in updates)
+        assert list((scratch_dir / RESERVATIONS_DIR).glob("*.json")) == []
+
+    def test_compile_fails_up_front_when_scratch_is_short(self, tmp_path):
+        """Nothing is written or rendered when the estimate does not fit."""
+        compiler = FFmpegVideoCompiler(scratch_dir=tmp_path)
+        compiler._render_parallel_segments = MagicMock()
+
+        with patch.object(ScratchSpace, "free_bytes", return_value=0):
+            with pytest.raises(VideoProcessingError, match="Not enough scratch space"):
+                compiler.compile_video([create_image()], create_audio(), tmp_path / "video.mp4", backend="parallel")
+
+        compiler._render_parallel_segments.assert_not_called()
+        assert [p.name for p in tmp_path.iterdir()] == [RESERVATIONS_DIR]
+
+    def test_estimate_counts_pixel_store_only_for_frame_backends(self):
+        """moviepy and pipe hold decoded source pixels; the ffmpeg filter graph does not."""
+        compiler = FFmpegVideoCompiler()
+        args = ([create_image(), create_image()], create_audio(duration_seconds=10.0),
+                [("video.mp4", (1280, 720))], True)
+
+        ffmpeg = compiler._scratch_bytes(*args, "ffmpeg")
+        moviepy = compiler._scratch_bytes(*args, "moviepy")
+
+        assert moviepy - ffmpeg >= 2 * 1280 * 720 * 3
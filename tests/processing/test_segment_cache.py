@@ -0,0 +1,179 @@
+"""
+Tests for the content-addressed segment cache.
+
+Related files:
+- eleven_video/processing/segment_cache.py: SegmentCache implementation
+- eleven_video/processing/segments.py: ParallelSegmentRenderer.render(cache=...)
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(segment_cache=...)
+"""
+import os
+
+import pytest
+from unittest.mock import patch
+
+from eleven_video.processing.ffmpeg_backend import FilterGraphRenderer
+from eleven_video.processing.segment_cache import SegmentCache
+from eleven_video.processing.segments import ParallelSegmentRenderer
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+)
+
+
+def _write_pngs(tmp_path, colors, size=(64, 36)):
+    paths = []
+    for i, color in enumerate(colors):
+        path = tmp_path / f"image_{i:03d}.png"
+        path.write_bytes(create_png_bytes(size, color))
+        paths.append(str(path))
+    return paths
+
+
+def _fake_render_segment(job):
+    with open(job.output_path, "wb") as f:
+        f.write(b"x" * 100)
+    return job.output_path
+
+
+class TestCacheKey:
+    """What invalidates a cached segment."""
+
+    def test_key_changes_with_image_chain_and_encoder(self):
+        """Image content, filter chain (timing, zoom, size) and encoder settings all change the key."""
+        base = SegmentCache.key("abc", "chain", ["-crf", "23"])
+
+        assert SegmentCache.key("abd", "chain", ["-crf", "23"]) != base
+        assert SegmentCache.key("abc", "chain2", ["-crf", "23"]) != base
+        assert SegmentCache.key("abc", "chain", ["-crf", "28"]) != base
+
+    def test_thread_count_does_not_change_key(self):
+        """-threads varies with the worker count and is ignored."""
+        assert SegmentCache.key("abc", "chain", ["-crf", "23", "-threads", "4"]) == \
+            SegmentCache.key("abc", "chain", ["-crf", "23", "-threads", "1"])
+
+
+class TestCacheStore:
+    """Put, get and LRU eviction."""
+
+    def test_put_then_get(self, tmp_path):
+        """A stored segment is moved into the cache and returned on lookup."""
+        cache = SegmentCache(tmp_path / "cache")
+        source = tmp_path / "seg.mp4"
+        source.write_bytes(b"data")
+
+        stored = cache.put("k1", source)
+
+        assert not source.exists()
+        assert cache.get("k1") == stored
+        assert stored.read_bytes() == b"data"
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """
+        GIVEN a cache capped at two 100-byte segments
+        WHEN a third is added after the oldest was read again
+        THEN the least recently used segment is evicted.
+        """
+        cache = SegmentCache(tmp_path / "cache", max_bytes=200)
+        for i, key in enumerate(["a", "b"]):
+            source = tmp_path / f"{key}.mp4"
+            source.write_bytes(b"x" * 100)
+            path = cache.put(key, source)
+            os.utime(path, (1000 + i, 1000 + i))
+        assert cache.get("a") is not None  # "a" is now most recently used
+
+        source = tmp_path / "c.mp4"
+        source.write_bytes(b"x" * 100)
+        cache.put("c", source)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.size_bytes() == 200
+
+
+class TestRendererWithCache:
+    """ParallelSegmentRenderer reuses cached segments."""
+
+    def test_second_render_encodes_only_changed_segment(self, tmp_path):
+        """
+        GIVEN a render of three images through the cache
+        WHEN one image is swapped and the video rendered again
+        THEN only that image's segment is re-encoded.
+        """
+        cache = SegmentCache(tmp_path / "cache")
+        paths = _write_pngs(tmp_path, [(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+        renderer = ParallelSegmentRenderer(FilterGraphRenderer(), max_workers=1)
+
+        with patch("eleven_video.processing.segments.ProcessPoolExecutor") as mock_pool, \
+             patch("eleven_video.processing.segments.concat_segments") as mock_concat:
+            mock_pool.return_value.__enter__.return_value.map = lambda fn, jobs: [
+                _fake_render_segment(j) for j in jobs
+            ]
+            first = renderer.render(paths, "a.mp3", [24, 24, 24], tmp_path / "o.mp4", (160, 90),
+                                    tmp_path / "w1", cache=cache)
+            with open(paths[1], "wb") as f:
+                f.write(create_png_bytes((64, 36), (255, 255, 0)))
+            second = renderer.render(paths, "a.mp3", [24, 24, 24], tmp_path / "o.mp4", (160, 90),
+                                     tmp_path / "w2", cache=cache)
+            third = renderer.render(paths, "a.mp3", [24, 24, 24], tmp_path / "o.mp4", (160, 90),
+                                    tmp_path / "w3", cache=cache)
+
+        assert (first, second, third) == (3, 1, 0)
+        # Every concat list points at cache entries, in segment order
+        lines = (tmp_path / "w3" / "segments.txt").read_text().splitlines()
+        assert len(lines) == 3
+        assert all(str(cache.cache_dir.resolve()) in line for line in lines)
+        assert mock_concat.call_count == 3
+
+    def test_compiler_reports_reuse(self, tmp_path):
+        """The compiler passes its cache to the renderer and reports reused segments."""
+        cache = SegmentCache(tmp_path / "cache")
+        compiler = FFmpegVideoCompiler(segment_cache=cache)
+        updates = []
+
+        with patch("eleven_video.processing.video_handler.ParallelSegmentRenderer") as mock_renderer:
+            mock_renderer.return_value.render.return_value = 1
+            compiler.compile_video(
+                [create_image(), create_image()], create_audio(duration_seconds=2.0),
+                tmp_path / "out.mp4", progress_callback=updates.append, backend="parallel"
+            )
+
+        assert mock_renderer.return_value.render.call_args.kwargs["cache"] is cache
+        assert "Reused 1 of 2 cached segments" in updates
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestCachedRenderReal:
+    """Real renders joining cached and fresh segments."""
+
+    def test_swapped_image_rerender_is_complete(self, tmp_path):
+        """
+        GIVEN a cached three-segment render
+        WHEN the middle image is swapped and the video re-rendered
+        THEN one segment is encoded and the joined video still holds every frame.
+        """
+        import imageio_ffmpeg
+
+        cache = SegmentCache(tmp_path / "cache")
+        paths = _write_pngs(tmp_path, [(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(create_silent_mp3_bytes(3.0))
+        renderer = ParallelSegmentRenderer(FilterGraphRenderer(), max_workers=1)
+
+        renderer.render(paths, str(audio_path), [24, 24, 24], tmp_path / "a.mp4", (160, 90),
+                        tmp_path / "w1", cache=cache)
+        with open(paths[1], "wb") as f:
+            f.write(create_png_bytes((64, 36), (255, 255, 0)))
+        encoded = renderer.render(paths, str(audio_path), [24, 24, 24], tmp_path / "b.mp4", (160, 90),
+                                  tmp_path / "w2", cache=cache)
+
+        frames, _ = imageio_ffmpeg.count_frames_and_secs(str(tmp_path / "b.mp4"))
+        assert encoded == 1
+        assert frames == 72
+        assert len(list(cache.cache_dir.glob("*.mp4"))) == 4
@@ -0,0 +1,216 @@
+"""
+Tests for the static-slideshow fast path (zoom disabled).
+
+Related files:
+- eleven_video/processing/slideshow.py: StaticSlideshowRenderer implementation
+- eleven_video/processing/video_handler.py: compile_video(enable_zoom=False)
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+from PIL import Image as PILImage
+
+from eleven_video.exceptions.custom_errors import VideoProcessingError
+from eleven_video.processing.slideshow import StaticSlideshowRenderer
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+    stream_duration,
+)
+
+
+def _write_pngs(tmp_path, colors, size=(64, 36)):
+    paths = []
+    for i, color in enumerate(colors):
+        path = tmp_path / f"image_{i:03d}.png"
+        path.write_bytes(create_png_bytes(size, color))
+        paths.append(str(path))
+    return paths
+
+
+class TestPrescale:
+    """One-time image scaling."""
+
+    def test_images_scaled_to_target_resolution(self, tmp_path):
+        """
+        GIVEN source images of a different size
+        WHEN they are pre-scaled
+        THEN every still matches the target resolution exactly.
+        """
+        paths = _write_pngs(tmp_path, [(255, 0, 0), (0, 0, 255)], size=(50, 50))
+
+        stills = StaticSlideshowRenderer().prescale(paths, (160, 90), tmp_path / "stills")
+
+        assert len(stills) == 2
+        for still in stills:
+            with PILImage.open(still) as img:
+                assert img.size == (160, 90)
+                assert img.mode == "RGB"
+
+
+class TestConcatList:
+    """Concat-demuxer list with durations."""
+
+    def test_durations_follow_frame_grid_and_last_file_repeats(self, tmp_path):
+        """
+        GIVEN three segments where one has no frames
+        WHEN the list is written
+        THEN empty segments are skipped, durations are frames/fps and the last still
+        repeats for the timeline's final frame.
+        """
+        renderer = StaticSlideshowRenderer(fps=24)
+        list_path = renderer.write_concat_list(
+            [str(tmp_path / "a.png"), str(tmp_path / "b.png"), str(tmp_path / "c.png")],
+            [36, 0, 12],
+            tmp_path / "stills.txt",
+        )
+        lines = list_path.read_text().splitlines()
+
+        assert lines[1] == "duration 1.500000"
+        assert lines[3] == "duration 0.458333"
+        assert lines[2] == lines[4]
+        assert not any("b.png" in line for line in lines)
+
+    def test_single_frame_last_still_is_not_repeated(self, tmp_path):
+        renderer = StaticSlideshowRenderer(fps=24)
+        list_path = renderer.write_concat_list(
+            [str(tmp_path / "a.png"), str(tmp_path / "b.png")], [24, 1], tmp_path / "stills.txt"
+        )
+
+        assert list_path.read_text().splitlines()[2:] == [f"file '{tmp_path / 'b.png'}'"]
+
+    def test_entry_ends_on_the_timeline(self):
+        """Each encoded frame is one list entry; the repeated last still ends the timeline."""
+        renderer = StaticSlideshowRenderer(fps=24)
+
+        assert renderer.entry_end_frames([36, 0, 12]) == [36, 47, 48]
+        assert renderer.entry_end_frames([24, 1]) == [24, 25]
+
+    def test_progress_follows_the_timeline(self, tmp_path):
+        """
+        GIVEN ffmpeg reporting 2 and then 4 encoded frames of a three-still slideshow
+        WHEN the slideshow renders
+        THEN progress is the timeline position of those stills, ending at every frame.
+        """
+        renderer = StaticSlideshowRenderer(fps=24)
+        renderer.prescale = MagicMock(return_value=["a.png", "b.png", "c.png"])
+        seen = []
+
+        def fake_run(args, on_progress=None):
+            for encoded in (0, 2, 4):
+                on_progress(encoded)
+
+        with patch("eleven_video.processing.slideshow.run_ffmpeg", side_effect=fake_run) as mock_run:
+            renderer.render(["a", "b", "c"], "a.mp3", [24, 24, 24], tmp_path / "o.mp4", (160, 90), tmp_path,
+                            on_progress=seen.append)
+
+        assert seen == [48, 72]
+        args = mock_run.call_args.args[0]
+        assert args[args.index("-t") + 1] == "3.000000"
+
+    def test_encoder_uses_stillimage_tuning(self):
+        """x264 is tuned for still content and frames are not duplicated."""
+        args = StaticSlideshowRenderer(fps=24).encoder_args()
+
+        assert args[args.index("-tune") + 1] == "stillimage"
+        assert args[args.index("-fps_mode") + 1] == "vfr"
+        assert args[args.index("-enc_time_base") + 1] == "1/24"
+
+    def test_render_without_frames_raises(self, tmp_path):
+        """A timeline with no frames at all cannot be rendered."""
+        with pytest.raises(VideoProcessingError):
+            StaticSlideshowRenderer().render(["a.png"], "a.mp3", [0], tmp_path / "o.mp4", (160, 90), tmp_path)
+
+
+class TestStaticFastPathSelection:
+    """compile_video(enable_zoom=False) dispatch."""
+
+    def test_ffmpeg_backend_without_zoom_uses_static_path(self, tmp_path):
+        """
+        GIVEN zoom disabled on an ffmpeg backend
+        WHEN compile_video runs
+        THEN the static slideshow renderer is used instead of the filter graph.
+        """
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_filter_graph = MagicMock()
+        compiler._render_with_moviepy = MagicMock()
+
+        with patch("eleven_video.processing.video_handler.StaticSlideshowRenderer") as mock_renderer:
+            compiler.compile_video(
+                [create_image(), create_image()], create_audio(duration_seconds=2.0),
+                tmp_path / "out.mp4", enable_zoom=False, backend="ffmpeg"
+            )
+
+        render_args = mock_renderer.return_value.render.call_args.args
+        assert render_args[2] == [24, 24]
+        assert render_args[5].name == "stills"
+        compiler._render_with_filter_graph.assert_not_called()
+        compiler._render_with_moviepy.assert_not_called()
+
+    def test_moviepy_backend_keeps_moviepy_path(self, tmp_path):
+        """The default moviepy backend still composites with moviepy."""
+        compiler = FFmpegVideoCompiler()
+        compiler._render_static_slideshow = MagicMock()
+        compiler._render_with_moviepy = MagicMock()
+
+        compiler.compile_video([create_image()], create_audio(), tmp_path / "out.mp4", enable_zoom=False)
+
+        compiler._render_static_slideshow.assert_not_called()
+        compiler._render_with_moviepy.assert_called_once()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestStaticRenderReal:
+    """Real renders through the ffmpeg binary."""
+
+    def test_static_render_holds_each_still(self, tmp_path):
+        """
+        GIVEN three images and 3 seconds of audio
+        WHEN rendered through the static fast path
+        THEN each still is encoded once and, decoded at 24 fps, fills its segment.
+        """
+        import imageio_ffmpeg
+
+        paths = _write_pngs(tmp_path, [(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(create_silent_mp3_bytes(3.0))
+        output = tmp_path / "out.mp4"
+
+        StaticSlideshowRenderer().render(
+            paths, str(audio_path), [24, 24, 24], output, (160, 90), tmp_path / "stills"
+        )
+
+        encoded, seconds = imageio_ffmpeg.count_frames_and_secs(str(output))
+        assert encoded < 72
+        assert seconds == pytest.approx(3.0, abs=0.1)
+
+        reader = imageio_ffmpeg.read_frames(str(output), output_params=["-vf", "fps=24"])
+        meta = next(reader)
+        pixels = [tuple(bytes(f[:3])) for f in reader]
+        assert meta["size"] == (160, 90)
+        assert len(pixels) == 72
+        # Stills change exactly on the segment boundaries
+        changes = [i for i in range(1, len(pixels)) if pixels[i] != pixels[i - 1]]
+        assert changes == [24, 48]
+
+    def test_video_ends_with_the_audio(self, tmp_path):
+        """
+        GIVEN three images and 3 seconds of audio
+        WHEN rendered through the static fast path
+        THEN the video stream is exactly as long as the audio (not one frame longer).
+        """
+        paths = _write_pngs(tmp_path, [(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(create_silent_mp3_bytes(3.0))
+        output = tmp_path / "out.mp4"
+
+        StaticSlideshowRenderer().render(
+            paths, str(audio_path), [24, 24, 24], output, (160, 90), tmp_path / "stills"
+        )
+
+        assert stream_duration(output, "v") == pytest.approx(3.0, abs=0.011)
+        assert stream_duration(output, "v") == pytest.approx(stream_duration(output, "a"), abs=0.03)
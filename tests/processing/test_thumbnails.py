@@ -0,0 +1,174 @@
+"""
+Tests for the poster frame and seek-bar thumbnail sprite.
+
+Related files:
+- eleven_video/processing/thumbnails.py: ThumbnailRenderer, zoom_window
+- eleven_video/processing/video_handler.py: Video.poster_path, sprite_path, sprite_index_path
+"""
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from PIL import Image as PILImage
+
+from eleven_video.models.domain import Image
+from eleven_video.processing.image_store import SourceImageStore
+from eleven_video.processing.thumbnails import ThumbnailRenderer, poster_path, sprite_path, zoom_window
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from eleven_video.processing.zoom import ZoomRenderer, zoom_base_size
+from tests.support.factories.media_factory import create_audio, create_image, create_png_bytes
+
+
+def _gradient(size=(64, 36)):
+    w, h = size
+    x = np.linspace(0, 255, w, dtype=np.float32)[None, :]
+    y = np.linspace(0, 255, h, dtype=np.float32)[:, None]
+    return np.stack([x + 0 * y, 0 * x + y, (x + y) / 2], axis=-1).astype(np.uint8)
+
+
+def _write_output(images, audio_path, audio_duration, output_path, *args, **kwargs):
+    output_path.write_bytes(b"video")
+
+
+def _write_pngs(tmp_path, colors):
+    paths = []
+    for i, color in enumerate(colors):
+        path = tmp_path / f"image_{i:03d}.png"
+        path.write_bytes(create_png_bytes((64, 36), color))
+        paths.append(str(path))
+    return paths
+
+
+class TestZoomMath:
+    """Crop windows and timing shared with the renderers."""
+
+    def test_zoom_window_spans_full_image_to_zoomed_window(self):
+        half = 1 / 1.08 / 2
+
+        assert zoom_window(0.0, "in") == pytest.approx((0, 0, 1, 1))
+        assert zoom_window(1.0, "in") == pytest.approx((0.5 - half, 0.5 - half, 0.5 + half, 0.5 + half))
+        assert zoom_window(0.0, "out") == pytest.approx(zoom_window(1.0, "in"))
+
+    def test_frame_at_maps_time_to_segment_and_progress(self):
+        renderer = ThumbnailRenderer(fps=24)
+
+        assert renderer.frame_at([24, 48], 0.0) == (0, 0.0)
+        assert renderer.frame_at([24, 48], 2.0) == (1, 0.5)
+        assert renderer.frame_at([24, 48], 99.0) == (1, 47 / 48)
+
+    def test_thumbnail_matches_rendered_zoom_frame(self):
+        """
+        GIVEN a source image and a frame in the middle of a zoom-out segment
+        WHEN the thumbnail crop is taken at full size
+        THEN it matches the frame ZoomRenderer encodes at that point.
+        """
+        source = _gradient((320, 180))
+        renderer = ThumbnailRenderer(fps=24)
+        zoom = ZoomRenderer(source, (160, 90), duration=2.0, zoom_direction="out", fps=24)
+
+        thumb = np.asarray(renderer._crop(PILImage.fromarray(source), renderer.window(1, 12 / 48), (160, 90)))
+        frame = zoom.frame_at(0.5)
+
+        assert np.abs(thumb.astype(int) - frame.astype(int)).mean() < 3
+
+    def test_store_pixels_and_decoded_image_give_same_thumbnail(self):
+        """Reading a window from pre-scaled pixels matches resizing the decoded image."""
+        renderer = ThumbnailRenderer()
+        base = _gradient(zoom_base_size((160, 90)))
+        window = renderer.window(0, 0.7)
+
+        from_pixels = np.asarray(renderer._crop(base, window, (40, 22)))
+        from_image = np.asarray(renderer._crop(PILImage.fromarray(base), window, (40, 22)))
+
+        assert np.abs(from_pixels.astype(int) - from_image.astype(int)).max() <= 2
+
+
+class TestThumbnailRenderer:
+    """Poster, sprite and WebVTT index files."""
+
+    def test_writes_poster_sprite_and_index(self, tmp_path):
+        """
+        GIVEN two images of 2 s each and one tile per second
+        WHEN the thumbnails are rendered
+        THEN the poster has the video size and the sprite holds four tiles in order.
+        """
+        paths = _write_pngs(tmp_path, [(255, 0, 0), (0, 0, 255)])
+        renderer = ThumbnailRenderer(fps=10, interval=1.0, tile_width=32, columns=3)
+
+        poster, sprite, index = renderer.render(paths, [20, 20], (160, 90), tmp_path / "video.mp4")
+
+        assert (poster, sprite) == (poster_path(tmp_path / "video.mp4"), sprite_path(tmp_path / "video.mp4"))
+        assert PILImage.open(poster).size == (160, 90)
+        sheet = PILImage.open(sprite).convert("RGB")
+        assert sheet.size == (96, 36)
+        assert sheet.getpixel((16, 9))[0] > 200 and sheet.getpixel((16 + 64, 9))[2] > 200
+        assert index.read_text().splitlines()[:4] == [
+            "WEBVTT", "", "00:00:00.000 --> 00:00:01.000", "video.sprite.jpg#xywh=0,0,32,18"
+        ]
+        assert "00:00:03.000 --> 00:00:04.000" in index.read_text()
+
+    def test_short_video_still_gets_one_tile(self, tmp_path):
+        paths = _write_pngs(tmp_path, [(0, 255, 0)])
+
+        _, sprite, _ = ThumbnailRenderer(fps=10).render(paths, [5], (160, 90), tmp_path / "clip.mp4")
+
+        assert PILImage.open(sprite).size == (160, 90)
+
+
+class TestCompilerThumbnails:
+    """Thumbnails written by FFmpegVideoCompiler."""
+
+    def _images(self):
+        return [Image(data=create_png_bytes((64, 36), c), mime_type="image/png") for c in [(255, 0, 0), (0, 0, 255)]]
+
+    def test_video_references_thumbnails(self, tmp_path):
+        """The returned Video points at the poster, sprite and index next to the output."""
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_filter_graph = MagicMock(side_effect=_write_output)
+
+        video = compiler.compile_video(self._images(), create_audio(), tmp_path / "video.mp4", backend="ffmpeg")
+
+        assert video.poster_path == tmp_path / "video.poster.jpg"
+        assert video.sprite_path == tmp_path / "video.sprite.jpg"
+        assert video.sprite_index_path == tmp_path / "video.sprite.vtt"
+        assert all(p.exists() for p in (video.poster_path, video.sprite_path, video.sprite_index_path))
+
+    def test_thumbnails_read_the_render_store(self, tmp_path):
+        """
+        GIVEN a SourceImageStore left in the work directory by the render
+        WHEN thumbnails are rendered after the image files are gone
+        THEN they come from the stored pixels.
+        """
+        paths = _write_pngs(tmp_path, [(255, 0, 0), (0, 0, 255)])
+        SourceImageStore.build(paths, zoom_base_size((160, 90)), tmp_path / "work" / "sources").close()
+        for path in paths:
+            PILImage.new("RGB", (8, 8)).save(path)  # would give black thumbnails if decoded
+        compiler = FFmpegVideoCompiler()
+
+        poster, sprite, index = compiler._render_thumbnails(
+            paths, 4.0, (tmp_path / "video.mp4", (160, 90)), True, tmp_path / "work", None
+        )
+
+        assert PILImage.open(poster).convert("RGB").getpixel((80, 45))[0] > 200
+
+    def test_undecodable_images_only_skip_thumbnails(self, tmp_path):
+        """A thumbnail failure is a warning; the video is still returned."""
+        compiler = FFmpegVideoCompiler()
+        compiler._render_with_filter_graph = MagicMock(side_effect=_write_output)
+        updates = []
+
+        video = compiler.compile_video(
+            [create_image(data=b"not an image")], create_audio(), tmp_path / "video.mp4",
+            progress_callback=updates.append, backend="ffmpeg"
+        )
+
+        assert video.poster_path is None
+        assert any(u.startswith("Warning: could not write poster") for u in updates)
+
+    def test_disabled_compile_writes_no_thumbnails(self, tmp_path):
+        compiler = FFmpegVideoCompiler(thumbnails=False)
+        compiler._render_with_filter_graph = MagicMock(side_effect=_write_output)
+
+        video = compiler.compile_video(self._images(), create_audio(), tmp_path / "video.mp4", backend="ffmpeg")
+
+        assert video.poster_path is None
+        assert not poster_path(tmp_path / "video.mp4").exists()
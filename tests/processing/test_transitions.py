@@ -0,0 +1,214 @@
+"""
+Tests for crossfade transitions encoded as separate windows between segments.
+
+Related files:
+- eleven_video/processing/segments.py: transition_windows, ParallelSegmentRenderer(transition_frames=...)
+- eleven_video/processing/ffmpeg_backend.py: FilterGraphRenderer.transition_chain
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler(transition_seconds=...)
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from eleven_video.exceptions.custom_errors import ValidationError
+from eleven_video.processing.ffmpeg_backend import FilterGraphRenderer
+from eleven_video.processing.segment_cache import SegmentCache
+from eleven_video.processing.segments import ParallelSegmentRenderer, render_segment, transition_windows
+from eleven_video.processing.video_handler import FFmpegVideoCompiler
+from tests.support.factories.media_factory import (
+    create_audio,
+    create_image,
+    create_png_bytes,
+    create_silent_mp3_bytes,
+    ffmpeg_available,
+)
+
+
+def _write_pngs(tmp_path, colors, size=(64, 36)):
+    paths = []
+    for i, color in enumerate(colors):
+        path = tmp_path / f"image_{i:03d}.png"
+        path.write_bytes(create_png_bytes(size, color))
+        paths.append(str(path))
+    return paths
+
+
+def _fake_render_segment(job):
+    with open(job.output_path, "wb") as f:
+        f.write(b"x" * 100)
+    return job.output_path
+
+
+class TestTransitionWindows:
+    """Window placement at each boundary."""
+
+    def test_window_split_across_the_cut(self):
+        """Half the window comes from each side of the cut."""
+        assert transition_windows([48, 48, 48], 12) == [(6, 12), (6, 12)]
+
+    def test_window_limited_by_short_segments(self):
+        """
+        GIVEN a 10-frame segment between two long ones
+        WHEN 12-frame transitions are placed
+        THEN both windows shrink to half of it, leaving the short segment frames of its own.
+        """
+        assert transition_windows([48, 10, 48], 12) == [(2, 5), (2, 5)]
+
+    def test_too_short_for_a_fade_is_a_hard_cut(self):
+        assert transition_windows([48, 3, 48], 12) == [(0, 0), (0, 0)]
+        assert transition_windows([48, 48], 0) == [(0, 0)]
+
+
+class TestTransitionJobs:
+    """Bodies and windows built by ParallelSegmentRenderer."""
+
+    def test_jobs_alternate_bodies_and_windows(self, tmp_path):
+        """
+        GIVEN three images of 48 frames and 12-frame transitions
+        WHEN jobs are built
+        THEN each body is followed by the window into the next image, and together they cover every frame.
+        """
+        renderer = ParallelSegmentRenderer(transition_frames=12)
+        jobs = renderer.build_jobs(["a.png", "b.png", "c.png"], [48, 48, 48], (1280, 720), tmp_path)
+
+        names = [job.output_path.rsplit("/", 1)[-1] for job in jobs]
+        assert names == [
+            "segment_0000.mp4", "transition_0000.mp4", "segment_0001.mp4", "transition_0001.mp4",
+            "segment_0002.mp4",
+        ]
+        assert [job.frame_count for job in jobs] == [42, 12, 36, 12, 42]
+        assert jobs[1].inputs == ["a.png", "b.png"]
+        assert jobs[3].inputs == ["b.png", "c.png"]
+        assert "xfade=transition=fade" in jobs[1].filter_chain
+
+    def test_bodies_continue_the_full_zoom(self, tmp_path):
+        """A body that starts after the incoming window picks up the zoom where the window left it."""
+        renderer = ParallelSegmentRenderer(transition_frames=12)
+        jobs = renderer.build_jobs(["a.png", "b.png"], [48, 48], (1280, 720), tmp_path)
+
+        assert "*on'" in jobs[0].filter_chain
+        assert "*(on+6)'" in jobs[2].filter_chain
+        assert "*(on+42)'" in jobs[1].filter_chain and "*(on-6)'" in jobs[1].filter_chain
+
+    def test_without_transitions_chains_are_unchanged(self, tmp_path):
+        """Hard-cut segments keep the filter chain (and so the cache key) they had before transitions."""
+        graph = FilterGraphRenderer()
+        jobs = ParallelSegmentRenderer(graph).build_jobs(["a.png", "b.png"], [24, 24], (1280, 720), tmp_path)
+
+        assert [job.filter_chain for job in jobs] == [
+            graph.segment_chain(i, "0:v", "v", 24, (1280, 720)) for i in range(2)
+        ]
+        assert all(job.extra_inputs == [] for job in jobs)
+
+    def test_window_job_passes_both_images(self, tmp_path):
+        renderer = ParallelSegmentRenderer(transition_frames=12)
+        window = renderer.build_jobs(["a.png", "b.png"], [48, 48], (1280, 720), tmp_path)[1]
+
+        with patch("eleven_video.processing.segments.run_ffmpeg") as mock_run:
+            render_segment(window)
+
+        args = mock_run.call_args.args[0]
+        assert args[:4] == ["-i", "a.png", "-i", "b.png"]
+        assert args[args.index("-frames:v") + 1] == "12"
+
+
+class TestTransitionCache:
+    """Only the intermediates touching a changed image are re-encoded."""
+
+    def test_changed_image_reencodes_its_body_and_adjacent_windows(self, tmp_path):
+        """
+        GIVEN a cached render of three images with transitions (3 bodies + 2 windows)
+        WHEN the middle image changes and the video is rendered again
+        THEN its body and both windows are re-encoded, and the outer bodies come from the cache.
+        """
+        cache = SegmentCache(tmp_path / "cache")
+        paths = _write_pngs(tmp_path, [(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+        renderer = ParallelSegmentRenderer(FilterGraphRenderer(), max_workers=1, transition_frames=12)
+        encoded = []
+
+        def fake_map(fn, jobs):
+            encoded.append([j.output_path.rsplit("/", 1)[-1] for j in jobs])
+            return [_fake_render_segment(j) for j in jobs]
+
+        with patch("eleven_video.processing.segments.ProcessPoolExecutor") as mock_pool, \
+             patch("eleven_video.processing.segments.concat_segments"):
+            mock_pool.return_value.__enter__.return_value.map = fake_map
+            first = renderer.render(paths, "a.mp3", [48, 48, 48], tmp_path / "o.mp4", (160, 90),
+                                    tmp_path / "w1", cache=cache)
+            with open(paths[1], "wb") as f:
+                f.write(create_png_bytes((64, 36), (255, 255, 0)))
+            second = renderer.render(paths, "a.mp3", [48, 48, 48], tmp_path / "o.mp4", (160, 90),
+                                     tmp_path / "w2", cache=cache)
+
+        assert (first, second) == (5, 3)
+        assert encoded[1] == ["transition_0000.mp4", "segment_0001.mp4", "transition_0001.mp4"]
+        assert len((tmp_path / "w2" / "segments.txt").read_text().splitlines()) == 5
+
+
+class TestCompilerTransitions:
+    """FFmpegVideoCompiler(transition_seconds=...)."""
+
+    def test_negative_transition_rejected(self):
+        with pytest.raises(ValidationError, match="Transition length"):
+            FFmpegVideoCompiler(transition_seconds=-0.5)
+
+    def test_transitions_use_parallel_backend(self, tmp_path):
+        """
+        GIVEN a half-second transition and the default moviepy backend
+        WHEN compile_video runs
+        THEN the segments render on the parallel backend with 12-frame windows at 24 fps.
+        """
+        compiler = FFmpegVideoCompiler(transition_seconds=0.5)
+        compiler._render_with_moviepy = MagicMock()
+        updates = []
+
+        with patch("eleven_video.processing.video_handler.ParallelSegmentRenderer") as mock_renderer:
+            mock_renderer.return_value.render.return_value = 3
+            compiler.compile_video(
+                [create_image(), create_image()], create_audio(duration_seconds=4.0),
+                tmp_path / "out.mp4", progress_callback=updates.append
+            )
+
+        assert mock_renderer.call_args.kwargs["transition_frames"] == 12
+        compiler._render_with_moviepy.assert_not_called()
+        assert any("Crossfading images over 0.5s" in u for u in updates)
+
+    def test_static_images_still_crossfade(self, tmp_path):
+        """Without zoom the static slideshow shortcut would drop the transitions, so it is skipped."""
+        compiler = FFmpegVideoCompiler(transition_seconds=0.5)
+        compiler._render_static_slideshow = MagicMock()
+
+        with patch("eleven_video.processing.video_handler.ParallelSegmentRenderer") as mock_renderer:
+            mock_renderer.return_value.render.return_value = 3
+            compiler.compile_video(
+                [create_image(), create_image()], create_audio(duration_seconds=4.0),
+                tmp_path / "out.mp4", enable_zoom=False
+            )
+
+        compiler._render_static_slideshow.assert_not_called()
+        mock_renderer.return_value.render.assert_called_once()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestTransitionRenderReal:
+    """Real renders through the ffmpeg binary."""
+
+    def test_crossfaded_video_keeps_the_timeline_length(self, tmp_path):
+        """
+        GIVEN three images of 24 frames and 8-frame transitions
+        WHEN rendered as bodies and windows and joined by stream copy
+        THEN the video has exactly the 72 frames of the hard-cut timeline.
+        """
+        import imageio_ffmpeg
+
+        paths = _write_pngs(tmp_path, [(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(create_silent_mp3_bytes(3.0))
+        output = tmp_path / "out.mp4"
+
+        renderer = ParallelSegmentRenderer(FilterGraphRenderer(), max_workers=2, transition_frames=8)
+        encoded = renderer.render(paths, str(audio_path), [24, 24, 24], output, (160, 90), tmp_path / "segments")
+
+        frames, _ = imageio_ffmpeg.count_frames_and_secs(str(output))
+        assert (encoded, frames) == (5, 72)
+        assert len(list((tmp_path / "segments").glob("transition_*.mp4"))) == 2
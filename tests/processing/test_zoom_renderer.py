@@ -0,0 +1,135 @@
+"""
+Tests for ZoomRenderer - precomputed Ken Burns frame generator.
+
+Includes a quality check against the previous per-frame implementation
+(upscale to the base size, resize to the frame scale, center-crop), which is
+kept here as the reference.
+
+Related files:
+- eleven_video/processing/zoom.py: ZoomRenderer implementation
+- eleven_video/processing/video_handler.py: FFmpegVideoCompiler._apply_zoom_effect
+"""
+import io
+
+import numpy as np
+import pytest
+from PIL import Image as PILImage
+
+from eleven_video.processing.zoom import ZoomRenderer
+
+
+def reference_zoom_frame(source, target_resolution, start_scale, end_scale, duration, t):
+    """Frame at time t as produced by the original two-resize zoom closure."""
+    w, h = target_resolution
+    progress = t / duration if duration > 0 else 0
+    scale = start_scale + (end_scale - start_scale) * progress
+    new_w, new_h = int(w * scale), int(h * scale)
+
+    img = PILImage.fromarray(source)
+    max_scale = max(start_scale, end_scale)
+    base_w, base_h = int(w * max_scale), int(h * max_scale)
+    if img.size != (base_w, base_h):
+        img = img.resize((base_w, base_h), PILImage.LANCZOS)
+    img_scaled = img.resize((new_w, new_h), PILImage.LANCZOS)
+
+    x_off = (new_w - w) // 2
+    y_off = (new_h - h) // 2
+    return np.array(img_scaled.crop((x_off, y_off, x_off + w, y_off + h)))
+
+
+def psnr(a: np.ndarray, b: np.ndarray) -> float:
+    """Peak signal-to-noise ratio between two uint8 frames (dB)."""
+    mse = np.mean((a.astype(float) - b.astype(float)) ** 2)
+    return float("inf") if mse == 0 else 10 * np.log10(255 ** 2 / mse)
+
+
+@pytest.fixture
+def detailed_source():
+    """A 512x384 source with gradients and hard edges."""
+    yy, xx = np.mgrid[0:384, 0:512]
+    img = np.stack([(xx / 2) % 256, (yy * 0.7) % 256, ((xx + yy) / 4) % 256], axis=-1).astype(np.uint8)
+    img[100:200, 150:300] = [250, 30, 40]
+    return img
+
+
+class TestZoomRendererGeometry:
+    """Precomputed crop rectangles."""
+
+    def test_boxes_cover_fps_grid(self, detailed_source):
+        """
+        GIVEN a 2 second clip at 24 fps
+        WHEN the renderer is created
+        THEN one crop box exists per frame on the fps grid.
+        """
+        renderer = ZoomRenderer(detailed_source, (320, 180), duration=2.0)
+
+        assert renderer.frame_count == 48
+        assert renderer.boxes.shape == (48, 4)
+
+    def test_zoom_in_shrinks_crop_window(self, detailed_source):
+        """Zooming in narrows the crop window each frame, always centered."""
+        renderer = ZoomRenderer(detailed_source, (320, 180), duration=2.0, zoom_direction="in")
+        widths = renderer.boxes[:, 2] - renderer.boxes[:, 0]
+        centers = (renderer.boxes[:, 2] + renderer.boxes[:, 0]) / 2
+
+        assert np.all(np.diff(widths) < 0)
+        assert widths[0] == pytest.approx(renderer.base.size[0])
+        assert np.allclose(centers, renderer.base.size[0] / 2)
+
+    def test_zoom_out_widens_crop_window(self, detailed_source):
+        """Zooming out widens the crop window each frame."""
+        renderer = ZoomRenderer(detailed_source, (320, 180), duration=2.0, zoom_direction="out")
+        widths = renderer.boxes[:, 2] - renderer.boxes[:, 0]
+
+        assert np.all(np.diff(widths) > 0)
+
+    def test_base_image_is_oversampled_once(self, detailed_source):
+        """The base is stored at target size times the max zoom scale."""
+        renderer = ZoomRenderer(detailed_source, (320, 180), duration=1.0, zoom_factor=1.08)
+
+        assert renderer.base.size == (int(320 * 1.08), int(180 * 1.08))
+
+    def test_accepts_encoded_bytes(self, detailed_source):
+        """Encoded PNG bytes are decoded directly."""
+        buffer = io.BytesIO()
+        PILImage.fromarray(detailed_source).save(buffer, format="PNG")
+
+        renderer = ZoomRenderer(buffer.getvalue(), (320, 180), duration=1.0)
+
+        assert renderer.frame_at(0).shape == (180, 320, 3)
+
+
+class TestZoomRendererFrames:
+    """Frame production."""
+
+    def test_render_frames_batch_matches_single_frames(self, detailed_source):
+        """Batched rendering yields the same pixels as frame_at on the grid."""
+        renderer = ZoomRenderer(detailed_source, (320, 180), duration=1.0)
+        batch = renderer.render_frames([0, 5, 23])
+
+        assert batch.shape == (3, 180, 320, 3)
+        assert batch.dtype == np.uint8
+        assert np.array_equal(batch[1], renderer.frame_at(5 / 24))
+
+    def test_times_past_end_clamp_to_last_frame(self, detailed_source):
+        """Requests beyond the clip duration return the last grid frame."""
+        renderer = ZoomRenderer(detailed_source, (320, 180), duration=1.0)
+
+        assert np.array_equal(renderer.frame_at(5.0), renderer.render_frames([23])[0])
+
+    @pytest.mark.parametrize("direction", ["in", "out"])
+    def test_quality_matches_previous_implementation(self, detailed_source, direction):
+        """
+        GIVEN a detailed source image
+        WHEN frames are rendered across the clip
+        THEN every frame is above 35 dB PSNR against the original two-resize output.
+        """
+        resolution = (640, 360)
+        renderer = ZoomRenderer(detailed_source, resolution, duration=2.0, zoom_direction=direction)
+
+        for index in (0, 12, 24, 47):
+            t = index / 24
+            expected = reference_zoom_frame(
+                detailed_source, resolution, renderer.start_scale, renderer.end_scale, 2.0, t
+            )
+            assert psnr(renderer.frame_at(t), expected) > 35
@@ -32,3 +32,61 @@ def create_video(file_path: Path = None, duration_seconds: float = 10.0, resolut
 def create_resolution() -> Resolution:
     """Return a random Resolution enum member."""
     return random.choice(list(Resolution))
+
+
+def create_png_bytes(size: tuple = (64, 36), color: tuple = (255, 0, 0)) -> bytes:
+    """Return real PNG bytes for a solid-colour image (decodable by Pillow/ffmpeg)."""
+    import io
+    from PIL import Image as PILImage
+    buffer = io.BytesIO()
+    PILImage.new("RGB", size, color=color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def create_silent_mp3_bytes(duration_seconds: float = 1.0) -> bytes:
+    """Return real MP3 bytes of silence, encoded with the ffmpeg moviepy uses.
+
+    Callers should skip when ffmpeg is unavailable (see ffmpeg_available()).
+    """
+    import subprocess
+    from eleven_video.processing.ffmpeg_backend import get_ffmpeg_binary
+    result = subprocess.run(
+        [get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error",
+         "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono", "-t", str(duration_seconds),
+         "-c:a", "libmp3lame", "-b:a", "64k", "-f", "mp3", "pipe:1"],
+        capture_output=True, check=True
+    )
+    return result.stdout
+
+
+def ffmpeg_available() -> bool:
+    """Whether a real ffmpeg binary can be located for integration tests."""
+    from eleven_video.exceptions.custom_errors import VideoProcessingError
+    from eleven_video.processing.ffmpeg_backend import get_ffmpeg_binary
+    try:
+        get_ffmpeg_binary()
+        return True
+    except VideoProcessingError:
+        return False
+
+
+def stream_duration(path: Path, stream: str = "v") -> float:
+    """Return the duration in seconds of one stream ("v" or "a") of a media file.
+
+    The stream is copied into a file of its own, whose container duration
+    ffmpeg reports (to 10 ms). Callers should skip when ffmpeg is unavailable.
+    """
+    import re
+    import subprocess
+    import tempfile
+    from eleven_video.processing.ffmpeg_backend import get_ffmpeg_binary
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        copy = Path(tmp_dir) / f"stream{Path(path).suffix or '.mp4'}"
+        subprocess.run(
+            [get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error", "-i", str(path),
+             "-map", f"0:{stream}:0", "-c", "copy", str(copy)],
+            capture_output=True, check=True
+        )
+        info = subprocess.run([get_ffmpeg_binary(), "-hide_banner", "-i", str(copy)], capture_output=True, text=True)
+    hours, minutes, seconds = re.search(r"Duration: (\d+):(\d+):([\d.]+)", info.stderr).groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
@@ -55,7 +55,7 @@ def test_cli_generate_interactive(mock_pipeline, mock_ui_selectors):
     # Story 3.5: generate() now takes gemini_model_id parameter
     # Story 3.6: generate() now takes duration_minutes parameter (defaults to 5 in interactive mode)
     # Story 3.8: generate() now takes resolution parameter (defaults to HD_1080P)
-    mock_pipeline.generate.assert_called_once_with(prompt="Test Topic", voice_id=None, image_model_id=None, gemini_model_id=None, duration_minutes=5, resolution=Resolution.HD_1080P)
+    mock_pipeline.generate.assert_called_once_with(prompt="Test Topic", voice_id=None, image_model_id=None, gemini_model_id=None, duration_minutes=5, resolution=Resolution.HD_1080P, enable_zoom=True, render_mode="full")
 
 def test_cli_generate_with_args(mock_pipeline, mock_ui_selectors):
     """
@@ -71,7 +71,7 @@ def test_cli_generate_with_args(mock_pipeline, mock_ui_selectors):
     # Story 3.5: generate() now takes gemini_model_id parameter
     # Story 3.6: generate() now takes duration_minutes parameter
     # Story 3.8: generate() now takes resolution parameter (defaults to HD_1080P)
-    mock_pipeline.generate.assert_called_once_with(prompt="My Topic", voice_id="voice_123", image_model_id=None, gemini_model_id=None, duration_minutes=None, resolution=Resolution.HD_1080P)
+    mock_pipeline.generate.assert_called_once_with(prompt="My Topic", voice_id="voice_123", image_model_id=None, gemini_model_id=None, duration_minutes=None, resolution=Resolution.HD_1080P, enable_zoom=True, render_mode="full")
 
 
 def test_cli_generate_with_image_model_flag(mock_pipeline, mock_ui_selectors):
@@ -98,7 +98,9 @@ def test_cli_generate_with_image_model_flag(mock_pipeline, mock_ui_selectors):
         image_model_id="gemini-3-flash",
         gemini_model_id=None,
         duration_minutes=None,
-        resolution=Resolution.HD_1080P
+        resolution=Resolution.HD_1080P,
+        enable_zoom=True,
+        render_mode="full"
     )
 
 
@@ -124,7 +126,9 @@ def test_cli_generate_with_gemini_model_flag(mock_pipeline, mock_ui_selectors):
         image_model_id=None,
         gemini_model_id="gemini-2.5-pro",
         duration_minutes=None,
-        resolution=Resolution.HD_1080P
+        resolution=Resolution.HD_1080P,
+        enable_zoom=True,
+        render_mode="full"
     )
 
 
@@ -151,5 +155,292 @@ def test_cli_generate_with_all_model_flags(mock_pipeline, mock_ui_selectors):
         image_model_id="gemini-3-flash",
         gemini_model_id="gemini-2.5-pro",
         duration_minutes=None,
-        resolution=Resolution.HD_1080P
+        resolution=Resolution.HD_1080P,
+        enable_zoom=True,
+        render_mode="full"
     )
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_no_zoom_flag(mock_settings, mock_pipeline, mock_ui_selectors):
+    """
+    GIVEN --no-zoom flag
+    WHEN generate command run
+    THEN pipeline runs with zoom disabled
+    """
+    result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--no-zoom"])
+
+    assert result.exit_code == 0
+    assert mock_pipeline.generate.call_args.kwargs["enable_zoom"] is False
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_render_profile_flag(mock_settings, mock_ui_selectors):
+    """
+    GIVEN --render-profile draft
+    WHEN generate command run
+    THEN the pipeline is created with the draft profile
+    """
+    with patch("eleven_video.orchestrator.VideoPipeline") as MockPipeline:
+        result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--render-profile", "draft"])
+
+    assert result.exit_code == 0
+    assert MockPipeline.call_args.kwargs["render_profile"] == "draft"
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_render_profile_from_config(mock_settings, mock_ui_selectors):
+    """
+    GIVEN default_render_profile in config and no flag
+    WHEN generate command run
+    THEN the configured profile is used
+    """
+    with patch("eleven_video.orchestrator.VideoPipeline") as MockPipeline, \
+         patch("eleven_video.main.load_config", return_value={"default_render_profile": "archival"}):
+        result = runner.invoke(app, ["generate", "--prompt", "My Topic"])
+
+    assert result.exit_code == 0
+    assert MockPipeline.call_args.kwargs["render_profile"] == "archival"
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_audio_mode_flag(mock_settings, mock_ui_selectors):
+    """
+    GIVEN --audio-mode copy
+    WHEN generate command run
+    THEN the pipeline is created to mux the narration without re-encoding
+    """
+    with patch("eleven_video.orchestrator.VideoPipeline") as MockPipeline:
+        result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--audio-mode", "copy"])
+
+    assert result.exit_code == 0
+    assert MockPipeline.call_args.kwargs["audio_mode"] == "copy"
+
+
+def test_cli_generate_invalid_audio_mode(mock_pipeline, mock_ui_selectors):
+    """
+    GIVEN an unknown --audio-mode
+    WHEN generate command run
+    THEN it exits with an error listing the options
+    """
+    result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--audio-mode", "flac"])
+
+    assert result.exit_code == 1
+    assert "Invalid audio mode" in result.stdout
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_output_format_flag(mock_settings, mock_ui_selectors):
+    """
+    GIVEN --output-format hls
+    WHEN generate command run
+    THEN the pipeline writes a progressive HLS output
+    """
+    with patch("eleven_video.orchestrator.VideoPipeline") as MockPipeline:
+        result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--output-format", "hls"])
+
+    assert result.exit_code == 0
+    assert MockPipeline.call_args.kwargs["output_format"] == "hls"
+    assert MockPipeline.call_args.kwargs["output_path"] is None
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_output_to_stdout(mock_settings, mock_ui_selectors):
+    """
+    GIVEN --output -
+    WHEN generate command run
+    THEN fragmented MP4 is streamed to stdout and messages move to stderr
+    """
+    from eleven_video.ui.console import console
+
+    with patch("eleven_video.orchestrator.VideoPipeline") as MockPipeline:
+        MockPipeline.return_value.generate.side_effect = lambda **kwargs: console.print("rendering")
+        result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--output", "-"])
+
+    assert result.exit_code == 0
+    kwargs = MockPipeline.call_args.kwargs
+    assert kwargs["output_format"] == "fmp4"
+    assert str(kwargs["output_path"]) == "-"
+    assert "rendering" not in result.stdout
+    assert "rendering" in result.stderr
+    assert console.stderr is False
+
+
+def test_cli_generate_hls_to_stdout_rejected(mock_pipeline, mock_ui_selectors):
+    """HLS is a playlist plus segment files and cannot go to stdout."""
+    result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--output", "-", "--output-format", "hls"])
+
+    assert result.exit_code == 1
+    assert "cannot be streamed to stdout" in result.stderr
+
+
+def test_cli_generate_invalid_output_format(mock_pipeline, mock_ui_selectors):
+    """An unknown --output-format exits with the options."""
+    result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--output-format", "webm"])
+
+    assert result.exit_code == 1
+    assert "Invalid output format" in result.stdout
+
+
+def test_cli_generate_invalid_render_profile(mock_pipeline, mock_ui_selectors):
+    """
+    GIVEN an unknown --render-profile
+    WHEN generate command run
+    THEN it exits with an error listing the options
+    """
+    result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--render-profile", "turbo"])
+
+    assert result.exit_code == 1
+    assert "Invalid render profile" in result.stdout
+    mock_pipeline.generate.assert_not_called()
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_preview_flag_renders_both(mock_settings, mock_pipeline, mock_ui_selectors):
+    """
+    GIVEN --preview flag
+    WHEN generate command run
+    THEN the pipeline renders the proxy and the full video
+    """
+    result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--preview"])
+
+    assert result.exit_code == 0
+    assert mock_pipeline.generate.call_args.kwargs["render_mode"] == "both"
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_preview_command_renders_proxy_only(mock_settings, mock_pipeline, mock_ui_selectors):
+    """
+    GIVEN the preview command
+    WHEN run with a prompt
+    THEN the pipeline renders only the proxy
+    """
+    result = runner.invoke(app, ["preview", "--prompt", "My Topic", "--resolution", "portrait"])
+
+    assert result.exit_code == 0
+    kwargs = mock_pipeline.generate.call_args.kwargs
+    assert kwargs["render_mode"] == "preview"
+    assert kwargs["resolution"] == Resolution.PORTRAIT
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_scratch_dir_flag(mock_settings, mock_ui_selectors, tmp_path):
+    """
+    GIVEN --scratch-dir pointing at a directory
+    WHEN generate command run
+    THEN the pipeline writes its intermediates there
+    """
+    with patch("eleven_video.orchestrator.VideoPipeline") as MockPipeline:
+        result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--scratch-dir", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert MockPipeline.call_args.kwargs["scratch_dir"] == tmp_path
+
+
+def test_cli_generate_scratch_dir_must_be_directory(mock_pipeline, mock_ui_selectors, tmp_path):
+    """
+    GIVEN --scratch-dir pointing at a file
+    WHEN generate command run
+    THEN it exits with an error
+    """
+    not_a_dir = tmp_path / "file.txt"
+    not_a_dir.write_text("x")
+
+    result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--scratch-dir", str(not_a_dir)])
+
+    assert result.exit_code == 1
+    assert "Invalid scratch directory" in result.stdout
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_shared_dir_flag(mock_settings, mock_ui_selectors, tmp_path):
+    """
+    GIVEN --shared-dir pointing at a directory
+    WHEN generate command run
+    THEN the pipeline publishes segments there for render workers
+    """
+    with patch("eleven_video.orchestrator.VideoPipeline") as MockPipeline:
+        result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--shared-dir", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert MockPipeline.call_args.kwargs["shared_dir"] == tmp_path
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_transition_flag(mock_settings, mock_ui_selectors):
+    """
+    GIVEN --transition 0.5
+    WHEN generate command run
+    THEN the pipeline crossfades consecutive images over half a second
+    """
+    with patch("eleven_video.orchestrator.VideoPipeline") as MockPipeline:
+        result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--transition", "0.5"])
+
+    assert result.exit_code == 0
+    assert MockPipeline.call_args.kwargs["transition_seconds"] == 0.5
+
+
+def test_cli_generate_negative_transition_rejected(mock_pipeline, mock_ui_selectors):
+    result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--transition", "-1"])
+
+    assert result.exit_code == 1
+    assert "Invalid transition" in result.stdout
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_work_dir_flag(mock_settings, mock_ui_selectors, tmp_path):
+    """
+    GIVEN --work-dir
+    WHEN generate command run
+    THEN the pipeline keeps its assets and compile progress there so a rerun can resume
+    """
+    with patch("eleven_video.orchestrator.VideoPipeline") as MockPipeline:
+        result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--work-dir", str(tmp_path / "run")])
+
+    assert result.exit_code == 0
+    assert MockPipeline.call_args.kwargs["work_dir"] == tmp_path / "run"
+
+
+def test_cli_generate_work_dir_must_be_directory(mock_pipeline, mock_ui_selectors, tmp_path):
+    not_a_dir = tmp_path / "file.txt"
+    not_a_dir.write_text("x")
+
+    result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--work-dir", str(not_a_dir)])
+
+    assert result.exit_code == 1
+    assert "Invalid work directory" in result.stdout
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_segment_cache_flag(mock_settings, mock_ui_selectors, tmp_path):
+    """
+    GIVEN --segment-cache
+    WHEN generate command run
+    THEN the pipeline reuses encoded segments from that directory
+    """
+    with patch("eleven_video.orchestrator.VideoPipeline") as MockPipeline:
+        result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--segment-cache", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert MockPipeline.call_args.kwargs["segment_cache_dir"] == tmp_path
+
+
+@patch("eleven_video.main.Settings")
+def test_cli_generate_segment_cache_from_settings(mock_settings, mock_ui_selectors, tmp_path):
+    """Without the flag the segment_cache_dir setting is used."""
+    mock_settings.return_value.segment_cache_dir = str(tmp_path)
+    with patch("eleven_video.orchestrator.VideoPipeline") as MockPipeline:
+        result = runner.invoke(app, ["generate", "--prompt", "My Topic"])
+
+    assert result.exit_code == 0
+    assert MockPipeline.call_args.kwargs["segment_cache_dir"] == tmp_path
+
+
+def test_cli_generate_segment_cache_must_be_directory(mock_pipeline, mock_ui_selectors, tmp_path):
+    not_a_dir = tmp_path / "file.txt"
+    not_a_dir.write_text("x")
+
+    result = runner.invoke(app, ["generate", "--prompt", "My Topic", "--segment-cache", str(not_a_dir)])
+
+    assert result.exit_code == 1
+    assert "Invalid segment cache" in result.stdout
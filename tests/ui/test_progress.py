@@ -538,6 +538,26 @@ class TestSummaryDisplay:
         result = output.getvalue()
         assert "10" in result or "duration" in result.lower()
 
+    def test_show_summary_includes_encode_rate(self, mock_console, tmp_path):
+        """
+        GIVEN a video whose render measured its encode rate
+        WHEN show_summary is called
+        THEN the frames/sec is displayed.
+        """
+        from eleven_video.ui.progress import VideoPipelineProgress
+        from eleven_video.models.domain import PipelineStage
+
+        output, test_console = mock_console
+        progress = VideoPipelineProgress(console=test_console)
+        progress.start_stage(PipelineStage.INITIALIZING)
+
+        video = create_test_video(file_path=tmp_path / "output.mp4")
+        video.encode_fps = 41.27
+
+        progress.show_summary(video.file_path, video)
+
+        assert "Encode: 41.3 fps" in output.getvalue()
+
 
 # =============================================================================
 # Story 2.5: AC1 - Callback Factory Tests
@@ -614,3 +634,21 @@ class TestCallbackFactory:
         
         result = output.getvalue()
         assert "image" in result.lower() or "3" in result
+
+    def test_show_summary_omits_unmeasured_details(self, mock_console, tmp_path):
+        """Preview, poster and encode lines appear only when the video has them."""
+        from eleven_video.ui.progress import VideoPipelineProgress
+        from eleven_video.models.domain import PipelineStage
+
+        output, test_console = mock_console
+        progress = VideoPipelineProgress(console=test_console)
+        progress.start_stage(PipelineStage.INITIALIZING)
+
+        video = create_test_video(file_path=tmp_path / "output.mp4")
+        video.encode_fps = 0.0
+
+        progress.show_summary(video.file_path, video)
+
+        result = output.getvalue()
+        assert "Encode: 0.0 fps" in result
+        assert "Preview:" not in result and "Poster:" not in result
@@ -0,0 +1,106 @@
+"""
+Tests for the pure-Python MP3 duration parser.
+
+Related files:
+- eleven_video/utils/mp3.py: mp3_duration, parse_frame_header
+- eleven_video/api/elevenlabs.py: Audio.duration_seconds at TTS time
+"""
+import subprocess
+
+import pytest
+
+from eleven_video.utils.mp3 import mp3_duration, parse_frame_header
+from tests.support.factories.media_factory import ffmpeg_available
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo, no padding: 417-byte frames
+CBR_HEADER = b"\xff\xfb\x90\x00"
+CBR_FRAME = CBR_HEADER + bytes(413)
+
+
+def _id3v2(payload_size: int) -> bytes:
+    size = bytes((payload_size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    return b"ID3\x04\x00\x00" + size + bytes(payload_size)
+
+
+class TestFrameHeader:
+    """Frame header decoding."""
+
+    def test_decodes_mpeg1_layer3(self):
+        """The ElevenLabs mp3_44100_128 header decodes to 1152-sample, 417-byte frames."""
+        header = parse_frame_header(CBR_HEADER, 0)
+
+        assert header.mpeg1 and header.layer == 3
+        assert header.sample_rate == 44100
+        assert header.frame_length == 417
+        assert header.samples == 1152
+
+    @pytest.mark.parametrize("data", [
+        b"\xff\xfb\xf0\x00",  # bitrate index 15
+        b"\xff\xfb\x9c\x00",  # sample rate index 3
+        b"\xff\xeb\x90\x00",  # reserved version
+        b"ID3\x04",
+    ])
+    def test_rejects_invalid_headers(self, data):
+        """Reserved or invalid fields are not frame headers."""
+        assert parse_frame_header(data, 0) is None
+
+
+class TestDuration:
+    """Duration without decoding."""
+
+    def test_cbr_frames_counted(self):
+        """
+        GIVEN 100 CBR frames after an ID3v2 tag
+        WHEN the duration is parsed
+        THEN it is 100 x 1152 samples at 44.1 kHz.
+        """
+        data = _id3v2(300) + CBR_FRAME * 100
+
+        assert mp3_duration(data) == pytest.approx(100 * 1152 / 44100)
+
+    def test_truncated_final_frame_dropped(self):
+        """A partial last frame is not counted."""
+        assert mp3_duration(CBR_FRAME * 10 + CBR_FRAME[:100]) == pytest.approx(10 * 1152 / 44100)
+
+    def test_not_mp3_returns_none(self):
+        """Data without a complete MPEG frame yields None (callers fall back to ffmpeg)."""
+        assert mp3_duration(b"fake_audio_data") is None
+        assert mp3_duration(CBR_FRAME[:8]) is None
+        assert mp3_duration(b"") is None
+
+    def test_vbri_frame_count(self):
+        """A VBRI tag's frame count is used instead of walking the stream."""
+        vbri = b"VBRI" + bytes(10) + (500).to_bytes(4, "big")
+        first = CBR_HEADER + bytes(32) + vbri
+        first += bytes(417 - len(first))
+
+        assert mp3_duration(first + CBR_FRAME * 3) == pytest.approx(500 * 1152 / 44100)
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not ffmpeg_available(), reason="ffmpeg not available")
+class TestDurationAgainstEncoder:
+    """Durations of real LAME-encoded files."""
+
+    @pytest.mark.parametrize("source,extra", [
+        ("anullsrc=r=44100:cl=mono", ["-b:a", "64k"]),
+        ("anullsrc=r=48000:cl=stereo", ["-b:a", "128k"]),
+        ("sine=f=440:r=44100", ["-q:a", "4"]),  # VBR
+        ("anullsrc=r=44100:cl=mono", ["-b:a", "32k", "-ar", "22050"]),  # MPEG-2
+    ])
+    def test_xing_lame_tag_gives_exact_duration(self, tmp_path, source, extra):
+        """
+        GIVEN a file written by libmp3lame with a Xing/Info + LAME tag
+        WHEN the duration is parsed
+        THEN encoder delay and padding are removed and it matches the source exactly.
+        """
+        from eleven_video.processing.ffmpeg_backend import get_ffmpeg_binary
+
+        path = tmp_path / "audio.mp3"
+        subprocess.run(
+            [get_ffmpeg_binary(), "-hide_banner", "-loglevel", "error",
+             "-f", "lavfi", "-i", source, "-t", "3.3", "-c:a", "libmp3lame", *extra, str(path)],
+            check=True,
+        )
+
+        assert mp3_duration(path.read_bytes()) == pytest.approx(3.3, abs=1e-6)